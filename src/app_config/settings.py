@@ -2,6 +2,7 @@ import datetime
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dynaconf import settings
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -9,6 +10,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = settings.ENVIRONMENT.SECRET_KEY
 DEBUG = bool(settings.ENVIRONMENT.get("DEBUG", 0))
 DEBUG_TOOLBAR_ENABLED = bool(settings.ENVIRONMENT.get("DEBUG_TOOLBAR_ENABLED", 0))
+TRANSFER_ROLLUPS_ENABLED = bool(settings.ENVIRONMENT.get("TRANSFER_ROLLUPS_ENABLED", 0))
 ALLOWED_HOSTS = [host(settings) if callable(host) else host for host in settings.ENVIRONMENT.ALLOWED_HOSTS]
 
 # Application definition
@@ -106,6 +108,31 @@ else:
         }
     }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": settings.ENVIRONMENT.get("CACHE_BACKEND") or "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": settings.ENVIRONMENT.get("CACHE_LOCATION") or "budgetory",
+    }
+}
+# Wallet data versions reach other worker processes only through cache shared between them, so caches relying
+# on these versions are enabled only for shared cache backend.
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+SHARED_CACHE_CONFIGURED = CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+_wallet_response_cache_enabled = settings.ENVIRONMENT.get("WALLET_RESPONSE_CACHE_ENABLED", None)
+if _wallet_response_cache_enabled in (None, ""):
+    WALLET_RESPONSE_CACHE_ENABLED = SHARED_CACHE_CONFIGURED
+elif bool(int(_wallet_response_cache_enabled)) and not SHARED_CACHE_CONFIGURED:
+    raise ImproperlyConfigured("WALLET_RESPONSE_CACHE_ENABLED requires shared CACHE_BACKEND, like Redis or Memcached.")
+else:
+    WALLET_RESPONSE_CACHE_ENABLED = bool(int(_wallet_response_cache_enabled))
+WALLET_RESPONSE_CACHE_TIMEOUT = int(settings.ENVIRONMENT.get("WALLET_RESPONSE_CACHE_TIMEOUT") or 300)
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
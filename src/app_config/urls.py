@@ -34,6 +34,7 @@ urlpatterns = [
     path("api/users/", include("app_users.urls")),
     path("api/wallets/", include("wallets.urls")),
     path("api/wallets/<int:wallet_pk>/", include("predictions.urls")),
+    path("api/wallets/<int:wallet_pk>/", include("transfers.urls")),
     path("api/categories/", include("categories.urls")),
     path("api/", include("charts.urls")),
     path(
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AppInfrastructureConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app_infrastructure"
+
+    def ready(self) -> None:
+        """Registers signal receivers of app_infrastructure app."""
+        from app_infrastructure import receivers  # noqa: F401
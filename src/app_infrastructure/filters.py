@@ -0,0 +1,111 @@
+import re
+from functools import lru_cache, reduce
+from operator import or_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+from django_filters import rest_framework as filters
+
+SEARCH_CONFIG = "simple"
+SEARCH_WORD_PATTERN = re.compile(r"\w+")
+
+
+def get_search_vector(*fields: str) -> SearchVector:
+    """
+    Returns full-text search vector of given fields. Expression has to be the same as in GIN indexes created
+    for searched models, so filtering by it can use these indexes.
+
+    Args:
+        *fields (str): Names of searched text fields.
+
+    Returns:
+        SearchVector: Search vector of fields.
+    """
+    return SearchVector(*fields, config=SEARCH_CONFIG)
+
+
+@lru_cache
+def is_trigram_search_available(using: str) -> bool:
+    """
+    Checks if pg_trgm extension is installed in database, so case-insensitive substring conditions are served
+    by trigram GIN indexes. Result is cached for process lifetime.
+
+    Args:
+        using (str): Database alias.
+
+    Returns:
+        bool: True if pg_trgm extension is installed.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def get_prefix_search_query(value: str) -> SearchQuery | None:
+    """
+    Returns full-text search query matching documents containing words starting with every word of given value,
+    so documents are found while search value is being typed.
+
+    Args:
+        value (str): Search value.
+
+    Returns:
+        SearchQuery | None: Search query or None if value contains no words.
+    """
+    words = SEARCH_WORD_PATTERN.findall(value.lower())
+    if not words:
+        return None
+    return SearchQuery(" & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG)
+
+
+class TextSearchFilter(filters.CharFilter):
+    """
+    Filter searching given value in text fields and ordering results by relevance. On PostgreSQL value is matched
+    with prefix full-text query against search vector of fields, served by GIN index on the vector. If pg_trgm
+    extension is installed, value is also matched as case-insensitive substring of first field, served by trigram
+    GIN index. On other databases only case-insensitive substring of every field is matched. Search rank is cast
+    to double precision, so its value returned to Python (e.g. in keyset pagination cursor) compares equal
+    to the one in database. Relevance ordering is the default one only - OrderingFilter running after filtering
+    replaces it when "ordering" query param is given, so explicitly requested ordering discards relevance.
+
+    Args:
+        search_fields (tuple[str, ...]): Names of searched text fields.
+    """
+
+    def __init__(self, *args, search_fields: tuple[str, ...] = ("name", "description"), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.search_fields = search_fields
+
+    def filter(self, qs: QuerySet, value: str) -> QuerySet:
+        """
+        Filters QuerySet by search value and orders it by search rank, unless ordering is replaced afterwards
+        by OrderingFilter.
+
+        Args:
+            qs (QuerySet): Input QuerySet.
+            value (str): Search value.
+
+        Returns:
+            QuerySet: Filtered QuerySet.
+        """
+        value = (value or "").strip()
+        if not value:
+            return qs
+        substring_condition = Q(**{f"{self.search_fields[0]}__icontains": value})
+        if connections[qs.db].vendor != "postgresql":
+            return qs.filter(reduce(or_, (Q(**{f"{field}__icontains": value}) for field in self.search_fields)))
+        search_query = get_prefix_search_query(value)
+        if search_query is None:
+            return qs.filter(substring_condition)
+        search_vector = get_search_vector(*self.search_fields)
+        search_condition = Q(search_vector=search_query)
+        if is_trigram_search_available(qs.db):
+            search_condition |= substring_condition
+        return (
+            qs.alias(search_vector=search_vector)
+            .annotate(search_rank=Cast(SearchRank(search_vector, search_query), FloatField()))
+            .filter(search_condition)
+            .order_by("-search_rank", "id")
+        )
@@ -1,7 +1,356 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Field, Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class DefaultPagination(PageNumberPagination):
     page_size = None  # None value enables to return all objects when no pagination params passed.
     page_size_query_param = "page_size"
     max_page_size = 1000
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination filtering rows placed after (or before) last row of previous page on (ordering field, id) key
+    instead of using OFFSET, so every page is fetched with the same cost. Ordering is taken from first field
+    of QuerySet ordering (set by OrderingFilter or by view), id is used as tiebreaker. NULL values are placed last
+    regardless of ordering direction. Total number of objects is returned only on count_query_param request.
+    """
+
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> list[Model | dict]:
+        """
+        Returns single page of QuerySet objects placed after position encoded in cursor.
+
+        Args:
+            queryset (QuerySet): Filtered and ordered QuerySet.
+            request (Request): User request.
+            view (Any): View calling pagination.
+
+        Returns:
+            list[Model | dict]: Page of objects.
+
+        Raises:
+            NotFound: Raised on invalid cursor.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.count = queryset.count() if self.is_count_requested(request) else None
+        self.ordering_field, self.descending = self.get_ordering_field(queryset)
+        self.key_field, self.key_nullable = self.get_key_field(queryset, self.ordering_field)
+        position, self.reverse = self.decode_cursor(request)
+
+        descending, nulls_last = self.descending != self.reverse, not self.reverse
+        queryset = queryset.order_by(*self.get_keyset_ordering(descending, nulls_last))
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position, descending, nulls_last))
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if self.reverse:
+            results.reverse()
+        self.has_next = position is not None if self.reverse else has_more
+        self.has_previous = has_more if self.reverse else position is not None
+        self.first_position = self.get_position(results[0]) if results else None
+        self.last_position = self.get_position(results[-1]) if results else None
+        return results
+
+    def get_paginated_response(self, data: list) -> Response:
+        """
+        Returns response with page results and links to next and previous pages.
+
+        Args:
+            data (list): Serialized page.
+
+        Returns:
+            Response: Paginated response.
+        """
+        content = [("next", self.get_next_link()), ("previous", self.get_previous_link()), ("results", data)]
+        if self.count is not None:
+            content.insert(0, ("count", self.count))
+        return Response(OrderedDict(content))
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        """
+        Returns OpenAPI schema of paginated response.
+
+        Args:
+            schema (dict): Schema of single page results.
+
+        Returns:
+            dict: Schema of paginated response.
+        """
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer", "example": 123},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        """
+        Returns page size passed in request, limited by max_page_size, or default one.
+
+        Args:
+            request (Request): User request.
+
+        Returns:
+            int: Page size.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def is_count_requested(self, request: Request) -> bool:
+        """
+        Checks if total number of objects was requested.
+
+        Args:
+            request (Request): User request.
+
+        Returns:
+            bool: True if count_query_param has truthy value.
+        """
+        return request.query_params.get(self.count_query_param, "").lower() in ("1", "true")
+
+    @staticmethod
+    def get_ordering_field(queryset: QuerySet) -> tuple[str, bool]:
+        """
+        Returns first field of QuerySet ordering with its direction.
+
+        Args:
+            queryset (QuerySet): Ordered QuerySet.
+
+        Returns:
+            tuple[str, bool]: Ordering field name and True for descending ordering.
+        """
+        ordering = next((field for field in queryset.query.order_by if isinstance(field, str)), "id")
+        field_name = ordering.lstrip("-")
+        return "id" if field_name == "pk" else field_name, ordering.startswith("-")
+
+    @staticmethod
+    def get_key_field(queryset: QuerySet, ordering_field: str) -> tuple[Field, bool]:
+        """
+        Returns field used to convert cursor values for ordering field and checks if ordering field can be NULL.
+
+        Args:
+            queryset (QuerySet): Ordered QuerySet.
+            ordering_field (str): Ordering field name or annotation.
+
+        Returns:
+            tuple[Field, bool]: Field of ordering values and True if they can be NULL.
+        """
+        if ordering_field in queryset.query.annotations:
+            return queryset.query.annotations[ordering_field].output_field, True
+        model, nullable = queryset.model, False
+        for part in ordering_field.split("__"):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return Field(), True
+            nullable = nullable or field.null
+            if field.is_relation:
+                model = field.related_model
+        return (field.target_field if field.is_relation else field), nullable
+
+    def get_keyset_ordering(self, descending: bool, nulls_last: bool) -> tuple:
+        """
+        Returns QuerySet ordering on (ordering field, id) key.
+
+        Args:
+            descending (bool): Ordering direction.
+            nulls_last (bool): True to place NULL values last, False to place them first (for reversed cursor).
+
+        Returns:
+            tuple: Ordering expressions.
+        """
+        if self.ordering_field == "id":
+            return ("-id",) if descending else ("id",)
+        nulls_position = {"nulls_last": True} if nulls_last else {"nulls_first": True}
+        if descending:
+            return F(self.ordering_field).desc(**nulls_position), "-id"
+        return F(self.ordering_field).asc(**nulls_position), "id"
+
+    def get_keyset_filter(self, position: tuple[Any, int], descending: bool, nulls_last: bool) -> Q:
+        """
+        Returns condition selecting rows placed after given position in keyset ordering.
+
+        Args:
+            position (tuple[Any, int]): Ordering field value and id of last row of previous page.
+            descending (bool): Ordering direction.
+            nulls_last (bool): True if NULL values are placed last, False if they are placed first.
+
+        Returns:
+            Q: Filtering condition.
+        """
+        value, pk = position
+        lookup = "lt" if descending else "gt"
+        if self.ordering_field == "id":
+            return Q(**{f"id__{lookup}": pk})
+        if value is None:
+            condition = Q(**{f"{self.ordering_field}__isnull": True, f"id__{lookup}": pk})
+            return condition if nulls_last else condition | Q(**{f"{self.ordering_field}__isnull": False})
+        condition = Q(**{f"{self.ordering_field}__{lookup}": value}) | Q(
+            **{self.ordering_field: value, f"id__{lookup}": pk}
+        )
+        if self.key_nullable and nulls_last:
+            condition |= Q(**{f"{self.ordering_field}__isnull": True})
+        return condition
+
+    def get_position(self, obj: Model | dict) -> tuple[Any, int]:
+        """
+        Returns position of object in keyset ordering.
+
+        Args:
+            obj (Model | dict): Paginated object or row of QuerySet.values() containing ordering field and id.
+
+        Returns:
+            tuple[Any, int]: Ordering field value and id of object.
+        """
+        if isinstance(obj, dict):
+            return obj[self.ordering_field], obj["id"]
+        value = obj
+        parts = self.ordering_field.split("__")
+        for index, part in enumerate(parts):
+            if value is None:
+                break
+            if index == len(parts) - 1:
+                try:
+                    part = value._meta.get_field(part).attname
+                except FieldDoesNotExist:
+                    pass
+            value = getattr(value, part)
+        return value, obj.pk
+
+    def encode_cursor(self, position: tuple[Any, int], reverse: bool) -> str:
+        """
+        Returns URL with opaque cursor pointing given position.
+
+        Args:
+            position (tuple[Any, int]): Ordering field value and id of row.
+            reverse (bool): True for cursor pointing rows before given position.
+
+        Returns:
+            str: Page URL.
+        """
+        payload = {"o": self.ordering_field, "p": list(position), "r": int(reverse)}
+        cursor = b64encode(json.dumps(payload, cls=DjangoJSONEncoder).encode(), altchars=b"-_").decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request: Request) -> tuple[tuple[Any, int] | None, bool]:
+        """
+        Decodes cursor passed in request.
+
+        Args:
+            request (Request): User request.
+
+        Returns:
+            tuple[tuple[Any, int] | None, bool]: Position (None for first page) and True for reversed cursor.
+
+        Raises:
+            NotFound: Raised on invalid cursor or on cursor created for different ordering.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(b64decode(encoded.encode(), altchars=b"-_", validate=True))
+            if payload["o"] != self.ordering_field:
+                raise ValueError
+            value, pk = payload["p"]
+            value = None if value is None else self.key_field.to_python(value)
+            return (value, int(pk)), bool(payload["r"])
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self) -> str | None:
+        """
+        Returns URL of next page.
+
+        Returns:
+            str | None: Next page URL or None on last page.
+        """
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position, reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        """
+        Returns URL of previous page.
+
+        Returns:
+            str | None: Previous page URL or None on first page.
+        """
+        if not self.has_previous:
+            return None
+        if self.first_position is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.first_position, reverse=True)
+
+
+class DefaultOrKeysetPagination(DefaultPagination):
+    """
+    DefaultPagination with opt-in KeysetPagination mode, enabled with "pagination=cursor" query param
+    or by passing cursor returned in previous page.
+    """
+
+    pagination_mode_query_param = "pagination"
+    keyset_pagination_class = KeysetPagination
+    keyset_paginator = None
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> list | None:
+        """
+        Paginates QuerySet with KeysetPagination if it was requested, otherwise with DefaultPagination.
+
+        Args:
+            queryset (QuerySet): Filtered and ordered QuerySet.
+            request (Request): User request.
+            view (Any): View calling pagination.
+
+        Returns:
+            list | None: Page of objects or None if pagination is disabled.
+        """
+        if (
+            request.query_params.get(self.pagination_mode_query_param) == "cursor"
+            or self.keyset_pagination_class.cursor_query_param in request.query_params
+        ):
+            self.keyset_paginator = self.keyset_pagination_class()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: list) -> Response:
+        """
+        Returns paginated response of used pagination mode.
+
+        Args:
+            data (list): Serialized page.
+
+        Returns:
+            Response: Paginated response.
+        """
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,94 @@
+from typing import Any, Iterable
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from app_infrastructure.services.wallet_response_cache_service import bump_wallets_data_versions
+from app_infrastructure.signals import wallet_data_changed
+from categories.models import TransferCategory
+from entities.models import Deposit, Entity
+from periods.models import Period
+from periods.services.period_index_service import bump_wallet_periods_version
+from predictions.models import ExpensePrediction
+from transfers.models import Expense, Income, Transfer
+
+
+def get_instance_wallet_id(instance: models.Model) -> int | None:
+    """
+    Returns Wallet ID of given model instance - directly or through its Period.
+
+    Args:
+        instance (models.Model): Model instance.
+
+    Returns:
+        int | None: Wallet ID.
+    """
+    if hasattr(instance, "wallet_id"):
+        return instance.wallet_id
+    return instance.period.wallet_id
+
+
+@receiver(post_save, sender=Period)
+@receiver(post_save, sender=TransferCategory)
+@receiver(post_save, sender=Entity)
+@receiver(post_save, sender=Deposit)
+@receiver(post_save, sender=Transfer)
+@receiver(post_save, sender=Expense)
+@receiver(post_save, sender=Income)
+@receiver(post_save, sender=ExpensePrediction)
+@receiver(post_delete, sender=Period)
+@receiver(post_delete, sender=TransferCategory)
+@receiver(post_delete, sender=Entity)
+@receiver(post_delete, sender=Deposit)
+def bump_instance_wallet_data_version(sender: type[models.Model], instance: models.Model, **kwargs: Any) -> None:
+    """
+    Bumps data version of Wallet of saved or deleted instance.
+
+    Args:
+        sender (type[models.Model]): Model class sending signal.
+        instance (models.Model): Saved or deleted instance.
+    """
+    bump_wallets_data_versions([get_instance_wallet_id(instance)])
+
+
+@receiver(post_delete, sender=ExpensePrediction)
+def bump_deleted_prediction_wallet_data_version(
+    sender: type[ExpensePrediction], instance: ExpensePrediction, origin: Any = None, **kwargs: Any
+) -> None:
+    """
+    Bumps data version of Wallet of deleted ExpensePrediction. Skipped for cascade and QuerySet deletions,
+    as they bump Wallet version on their own.
+
+    Args:
+        sender (type[ExpensePrediction]): Model class sending signal.
+        instance (ExpensePrediction): Deleted ExpensePrediction.
+        origin (Any): Instance or QuerySet, which deletion was started for.
+    """
+    if origin is instance:
+        bump_wallets_data_versions([get_instance_wallet_id(instance)])
+
+
+@receiver(post_save, sender=Period)
+@receiver(post_delete, sender=Period)
+def bump_period_wallet_periods_version(sender: type[Period], instance: Period, **kwargs: Any) -> None:
+    """
+    Bumps Periods version of Wallet of saved or deleted Period, which invalidates PeriodIndexes of Wallet.
+
+    Args:
+        sender (type[Period]): Model class sending signal.
+        instance (Period): Saved or deleted Period.
+    """
+    bump_wallet_periods_version(instance.wallet_id)
+
+
+@receiver(wallet_data_changed)
+def bump_changed_wallets_data_versions(sender: Any, wallet_ids: Iterable[int], **kwargs: Any) -> None:
+    """
+    Bumps data versions of Wallets changed by bulk operation.
+
+    Args:
+        sender (Any): Signal sender.
+        wallet_ids (Iterable[int]): Changed Wallets IDs.
+    """
+    bump_wallets_data_versions(wallet_ids)
@@ -0,0 +1,194 @@
+from typing import Any
+
+from django.db.models import Expression, F, Field, QuerySet
+from django.db.models.sql.constants import LOUTER
+from django.db.models.sql.datastructures import Join
+
+
+class DerivedTableColumn(Expression):
+    """
+    Expression referencing column of derived table joined to QuerySet with join_derived_table function.
+
+    Args:
+        table_alias (str): Alias of joined derived table.
+        column (str): Name of derived table column.
+        output_field (Field): Field type of column.
+    """
+
+    def __init__(self, table_alias: str, column: str, output_field: Field):
+        super().__init__(output_field=output_field)
+        self.table_alias = table_alias
+        self.column = column
+
+    def as_sql(self, compiler: Any, connection: Any) -> tuple[str, list]:
+        """
+        Generates SQL referencing derived table column.
+
+        Args:
+            compiler (Any): SQL compiler.
+            connection (Any): Database connection.
+
+        Returns:
+            tuple[str, list]: SQL and its params.
+        """
+        qn = compiler.quote_name_unless_alias
+        return f"{qn(self.table_alias)}.{connection.ops.quote_name(self.column)}", []
+
+    def relabeled_clone(self, change_map: dict[str, str]) -> "DerivedTableColumn":
+        """
+        Returns copy of expression with table alias changed according to change_map.
+
+        Args:
+            change_map (dict[str, str]): Mapping of old to new aliases.
+
+        Returns:
+            DerivedTableColumn: Relabeled expression.
+        """
+        return self.__class__(change_map.get(self.table_alias, self.table_alias), self.column, self.output_field)
+
+    def get_group_by_cols(self) -> list["DerivedTableColumn"]:
+        """
+        Returns expression itself as it has to be grouped by like regular column.
+
+        Returns:
+            list[DerivedTableColumn]: List containing expression.
+        """
+        return [self]
+
+
+class DerivedTableJoin(Join):
+    """
+    LEFT OUTER JOIN of subquery results, joined on equality of resolved expressions of parent table and
+    derived table columns.
+
+    Args:
+        subquery (QuerySet): QuerySet compiled into derived table.
+        table_name (str): Name identifying derived table in query. Has to be unique within the query.
+        table_alias (str): Alias of derived table in query, initially equal to table_name.
+        parent_alias (str): Alias of table derived table is joined to.
+        join_conditions (tuple[tuple[Expression, str], ...]): Pairs of resolved parent table expressions
+            and derived table columns compared in ON clause.
+    """
+
+    def __init__(
+        self,
+        subquery: QuerySet,
+        table_name: str,
+        table_alias: str,
+        parent_alias: str,
+        join_conditions: tuple[tuple[Expression, str], ...],
+        join_type: str = LOUTER,
+    ):
+        self.subquery = subquery
+        self.table_name = table_name
+        self.table_alias = table_alias
+        self.parent_alias = parent_alias
+        self.join_conditions = join_conditions
+        self.join_type = join_type
+        self.join_field = None
+        self.nullable = True
+        self.filtered_relation = None
+
+    def as_sql(self, compiler: Any, connection: Any) -> tuple[str, list]:
+        """
+        Generates "LEFT OUTER JOIN (subquery) alias ON (...)" clause.
+
+        Args:
+            compiler (Any): SQL compiler.
+            connection (Any): Database connection.
+
+        Returns:
+            tuple[str, list]: SQL and its params.
+        """
+        subquery_sql, params = self.subquery.query.get_compiler(connection=connection).as_sql()
+        params = list(params)
+        conditions = []
+        for expression, column in self.join_conditions:
+            expression_sql, expression_params = compiler.compile(expression)
+            conditions.append(
+                f"{expression_sql} = {compiler.quote_name_unless_alias(self.table_alias)}"
+                f".{connection.ops.quote_name(column)}"
+            )
+            params.extend(expression_params)
+        return (
+            f"{self.join_type} ({subquery_sql}) {self.table_alias} ON ({' AND '.join(conditions)})",
+            params,
+        )
+
+    def relabeled_clone(self, change_map: dict[str, str]) -> "DerivedTableJoin":
+        """
+        Returns copy of join with aliases changed according to change_map.
+
+        Args:
+            change_map (dict[str, str]): Mapping of old to new aliases.
+
+        Returns:
+            DerivedTableJoin: Relabeled join.
+        """
+        return self.__class__(
+            subquery=self.subquery,
+            table_name=self.table_name,
+            table_alias=change_map.get(self.table_alias, self.table_alias),
+            parent_alias=change_map.get(self.parent_alias, self.parent_alias),
+            join_conditions=tuple(
+                (expression.relabeled_clone(change_map), column) for expression, column in self.join_conditions
+            ),
+            join_type=self.join_type,
+        )
+
+    @property
+    def identity(self) -> tuple:
+        """
+        Returns join identity used by Query to check if join can be reused.
+
+        Returns:
+            tuple: Join identity.
+        """
+        return self.__class__, self.table_name, self.parent_alias
+
+    def equals(self, other: "DerivedTableJoin") -> bool:
+        """
+        Checks if given join is equal to this one.
+
+        Args:
+            other (DerivedTableJoin): Compared join.
+
+        Returns:
+            bool: True if joins identities are equal.
+        """
+        return self.identity == other.identity
+
+
+def join_derived_table(
+    queryset: QuerySet, subquery: QuerySet, table_alias: str, join_on: dict[str, Expression | str]
+) -> QuerySet:
+    """
+    Joins results of subquery as derived table to QuerySet with LEFT OUTER JOIN. Derived table is computed once
+    for whole query, contrary to correlated Subquery computed for every row. Its columns can be referenced
+    in annotations, filters and ordering with DerivedTableColumn expression.
+
+    Args:
+        queryset (QuerySet): QuerySet derived table will be joined to.
+        subquery (QuerySet): QuerySet compiled into derived table, f.e. values().annotate() aggregation.
+        table_alias (str): Alias of derived table. Has to be unique within the query. Referenced columns
+            keep using it, as Query relabels derived table join together with DerivedTableColumn expressions.
+        join_on (dict[str, Expression | str]): Mapping of derived table columns to QuerySet model field names
+            or expressions, which values have to be equal to join rows.
+
+    Returns:
+        QuerySet: QuerySet with joined derived table.
+    """
+    queryset = queryset._chain()
+    query = queryset.query
+    parent_alias = query.get_initial_alias()
+    join_conditions = tuple(
+        (
+            (F(expression) if isinstance(expression, str) else expression).resolve_expression(
+                query, allow_joins=False, reuse=None, summarize=False
+            ),
+            column,
+        )
+        for column, expression in join_on.items()
+    )
+    query.join(DerivedTableJoin(subquery, table_alias, table_alias, parent_alias, join_conditions))
+    return queryset
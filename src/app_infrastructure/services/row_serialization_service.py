@@ -0,0 +1,90 @@
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple
+
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+class RowSerializer(NamedTuple):
+    """Columns selected for serialized model and function rendering single row of their values to response dict."""
+
+    columns: tuple[str, ...]
+    serialize: Callable[[dict], dict]
+
+
+def get_field_converter(field: serializers.Field) -> Callable[[Any], Any] | None:
+    """
+    Returns function converting not NULL database value of field to its representation. Representations
+    of common fields are computed directly from database values, other fields use their to_representation.
+
+    Args:
+        field (serializers.Field): Serializer field.
+
+    Returns:
+        Callable[[Any], Any] | None: Converting function or None, if database value is its representation.
+    """
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return None if field.pk_field is None else field.pk_field.to_representation
+    if isinstance(field, (serializers.IntegerField, serializers.CharField, serializers.BooleanField)):
+        return None
+    if isinstance(field, serializers.DecimalField):
+        coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if coerce_to_string and field.decimal_places is not None and not (field.localize or field.normalize_output):
+            # Database returns values already rounded to field scale, so they only need to be formatted.
+            return lambda value, format_spec=f".{field.decimal_places}f": format(value, format_spec)
+    if isinstance(field, serializers.DateField):
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if output_format is None:
+            return None
+        if output_format.lower() == ISO_8601:
+            return lambda value: value.isoformat()
+    return field.to_representation
+
+
+@lru_cache
+def get_row_serializer(serializer_class: type[serializers.ModelSerializer]) -> RowSerializer | None:
+    """
+    Compiles ModelSerializer into RowSerializer, rendering rows of QuerySet.values() the same way as serializer
+    renders model instances, without instantiating models and serializer fields for every row. Result is cached
+    for serializer class.
+
+    Args:
+        serializer_class (type[serializers.ModelSerializer]): ModelSerializer class.
+
+    Returns:
+        RowSerializer | None: Compiled RowSerializer or None, if any readable field is not rendered from single
+        column of serialized model (e.g. nested serializer, method field or dotted source).
+    """
+    model = serializer_class.Meta.model
+    concrete_fields = {field.name for field in model._meta.concrete_fields}
+    spec = []
+    for field_name, field in serializer_class().fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, (serializers.BaseSerializer, serializers.SerializerMethodField)):
+            return None
+        if field.source == "pk":
+            column = model._meta.pk.name
+        elif field.source in concrete_fields:
+            column = field.source
+        else:
+            return None
+        spec.append((field_name, column, get_field_converter(field)))
+    spec = tuple(spec)
+
+    def serialize(row: dict) -> dict:
+        """
+        Renders single row of QuerySet.values().
+
+        Args:
+            row (dict): Row with values of RowSerializer columns.
+
+        Returns:
+            dict: Serialized row.
+        """
+        return {
+            field_name: value if (value := row[column]) is None or converter is None else converter(value)
+            for field_name, column, converter in spec
+        }
+
+    return RowSerializer(columns=tuple(dict.fromkeys(column for _, column, _ in spec)), serialize=serialize)
@@ -0,0 +1,122 @@
+from datetime import date
+from functools import reduce
+from typing import NamedTuple
+
+from django.apps import apps
+from django.db import models
+from django.db.models import BooleanField, CharField, DateField, F, IntegerField, QuerySet, Value
+from django.db.models.functions import Cast
+
+
+class RelatedObjectData(NamedTuple):
+    """Values of object referenced by Transfer or ExpensePrediction needed to validate it without loading object."""
+
+    wallet_id: int
+    is_deposit: bool = False
+    deposit_id: int | None = None
+    date_start: date | None = None
+    date_end: date | None = None
+
+
+class WalletRelationsLookup:
+    """
+    Lookup of RelatedObjectData for objects referenced by model instance foreign keys. Data is taken from related
+    objects cached on instance, from data loaded before or with single UNION query for all missing objects,
+    so instance can be validated with at most one query. Single lookup can be shared by all instances saved within
+    one request, to load every referenced object only once.
+    """
+
+    def __init__(self):
+        self.data: dict[tuple[str, int], RelatedObjectData] = {}
+
+    @staticmethod
+    def get_object_data(obj: models.Model) -> RelatedObjectData:
+        """
+        Returns RelatedObjectData of loaded object.
+
+        Args:
+            obj (models.Model): Period, Entity, Deposit or TransferCategory instance.
+
+        Returns:
+            RelatedObjectData: Values of object.
+        """
+        return RelatedObjectData(
+            wallet_id=obj.wallet_id,
+            is_deposit=getattr(obj, "is_deposit", False),
+            deposit_id=getattr(obj, "deposit_id", None),
+            date_start=getattr(obj, "date_start", None),
+            date_end=getattr(obj, "date_end", None),
+        )
+
+    def get_instance_relations(
+        self, instance: models.Model, field_names: tuple[str, ...]
+    ) -> dict[str, RelatedObjectData | None]:
+        """
+        Returns RelatedObjectData of objects referenced by given foreign keys of instance.
+
+        Args:
+            instance (models.Model): Model instance.
+            field_names (tuple[str, ...]): Names of foreign keys to Period, Entity, Deposit or TransferCategory.
+
+        Returns:
+            dict[str, RelatedObjectData | None]: RelatedObjectData by field name. None for empty foreign key.
+        """
+        keys = {}
+        for field_name in field_names:
+            field = instance._meta.get_field(field_name)
+            pk = getattr(instance, field.attname)
+            if pk is None:
+                keys[field_name] = None
+                continue
+            key = (field.related_model._meta.concrete_model._meta.label_lower, pk)
+            if field.is_cached(instance) and (obj := field.get_cached_value(instance)) is not None:
+                self.data[key] = self.get_object_data(obj)
+            keys[field_name] = key
+        self.load({key for key in keys.values() if key is not None} - self.data.keys())
+        return {field_name: self.data[key] if key else None for field_name, key in keys.items()}
+
+    def load(self, keys: set[tuple[str, int]]) -> None:
+        """
+        Loads RelatedObjectData of given objects with single UNION query.
+
+        Args:
+            keys (set[tuple[str, int]]): Pairs of model label and primary key of loaded objects.
+        """
+        pks_by_label = {}
+        for label, pk in keys:
+            pks_by_label.setdefault(label, set()).add(pk)
+        querysets = [self._get_data_queryset(label, pks) for label, pks in pks_by_label.items()]
+        if not querysets:
+            return
+        queryset = reduce(lambda union, other: union.union(other, all=True), querysets)
+        for label, pk, *values in queryset:
+            self.data[(label, pk)] = RelatedObjectData(*values)
+
+    @staticmethod
+    def _get_data_queryset(label: str, pks: set[int]) -> QuerySet:
+        """
+        Returns QuerySet of model label, primary key and RelatedObjectData values of given objects. Every
+        value is annotated in the same order for every model and missing values are typed with Cast, so QuerySets
+        can be combined with UNION.
+
+        Args:
+            label (str): Model label.
+            pks (set[int]): Primary keys of objects.
+
+        Returns:
+            QuerySet: QuerySet of values tuples.
+        """
+        model = apps.get_model(label)
+        field_names = {field.name for field in model._meta.concrete_fields}
+        values = {
+            "related_label": Value(label, output_field=CharField()),
+            "related_pk": F("pk"),
+            "related_wallet_id": F("wallet_id"),
+            "related_is_deposit": (
+                F("is_deposit") if "is_deposit" in field_names else Cast(Value(False), BooleanField())
+            ),
+            "related_deposit_id": (F("deposit_id") if "deposit" in field_names else Cast(Value(None), IntegerField())),
+            "related_date_start": (F("date_start") if "date_start" in field_names else Cast(Value(None), DateField())),
+            "related_date_end": F("date_end") if "date_end" in field_names else Cast(Value(None), DateField()),
+        }
+        return model._base_manager.filter(pk__in=pks).order_by().annotate(**values).values_list(*values)
@@ -0,0 +1,181 @@
+import hashlib
+import logging
+import time
+from functools import partial, wraps
+from typing import Any, Callable, Iterable
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+logger = logging.getLogger("default")
+
+WALLET_DATA_VERSION_KEY = "wallet_data_version:{wallet_pk}"
+WALLET_RESPONSE_KEY = "wallet_response:{endpoint}:{wallet_pk}:{version}:{params_digest}"
+WALLET_RESPONSE_HITS_KEY = "wallet_response_cache_hits:{endpoint}"
+WALLET_RESPONSE_MISSES_KEY = "wallet_response_cache_misses:{endpoint}"
+
+
+def get_wallet_data_version(wallet_pk: int) -> int:
+    """
+    Returns current data version of Wallet. Missing version is initialized with current timestamp, so evicted
+    version never starts again from value used by already cached responses.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+
+    Returns:
+        int: Wallet data version.
+    """
+    key = WALLET_DATA_VERSION_KEY.format(wallet_pk=wallet_pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _increment_wallet_data_version(wallet_pk: int) -> None:
+    """
+    Increments data version of Wallet in cache.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+    """
+    key = WALLET_DATA_VERSION_KEY.format(wallet_pk=wallet_pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def bump_wallets_data_versions(wallet_pks: Iterable[int]) -> None:
+    """
+    Bumps data versions of given Wallets, which makes all their cached responses unreachable. Versions are
+    bumped immediately and once again after transaction commit, so responses cached by concurrent requests
+    with uncommitted state are invalidated as well.
+
+    Args:
+        wallet_pks (Iterable[int]): Wallets IDs.
+    """
+    for wallet_pk in set(wallet_pks):
+        if wallet_pk is None:
+            continue
+        _increment_wallet_data_version(wallet_pk)
+        transaction.on_commit(partial(_increment_wallet_data_version, wallet_pk))
+
+
+def normalize_request_params(params: dict[str, Any]) -> str:
+    """
+    Converts request parameters into string independent of parameters order. Empty values are skipped,
+    as views treat them the same way as missing parameters.
+
+    Args:
+        params (dict[str, Any]): URL kwargs and query parameters. Values can be lists for multi-value parameters.
+
+    Returns:
+        str: Normalized parameters.
+    """
+    items = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        items.extend((str(key), str(item)) for item in values if item not in (None, ""))
+    return urlencode(sorted(items))
+
+
+def get_wallet_response_cache_key(endpoint: str, wallet_pk: int, params: dict[str, Any]) -> str:
+    """
+    Builds cache key for response of given endpoint for current Wallet data version.
+
+    Args:
+        endpoint (str): Endpoint identifier.
+        wallet_pk (int): Wallet ID.
+        params (dict[str, Any]): URL kwargs and query parameters of request.
+
+    Returns:
+        str: Cache key.
+    """
+    params_digest = hashlib.sha256(normalize_request_params(params).encode()).hexdigest()
+    return WALLET_RESPONSE_KEY.format(
+        endpoint=endpoint,
+        wallet_pk=wallet_pk,
+        version=get_wallet_data_version(wallet_pk),
+        params_digest=params_digest,
+    )
+
+
+def _increment_counter(key: str) -> None:
+    """
+    Increments counter stored in cache.
+
+    Args:
+        key (str): Counter cache key.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_wallet_response_cache_stats(endpoint: str) -> dict[str, int]:
+    """
+    Returns hits and misses counters of cached endpoint.
+
+    Args:
+        endpoint (str): Endpoint identifier.
+
+    Returns:
+        dict[str, int]: Dictionary with "hits" and "misses" counters.
+    """
+    return {
+        "hits": cache.get(WALLET_RESPONSE_HITS_KEY.format(endpoint=endpoint), 0),
+        "misses": cache.get(WALLET_RESPONSE_MISSES_KEY.format(endpoint=endpoint), 0),
+    }
+
+
+def cache_wallet_response(timeout: int | None = None) -> Callable:
+    """
+    Decorator for APIView handler methods enabling versioned caching of responses for Wallet.
+    Cached responses are reachable only until data version of Wallet changes.
+
+    Args:
+        timeout (int | None): Cache timeout in seconds. WALLET_RESPONSE_CACHE_TIMEOUT setting used if not given.
+
+    Returns:
+        Callable: Decorator for view handler method.
+    """
+
+    def decorator(view_method: Callable) -> Callable:
+        @wraps(view_method)
+        def wrapper(view: APIView, request: Request, *args: Any, **kwargs: Any) -> Response:
+            if not getattr(settings, "WALLET_RESPONSE_CACHE_ENABLED", False):
+                return view_method(view, request, *args, **kwargs)
+            endpoint = type(view).__name__
+            key = get_wallet_response_cache_key(
+                endpoint=endpoint,
+                wallet_pk=kwargs["wallet_pk"],
+                params={**kwargs, **{key: request.query_params.getlist(key) for key in request.query_params}},
+            )
+            data = cache.get(key)
+            if data is not None:
+                _increment_counter(WALLET_RESPONSE_HITS_KEY.format(endpoint=endpoint))
+                return Response(data)
+            _increment_counter(WALLET_RESPONSE_MISSES_KEY.format(endpoint=endpoint))
+            response = view_method(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(
+                    key,
+                    response.data,
+                    timeout=timeout if timeout is not None else getattr(settings, "WALLET_RESPONSE_CACHE_TIMEOUT", 300),
+                )
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# Sent with "wallet_ids" argument after bulk operations changing Wallets data without sending model signals.
+wallet_data_changed = Signal()
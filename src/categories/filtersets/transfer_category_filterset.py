@@ -1,5 +1,6 @@
 from django_filters import rest_framework as filters
 
+from app_infrastructure.filters import TextSearchFilter
 from categories.models.choices.category_priority import CategoryPriority
 from categories.models.choices.category_type import CategoryType
 from entities.models import Deposit
@@ -11,6 +12,7 @@ class TransferCategoryFilterSet(filters.FilterSet):
 
     name = filters.CharFilter(lookup_expr="icontains", field_name="name")
     description = filters.CharFilter(lookup_expr="icontains", field_name="description")
+    search = TextSearchFilter(search_fields=("name", "description"))
     deposit = filters.ModelChoiceFilter(
         queryset=lambda request: Deposit.objects.filter(wallet__pk=get_wallet_pk(request))
     )
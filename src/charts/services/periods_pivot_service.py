@@ -0,0 +1,41 @@
+from typing import Any, Iterable
+
+from django.db.models import Aggregate, QuerySet, Sum
+
+
+def get_periods_pivot(
+    queryset: QuerySet,
+    periods: list[dict[str, Any]],
+    series_field: str,
+    series_ids: Iterable[int],
+    aggregate: Aggregate | None = None,
+) -> list[list[float]]:
+    """
+    Calculates aggregated values of given QuerySet for every (series, period) pair with single GROUP BY query
+    and arranges them into dense 2-D array.
+
+    Args:
+        queryset (QuerySet): QuerySet of objects with "period" field, f.e. Transfers.
+        periods (list[dict[str, Any]]): Periods data containing "pk" key, in chart order.
+        series_field (str): Name of field identifying series, f.e. "category_id" or "deposit_id".
+        series_ids (Iterable[int]): IDs of series objects, in chart order.
+        aggregate (Aggregate | None): Aggregate calculated for each cell. Sum of "value" field by default.
+
+    Returns:
+        list[list[float]]: Array of results, where array[series_index][period_index] contains value for
+        series and period on given positions. Cells without any matching objects are filled with 0.0.
+    """
+    periods_indexes = {period["pk"]: index for index, period in enumerate(periods)}
+    series_indexes = {series_id: index for index, series_id in enumerate(series_ids)}
+    pivot = [[0.0] * len(periods_indexes) for _ in series_indexes]
+    if not periods_indexes or not series_indexes:
+        return pivot
+    cells = (
+        queryset.filter(period_id__in=periods_indexes.keys(), **{f"{series_field}__in": series_indexes.keys()})
+        .order_by()
+        .values_list("period_id", series_field)
+        .annotate(result=aggregate or Sum("value"))
+    )
+    for period_id, series_id, result in cells:
+        pivot[series_indexes[series_id]][periods_indexes[period_id]] = float(result)
+    return pivot
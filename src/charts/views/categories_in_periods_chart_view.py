@@ -1,18 +1,18 @@
-from functools import partial
 from typing import Any
 
-from django.db.models import DecimalField, F, Sum, Value
-from django.db.models.functions import Coalesce
+from django.db.models import F
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.wallet_response_cache_service import cache_wallet_response
 from categories.models import TransferCategory
 from categories.models.choices.category_type import CategoryType
+from charts.services.periods_pivot_service import get_periods_pivot
 from charts.views.utils import generate_rgba_value, get_periods
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
 
 def get_categories(wallet_pk: int, category_id: str, category_type: str, deposit_id: str) -> list[dict[str, Any]]:
@@ -49,59 +49,28 @@ def get_categories(wallet_pk: int, category_id: str, category_type: str, deposit
 
 
 def get_chart_data(
-    categories: list[dict[str, Any]], all_categories_results: list[dict[str, Any]], category_type: CategoryType | None
+    categories: list[dict[str, Any]], categories_results: list[list[float]], category_type: CategoryType | None
 ) -> list[dict[str, Any]]:
     """
     Coverts categories balances date to MUI charts format.
 
     Args:
         categories (list[dict[str, Any]]): Categories data.
-        all_categories_results(list[dict[str, Any]]): All Categories results in periods.
+        categories_results (list[list[float]]): Categories results in periods indexed by category and period
+            positions.
         category_type (CategoryType|None): CategoryType (Expense or Income).
     Returns:
         list[dict[str, Any]]: Formatted categories balances in periods.
     """
     categories_count = len(categories)
-    series_data = []
-    for idx, category in enumerate(categories):
-        category_id = category["pk"]
-        category_results = [item["results"] for item in all_categories_results if item["category_id"] == category_id]
-        series_data.append(
-            {
-                "label": f'({category["deposit_name"]}) {category["name"]}',
-                "data": category_results,
-                "color": generate_rgba_value(idx, categories_count, category_type),
-            }
-        )
-    return series_data
-
-
-def get_categories_transfers_sums_in_period(
-    wallet_pk: int, categories_ids: list[int], period: dict
-) -> dict[int, float]:
-    """
-    Calculates passed transfer categories sum of specified in given period.
-
-    Args:
-        wallet_pk (int): Primary key of the wallet to filter categories for
-        categories_ids (list[int]): List of TransferCategory IDs
-        period (dict): Period data
-
-    Returns:
-        dict[int, float]: Dict containing category id as a key and category result as the value.
-    """
-    period_results = (
-        Transfer.objects.filter(category_id__in=categories_ids, period__wallet_id=wallet_pk, period_id=period["pk"])
-        .values("category_id")
-        .annotate(
-            result=Coalesce(
-                Sum("value"),
-                Value(0, output_field=DecimalField(max_digits=10, decimal_places=2)),
-            )
-        )
-    )
-
-    return {item["category_id"]: float(item["result"]) for item in period_results}
+    return [
+        {
+            "label": f'({category["deposit_name"]}) {category["name"]}',
+            "data": category_results,
+            "color": generate_rgba_value(idx, categories_count, category_type),
+        }
+        for idx, (category, category_results) in enumerate(zip(categories, categories_results))
+    ]
 
 
 class CategoriesInPeriodsChartAPIView(APIView):
@@ -129,6 +98,7 @@ class CategoriesInPeriodsChartAPIView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @cache_wallet_response()
     def get(self, request: Request, wallet_pk: int, **kwargs: dict[str, Any]) -> Response:
         """
         Handle GET requests for category balance results.
@@ -160,31 +130,15 @@ class CategoriesInPeriodsChartAPIView(APIView):
         )
         if not categories:
             return Response({"xAxis": [], "series": []})
-        # Prepare service for chart data generation
-        chart_data_service = partial(
-            get_categories_transfers_sums_in_period,
-            wallet_pk=wallet_pk,
-            categories_ids=[category["pk"] for category in categories],
-        )
-
         # Get chart data
-        formatted_categories_results: list[dict[str, Any]] = []
-
-        for period in periods:
-            all_categories_results: dict[int, float] = chart_data_service(period=period)
-            for category in categories:
-                category_results = all_categories_results.get(category["pk"], 0.0)
-                formatted_categories_results.append(
-                    {
-                        "category_id": category["pk"],
-                        "category_name": category["name"],
-                        "period_name": period["name"],
-                        "results": category_results,
-                    }
-                )
-
+        categories_results = get_periods_pivot(
+            queryset=get_transfer_aggregate_model().objects.filter(wallet_id=wallet_pk),
+            periods=periods,
+            series_field="category_id",
+            series_ids=[category["pk"] for category in categories],
+        )
         series_data: list[dict[str, Any]] = get_chart_data(
-            categories=categories, all_categories_results=formatted_categories_results, category_type=category_type
+            categories=categories, categories_results=categories_results, category_type=category_type
         )
 
         return Response({"xAxis": [period["name"] for period in periods], "series": series_data})
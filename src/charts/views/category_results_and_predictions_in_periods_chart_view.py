@@ -9,9 +9,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.wallet_response_cache_service import cache_wallet_response
 from periods.models import Period
 from predictions.models import ExpensePrediction
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
 
 class DisplayValueChoices(Enum):
@@ -30,7 +31,8 @@ def get_period_transfers_sum_in_category(category_id: str) -> Coalesce:
     """
     return Coalesce(
         Subquery(
-            Transfer.objects.filter(Q(period_id=OuterRef("id"), category_id=category_id))
+            get_transfer_aggregate_model()
+            .objects.filter(Q(period_id=OuterRef("id"), category_id=category_id))
             .values("period")
             .annotate(total=Sum("value"))
             .values("total")[:1],
@@ -81,6 +83,7 @@ class CategoryResultsAndPredictionsInPeriodsChartApiView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @cache_wallet_response()
     def get(self, request: Request, wallet_pk: int) -> Response:
         """
         Handle GET requests for Period Transfers chart data.
@@ -1,40 +1,63 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
 from django.db.models import Case, DecimalField, F, Sum, Value, When
-from django.db.models.functions import Coalesce
 
 from categories.models.choices.category_type import CategoryType
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
 
-def get_deposits_balance_in_period(wallet_pk: int, deposit_ids: list[int], period: dict) -> dict[int, float]:
+def get_deposits_balances_in_periods(wallet_pk: int, deposit_ids: list[int], periods: list[dict]) -> list[list[float]]:
     """
-    Calculates passed deposits balances at the end of period.
+    Calculates passed deposits balances at the end of each of given periods with single query.
+    Net flows are grouped by deposit and period end date in database and accumulated with prefix sums.
 
     Args:
         wallet_pk (int): Primary key of the wallet to filter deposits for
         deposit_ids (list[int]): List of deposit IDs
-        period (dict): Period data
+        periods (list[dict]): Periods data containing "date_end" key
 
     Returns:
-        dict[int, float]: Dict containing deposit id as a key and deposit balance as the value.
+        list[list[float]]: Array of balances, where array[deposit_index][period_index] contains balance of deposit
+        at the end of period on given positions.
     """
-    period_balances = (
-        Transfer.objects.filter(
-            deposit_id__in=deposit_ids, period__wallet_id=wallet_pk, period__date_end__lte=period["date_end"]
+    if not deposit_ids or not periods:
+        return [[0.0] * len(periods) for _ in deposit_ids]
+    flows = (
+        get_transfer_aggregate_model()
+        .objects.filter(
+            deposit_id__in=deposit_ids,
+            wallet_id=wallet_pk,
+            period__date_end__lte=max(period["date_end"] for period in periods),
         )
-        .values("deposit_id")
+        .values_list("deposit_id", "period__date_end")
         .annotate(
-            balance=Coalesce(
-                Sum(
-                    Case(
-                        When(transfer_type=CategoryType.INCOME, then=F("value")),
-                        When(transfer_type=CategoryType.EXPENSE, then=-F("value")),
-                        default=Value(0),
-                        output_field=DecimalField(max_digits=10, decimal_places=2),
-                    )
-                ),
-                Value(0, output_field=DecimalField(max_digits=10, decimal_places=2)),
+            flow=Sum(
+                Case(
+                    When(transfer_type=CategoryType.INCOME, then=F("value")),
+                    When(transfer_type=CategoryType.EXPENSE, then=-F("value")),
+                    default=Value(0),
+                    output_field=DecimalField(max_digits=10, decimal_places=2),
+                )
             )
         )
+        .order_by("period__date_end")
     )
+    deposits_dates: dict[int, list[date]] = defaultdict(list)
+    deposits_balances: dict[int, list[Decimal]] = defaultdict(list)
+    for deposit_id, date_end, flow in flows:
+        balances = deposits_balances[deposit_id]
+        deposits_dates[deposit_id].append(date_end)
+        balances.append(balances[-1] + flow if balances else flow)
 
-    return {item["deposit_id"]: float(item["balance"]) for item in period_balances}
+    results = []
+    for deposit_id in deposit_ids:
+        dates, balances = deposits_dates[deposit_id], deposits_balances[deposit_id]
+        deposit_results = []
+        for period in periods:
+            balance_index = bisect_right(dates, period["date_end"])
+            deposit_results.append(float(balances[balance_index - 1]) if balance_index else 0.0)
+        results.append(deposit_results)
+    return results
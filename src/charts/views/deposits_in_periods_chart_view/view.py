@@ -1,4 +1,3 @@
-from functools import partial
 from typing import Any
 
 from rest_framework.permissions import IsAuthenticated
@@ -7,15 +6,15 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.wallet_response_cache_service import cache_wallet_response
 from categories.models.choices.category_type import CategoryType
+from charts.services.periods_pivot_service import get_periods_pivot
 from charts.views.deposits_in_periods_chart_view.services.deposits_balances_service import (
-    get_deposits_balance_in_period,
-)
-from charts.views.deposits_in_periods_chart_view.services.deposits_transfers_sums_service import (
-    get_deposits_transfers_sums_in_period,
+    get_deposits_balances_in_periods,
 )
 from charts.views.utils import generate_rgba_value, get_periods
 from entities.models import Deposit
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
 
 def get_deposits(wallet_pk: int, deposit_id: str) -> list[dict[str, Any]]:
@@ -41,31 +40,27 @@ def get_deposits(wallet_pk: int, deposit_id: str) -> list[dict[str, Any]]:
 
 
 def get_chart_data(
-    deposits: list[dict[str, Any]], all_deposits_results: list[dict[str, Any]], display_value: CategoryType | None
+    deposits: list[dict[str, Any]], deposits_results: list[list[float]], display_value: CategoryType | None
 ) -> list[dict[str, Any]]:
     """
     Coverts deposits balances date to MUI charts format.
 
     Args:
         deposits (list[dict[str, Any]]): Deposits data.
-        all_deposits_results(list[dict[str, Any]]): All Deposits results in periods.
+        deposits_results (list[list[float]]): Deposits results in periods indexed by deposit and period positions.
         display_value (CategoryType|None): Type of value to display on chart.
     Returns:
         list[dict[str, Any]]: Formatted deposits balances in periods.
     """
     deposits_count = len(deposits)
-    series_data = []
-    for idx, deposit in enumerate(deposits):
-        deposit_id = deposit["pk"]
-        deposit_results = [item["results"] for item in all_deposits_results if item["deposit_id"] == deposit_id]
-        series_data.append(
-            {
-                "label": deposit["name"],
-                "data": deposit_results,
-                "color": generate_rgba_value(idx, deposits_count, display_value),
-            }
-        )
-    return series_data
+    return [
+        {
+            "label": deposit["name"],
+            "data": deposit_results,
+            "color": generate_rgba_value(idx, deposits_count, display_value),
+        }
+        for idx, (deposit, deposit_results) in enumerate(zip(deposits, deposits_results))
+    ]
 
 
 class DepositsInPeriodsChartAPIView(APIView):
@@ -92,6 +87,7 @@ class DepositsInPeriodsChartAPIView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @cache_wallet_response()
     def get(self, request: Request, wallet_pk: int, **kwargs: dict[str, Any]) -> Response:
         """
         Handle GET requests for deposit balance results.
@@ -117,36 +113,24 @@ class DepositsInPeriodsChartAPIView(APIView):
         deposits = get_deposits(wallet_pk=wallet_pk, deposit_id=request.query_params.get("deposit"))
         if not deposits:
             return Response({"xAxis": [], "series": []})
-        # Select proper service chart data generation
+        # Get chart data
         deposits_ids = [deposit["pk"] for deposit in deposits]
         if display_value := request.query_params.get("display_value"):
-            chart_data_service = partial(
-                get_deposits_transfers_sums_in_period,
-                wallet_pk=wallet_pk,
-                deposit_ids=deposits_ids,
-                transfer_type=display_value,
+            deposits_results = get_periods_pivot(
+                queryset=get_transfer_aggregate_model().objects.filter(
+                    wallet_id=wallet_pk, transfer_type=display_value
+                ),
+                periods=periods,
+                series_field="deposit_id",
+                series_ids=deposits_ids,
             )
         else:
-            chart_data_service = partial(get_deposits_balance_in_period, wallet_pk=wallet_pk, deposit_ids=deposits_ids)
-
-        # Get chart data
-        formatted_deposits_results: list[dict[str, Any]] = []
-
-        for period in periods:
-            all_deposits_results: dict[int, float] = chart_data_service(period=period)
-            for deposit in deposits:
-                deposit_results = all_deposits_results.get(deposit["pk"], 0.0)
-                formatted_deposits_results.append(
-                    {
-                        "deposit_id": deposit["pk"],
-                        "deposit_name": deposit["name"],
-                        "period_name": period["name"],
-                        "results": deposit_results,
-                    }
-                )
+            deposits_results = get_deposits_balances_in_periods(
+                wallet_pk=wallet_pk, deposit_ids=deposits_ids, periods=periods
+            )
 
         series_data: list[dict[str, Any]] = get_chart_data(
-            deposits=deposits, all_deposits_results=formatted_deposits_results, display_value=display_value
+            deposits=deposits, deposits_results=deposits_results, display_value=display_value
         )
 
         return Response({"xAxis": [period["name"] for period in periods], "series": series_data})
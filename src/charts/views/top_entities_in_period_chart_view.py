@@ -6,9 +6,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.wallet_response_cache_service import cache_wallet_response
 from categories.models.choices.category_type import CategoryType
 from entities.models import Entity
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
 
 def get_entity_period_transfers_sum(
@@ -29,7 +30,8 @@ def get_entity_period_transfers_sum(
         queryset_kwargs["deposit_id"] = deposit_id
     return Coalesce(
         Subquery(
-            Transfer.objects.filter(Q(entity_id=OuterRef("id"), **queryset_kwargs))
+            get_transfer_aggregate_model()
+            .objects.filter(Q(entity_id=OuterRef("id"), **queryset_kwargs))
             .values("entity")
             .annotate(total=Sum("value"))
             .values("total")[:1],
@@ -55,6 +57,7 @@ class TopEntitiesInPeriodChartAPIView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @cache_wallet_response()
     def get(self, request: Request, wallet_pk: int) -> Response:
         """
         Handle GET requests for Period Transfers chart data.
@@ -8,9 +8,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.wallet_response_cache_service import cache_wallet_response
 from categories.models.choices.category_type import CategoryType
 from periods.models import Period
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
 
 def get_period_transfers_sum(
@@ -33,7 +34,8 @@ def get_period_transfers_sum(
         transfer_kwargs["entity_id"] = entity_id
     return Coalesce(
         Subquery(
-            Transfer.objects.filter(Q(period_id=OuterRef("id"), **transfer_kwargs))
+            get_transfer_aggregate_model()
+            .objects.filter(Q(period_id=OuterRef("id"), **transfer_kwargs))
             .values("period")
             .annotate(total=Sum("value"))
             .values("total")[:1],
@@ -60,6 +62,7 @@ class TransfersInPeriodsChartApiView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @cache_wallet_response()
     def get(self, request: Request, wallet_pk: int) -> Response:
         """
         Handle GET requests for Period Transfers chart data.
@@ -1,11 +1,14 @@
 from django_filters import rest_framework as filters
 
+from app_infrastructure.filters import TextSearchFilter
+
 
 class DepositFilterSet(filters.FilterSet):
     """FilterSet for Deposit endpoint."""
 
     name = filters.CharFilter(lookup_expr="icontains", field_name="name")
     description = filters.CharFilter(lookup_expr="icontains", field_name="description")
+    search = TextSearchFilter(search_fields=("name", "description"))
     is_active = filters.BooleanFilter(field_name="is_active")
     balance = filters.NumberFilter()
     balance_min = filters.NumberFilter(field_name="balance", lookup_expr="gte")
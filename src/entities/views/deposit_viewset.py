@@ -1,7 +1,7 @@
 from decimal import Decimal
 
 from django.db import transaction
-from django.db.models import Case, DecimalField, F, Func, OuterRef, Q, QuerySet, Subquery, Sum, Value, When
+from django.db.models import Case, DecimalField, F, Func, Q, QuerySet, Subquery, Sum, Value, When
 from django.db.models.functions import Coalesce
 from django_filters import rest_framework as filters
 from rest_framework.filters import OrderingFilter
@@ -15,23 +15,26 @@ from entities.models.deposit_model import Deposit
 from entities.serializers.deposit_serializer import DepositSerializer
 from periods.models import Period
 from predictions.models import ExpensePrediction
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model, is_transfer_rollups_enabled
 
 
-def get_wallet_transfers_sum(transfer_type: CategoryType) -> Func:
+def get_wallet_transfers_sum(transfer_type: CategoryType, wallet_pk: int) -> Func:
     """
-    Function for calculate Transfers values sum in Wallet.
+    Function for calculate Transfers values sum in Wallet. Subquery is not correlated with Deposits, so it is
+    calculated once, even if it lands in GROUP BY clause of Deposits aggregation.
 
     Args:
         transfer_type (CategoryType): Transfer type.
+        wallet_pk (int): Wallet ID.
 
     Returns:
         Func: ORM function returning Sum of Wallet Transfers values for specified Transfer Type.
     """
     return Coalesce(
         Subquery(
-            Transfer.objects.filter(transfer_type=transfer_type, period__wallet__pk=OuterRef("wallet__pk"))
-            .values("period__wallet")
+            get_transfer_aggregate_model()
+            .objects.filter(transfer_type=transfer_type, wallet__pk=wallet_pk)
+            .values("wallet")
             .annotate(total=Sum("value"))
             .values("total")[:1],
             output_field=DecimalField(decimal_places=2),
@@ -51,10 +54,11 @@ def sum_deposit_transfers(transfer_type: CategoryType) -> Func:
     Returns:
         Func: ORM function returning Sum of Deposit Transfers values for specified CategoryType.
     """
+    relation = "deposit_transfer_rollups" if is_transfer_rollups_enabled() else "deposit_transfers"
     return Coalesce(
         Sum(
-            "deposit_transfers__value",
-            filter=Q(deposit_transfers__transfer_type=transfer_type),
+            f"{relation}__value",
+            filter=Q(**{f"{relation}__transfer_type": transfer_type}),
             output_field=DecimalField(decimal_places=2),
         ),
         Value(0),
@@ -132,8 +136,8 @@ class DepositViewSet(ModelViewSet):
             )
         if any(key in fields for key in ("wallet_balance", "wallet_percentage")):
             qs = qs.annotate(
-                wallet_incomes_sum=get_wallet_transfers_sum(CategoryType.INCOME),
-                wallet_expenses_sum=get_wallet_transfers_sum(CategoryType.EXPENSE),
+                wallet_incomes_sum=get_wallet_transfers_sum(CategoryType.INCOME, self.kwargs.get("wallet_pk")),
+                wallet_expenses_sum=get_wallet_transfers_sum(CategoryType.EXPENSE, self.kwargs.get("wallet_pk")),
             ).annotate(
                 wallet_balance=get_wallet_balance(),
             )
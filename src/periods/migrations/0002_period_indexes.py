@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('periods', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='period',
+            index=models.Index(fields=['wallet', 'date_start', 'date_end'], name='period_wallet_dates_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('periods', '0002_period_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='period',
+            constraint=models.UniqueConstraint(fields=('id', 'wallet'), name='period_id_wallet_unique'),
+        ),
+    ]
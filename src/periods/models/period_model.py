@@ -25,6 +25,11 @@ class Period(models.Model):
             "name",
             "wallet",
         )
+        indexes = (models.Index(fields=("wallet", "date_start", "date_end"), name="period_wallet_dates_idx"),)
+        constraints = (
+            # Target of (period_id, wallet_id) foreign key of Transfer, keeping Transfer wallet equal to Period one.
+            models.UniqueConstraint(fields=("id", "wallet"), name="period_id_wallet_unique"),
+        )
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,89 @@
+import logging
+import time
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.db import connection, transaction
+from django.db.models import DecimalField, Exists, F, IntegerField, OuterRef, Q, Value
+
+from app_infrastructure.signals import wallet_data_changed
+from categories.models import TransferCategory
+from categories.models.choices.category_type import CategoryType
+from predictions.models import ExpensePrediction
+from predictions.services.prediction_result_service import refresh_prediction_results
+
+logger = logging.getLogger("default")
+
+
+class PeriodActivationResult(NamedTuple):
+    """Summary of preparing ExpensePredictions on Period activation."""
+
+    initial_plans_count: int
+    created_predictions_count: int
+    duration: float
+
+
+def prepare_predictions_on_period_activation(wallet_pk: int | str, period_pk: int | str) -> PeriodActivationResult:
+    """
+    Prepares ExpensePredictions of activated Period in single transaction with two set-based statements:
+    UPDATE setting initial_plan of Period ExpensePredictions to their current_plan and INSERT ... SELECT ...
+    ON CONFLICT DO NOTHING creating zero ExpensePredictions for Wallet expense TransferCategories not predicted
+    in Period yet, which current_result is calculated afterwards. All statements are restricted to given Wallet,
+    so their cost does not depend on number of other Wallets.
+
+    Args:
+        wallet_pk (int | str): Wallet ID.
+        period_pk (int | str): Period ID.
+
+    Returns:
+        PeriodActivationResult: Numbers of updated and created ExpensePredictions and duration in seconds.
+    """
+    start = time.perf_counter()
+    if not all((wallet_pk, period_pk)):
+        return PeriodActivationResult(initial_plans_count=0, created_predictions_count=0, duration=0.0)
+    wallet_pk, period_pk = int(wallet_pk), int(period_pk)
+    plan_value = Value(Decimal("0.00"), output_field=DecimalField(max_digits=10, decimal_places=2))
+    source_sql, source_params = (
+        TransferCategory.objects.filter(wallet_id=wallet_pk, category_type=CategoryType.EXPENSE)
+        .exclude(Exists(ExpensePrediction.objects.filter(period_id=period_pk, category_id=OuterRef("pk"))))
+        .order_by("id")
+        # Only annotations selected, as Django orders them before model fields in SELECT clause.
+        .values(
+            prediction_period_id=Value(period_pk, output_field=IntegerField()),
+            prediction_deposit_id=F("deposit_id"),
+            prediction_category_id=F("id"),
+            prediction_initial_plan=plan_value,
+            prediction_current_plan=plan_value,
+            prediction_current_result=plan_value,
+        )
+        .query.sql_with_params()
+    )
+    table = ExpensePrediction._meta.db_table
+    sql = f"""
+        INSERT INTO {table} (period_id, deposit_id, category_id, initial_plan, current_plan, current_result)
+        {source_sql}
+        ON CONFLICT (period_id, category_id, deposit_id) DO NOTHING
+    """
+    with transaction.atomic():
+        # Base manager skips wallet_data_changed signal of ExpensePredictionQuerySet, sent once below.
+        initial_plans_count = ExpensePrediction._base_manager.filter(
+            period_id=period_pk, period__wallet_id=wallet_pk, initial_plan__isnull=True
+        ).update(initial_plan=F("current_plan"))
+        with connection.cursor() as cursor:
+            cursor.execute(sql, source_params)
+            created_predictions_count = cursor.rowcount
+        if created_predictions_count:
+            refresh_prediction_results(Q(period_id=period_pk, current_plan=0))
+    if initial_plans_count or created_predictions_count:
+        wallet_data_changed.send(sender=ExpensePrediction, wallet_ids={wallet_pk})
+    result = PeriodActivationResult(
+        initial_plans_count=initial_plans_count,
+        created_predictions_count=created_predictions_count,
+        duration=time.perf_counter() - start,
+    )
+    logger.info(
+        f"ExpensePredictions prepared on Period activation | Wallet ID: {wallet_pk} | Period ID: {period_pk} | "
+        f"Initial plans set: {result.initial_plans_count} | Zero predictions created: "
+        f"{result.created_predictions_count} | Duration: {result.duration * 1000:.1f} ms"
+    )
+    return result
@@ -0,0 +1,151 @@
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date
+from functools import partial
+from operator import attrgetter
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from periods.models import Period
+
+WALLET_PERIODS_VERSION_KEY = "wallet_periods_version:{wallet_pk}"
+PERIOD_INDEXES_MAX_SIZE = 1024
+
+# Process level cache of PeriodIndexes by Wallet ID, stored with Wallet Periods version they were built for.
+_period_indexes: OrderedDict[int, tuple[int, "PeriodIndex"]] = OrderedDict()
+
+
+class PeriodIndex:
+    """
+    Sorted interval index of Wallet Periods, resolving date to Period containing it with binary search
+    over Periods start dates. Periods of single Wallet do not overlap, so Period containing date is the last one
+    starting not later than date. Indexed Periods are shared between requests and should not be modified.
+
+    Args:
+        periods (Iterable[Period]): Periods of single Wallet.
+    """
+
+    def __init__(self, periods: Iterable[Period]):
+        self.periods = sorted(periods, key=attrgetter("date_start"))
+        self.periods_starts = [period.date_start for period in self.periods]
+
+    def __len__(self) -> int:
+        """
+        Returns number of indexed Periods.
+
+        Returns:
+            int: Number of Periods.
+        """
+        return len(self.periods)
+
+    def get_period(self, period_date: date) -> Period | None:
+        """
+        Finds Period containing given date.
+
+        Args:
+            period_date (date): Searched date.
+
+        Returns:
+            Period | None: Period containing given date or None if there is no such Period.
+        """
+        index = bisect_right(self.periods_starts, period_date) - 1
+        if index >= 0 and period_date <= self.periods[index].date_end:
+            return self.periods[index]
+        return None
+
+
+def get_wallet_periods_version(wallet_pk: int) -> int:
+    """
+    Returns current version of Wallet Periods. Missing version is initialized with current timestamp, so evicted
+    version never starts again from value used by already built PeriodIndexes.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+
+    Returns:
+        int: Wallet Periods version.
+    """
+    key = WALLET_PERIODS_VERSION_KEY.format(wallet_pk=wallet_pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _increment_wallet_periods_version(wallet_pk: int) -> None:
+    """
+    Increments version of Wallet Periods in cache.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+    """
+    key = WALLET_PERIODS_VERSION_KEY.format(wallet_pk=wallet_pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def bump_wallet_periods_version(wallet_pk: int) -> None:
+    """
+    Bumps version of Wallet Periods, which invalidates PeriodIndexes of Wallet in all processes sharing cache
+    backend. Version is bumped immediately and once again after transaction commit, so indexes built by concurrent
+    requests with uncommitted state are invalidated as well.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+    """
+    if wallet_pk is None:
+        return
+    _increment_wallet_periods_version(wallet_pk)
+    transaction.on_commit(partial(_increment_wallet_periods_version, wallet_pk))
+
+
+def _store_period_index(wallet_pk: int, version: int, period_index: PeriodIndex) -> None:
+    """
+    Stores PeriodIndex in process level cache, removing least recently used index on exceeded size.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+        version (int): Wallet Periods version, which index was built for.
+        period_index (PeriodIndex): Stored PeriodIndex.
+    """
+    _period_indexes[wallet_pk] = (version, period_index)
+    _period_indexes.move_to_end(wallet_pk)
+    while len(_period_indexes) > PERIOD_INDEXES_MAX_SIZE:
+        _period_indexes.popitem(last=False)
+
+
+def get_period_index(wallet_pk: int) -> PeriodIndex:
+    """
+    Returns PeriodIndex of Wallet from process level cache, if it was built for current Wallet Periods version.
+    Otherwise, Wallet Periods are fetched with single query. Built index is cached after transaction commit only,
+    so Periods rolled back with transaction never get into cache. Process level cache is used only with shared
+    cache backend, as versions bumped in process local cache never reach other processes.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+
+    Returns:
+        PeriodIndex: PeriodIndex of Wallet.
+    """
+    wallet_pk = int(wallet_pk)
+    if not settings.SHARED_CACHE_CONFIGURED:
+        return PeriodIndex(Period.objects.filter(wallet__pk=wallet_pk))
+    version = get_wallet_periods_version(wallet_pk)
+    cached = _period_indexes.get(wallet_pk)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    period_index = PeriodIndex(Period.objects.filter(wallet__pk=wallet_pk))
+    transaction.on_commit(partial(_store_period_index, wallet_pk, version, period_index))
+    return period_index
+
+
+def clear_period_indexes() -> None:
+    """Removes all PeriodIndexes from process level cache."""
+    _period_indexes.clear()
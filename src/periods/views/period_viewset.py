@@ -1,7 +1,7 @@
 from decimal import Decimal
 
 from django.db import transaction
-from django.db.models import DecimalField, F, Func, Q, QuerySet, Sum, Value
+from django.db.models import DecimalField, Func, Q, QuerySet, Sum, Value
 from django.db.models.functions import Coalesce
 from django_filters import rest_framework as filters
 from rest_framework.filters import OrderingFilter
@@ -11,14 +11,16 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
-from categories.models import TransferCategory
 from categories.models.choices.category_type import CategoryType
 from entities.models import Deposit
 from periods.filtersets.period_filterset import PeriodFilterSet
 from periods.models import Period
 from periods.models.choices.period_status import PeriodStatus
 from periods.serializers.period_serializer import PeriodSerializer
+from periods.services.period_activation_service import prepare_predictions_on_period_activation
 from predictions.models import ExpensePrediction
+from transfers.services.recurring_transfer_service import materialize_recurring_transfers
+from transfers.services.transfer_rollup_service import is_transfer_rollups_enabled
 
 
 def sum_period_transfers(transfer_type: CategoryType) -> Func:
@@ -31,10 +33,11 @@ def sum_period_transfers(transfer_type: CategoryType) -> Func:
     Returns:
         Func: ORM function returning Sum of Period Transfers values for specified CategoryType.
     """
+    relation = "transfer_rollups" if is_transfer_rollups_enabled() else "transfers"
     return Coalesce(
         Sum(
-            "transfers__value",
-            filter=Q(transfers__transfer_type=transfer_type),
+            f"{relation}__value",
+            filter=Q(**{f"{relation}__transfer_type": transfer_type}),
             output_field=DecimalField(decimal_places=2),
         ),
         Value(0),
@@ -42,43 +45,6 @@ def sum_period_transfers(transfer_type: CategoryType) -> Func:
     )
 
 
-def prepare_predictions_on_period_activation(wallet_pk: str, period_pk: str) -> None:
-    """
-    Function for updating ExpensePrediction data on Period activation.
-
-    Args:
-        wallet_pk (str): Wallet ID.
-        period_pk (str): Period ID.
-    """
-    if not all((wallet_pk, period_pk)):
-        return
-    # Set initial_value for predictions create by User
-    ExpensePrediction.objects.filter(period__id=period_pk, initial_plan__isnull=True).update(
-        initial_plan=F("current_plan")
-    )
-    # Create predictions with 0 value for not predicted categories
-    predicted_categories_ids = ExpensePrediction.objects.filter(
-        period__id=period_pk, period__wallet__id=wallet_pk, category__isnull=False
-    ).values_list("category", flat=True)
-
-    unpredicted_categories = TransferCategory.objects.filter(
-        ~Q(id__in=predicted_categories_ids),
-        category_type=CategoryType.EXPENSE,
-    ).values_list("id", "deposit")
-
-    zero_predictions = [
-        ExpensePrediction(
-            period_id=period_pk,
-            deposit_id=deposit_id,
-            category_id=category_id,
-            initial_plan=Decimal("0.00"),
-            current_plan=Decimal("0.00"),
-        )
-        for category_id, deposit_id in unpredicted_categories
-    ]
-    ExpensePrediction.objects.bulk_create(zero_predictions)
-
-
 class PeriodViewSet(ModelViewSet):
     """View for manage Periods."""
 
@@ -112,14 +78,15 @@ class PeriodViewSet(ModelViewSet):
 
     def perform_create(self, serializer: PeriodSerializer) -> None:
         """
-        Extended with saving Wallet in Period model.
+        Extended with saving Wallet in Period model and with materializing Wallet RecurringTransfers occurrences
+        due in created Period.
 
         Args:
             serializer [PeriodSerializer]: Serializer for Period
         """
         wallet_pk = self.kwargs.get("wallet_pk")
         with transaction.atomic():
-            period = serializer.save(wallet_id=wallet_pk)
+            period = serializer.save(wallet_id=int(wallet_pk))
             ExpensePrediction.objects.bulk_create(
                 ExpensePrediction(
                     deposit_id=deposit_id,
@@ -130,6 +97,7 @@ class PeriodViewSet(ModelViewSet):
                 )
                 for deposit_id in Deposit.objects.filter(wallet_id=wallet_pk).values_list("id", flat=True)
             )
+            materialize_recurring_transfers([period])
 
     def update(self, request: Request, *args: list, **kwargs: dict) -> Response:
         """
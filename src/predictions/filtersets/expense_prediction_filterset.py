@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from django.db.models import F, QuerySet
+from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
 from categories.models import TransferCategory
@@ -38,7 +38,9 @@ class ExpensePredictionFilterSet(filters.FilterSet):
     @staticmethod
     def filter_by_progress_status(queryset: QuerySet, name: str, value: Decimal) -> QuerySet:
         """
-        Filters ExpensePredictions queryset by Transfer Category progress_status field value.
+        Filters ExpensePredictions queryset by Transfer Category progress_status field value. Conditions use
+        persisted current_result and current_funds_left expression covered by "prediction_funds_left_idx"
+        index.
 
         Args:
             queryset [QuerySet]: Input QuerySet
@@ -50,9 +52,9 @@ class ExpensePredictionFilterSet(filters.FilterSet):
         """
         match int(value):
             case PredictionProgressStatus.NOT_USED.value:
-                return queryset.filter(current_funds_left=F("current_plan"))
+                return queryset.filter(current_result=0)
             case PredictionProgressStatus.IN_PLANNED_RANGE.value:
-                return queryset.filter(current_funds_left__gt=0, current_funds_left__lt=F("current_plan"))
+                return queryset.filter(current_funds_left__gt=0, current_result__gt=0)
             case PredictionProgressStatus.FULLY_UTILIZED.value:
                 return queryset.filter(current_funds_left=0)
             case PredictionProgressStatus.OVERUSED.value:
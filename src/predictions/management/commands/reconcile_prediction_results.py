@@ -0,0 +1,41 @@
+"""
+Django command to verify and repair persisted current_result of ExpensePredictions.
+"""
+
+from django.core.management.base import BaseCommand
+
+from predictions.services.prediction_result_service import get_prediction_results_drift, repair_prediction_results
+
+
+class Command(BaseCommand):
+    """Django command to compare persisted ExpensePredictions results with Transfers and repair drifted ones."""
+
+    help = "Compares persisted current_result of ExpensePredictions with Transfers sums and repairs differences."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wallet", type=int, default=None, help="ID of Wallet to reconcile predictions for.")
+        parser.add_argument("--fix", action="store_true", help="Repair drifted predictions results.")
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        wallet_id = options["wallet"]
+        self.stdout.write(
+            "Reconciling prediction results for all Wallets..."
+            if wallet_id is None
+            else f"Reconciling prediction results for Wallet {wallet_id}..."
+        )
+        drifts = get_prediction_results_drift(wallet_id=wallet_id)
+        for drift in drifts:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"ExpensePrediction {drift.prediction_id}: persisted result {drift.current_result}, "
+                    f"actual result {drift.actual_result}."
+                )
+            )
+        if not drifts:
+            self.stdout.write(self.style.SUCCESS("Prediction results consistent."))
+        elif options["fix"]:
+            repaired_count = repair_prediction_results([drift.prediction_id for drift in drifts])
+            self.stdout.write(self.style.SUCCESS(f"Prediction results repaired: {repaired_count}."))
+        else:
+            self.stdout.write(self.style.ERROR(f"Drifted prediction results: {len(drifts)}. Run with --fix to repair."))
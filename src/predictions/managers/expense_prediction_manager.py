@@ -0,0 +1,88 @@
+from typing import Iterable
+
+from django.db import models
+from django.db.models import Q, QuerySet
+
+from app_infrastructure.signals import wallet_data_changed
+
+RESULT_KEY_FIELDS = ("period", "period_id", "deposit", "deposit_id", "category", "category_id")
+
+
+class ExpensePredictionQuerySet(QuerySet):
+    """
+    Custom ExpensePredictionQuerySet notifying about changed Wallets on bulk ExpensePredictions operations and
+    keeping persisted current_result of created or moved ExpensePredictions up to date.
+    """
+
+    def _get_wallets_ids(self) -> set[int]:
+        """
+        Returns IDs of Wallets of ExpensePredictions in QuerySet.
+
+        Returns:
+            set[int]: Wallets IDs.
+        """
+        return set(self.order_by().values_list("period__wallet_id", flat=True).distinct())
+
+    def bulk_create(self, objs: Iterable, *args, **kwargs) -> list:
+        """
+        Extends bulk_create with calculating current_result of created ExpensePredictions with single query
+        and sending wallet_data_changed signal for their Wallets.
+
+        Args:
+            objs (Iterable): ExpensePrediction instances to create.
+
+        Returns:
+            list: Created ExpensePrediction instances.
+        """
+        from predictions.services.prediction_result_service import refresh_prediction_results
+
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if objs:
+            refresh_prediction_results(
+                Q(period_id__in={obj.period_id for obj in objs}, deposit_id__in={obj.deposit_id for obj in objs})
+            )
+            period_model = self.model._meta.get_field("period").related_model
+            wallet_data_changed.send(
+                sender=self.model,
+                wallet_ids=set(
+                    period_model.objects.filter(pk__in={obj.period_id for obj in objs}).values_list(
+                        "wallet_id", flat=True
+                    )
+                ),
+            )
+        return objs
+
+    def update(self, **kwargs) -> int:
+        """
+        Extends update with sending wallet_data_changed signal for Wallets of updated ExpensePredictions
+        and with recalculating their current_result, when they are moved to other Period, Deposit
+        or TransferCategory.
+
+        Returns:
+            int: Number of affected database rows.
+        """
+        from predictions.services.prediction_result_service import refresh_prediction_results
+
+        wallet_ids = self._get_wallets_ids()
+        moved_ids = list(self.values_list("id", flat=True)) if set(RESULT_KEY_FIELDS) & set(kwargs) else []
+        rows = super().update(**kwargs)
+        if moved_ids:
+            refresh_prediction_results(Q(id__in=moved_ids))
+        wallet_data_changed.send(sender=self.model, wallet_ids=wallet_ids)
+        return rows
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Extends delete with sending wallet_data_changed signal for Wallets of deleted ExpensePredictions.
+
+        Returns:
+            tuple[int, dict[str, int]]: Number of deleted objects and number of deletions per model type.
+        """
+        wallet_ids = self._get_wallets_ids()
+        result = super().delete()
+        wallet_data_changed.send(sender=self.model, wallet_ids=wallet_ids)
+        return result
+
+
+class ExpensePredictionManager(models.Manager.from_queryset(ExpensePredictionQuerySet)):
+    """Manager for ExpensePredictions."""
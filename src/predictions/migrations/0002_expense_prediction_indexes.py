@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expenseprediction',
+            index=models.Index(fields=['category', 'period'], include=('current_plan',), name='prediction_category_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenseprediction',
+            index=models.Index(fields=['deposit', 'period'], include=('current_plan',), name='prediction_deposit_period_idx'),
+        ),
+    ]
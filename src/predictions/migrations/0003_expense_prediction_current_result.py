@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:47
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.expressions
+from django.db.models.functions import Coalesce
+
+
+def populate_predictions_current_result(apps, schema_editor):
+    ExpensePrediction = apps.get_model("predictions", "ExpensePrediction")
+    Transfer = apps.get_model("transfers", "Transfer")
+    output_field = models.DecimalField(max_digits=20, decimal_places=2)
+
+    def sum_transfers(category_condition):
+        return Coalesce(
+            models.Subquery(
+                Transfer.objects.filter(
+                    category_condition, period=models.OuterRef("period"), deposit=models.OuterRef("deposit")
+                )
+                .order_by()
+                .values("period")
+                .annotate(total=models.Sum("value"))
+                .values("total")[:1],
+                output_field=output_field,
+            ),
+            models.Value(Decimal("0.00")),
+            output_field=output_field,
+        )
+
+    ExpensePrediction.objects.update(
+        current_result=models.Case(
+            models.When(category__isnull=True, then=sum_transfers(models.Q(category__isnull=True))),
+            default=sum_transfers(models.Q(category=models.OuterRef("category"))),
+            output_field=output_field,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('predictions', '0002_expense_prediction_indexes'),
+        ('transfers', '0006_recurring_transfer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expenseprediction',
+            name='current_result',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Sum of Transfers values of Period, Deposit and TransferCategory, maintained on Transfer writes.', max_digits=20),
+        ),
+        migrations.AddIndex(
+            model_name='expenseprediction',
+            index=models.Index(models.F('period'), django.db.models.expressions.CombinedExpression(models.F('current_plan'), '-', models.F('current_result')), name='prediction_funds_left_idx'),
+        ),
+        migrations.RunPython(populate_predictions_current_result, migrations.RunPython.noop),
+    ]
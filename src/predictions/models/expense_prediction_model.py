@@ -1,8 +1,11 @@
 from decimal import Decimal
+from typing import Any
 
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import CheckConstraint, Q
+from django.db.models import CheckConstraint, F, Q
+
+from predictions.managers.expense_prediction_manager import ExpensePredictionManager
 
 NOT_CATEGORIZED_CATEGORY_NAME = "❗Not categorized"
 
@@ -22,9 +25,25 @@ class ExpensePrediction(models.Model):
     initial_plan = models.DecimalField(max_digits=10, decimal_places=2, default=None, blank=True, null=True)
     current_plan = models.DecimalField(max_digits=10, decimal_places=2)
     description = models.TextField(blank=True, null=True)
+    current_result = models.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Sum of Transfers values of Period, Deposit and TransferCategory, maintained on Transfer writes.",
+    )
+
+    objects = ExpensePredictionManager()
 
     class Meta:
         unique_together = ("period", "category", "deposit")
+        indexes = (
+            models.Index(
+                fields=("category", "period"), include=("current_plan",), name="prediction_category_period_idx"
+            ),
+            models.Index(fields=("deposit", "period"), include=("current_plan",), name="prediction_deposit_period_idx"),
+            # Covers progress_status filtering and ordering by current_funds_left within Period.
+            models.Index(F("period"), F("current_plan") - F("current_result"), name="prediction_funds_left_idx"),
+        )
         constraints = (
             CheckConstraint(
                 check=Q(initial_plan__gte=Decimal("0.00")),
@@ -45,23 +64,43 @@ class ExpensePrediction(models.Model):
         """
         return f"[{self.period.name}] {getattr(self.category, 'name', NOT_CATEGORIZED_CATEGORY_NAME)}"
 
-    def save(self, *args, **kwargs) -> None:
+    def save(self, *args, wallet_relations_lookup: Any = None, **kwargs) -> None:
         """
-        Override save method to execute validation before saving model in database.
+        Override save method to execute validation before saving model in database and to calculate current_result
+        for (Period, Deposit, TransferCategory) key of ExpensePrediction.
+
+        Args:
+            wallet_relations_lookup (WalletRelationsLookup | None): Lookup shared between saved instances.
         """
-        self._validate_category()
+        from predictions.services.prediction_result_service import get_prediction_current_result
+
+        self._validate_category(wallet_relations_lookup)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"period", "deposit", "category"} & set(update_fields):
+            self.current_result = get_prediction_current_result(self)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "current_result"}
         super().save(*args, **kwargs)
 
-    def _validate_category(self) -> None:
+    def _validate_category(self, wallet_relations_lookup: Any = None) -> None:
         """
-        Checks if category Wallet and period Wallet are the same.
+        Checks if category Wallet and period Wallet are the same. Wallet IDs are taken from cached related objects
+        or loaded with at most one query.
+
+        Args:
+            wallet_relations_lookup (WalletRelationsLookup | None): Lookup shared between saved instances.
 
         Raises:
             ValidationError: Raised when category Wallet and period Wallet are not the same.
         """
-        if self.category is None:
+        from app_infrastructure.services.wallet_relations_service import WalletRelationsLookup
+
+        if self.category_id is None:
             return
-        if self.category.wallet != self.period.wallet:
+        relations = (wallet_relations_lookup or WalletRelationsLookup()).get_instance_relations(
+            self, ("period", "category")
+        )
+        if relations["category"].wallet_id != relations["period"].wallet_id:
             raise ValidationError("Wallet for period and category fields is not the same.", code="wallet-invalid")
-        if self.category.deposit != self.deposit:
+        if relations["category"].deposit_id != self.deposit_id:
             raise ValidationError("Category Deposit different than Prediction Deposit", code="deposit-invalid")
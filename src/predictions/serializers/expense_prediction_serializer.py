@@ -11,6 +11,7 @@ from categories.models.choices.category_type import CategoryType
 from periods.models import Period
 from periods.models.choices.period_status import PeriodStatus
 from predictions.models.expense_prediction_model import NOT_CATEGORIZED_CATEGORY_NAME, ExpensePrediction
+from predictions.services.prediction_forecast_service import FORECAST_HISTORY_MAX_PERIODS, ForecastMethod
 
 
 class ExpensePredictionSerializer(serializers.ModelSerializer):
@@ -146,3 +147,38 @@ class ExpensePredictionSerializer(serializers.ModelSerializer):
             CategoryPriority(instance.category.priority).label if instance.category else NOT_CATEGORIZED_CATEGORY_NAME
         )
         return representation
+
+
+class ExpensePredictionUpsertRowSerializer(serializers.Serializer):
+    """
+    Serializer for single row of ExpensePredictions bulk upsert. Validates only row values - relations of all rows
+    are validated together against TransferCategories preloaded for Wallet.
+    """
+
+    category = serializers.IntegerField()
+    deposit = serializers.IntegerField()
+    current_plan = serializers.DecimalField(max_digits=10, decimal_places=2)
+    description = serializers.CharField(required=False, allow_null=True, allow_blank=True, default=None)
+
+    @staticmethod
+    def validate_current_plan(current_plan: Decimal) -> Decimal:
+        """
+        Validates "current_plan" field the same way as ExpensePredictionSerializer.
+
+        Args:
+            current_plan [Decimal]: current_plan of given row.
+
+        Returns:
+            Decimal: Validated current_plan of row.
+        """
+        return ExpensePredictionSerializer.validate_current_plan(current_plan)
+
+
+class ExpensePredictionForecastSerializer(serializers.Serializer):
+    """Serializer for parameters of ExpensePredictions forecast."""
+
+    period = serializers.IntegerField()
+    method = serializers.ChoiceField(choices=ForecastMethod.choices, default=ForecastMethod.MOVING_AVERAGE)
+    window = serializers.IntegerField(min_value=1, max_value=FORECAST_HISTORY_MAX_PERIODS, default=3)
+    alpha = serializers.FloatField(min_value=0.01, max_value=1, default=0.5)
+    percentile = serializers.FloatField(min_value=0, max_value=100, default=75)
@@ -0,0 +1,127 @@
+import logging
+import time
+from typing import Iterable, NamedTuple
+
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet, Subquery
+
+from app_infrastructure.signals import wallet_data_changed
+from periods.models import Period
+from periods.models.choices.period_status import PeriodStatus
+from predictions.models import ExpensePrediction
+from predictions.services.prediction_result_service import refresh_prediction_results
+
+logger = logging.getLogger("default")
+
+
+class PredictionsCopyResult(NamedTuple):
+    """Summary of copying ExpensePredictions between Periods."""
+
+    copied_predictions_count: int
+    target_periods_count: int
+
+
+def _copy_predictions_into_periods(
+    wallet_pk: int, source_period_pk: int, target_periods: QuerySet[Period]
+) -> PredictionsCopyResult:
+    """
+    Copies categorized ExpensePredictions of source Period into all target Periods with single INSERT ... SELECT
+    statement. Predictions for (Period, TransferCategory, Deposit) already existing in target Period are skipped
+    with ON CONFLICT DO NOTHING. Only counts of inserted rows are returned by database. current_result of target
+    Periods ExpensePredictions is calculated afterwards with single UPDATE.
+
+    Args:
+        wallet_pk (int): Wallet ID of source and target Periods.
+        source_period_pk (int): ID of Period which ExpensePredictions will be copied.
+        target_periods (QuerySet[Period]): Periods into which ExpensePredictions will be copied.
+
+    Returns:
+        PredictionsCopyResult: Numbers of copied ExpensePredictions and of Periods they were copied into.
+    """
+    start = time.perf_counter()
+    targets_sql, targets_params = target_periods.filter(wallet_id=wallet_pk).values("id").query.sql_with_params()
+    table = ExpensePrediction._meta.db_table
+    periods_table = Period._meta.db_table
+    sql = f"""
+        WITH inserted AS (
+            INSERT INTO {table} (period_id, deposit_id, category_id, current_plan, description, current_result)
+            SELECT target.id, source.deposit_id, source.category_id, source.current_plan, source.description, 0
+            FROM {table} source
+            INNER JOIN {periods_table} source_period ON source_period.id = source.period_id
+            CROSS JOIN ({targets_sql}) target
+            WHERE source.period_id = %s AND source_period.wallet_id = %s AND source.category_id IS NOT NULL
+            AND target.id <> source.period_id
+            ORDER BY target.id, source.id
+            ON CONFLICT (period_id, category_id, deposit_id) DO NOTHING
+            RETURNING period_id
+        )
+        SELECT COUNT(*), COUNT(DISTINCT period_id) FROM inserted
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, (*targets_params, source_period_pk, wallet_pk))
+            result = PredictionsCopyResult(*cursor.fetchone())
+        if result.copied_predictions_count:
+            refresh_prediction_results(Q(period__in=target_periods, category__isnull=False))
+    if result.copied_predictions_count:
+        wallet_data_changed.send(sender=ExpensePrediction, wallet_ids={wallet_pk})
+    logger.info(
+        f"ExpensePredictions copied | Wallet ID: {wallet_pk} | Source Period ID: {source_period_pk} | "
+        f"Copied predictions: {result.copied_predictions_count} | Target Periods: {result.target_periods_count} | "
+        f"Duration: {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+    return result
+
+
+def copy_predictions(
+    wallet_pk: int | str, source_period_pk: int | str, target_periods_pks: Iterable[int | str]
+) -> PredictionsCopyResult:
+    """
+    Copies categorized ExpensePredictions of source Period into given Periods of the same Wallet.
+
+    Args:
+        wallet_pk (int | str): Wallet ID.
+        source_period_pk (int | str): ID of Period which ExpensePredictions will be copied.
+        target_periods_pks (Iterable[int | str]): IDs of Periods into which ExpensePredictions will be copied.
+
+    Returns:
+        PredictionsCopyResult: Numbers of copied ExpensePredictions and of Periods they were copied into.
+    """
+    target_periods_pks = [int(pk) for pk in target_periods_pks]
+    if not target_periods_pks:
+        return PredictionsCopyResult(copied_predictions_count=0, target_periods_count=0)
+    return _copy_predictions_into_periods(
+        wallet_pk=int(wallet_pk),
+        source_period_pk=int(source_period_pk),
+        target_periods=Period.objects.filter(pk__in=target_periods_pks),
+    )
+
+
+def roll_predictions_forward(
+    wallet_pk: int | str, source_period_pk: int | str, periods_count: int
+) -> PredictionsCopyResult:
+    """
+    Copies categorized ExpensePredictions of source Period into periods_count nearest draft Periods of the same
+    Wallet starting after source Period ends.
+
+    Args:
+        wallet_pk (int | str): Wallet ID.
+        source_period_pk (int | str): ID of Period which ExpensePredictions will be copied.
+        periods_count (int): Maximal number of future draft Periods to copy ExpensePredictions into.
+
+    Returns:
+        PredictionsCopyResult: Numbers of copied ExpensePredictions and of Periods they were copied into.
+    """
+    if periods_count < 1:
+        return PredictionsCopyResult(copied_predictions_count=0, target_periods_count=0)
+    wallet_pk, source_period_pk = int(wallet_pk), int(source_period_pk)
+    future_draft_periods = Period.objects.filter(
+        wallet_id=wallet_pk,
+        status=PeriodStatus.DRAFT,
+        date_start__gt=Subquery(Period.objects.filter(pk=source_period_pk).values("date_end")[:1]),
+    ).order_by("date_start")[:periods_count]
+    return _copy_predictions_into_periods(
+        wallet_pk=wallet_pk,
+        source_period_pk=source_period_pk,
+        target_periods=Period.objects.filter(pk__in=future_draft_periods.values("pk")),
+    )
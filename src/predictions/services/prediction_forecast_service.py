@@ -0,0 +1,247 @@
+import logging
+import math
+import time
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import F, Sum
+
+from categories.models import TransferCategory
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from predictions.models import ExpensePrediction
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
+
+logger = logging.getLogger("default")
+
+FORECAST_HISTORY_MAX_PERIODS = 120
+
+
+class ForecastMethod:
+    """Estimators available for forecasting ExpensePredictions current_plan."""
+
+    MOVING_AVERAGE = "moving_average"
+    EXPONENTIAL = "exponential"
+    SEASONAL = "seasonal"
+    PERCENTILE = "percentile"
+
+    choices = (MOVING_AVERAGE, EXPONENTIAL, SEASONAL, PERCENTILE)
+
+
+class ExpenseHistory(NamedTuple):
+    """Expenses sums of Wallet TransferCategories in consecutive Periods."""
+
+    categories: list[tuple[int, int]]
+    periods_starts: list[date]
+    values: list[list[float]]
+
+
+class CategoryForecast(NamedTuple):
+    """Estimates of next Period expenses of single TransferCategory."""
+
+    category: int
+    deposit: int
+    moving_average: Decimal
+    exponential: Decimal
+    seasonal: Decimal | None
+    percentile: Decimal
+    suggested_plan: Decimal
+
+
+def _to_amount(value: float) -> Decimal:
+    """
+    Converts float estimate to monetary Decimal value.
+
+    Args:
+        value (float): Estimated value.
+
+    Returns:
+        Decimal: Value rounded to two decimal places.
+    """
+    return Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def load_expense_history(
+    wallet_pk: int, before: date, max_periods: int = FORECAST_HISTORY_MAX_PERIODS
+) -> ExpenseHistory:
+    """
+    Loads expenses sums of active expense TransferCategories of Wallet in up to max_periods Periods starting
+    before given date. Sums are calculated with single query grouped by (TransferCategory, Period) and placed
+    in dense matrix with row for every TransferCategory and column for every Period ordered by date_start.
+    Periods without expenses of TransferCategory are filled with 0.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+        before (date): Only Periods starting before this date are loaded.
+        max_periods (int): Maximal number of latest Periods to load.
+
+    Returns:
+        ExpenseHistory: TransferCategories keys, Periods starts and matrix of expenses sums.
+    """
+    periods = list(
+        reversed(
+            Period.objects.filter(wallet_id=wallet_pk, date_start__lt=before)
+            .order_by("-date_start")
+            .values_list("id", "date_start")[:max_periods]
+        )
+    )
+    categories = list(
+        TransferCategory.objects.filter(wallet_id=wallet_pk, category_type=CategoryType.EXPENSE, is_active=True)
+        .order_by("id")
+        .values_list("id", "deposit_id")
+    )
+    columns = {period_id: index for index, (period_id, _) in enumerate(periods)}
+    rows = {category_id: index for index, (category_id, _) in enumerate(categories)}
+    values = [[0.0] * len(periods) for _ in categories]
+    if periods and categories:
+        sums = (
+            get_transfer_aggregate_model()
+            .objects.filter(
+                wallet_id=wallet_pk,
+                transfer_type=CategoryType.EXPENSE,
+                period_id__in=list(columns),
+                category_id__in=list(rows),
+                deposit_id=F("category__deposit_id"),
+            )
+            .order_by()
+            .values_list("category_id", "period_id")
+            .annotate(total=Sum("value"))
+        )
+        for category_id, period_id, total in sums:
+            values[rows[category_id]][columns[period_id]] = float(total)
+    return ExpenseHistory(
+        categories=categories, periods_starts=[date_start for _, date_start in periods], values=values
+    )
+
+
+def compute_forecasts(
+    history: ExpenseHistory,
+    target_start: date,
+    method: str = ForecastMethod.MOVING_AVERAGE,
+    window: int = 3,
+    alpha: float = 0.5,
+    percentile: float = 75,
+) -> list[CategoryForecast]:
+    """
+    Computes all estimators for every TransferCategory of ExpenseHistory. Everything that depends only on
+    Periods - exponential weights, percentile positions and seasonal column - is calculated once and applied
+    to all matrix rows.
+
+    Estimators:
+        * moving_average - mean of last "window" Periods.
+        * exponential - exponentially weighted mean of all Periods with "alpha" smoothing factor.
+        * seasonal - value of Period starting in the same month of previous year. None if such Period is missing.
+        * percentile - "percentile" of last "window" Periods values with linear interpolation.
+
+    Args:
+        history (ExpenseHistory): Expenses sums matrix.
+        target_start (date): date_start of forecasted Period.
+        method (str): Estimator used as suggested current_plan. Moving average used if seasonal one is missing.
+        window (int): Number of latest Periods used by moving average and percentile.
+        alpha (float): Smoothing factor of exponentially weighted mean, from (0, 1] range.
+        percentile (float): Percentile from [0, 100] range.
+
+    Returns:
+        list[CategoryForecast]: Estimates for every TransferCategory.
+    """
+    periods_count = len(history.periods_starts)
+    window_start = max(periods_count - window, 0)
+    window_size = periods_count - window_start
+    weights = [(1 - alpha) ** (periods_count - 1 - index) for index in range(periods_count)]
+    weights_sum = sum(weights)
+    rank = percentile / 100 * (window_size - 1)
+    lower_rank, upper_rank = math.floor(rank), math.ceil(rank)
+    fraction = rank - lower_rank
+    seasonal_column = next(
+        (
+            index
+            for index, date_start in enumerate(history.periods_starts)
+            if (date_start.year, date_start.month) == (target_start.year - 1, target_start.month)
+        ),
+        None,
+    )
+    forecasts = []
+    for (category_id, deposit_id), row in zip(history.categories, history.values):
+        if window_size:
+            recent = sorted(row[window_start:])
+            moving_average = sum(recent) / window_size
+            percentile_value = recent[lower_rank] + (recent[upper_rank] - recent[lower_rank]) * fraction
+            exponential = sum(weight * value for weight, value in zip(weights, row)) / weights_sum
+        else:
+            moving_average = percentile_value = exponential = 0.0
+        estimates = {
+            ForecastMethod.MOVING_AVERAGE: _to_amount(moving_average),
+            ForecastMethod.EXPONENTIAL: _to_amount(exponential),
+            ForecastMethod.SEASONAL: None if seasonal_column is None else _to_amount(row[seasonal_column]),
+            ForecastMethod.PERCENTILE: _to_amount(percentile_value),
+        }
+        forecasts.append(
+            CategoryForecast(
+                category=category_id,
+                deposit=deposit_id,
+                **estimates,
+                suggested_plan=(
+                    estimates[method] if estimates[method] is not None else estimates[ForecastMethod.MOVING_AVERAGE]
+                ),
+            )
+        )
+    return forecasts
+
+
+def forecast_expense_predictions(period: Period, **parameters) -> list[CategoryForecast]:
+    """
+    Forecasts current_plan of ExpensePredictions of given Period for all active expense TransferCategories
+    of its Wallet basing on expenses in previous Periods.
+
+    Args:
+        period (Period): Forecasted Period.
+        **parameters: Estimators parameters passed to compute_forecasts.
+
+    Returns:
+        list[CategoryForecast]: Estimates for every TransferCategory.
+    """
+    start = time.perf_counter()
+    history = load_expense_history(period.wallet_id, before=period.date_start)
+    forecasts = compute_forecasts(history, target_start=period.date_start, **parameters)
+    logger.info(
+        f"ExpensePredictions forecasted | Wallet ID: {period.wallet_id} | Period ID: {period.pk} | "
+        f"Categories: {len(history.categories)} | History Periods: {len(history.periods_starts)} | "
+        f"Duration: {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+    return forecasts
+
+
+def write_forecasted_predictions(period: Period, forecasts: list[CategoryForecast]) -> int:
+    """
+    Writes suggested plans as ExpensePredictions of Period with single INSERT ... ON CONFLICT DO UPDATE query.
+    Existing ExpensePredictions keep their description, only current_plan is overwritten. Forecasts without
+    positive suggested plan are skipped, as ExpensePrediction current_plan has to be higher than 0.
+
+    Args:
+        period (Period): Period of ExpensePredictions. Has to be a draft Period.
+        forecasts (list[CategoryForecast]): Forecasts to write.
+
+    Returns:
+        int: Number of written ExpensePredictions.
+    """
+    forecasts = [forecast for forecast in forecasts if forecast.suggested_plan > 0]
+    if not forecasts:
+        return 0
+    with transaction.atomic():
+        ExpensePrediction.objects.bulk_create(
+            [
+                ExpensePrediction(
+                    period=period,
+                    category_id=forecast.category,
+                    deposit_id=forecast.deposit,
+                    current_plan=forecast.suggested_plan,
+                )
+                for forecast in forecasts
+            ],
+            update_conflicts=True,
+            unique_fields=("period", "category", "deposit"),
+            update_fields=("current_plan",),
+        )
+    return len(forecasts)
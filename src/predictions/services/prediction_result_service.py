@@ -0,0 +1,156 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.db import connection
+from django.db.models import Case, DecimalField, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from predictions.models import ExpensePrediction
+from transfers.models.transfer_model import Transfer
+
+
+class PredictionResultDrift(NamedTuple):
+    """Persisted and actual current_result of ExpensePrediction, which values differ."""
+
+    prediction_id: int
+    current_result: Decimal
+    actual_result: Decimal
+
+
+def _sum_period_transfers(category_condition: Q) -> Coalesce:
+    """
+    Returns sum of values of Transfers with ExpensePrediction Period and Deposit matching given condition
+    of TransferCategory.
+
+    Args:
+        category_condition (Q): Condition for Transfer "category" field.
+
+    Returns:
+        Coalesce: ORM function returning Transfers values sum or 0.
+    """
+    return Coalesce(
+        Subquery(
+            Transfer.objects.filter(category_condition, period=OuterRef("period"), deposit=OuterRef("deposit"))
+            .order_by()
+            .values("period")
+            .annotate(total=Sum("value"))
+            .values("total")[:1],
+            output_field=DecimalField(max_digits=20, decimal_places=2),
+        ),
+        Value(Decimal("0.00")),
+        output_field=DecimalField(max_digits=20, decimal_places=2),
+    )
+
+
+def get_actual_current_result() -> Case:
+    """
+    Returns ORM expression calculating current_result of ExpensePrediction from Transfers of its Period, Deposit
+    and TransferCategory. Transfers without TransferCategory are counted for ExpensePrediction without it.
+
+    Returns:
+        Case: ORM function returning Transfers values sum for ExpensePrediction.
+    """
+    return Case(
+        When(category__isnull=True, then=_sum_period_transfers(Q(category__isnull=True))),
+        default=_sum_period_transfers(Q(category=OuterRef("category"))),
+        output_field=DecimalField(max_digits=20, decimal_places=2),
+    )
+
+
+def get_prediction_current_result(prediction: ExpensePrediction) -> Decimal:
+    """
+    Calculates current_result of single ExpensePrediction with single aggregate query.
+
+    Args:
+        prediction (ExpensePrediction): ExpensePrediction instance.
+
+    Returns:
+        Decimal: Sum of values of ExpensePrediction Transfers.
+    """
+    return Transfer.objects.filter(
+        period_id=prediction.period_id, deposit_id=prediction.deposit_id, category_id=prediction.category_id
+    ).aggregate(total=Coalesce(Sum("value"), Value(Decimal("0.00"))))["total"]
+
+
+def refresh_prediction_results(condition: Q) -> int:
+    """
+    Recalculates persisted current_result of ExpensePredictions matching condition with single UPDATE query.
+    Used for ExpensePredictions inserted or moved to other (Period, Deposit, TransferCategory) key, so
+    wallet_data_changed signal is not sent.
+
+    Args:
+        condition (Q): Condition of ExpensePredictions to recalculate.
+
+    Returns:
+        int: Number of updated ExpensePredictions.
+    """
+    return ExpensePrediction._base_manager.filter(condition).update(current_result=get_actual_current_result())
+
+
+def apply_prediction_result_deltas(deltas: dict) -> int:
+    """
+    Applies changes of Transfers values sums to persisted current_result of ExpensePredictions with single
+    UPDATE ... FROM (VALUES ...) query. RollupDeltas are summed by (Period, Deposit, TransferCategory) first, as
+    ExpensePrediction results include Transfers of every Entity and type.
+
+    Args:
+        deltas (RollupDeltas): Changes of TransferRollup rows.
+
+    Returns:
+        int: Number of updated ExpensePredictions.
+    """
+    values = defaultdict(Decimal)
+    for key, delta in deltas.items():
+        values[(key.period_id, key.deposit_id, key.category_id or 0)] += delta.value
+    rows = [(*key, value) for key, value in values.items() if value]
+    if not rows:
+        return 0
+    table = ExpensePrediction._meta.db_table
+    sql = f"""
+        UPDATE {table} AS prediction SET current_result = prediction.current_result + delta.value
+        FROM (VALUES {", ".join(["(%s, %s, %s, %s::numeric)"] * len(rows))})
+        AS delta (period_id, deposit_id, category_key, value)
+        WHERE prediction.period_id = delta.period_id AND prediction.deposit_id = delta.deposit_id
+        AND COALESCE(prediction.category_id, 0) = delta.category_key
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [param for row in rows for param in row])
+        return cursor.rowcount
+
+
+def get_prediction_results_drift(wallet_id: int | None = None) -> list[PredictionResultDrift]:
+    """
+    Compares persisted current_result of ExpensePredictions with value calculated from Transfers.
+
+    Args:
+        wallet_id (int | None): Wallet ID to check ExpensePredictions of. All Wallets checked if not provided.
+
+    Returns:
+        list[PredictionResultDrift]: ExpensePredictions with persisted current_result different from actual one.
+    """
+    queryset = ExpensePrediction.objects.all()
+    if wallet_id is not None:
+        queryset = queryset.filter(period__wallet_id=wallet_id)
+    return [
+        PredictionResultDrift(*row)
+        for row in queryset.annotate(actual_result=get_actual_current_result())
+        .exclude(current_result=F("actual_result"))
+        .order_by("id")
+        .values_list("id", "current_result", "actual_result")
+    ]
+
+
+def repair_prediction_results(predictions_ids: list[int]) -> int:
+    """
+    Recalculates persisted current_result of given ExpensePredictions and notifies about changed Wallets.
+
+    Args:
+        predictions_ids (list[int]): IDs of ExpensePredictions to repair.
+
+    Returns:
+        int: Number of repaired ExpensePredictions.
+    """
+    if not predictions_ids:
+        return 0
+    return ExpensePrediction.objects.filter(id__in=predictions_ids).update(current_result=get_actual_current_result())
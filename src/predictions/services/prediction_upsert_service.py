@@ -0,0 +1,128 @@
+from typing import NamedTuple, Sequence
+
+from django.db import transaction
+
+from categories.models import TransferCategory
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from periods.models.choices.period_status import PeriodStatus
+from predictions.models import ExpensePrediction
+
+BULK_UPSERT_MAX_SIZE = 1000
+UPSERT_UPDATE_FIELDS = ("current_plan", "description")
+
+
+class UpsertStatus:
+    """Statuses of ExpensePredictions bulk upsert rows."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    INVALID = "invalid"
+
+
+class UpsertRowResult(NamedTuple):
+    """Result of upserting single ExpensePrediction row."""
+
+    status: str
+    id: int | None = None
+    errors: list[str] | dict[str, list[str]] | None = None
+
+
+def validate_upsert_row(
+    row: dict, categories: dict[int, tuple[int, int]], existing_keys: set[tuple[int, int]], period: Period
+) -> list[str]:
+    """
+    Validates relations of single upsert row against preloaded data, with the same rules as
+    ExpensePredictionSerializer and ExpensePrediction model use for single ExpensePrediction.
+
+    Args:
+        row (dict): Validated row values.
+        categories (dict[int, tuple[int, int]]): Deposit ID and category_type of Wallet TransferCategories by ID.
+        existing_keys (set[tuple[int, int]]): (category ID, Deposit ID) pairs of Period ExpensePredictions.
+        period (Period): Period of upserted ExpensePredictions.
+
+    Returns:
+        list[str]: Errors of row. Empty for valid row.
+    """
+    if row["category"] not in categories:
+        return ["TransferCategory does not exist in Wallet."]
+    deposit_id, category_type = categories[row["category"]]
+    errors = []
+    if category_type != CategoryType.EXPENSE:
+        errors.append("Incorrect category provided. Please provide expense category.")
+    if deposit_id != row["deposit"]:
+        errors.append("Category Deposit different than Prediction Deposit")
+    if period.status == PeriodStatus.ACTIVE and (row["category"], row["deposit"]) not in existing_keys:
+        errors.append("New Expense Prediction cannot be added to active Period.")
+    return errors
+
+
+def upsert_expense_predictions(period: Period, rows: Sequence[dict]) -> list[UpsertRowResult]:
+    """
+    Creates or updates ExpensePredictions of Period for given (category, deposit, current_plan, description) rows.
+    All rows are validated against Wallet TransferCategories and Period ExpensePredictions loaded with single query
+    each, and valid rows are written with single INSERT ... ON CONFLICT DO UPDATE on (period, category, deposit)
+    unique key. Invalid rows and repeated (category, deposit) pairs are skipped and reported.
+
+    Args:
+        period (Period): Period of upserted ExpensePredictions. Has to be not closed.
+        rows (Sequence[dict]): Validated rows with "category", "deposit", "current_plan" and "description" values.
+
+    Returns:
+        list[UpsertRowResult]: Status, ExpensePrediction ID and errors for every given row.
+    """
+    categories_ids = {row["category"] for row in rows}
+    categories = {
+        category_id: (deposit_id, category_type)
+        for category_id, deposit_id, category_type in TransferCategory.objects.filter(
+            wallet_id=period.wallet_id, id__in=categories_ids
+        ).values_list("id", "deposit_id", "category_type")
+    }
+    with transaction.atomic():
+        existing_keys = set(
+            ExpensePrediction.objects.filter(period=period, category_id__in=categories_ids)
+            .select_for_update()
+            .values_list("category_id", "deposit_id")
+        )
+        results, predictions, seen_keys = [], {}, set()
+        for row in rows:
+            key = (row["category"], row["deposit"])
+            errors = validate_upsert_row(row, categories, existing_keys, period)
+            if key in seen_keys:
+                errors.append("ExpensePrediction for TransferCategory and Deposit already given in request.")
+            if errors:
+                results.append(UpsertRowResult(status=UpsertStatus.INVALID, errors=errors))
+                continue
+            seen_keys.add(key)
+            predictions[key] = ExpensePrediction(
+                period=period,
+                category_id=row["category"],
+                deposit_id=row["deposit"],
+                current_plan=row["current_plan"],
+                description=row["description"],
+            )
+            results.append(
+                UpsertRowResult(status=UpsertStatus.UPDATED if key in existing_keys else UpsertStatus.CREATED)
+            )
+        if not predictions:
+            return results
+        ExpensePrediction.objects.bulk_create(
+            predictions.values(),
+            update_conflicts=True,
+            unique_fields=("period", "category", "deposit"),
+            update_fields=UPSERT_UPDATE_FIELDS,
+        )
+    predictions_ids = {
+        (category_id, deposit_id): prediction_id
+        for category_id, deposit_id, prediction_id in ExpensePrediction.objects.filter(
+            period=period, category_id__in={category_id for category_id, _ in predictions}
+        ).values_list("category_id", "deposit_id", "id")
+    }
+    return [
+        (
+            result._replace(id=predictions_ids[(row["category"], row["deposit"])])
+            if result.status != UpsertStatus.INVALID
+            else result
+        )
+        for row, result in zip(rows, results)
+    ]
@@ -2,6 +2,7 @@ from django.urls import path
 
 from predictions.views.copy_predictions_from_previous_period_view import CopyPredictionsFromPreviousPeriodAPIView
 from predictions.views.deposits_predictions_results_view import DepositsPredictionsResultsAPIView
+from predictions.views.roll_predictions_forward_view import RollPredictionsForwardAPIView
 
 app_name = "predictions"
 
@@ -21,4 +22,9 @@ urlpatterns = [
         CopyPredictionsFromPreviousPeriodAPIView.as_view(),
         name="copy-predictions-from-previous-period",
     ),
+    path(
+        "roll_predictions_forward/<int:period_pk>/",
+        RollPredictionsForwardAPIView.as_view(),
+        name="roll-predictions-forward",
+    ),
 ]
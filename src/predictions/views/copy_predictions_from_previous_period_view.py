@@ -1,7 +1,7 @@
 import logging
 
-from django.db import transaction
-from django.db.models import Subquery
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -11,13 +11,14 @@ from rest_framework.views import APIView
 from app_infrastructure.permissions import UserBelongsToWalletPermission
 from periods.models import Period
 from predictions.models import ExpensePrediction
+from predictions.services.prediction_copy_service import copy_predictions
 
 logger = logging.getLogger("default")
 
 
 class CopyPredictionsFromPreviousPeriodAPIView(APIView):
     """
-    View for copying predictions from previous period.
+    View for copying predictions from previous period or from other Period of Wallet given in request.
     """
 
     permission_classes = (
@@ -25,9 +26,21 @@ class CopyPredictionsFromPreviousPeriodAPIView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @swagger_auto_schema(
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "source_period": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    description="ID of Period to copy Predictions from. Previous Period used if not given.",
+                ),
+            },
+        ),
+    )
     def post(self, request: Request, wallet_pk: int, period_pk: int) -> Response:
         """
-        Handles copying ExpensePrediction from previous Period of one with given period_pk.
+        Handles copying ExpensePrediction from previous Period of one with given period_pk or from Period given
+        in optional "source_period" request param.
 
         Args:
             request [Request]: User request.
@@ -48,33 +61,26 @@ class CopyPredictionsFromPreviousPeriodAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        previous_period_predictions = ExpensePrediction.objects.filter(
-            period__wallet__pk=wallet_pk,
-            period__pk=Subquery(Period.objects.filter(pk=period_pk).values("previous_period__pk")[:1]),
-            category__isnull=False,
-        ).values("category", "deposit", "current_plan", "description")
-        if not previous_period_predictions:
-            logger.warning(
-                f"Copying Predictions from previous Period not started - "
-                f"no Predictions to copy. | Period ID: {period_pk}"
+        source_period_pk = request.data.get("source_period", None)
+        if source_period_pk is not None:
+            try:
+                source_period_pk = int(source_period_pk)
+            except (TypeError, ValueError):
+                return Response("source_period must be a Period ID.", status=status.HTTP_400_BAD_REQUEST)
+            if not Period.objects.filter(pk=source_period_pk, wallet_id=wallet_pk).exists():
+                return Response("Source Period does not exist in Wallet.", status=status.HTTP_400_BAD_REQUEST)
+        else:
+            source_period_pk = (
+                Period.objects.filter(pk=period_pk, wallet_id=wallet_pk)
+                .values_list("previous_period_id", flat=True)
+                .first()
             )
-            return Response("No predictions to copy from previous Period.")
-        with transaction.atomic():
+        if source_period_pk:
             try:
                 logger.info(f"Copying Predictions from previous Period started. | Period ID: {period_pk}")
-                ExpensePrediction.objects.bulk_create(
-                    [
-                        ExpensePrediction(
-                            period_id=period_pk,
-                            deposit_id=previous_prediction["deposit"],
-                            category_id=previous_prediction["category"],
-                            current_plan=previous_prediction["current_plan"],
-                            description=previous_prediction["description"],
-                        )
-                        for previous_prediction in previous_period_predictions
-                    ]
-                )
-                return Response("Predictions copied successfully from previous Period.")
+                copied_predictions_count = copy_predictions(
+                    wallet_pk=wallet_pk, source_period_pk=source_period_pk, target_periods_pks=[period_pk]
+                ).copied_predictions_count
             except Exception as e:
                 logger.error(
                     f"Copying Predictions from previous Period failed. | Period ID: {period_pk} | Reason: {str(e)}"
@@ -83,3 +89,12 @@ class CopyPredictionsFromPreviousPeriodAPIView(APIView):
                     "Unexpected error raised on copying Predictions from previous Period.",
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
+        else:
+            copied_predictions_count = 0
+        if not copied_predictions_count:
+            logger.warning(
+                f"Copying Predictions from previous Period not started - "
+                f"no Predictions to copy. | Period ID: {period_pk}"
+            )
+            return Response("No predictions to copy from previous Period.")
+        return Response("Predictions copied successfully from previous Period.")
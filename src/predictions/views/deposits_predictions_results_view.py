@@ -1,6 +1,7 @@
 from decimal import Decimal
+from typing import Any
 
-from django.db.models import DecimalField, ExpressionWrapper, F, Func, OuterRef, Subquery, Sum, Value
+from django.db.models import DecimalField, ExpressionWrapper, F, Func, Q, QuerySet, Sum, Value
 from django.db.models.functions import Coalesce
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
@@ -9,97 +10,78 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.derived_table_service import DerivedTableColumn, join_derived_table
+from app_infrastructure.services.wallet_response_cache_service import cache_wallet_response
 from categories.models.choices.category_priority import CategoryPriority
 from categories.models.choices.category_type import CategoryType
+from entities.models import Entity
 from periods.models import Period
 from predictions.models import ExpensePrediction
-from transfers.models import Expense, Transfer
-from wallets.models import Wallet
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
+TRANSFERS_SUMS_ALIAS = "deposits_transfers_sums"
+PREDICTIONS_SUMS_ALIAS = "deposits_predictions_sums"
 
-def get_deposit_period_expenses(wallet_pk: int, period_pk: int) -> Func:
+
+def get_deposits_transfers_sums(wallet_pk: int, period: dict[str, Any]) -> QuerySet:
     """
-    Function for calculate Transfers values sum in Period done by particular Deposit.
+    Function for calculate Transfers sums of all Wallet Deposits with single grouped query. Conditional sums
+    contain Incomes from given and previous Periods, Expenses from previous Periods and Expenses from given Period.
 
     Args:
-        period_pk (int): Period id.
         wallet_pk (int): Wallet id.
+        period (dict[str, Any]): Period "pk", "date_start" and "date_end" values.
 
     Returns:
-        Func: ORM function returning Sum of Period Transfers values for specified Deposit.
+        QuerySet: QuerySet of "deposit_key", "incomes_sum", "expenses_sum" and "period_expenses" values.
     """
-    return Coalesce(
-        Subquery(
-            Expense.objects.filter(period__wallet__pk=wallet_pk, period=period_pk, deposit__id=OuterRef("pk"))
-            .values("period")
-            .annotate(total=Sum("value"))
-            .values("total")[:1],
-            output_field=DecimalField(decimal_places=2),
-        ),
-        Value(Decimal("0.00")),
-        output_field=DecimalField(decimal_places=2),
+    return (
+        get_transfer_aggregate_model()
+        .objects.filter(period__wallet__pk=wallet_pk, period__date_start__lt=period["date_end"])
+        .order_by()
+        .values(deposit_key=F("deposit"))
+        .annotate(
+            incomes_sum=Sum("value", filter=Q(transfer_type=CategoryType.INCOME)),
+            expenses_sum=Sum(
+                "value", filter=Q(transfer_type=CategoryType.EXPENSE, period__date_start__lt=period["date_start"])
+            ),
+            period_expenses=Sum("value", filter=Q(transfer_type=CategoryType.EXPENSE, period__pk=period["pk"])),
+        )
     )
 
 
-def get_deposit_period_expense_predictions(wallet_pk: int, period_pk: int) -> Func:
+def get_deposits_predictions_sums(wallet_pk: int, period_pk: int) -> QuerySet:
     """
-    Function for calculate ExpensePredictions current_plan values sum in Period for particular Deposit.
+    Function for calculate ExpensePredictions current_plan values sums in Period of all Wallet Deposits.
 
     Args:
-        period_pk (int): Period id.
         wallet_pk (int): Wallet id.
+        period_pk (int): Period id.
 
     Returns:
-        Func: ORM function returning Sum of Period ExpensePredictions current_plan values
-        for specified Deposit.
+        QuerySet: QuerySet of "deposit_key" and "predictions_sum" values.
     """
-
-    return Coalesce(
-        Subquery(
-            ExpensePrediction.objects.filter(
-                period__wallet__pk=wallet_pk, period=period_pk, category__deposit__id=OuterRef("pk")
-            )
-            .values("period")
-            .annotate(total=Sum("current_plan"))
-            .values("total")[:1],
-            output_field=DecimalField(decimal_places=2),
-        ),
-        Value(Decimal("0.00")),
-        output_field=DecimalField(decimal_places=2),
+    return (
+        ExpensePrediction.objects.filter(period__wallet__pk=wallet_pk, period__pk=period_pk)
+        .order_by()
+        .values(deposit_key=F("category__deposit"))
+        .annotate(predictions_sum=Sum("current_plan"))
     )
 
 
-def sum_period_and_previous_transfers(wallet_pk: int, period_pk: int, category_type: CategoryType) -> Func:
+def coalesce_deposit_sum(table_alias: str, column: str) -> Func:
     """
-    Function for calculate Transfers sum of specified type from given and previous Periods
-    for particular Deposit.
+    Function returning Deposit sum from joined derived table or 0.00 for Deposit without matching rows.
 
     Args:
-        wallet_pk (int): Wallet id.
-        period_pk (int): Period id.
-        category_type (CategoryType): Category type, like 'Income' or 'Expense'.
+        table_alias (str): Alias of joined derived table.
+        column (str): Name of sum column.
 
     Returns:
-        Func: ORM function returning Sum of Period Transfers (Incomes or Expenses) values for specified Deposit
-        from given and previous Periods.
+        Func: ORM function returning sum value.
     """
     return Coalesce(
-        Subquery(
-            Transfer.objects.filter(
-                period__wallet__pk=wallet_pk,
-                transfer_type=category_type,
-                period__date_start__lt=Subquery(
-                    Period.objects.filter(pk=period_pk).values(
-                        "date_start" if category_type == CategoryType.EXPENSE else "date_end"
-                    )[:1]
-                ),
-                deposit__id=OuterRef("pk"),
-            )
-            .values("transfer_type")
-            .annotate(total=Sum("value"))
-            .values("total")[:1],
-            output_field=DecimalField(decimal_places=2),
-        ),
+        DerivedTableColumn(table_alias, column, output_field=DecimalField(decimal_places=2)),
         Value(Decimal("0.00")),
         output_field=DecimalField(decimal_places=2),
     )
@@ -152,6 +134,7 @@ class DepositsPredictionsResultsAPIView(APIView):
         UserBelongsToWalletPermission,
     )
 
+    @cache_wallet_response()
     def get(self, request: Request, wallet_pk: int, period_pk: int) -> Response:
         """
         Returns serialized DepositResults in particular Period.
@@ -162,20 +145,29 @@ class DepositsPredictionsResultsAPIView(APIView):
         Returns:
             Response: Serialized DepositResults in particular Period.
         """
-        if not Period.objects.filter(wallet_id=wallet_pk, pk=period_pk).exists():
+        period = Period.objects.filter(wallet_id=wallet_pk, pk=period_pk).values("pk", "date_start", "date_end").first()
+        if period is None:
             raise NotFound("Period with given pk does not exist in Wallet.")
+        deposits = join_derived_table(
+            Entity.objects.filter(wallet__pk=wallet_pk, is_deposit=True),
+            get_deposits_transfers_sums(wallet_pk, period),
+            table_alias=TRANSFERS_SUMS_ALIAS,
+            join_on={"deposit_key": "pk"},
+        )
         deposits = (
-            Wallet.objects.get(pk=wallet_pk)
-            .entities.filter(is_deposit=True)
-            .annotate(
-                predictions_sum=get_deposit_period_expense_predictions(wallet_pk, period_pk),
-                incomes_sum=sum_period_and_previous_transfers(wallet_pk, period_pk, CategoryType.INCOME),
-                expenses_sum=sum_period_and_previous_transfers(wallet_pk, period_pk, CategoryType.EXPENSE),
+            join_derived_table(
+                deposits,
+                get_deposits_predictions_sums(wallet_pk, period_pk),
+                table_alias=PREDICTIONS_SUMS_ALIAS,
+                join_on={"deposit_key": "pk"},
             )
             .annotate(
-                period_expenses=get_deposit_period_expenses(wallet_pk, period_pk),
-                period_balance=get_deposit_period_balance(),
+                predictions_sum=coalesce_deposit_sum(PREDICTIONS_SUMS_ALIAS, "predictions_sum"),
+                incomes_sum=coalesce_deposit_sum(TRANSFERS_SUMS_ALIAS, "incomes_sum"),
+                expenses_sum=coalesce_deposit_sum(TRANSFERS_SUMS_ALIAS, "expenses_sum"),
+                period_expenses=coalesce_deposit_sum(TRANSFERS_SUMS_ALIAS, "period_expenses"),
             )
+            .annotate(period_balance=get_deposit_period_balance())
             .annotate(
                 funds_left_for_predictions=get_funds_left_for_predictions(),
                 funds_left_for_expenses=get_funds_left_for_expenses(),
@@ -195,11 +187,11 @@ class DepositsPredictionsResultsAPIView(APIView):
             [
                 {
                     "deposit_name": deposit["name"],
-                    "predictions_sum": f"{Decimal(str(deposit['predictions_sum'])):.2f}",
-                    "period_balance": f"{Decimal(str(deposit['period_balance'])):.2f}",
-                    "period_expenses": f"{Decimal(str(deposit['period_expenses'])):.2f}",
-                    "funds_left_for_predictions": f"{Decimal(str(deposit['funds_left_for_predictions'])):.2f}",
-                    "funds_left_for_expenses": f"{Decimal(str(deposit['funds_left_for_expenses'])):.2f}",
+                    "predictions_sum": f"{deposit['predictions_sum']:.2f}",
+                    "period_balance": f"{deposit['period_balance']:.2f}",
+                    "period_expenses": f"{deposit['period_expenses']:.2f}",
+                    "funds_left_for_predictions": f"{deposit['funds_left_for_predictions']:.2f}",
+                    "funds_left_for_expenses": f"{deposit['funds_left_for_expenses']:.2f}",
                 }
                 for deposit in deposits.order_by("id")
             ]
@@ -1,88 +1,138 @@
-from django.db.models import (
-    Case,
-    DecimalField,
-    ExpressionWrapper,
-    F,
-    Func,
-    OuterRef,
-    Q,
-    QuerySet,
-    Subquery,
-    Sum,
-    Value,
-    When,
-)
+from django.db.models import Case, DecimalField, ExpressionWrapper, F, Q, QuerySet, Sum, Value, When
 from django.db.models.functions import Coalesce
 from django_filters import rest_framework as filters
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.paginations import DefaultOrKeysetPagination
 from app_infrastructure.permissions import UserBelongsToWalletPermission
+from app_infrastructure.services.derived_table_service import DerivedTableColumn, join_derived_table
+from periods.models import Period
+from periods.models.choices.period_status import PeriodStatus
 from predictions.filtersets.expense_prediction_filterset import ExpensePredictionFilterSet
 from predictions.models.expense_prediction_model import ExpensePrediction
-from predictions.serializers.expense_prediction_serializer import ExpensePredictionSerializer
-from transfers.models import Transfer
+from predictions.serializers.expense_prediction_serializer import (
+    ExpensePredictionForecastSerializer,
+    ExpensePredictionSerializer,
+    ExpensePredictionUpsertRowSerializer,
+)
+from predictions.services.prediction_forecast_service import (
+    ForecastMethod,
+    forecast_expense_predictions,
+    write_forecasted_predictions,
+)
+from predictions.services.prediction_upsert_service import (
+    BULK_UPSERT_MAX_SIZE,
+    UpsertRowResult,
+    UpsertStatus,
+    upsert_expense_predictions,
+)
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 
+PREVIOUS_RESULTS_ALIAS = "prediction_previous_results"
+PREVIOUS_PLANS_ALIAS = "prediction_previous_plans"
 
-def sum_period_transfers_with_category(period_ref: str) -> Case:
+
+def get_transfers_sums_in_periods(wallet_pk: int, period_ref: str) -> QuerySet:
     """
-    Function for calculate Transfers values sum of given TransferCategory in Period.
+    Function for calculate Transfers values sums of Wallet grouped by Period, Deposit and TransferCategory
+    with single aggregation. Transfers without TransferCategory are grouped under category_key equal to 0.
 
     Args:
-        period_ref (string): Period field name for OuterRef.
+        wallet_pk (int): Wallet ID.
+        period_ref (string): Transfer field path of Period returned as period_key, f.e. "period"
+            or "period__next_periods" for summing Transfers of Period under its next Period.
 
     Returns:
-        Case: ORM function returning Sum of Period Transfers values for specified TransferCategory.
+        QuerySet: QuerySet of "period_key", "deposit_key", "category_key" and "total" values.
     """
+    return (
+        get_transfer_aggregate_model()
+        .objects.filter(**{"wallet__pk": wallet_pk, f"{period_ref}__isnull": False})
+        .order_by()
+        .values(
+            period_key=F(period_ref),
+            deposit_key=F("deposit"),
+            category_key=Coalesce(F("category"), Value(0)),
+        )
+        .annotate(total=Sum("value"))
+    )
 
-    return Case(
-        When(
-            category__isnull=True,
-            then=Coalesce(
-                Subquery(
-                    Transfer.objects.filter(
-                        Q(period=OuterRef(period_ref), deposit=OuterRef("deposit"), category__isnull=True)
-                    )
-                    .values("period")
-                    .annotate(total=Sum("value"))
-                    .values("total")[:1],
-                    output_field=DecimalField(decimal_places=2),
-                ),
-                Value(0),
-                output_field=DecimalField(decimal_places=2),
-            ),
-        ),
-        default=Coalesce(
-            Subquery(
-                Transfer.objects.filter(
-                    Q(period=OuterRef(period_ref), deposit=OuterRef("deposit"), category=OuterRef("category"))
-                )
-                .values("period")
-                .annotate(total=Sum("value"))
-                .values("total")[:1],
-                output_field=DecimalField(decimal_places=2),
-            ),
-            Value(0),
-            output_field=DecimalField(decimal_places=2),
-        ),
-        output_field=DecimalField(decimal_places=2),
+
+def get_previous_periods_predictions_plans(wallet_pk: int) -> QuerySet:
+    """
+    Function for collecting current plans of Wallet ExpensePredictions together with next Period ID.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+
+    Returns:
+        QuerySet: QuerySet of "period_key", "category_key" and "current_plan" values.
+    """
+    return (
+        ExpensePrediction.objects.filter(
+            period__wallet__pk=wallet_pk, period__next_periods__isnull=False, category__isnull=False
+        )
+        .order_by()
+        .values("current_plan", period_key=F("period__next_periods"), category_key=F("category"))
+    )
+
+
+def annotate_predictions_results(queryset: QuerySet, wallet_pk: int) -> QuerySet:
+    """
+    Function for annotating ExpensePredictions with previous_plan and previous_result fields. Transfers sums
+    and previous plans are calculated once for whole Wallet in derived tables joined to ExpensePredictions,
+    instead of correlated subqueries executed for every ExpensePrediction. current_result is persisted
+    in ExpensePrediction table.
+
+    Args:
+        queryset (QuerySet): ExpensePrediction QuerySet.
+        wallet_pk (int): Wallet ID.
+
+    Returns:
+        QuerySet: Annotated ExpensePrediction QuerySet.
+    """
+    queryset = join_derived_table(
+        queryset,
+        get_transfers_sums_in_periods(wallet_pk=wallet_pk, period_ref="period__next_periods"),
+        table_alias=PREVIOUS_RESULTS_ALIAS,
+        join_on={
+            "period_key": "period",
+            "deposit_key": "deposit",
+            "category_key": Coalesce(F("category"), Value(0)),
+        },
+    )
+    queryset = join_derived_table(
+        queryset,
+        get_previous_periods_predictions_plans(wallet_pk=wallet_pk),
+        table_alias=PREVIOUS_PLANS_ALIAS,
+        join_on={"period_key": "period", "category_key": "category"},
+    )
+    return queryset.annotate(
+        previous_plan=_coalesce_column(PREVIOUS_PLANS_ALIAS, "current_plan"),
+        previous_result=_coalesce_column(PREVIOUS_RESULTS_ALIAS, "total"),
     )
 
 
-def get_previous_period_prediction_plan() -> Func:
+def _coalesce_column(table_alias: str, column: str) -> Coalesce:
     """
-    Function for calculate Transfers values sum of given TransferCategory in particular Period.
+    Function returning value of derived table column or 0 if no row was joined.
+
+    Args:
+        table_alias (str): Alias of joined derived table.
+        column (str): Name of derived table column.
 
     Returns:
-        Func: ORM function returning Sum of Period Transfers values for specified TransferCategory.
+        Coalesce: ORM function returning column value or 0.
     """
     return Coalesce(
-        Subquery(
-            ExpensePrediction.objects.filter(
-                period=OuterRef("period__previous_period"), category=OuterRef("category")
-            ).values("current_plan")[:1]
-        ),
+        DerivedTableColumn(table_alias, column, output_field=DecimalField(decimal_places=2)),
         Value(0),
         output_field=DecimalField(decimal_places=2),
     )
@@ -135,6 +185,7 @@ class ExpensePredictionViewSet(ModelViewSet):
         UserBelongsToWalletPermission,
     )
     filter_backends = (filters.DjangoFilterBackend, OrderingFilter)
+    pagination_class = DefaultOrKeysetPagination
     serializer_class = ExpensePredictionSerializer
 
     filterset_class = ExpensePredictionFilterSet
@@ -157,20 +208,16 @@ class ExpensePredictionViewSet(ModelViewSet):
         Returns:
             QuerySet: Filtered ExpensePrediction QuerySet.
         """
+        wallet_pk = self.kwargs.get("wallet_pk")
+        queryset = ExpensePrediction.objects.filter(period__wallet__pk=wallet_pk).select_related(
+            "period",
+            "period__wallet",
+            "period__previous_period",
+            "category",
+            "deposit",
+        )
         return (
-            ExpensePrediction.objects.filter(period__wallet__pk=self.kwargs.get("wallet_pk"))
-            .select_related(
-                "period",
-                "period__wallet",
-                "period__previous_period",
-                "category",
-                "deposit",
-            )
-            .annotate(
-                current_result=sum_period_transfers_with_category(period_ref="period"),
-                previous_plan=get_previous_period_prediction_plan(),
-                previous_result=sum_period_transfers_with_category(period_ref="period__previous_period"),
-            )
+            annotate_predictions_results(queryset, wallet_pk=wallet_pk)
             .annotate(
                 current_funds_left=get_current_funds_left(),
                 current_progress=get_current_progress(),
@@ -179,3 +226,109 @@ class ExpensePredictionViewSet(ModelViewSet):
             .filter(Q(category__isnull=False) | (Q(category__isnull=True) & Q(current_result__gt=Value(0))))
             .order_by("id")
         )
+
+    @swagger_auto_schema(
+        method="post",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "period": openapi.Schema(type=openapi.TYPE_INTEGER, description="ID of Period of ExpensePredictions."),
+                "predictions": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "category": openapi.Schema(type=openapi.TYPE_INTEGER),
+                            "deposit": openapi.Schema(type=openapi.TYPE_INTEGER),
+                            "current_plan": openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DECIMAL),
+                            "description": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True),
+                        },
+                    ),
+                    description="ExpensePredictions to create or update.",
+                ),
+            },
+            required=["period", "predictions"],
+        ),
+    )
+    @action(detail=False, methods=["post"])
+    def upsert(self, request, wallet_pk: str) -> Response:
+        """
+        Creates or updates multiple ExpensePredictions of single Period at once. ExpensePrediction for given
+        TransferCategory and Deposit is updated if it exists in Period and created otherwise. Valid rows are
+        written with single query, invalid ones are skipped.
+
+        Returns:
+            Response: API response with status, ID and errors of every given row.
+        """
+        rows = request.data.get("predictions", None)
+        if not isinstance(rows, list) or not rows:
+            return Response({"error": "predictions must be a not empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > BULK_UPSERT_MAX_SIZE:
+            return Response(
+                {"error": f"Up to {BULK_UPSERT_MAX_SIZE} predictions can be upserted at once."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            period = Period.objects.filter(pk=int(request.data.get("period")), wallet_id=int(wallet_pk)).first()
+        except (TypeError, ValueError):
+            period = None
+        if period is None:
+            return Response({"error": "Period does not exist in Wallet."}, status=status.HTTP_400_BAD_REQUEST)
+        if period.status == PeriodStatus.CLOSED:
+            return Response(
+                {"error": "Expense Prediction cannot be changed when Period is closed."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        results, valid_rows_indexes, valid_rows = [], [], []
+        for index, row in enumerate(rows):
+            row_serializer = ExpensePredictionUpsertRowSerializer(data=row)
+            if row_serializer.is_valid():
+                valid_rows_indexes.append(index)
+                valid_rows.append(row_serializer.validated_data)
+                results.append(None)
+            else:
+                results.append(UpsertRowResult(status=UpsertStatus.INVALID, errors=row_serializer.errors))
+        if valid_rows:
+            for index, result in zip(valid_rows_indexes, upsert_expense_predictions(period, valid_rows)):
+                results[index] = result
+        return Response({"results": [result._asdict() for result in results]}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        method="get",
+        manual_parameters=[
+            openapi.Parameter("period", openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=True),
+            openapi.Parameter("method", openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=list(ForecastMethod.choices)),
+            openapi.Parameter("window", openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+            openapi.Parameter("alpha", openapi.IN_QUERY, type=openapi.TYPE_NUMBER),
+            openapi.Parameter("percentile", openapi.IN_QUERY, type=openapi.TYPE_NUMBER),
+        ],
+    )
+    @swagger_auto_schema(method="post", request_body=ExpensePredictionForecastSerializer)
+    @action(detail=False, methods=["get", "post"])
+    def forecast(self, request, wallet_pk: str) -> Response:
+        """
+        Suggests current_plan of ExpensePredictions of given Period for every active expense TransferCategory
+        of Wallet basing on expenses of previous Periods. GET returns suggested plans only, POST additionally
+        writes them as ExpensePredictions of draft Period with single query.
+
+        Returns:
+            Response: API response with estimates and suggested plan for every TransferCategory.
+        """
+        serializer = ExpensePredictionForecastSerializer(
+            data=request.query_params if request.method == "GET" else request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        parameters = dict(serializer.validated_data)
+        period = Period.objects.filter(pk=parameters.pop("period"), wallet_id=int(wallet_pk)).first()
+        if period is None:
+            return Response({"error": "Period does not exist in Wallet."}, status=status.HTTP_400_BAD_REQUEST)
+        if request.method == "POST" and period.status != PeriodStatus.DRAFT:
+            return Response(
+                {"error": "Forecasted Expense Predictions can be written only into draft Period."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        forecasts = forecast_expense_predictions(period, **parameters)
+        response = {"forecasts": [forecast._asdict() for forecast in forecasts]}
+        if request.method == "POST":
+            response["written_predictions_count"] = write_forecasted_predictions(period, forecasts)
+        return Response(response, status=status.HTTP_200_OK)
@@ -0,0 +1,65 @@
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app_infrastructure.permissions import UserBelongsToWalletPermission
+from periods.models import Period
+from predictions.services.prediction_copy_service import roll_predictions_forward
+
+ROLL_FORWARD_MAX_PERIODS = 24
+
+
+class RollPredictionsForwardAPIView(APIView):
+    """
+    View for copying predictions of Period into nearest future draft Periods of Wallet.
+    """
+
+    permission_classes = (
+        IsAuthenticated,
+        UserBelongsToWalletPermission,
+    )
+
+    @swagger_auto_schema(
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "periods_count": openapi.Schema(
+                    type=openapi.TYPE_INTEGER,
+                    description=f"Number of future draft Periods to copy Predictions into, up to "
+                    f"{ROLL_FORWARD_MAX_PERIODS}.",
+                ),
+            },
+            required=["periods_count"],
+        ),
+    )
+    def post(self, request: Request, wallet_pk: int, period_pk: int) -> Response:
+        """
+        Handles copying ExpensePredictions of Period with given period_pk into "periods_count" nearest draft
+        Periods starting after it. Predictions already existing in target Periods are not changed.
+
+        Args:
+            request [Request]: User request.
+            wallet_pk [int]: Wallet PK.
+            period_pk [int]: Period PK which predictions will be copied.
+
+        Returns:
+            Response: HTTP response with numbers of copied Predictions and of Periods they were copied into.
+        """
+        periods_count = request.data.get("periods_count", None)
+        if (
+            not isinstance(periods_count, int)
+            or isinstance(periods_count, bool)
+            or not 1 <= periods_count <= ROLL_FORWARD_MAX_PERIODS
+        ):
+            return Response(
+                {"error": f"periods_count must be an integer from 1 to {ROLL_FORWARD_MAX_PERIODS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not Period.objects.filter(pk=period_pk, wallet_id=wallet_pk).exists():
+            return Response({"error": "Period does not exist in Wallet."}, status=status.HTTP_400_BAD_REQUEST)
+        result = roll_predictions_forward(wallet_pk=wallet_pk, source_period_pk=period_pk, periods_count=periods_count)
+        return Response(result._asdict(), status=status.HTTP_200_OK)
@@ -1,5 +1,7 @@
 from .expense_admin import ExpenseAdmin
 from .income_admin import IncomeAdmin
+from .recurring_transfer_admin import RecurringTransferAdmin
 from .transfer_admin import TransferAdmin
+from .transfer_rollup_admin import TransferRollupAdmin
 
-__all__ = ["ExpenseAdmin", "IncomeAdmin", "TransferAdmin"]
+__all__ = ["ExpenseAdmin", "IncomeAdmin", "RecurringTransferAdmin", "TransferAdmin", "TransferRollupAdmin"]
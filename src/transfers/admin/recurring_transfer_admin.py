@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from transfers.models.recurring_transfer_model import RecurringTransfer
+
+
+@admin.register(RecurringTransfer)
+class RecurringTransferAdmin(admin.ModelAdmin):
+    """Custom admin view for RecurringTransfer model."""
+
+    list_display = ("transfer_type", "name", "frequency", "start_date", "end_date", "deposit", "category", "value")
+    list_filter = ("wallet", "transfer_type", "frequency", "deposit", "category")
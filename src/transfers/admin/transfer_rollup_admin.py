@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+@admin.register(TransferRollup)
+class TransferRollupAdmin(admin.ModelAdmin):
+    """Custom admin view for TransferRollup model."""
+
+    list_display = ("wallet", "period", "deposit", "category", "entity", "transfer_type", "transfers_count", "value")
+    list_filter = ("wallet", "period", "transfer_type", "deposit")
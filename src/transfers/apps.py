@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TransfersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "transfers"
+
+    def ready(self) -> None:
+        """Registers signal receivers of transfers app."""
+        from transfers import signals  # noqa: F401
@@ -26,7 +26,5 @@ class IncomeFilterSet(TransferFilterSet):
         """
         wallet_pk = self.request.parser_context.get("kwargs", {}).get("wallet_pk")
         if value == Decimal("-1"):
-            return queryset.filter(period__wallet__pk=wallet_pk, category__isnull=True)
-        return queryset.filter(
-            period__wallet__pk=wallet_pk, category__id=value, category__category_type=CategoryType.INCOME
-        )
+            return queryset.filter(wallet__pk=wallet_pk, category__isnull=True)
+        return queryset.filter(wallet__pk=wallet_pk, category__id=value, category__category_type=CategoryType.INCOME)
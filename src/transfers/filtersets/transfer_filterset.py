@@ -4,6 +4,7 @@ from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 from rest_framework.request import Request
 
+from app_infrastructure.filters import TextSearchFilter
 from entities.models import Deposit
 from periods.models import Period
 from wallets.utils import get_wallet_pk
@@ -13,6 +14,7 @@ class TransferFilterSet(filters.FilterSet):
     """Base FilterSet for Transfer endpoints."""
 
     name = filters.CharFilter(lookup_expr="icontains", field_name="name")
+    search = TextSearchFilter(search_fields=("name", "description"))
     period = filters.ModelChoiceFilter(
         queryset=lambda request: Period.objects.filter(wallet__pk=get_wallet_pk(request))
     )
@@ -52,5 +54,5 @@ class TransferFilterSet(filters.FilterSet):
         """
         wallet_pk = self.request.parser_context.get("kwargs", {}).get("wallet_pk")
         if value == Decimal("-1"):
-            return queryset.filter(period__wallet__pk=wallet_pk, entity__isnull=True)
-        return queryset.filter(period__wallet__pk=wallet_pk, entity__id=value)
+            return queryset.filter(wallet__pk=wallet_pk, entity__isnull=True)
+        return queryset.filter(wallet__pk=wallet_pk, entity__id=value)
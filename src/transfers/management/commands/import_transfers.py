@@ -0,0 +1,66 @@
+"""
+Django command to import bank statement file as Incomes and Expenses.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from entities.models import Deposit
+from transfers.services.transfer_import_service import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    CsvColumnMapping,
+    TransferImportService,
+    parse_csv_statement,
+    parse_ofx_statement,
+)
+
+
+class Command(BaseCommand):
+    """Django command to import bank statement (CSV or OFX) into Wallet Transfers."""
+
+    help = "Imports bank statement file as Incomes and Expenses of given Deposit."
+
+    def add_arguments(self, parser):
+        defaults = CsvColumnMapping._field_defaults
+        parser.add_argument("wallet", type=int, help="ID of Wallet.")
+        parser.add_argument("deposit", type=int, help="ID of Deposit, which statement is imported.")
+        parser.add_argument("path", type=str, help="Path to bank statement file.")
+        parser.add_argument("--format", choices=("csv", "ofx"), default="csv", help="Bank statement format.")
+        parser.add_argument("--encoding", default="utf-8-sig", help="Bank statement file encoding.")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE, help="Transfers per batch.")
+        parser.add_argument("--date-column", default=defaults["date_column"], help="CSV column with date.")
+        parser.add_argument("--value-column", default=defaults["value_column"], help="CSV column with signed value.")
+        parser.add_argument("--name-column", default=defaults["name_column"], help="CSV column with name.")
+        parser.add_argument(
+            "--description-column", default=defaults["description_column"], help="CSV column with description."
+        )
+        parser.add_argument("--date-format", default=defaults["date_format"], help="CSV date format.")
+        parser.add_argument("--delimiter", default=defaults["delimiter"], help="CSV delimiter.")
+        parser.add_argument(
+            "--decimal-separator", choices=(".", ","), default=defaults["decimal_separator"], help="Decimal separator."
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        if not Deposit.objects.filter(pk=options["deposit"], wallet_id=options["wallet"]).exists():
+            raise CommandError("Deposit does not exist in given Wallet.")
+        self.stdout.write(f"Importing {options['path']} into Wallet {options['wallet']}...")
+        with open(options["path"], encoding=options["encoding"], newline="") as statement_file:
+            rows = (
+                parse_ofx_statement(statement_file)
+                if options["format"] == "ofx"
+                else parse_csv_statement(
+                    statement_file,
+                    CsvColumnMapping(**{field_name: options[field_name] for field_name in CsvColumnMapping._fields}),
+                )
+            )
+            report = TransferImportService(
+                wallet_pk=options["wallet"], deposit_pk=options["deposit"], batch_size=options["batch_size"]
+            ).import_rows(rows)
+        for error in report.errors:
+            self.stdout.write(self.style.WARNING(f"Line {error.line_number}: {error.message}"))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Transfers imported: {report.imported_count}. Rows skipped: {report.skipped_count}. "
+                f"Rows/sec: {report.rows_per_second}."
+            )
+        )
@@ -0,0 +1,51 @@
+"""
+Django command to materialize RecurringTransfers occurrences in existing Periods.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from periods.models import Period
+from transfers.services.recurring_transfer_service import materialize_recurring_transfers
+
+
+class Command(BaseCommand):
+    """Django command to catch up RecurringTransfers occurrences not materialized yet in existing Periods."""
+
+    help = "Creates Transfers for RecurringTransfers occurrences due in existing Periods, not materialized yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--wallet", type=int, action="append", default=None, help="ID of Wallet. Can be passed many times."
+        )
+        parser.add_argument(
+            "--since", type=date.fromisoformat, default=None, help="Only Periods ending on or after date (YYYY-MM-DD)."
+        )
+        parser.add_argument("--batch-size", type=int, default=500, help="Number of Periods materialized at once.")
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        periods = Period.objects.order_by("id")
+        if options["wallet"]:
+            periods = periods.filter(wallet_id__in=options["wallet"])
+        if options["since"]:
+            periods = periods.filter(date_end__gte=options["since"])
+        self.stdout.write("Materializing recurring transfers...")
+        transfers_count = materialized_periods_count = 0
+        invalid_ids = set()
+        last_id = 0
+        while batch := list(periods.filter(id__gt=last_id)[: options["batch_size"]]):
+            last_id = batch[-1].id
+            result = materialize_recurring_transfers(batch)
+            transfers_count += len(result.transfers)
+            materialized_periods_count += result.materialized_periods_count
+            invalid_ids.update(result.invalid_recurring_transfers_ids)
+        for recurring_transfer_id in sorted(invalid_ids):
+            self.stdout.write(self.style.WARNING(f"Invalid RecurringTransfer {recurring_transfer_id} skipped."))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recurring transfers materialized. Created transfers: {transfers_count}, "
+                f"materialized periods: {materialized_periods_count}."
+            )
+        )
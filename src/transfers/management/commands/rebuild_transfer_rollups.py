@@ -0,0 +1,27 @@
+"""
+Django command to rebuild TransferRollup table from Transfers.
+"""
+
+from django.core.management.base import BaseCommand
+
+from transfers.services.transfer_rollup_service import rebuild_transfer_rollups
+
+
+class Command(BaseCommand):
+    """Django command to rebuild TransferRollup table from scratch."""
+
+    help = "Rebuilds TransferRollup table basing on existing Transfers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wallet", type=int, default=None, help="ID of Wallet to rebuild rollups for.")
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        wallet_id = options["wallet"]
+        self.stdout.write(
+            "Rebuilding transfer rollups for all Wallets..."
+            if wallet_id is None
+            else f"Rebuilding transfer rollups for Wallet {wallet_id}..."
+        )
+        rollups_count = rebuild_transfer_rollups(wallet_id=wallet_id)
+        self.stdout.write(self.style.SUCCESS(f"Transfer rollups rebuilt. Created rows: {rollups_count}."))
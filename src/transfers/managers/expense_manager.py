@@ -1,11 +1,14 @@
+from typing import Iterable
+
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import QuerySet
 
 from categories.models.choices.category_type import CategoryType
+from transfers.managers.transfer_manager import TransferQuerySet
 
 
-class ExpenseQuerySet(QuerySet):
+class ExpenseQuerySet(TransferQuerySet):
     """Custom ExpenseQuerySet for validating input data for Expense instances create and update."""
 
     def create(self, **kwargs):
@@ -18,6 +21,21 @@ class ExpenseQuerySet(QuerySet):
         kwargs["transfer_type"] = CategoryType.EXPENSE
         return super().create(**kwargs)
 
+    def bulk_create(self, objs: Iterable, *args, **kwargs) -> list:
+        """
+        Sets transfer_type of given objects before creating them.
+
+        Args:
+            objs (Iterable): Expense instances to create.
+
+        Returns:
+            list: Created Expense instances.
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.transfer_type = CategoryType.EXPENSE
+        return super().bulk_create(objs, *args, **kwargs)
+
     def update(self, **kwargs) -> int:
         """
         Method extended with additional check of "category" field.
@@ -28,7 +46,11 @@ class ExpenseQuerySet(QuerySet):
         Raises:
             ValidationError: Raised on category.category_type different from CategoryType.EXPENSE.
         """
-        if "category" in kwargs and kwargs["category"].category_type != CategoryType.EXPENSE:
+        if (
+            "category" in kwargs
+            and kwargs["category"] is not None
+            and kwargs["category"].category_type != CategoryType.EXPENSE
+        ):
             raise ValidationError("Expense model instance can not be created with IncomeCategory.")
         return super().update(**kwargs)
 
@@ -1,11 +1,14 @@
+from typing import Iterable
+
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import QuerySet
 
 from categories.models.choices.category_type import CategoryType
+from transfers.managers.transfer_manager import TransferQuerySet
 
 
-class IncomeQuerySet(QuerySet):
+class IncomeQuerySet(TransferQuerySet):
     """Custom IncomeQuerySet for validating input data for Income instances create and update."""
 
     def create(self, **kwargs):
@@ -18,6 +21,21 @@ class IncomeQuerySet(QuerySet):
         kwargs["transfer_type"] = CategoryType.INCOME
         return super().create(**kwargs)
 
+    def bulk_create(self, objs: Iterable, *args, **kwargs) -> list:
+        """
+        Sets transfer_type of given objects before creating them.
+
+        Args:
+            objs (Iterable): Income instances to create.
+
+        Returns:
+            list: Created Income instances.
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.transfer_type = CategoryType.INCOME
+        return super().bulk_create(objs, *args, **kwargs)
+
     def update(self, **kwargs) -> int:
         """
         Method extended with additional check of "category" field.
@@ -28,7 +46,11 @@ class IncomeQuerySet(QuerySet):
         Raises:
             ValidationError: Raised on category.category_type different from CategoryType.INCOME.
         """
-        if "category" in kwargs and kwargs["category"].category_type != CategoryType.INCOME:
+        if (
+            "category" in kwargs
+            and kwargs["category"] is not None
+            and kwargs["category"].category_type != CategoryType.INCOME
+        ):
             raise ValidationError("Income model instance can not be created with ExpenseCategory.")
         return super().update(**kwargs)
 
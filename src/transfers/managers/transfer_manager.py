@@ -0,0 +1,178 @@
+from typing import Iterable
+
+from django.db import connections, models, transaction
+from django.db.models import Model, QuerySet, Subquery, sql
+from django.db.models.deletion import Collector
+
+from app_infrastructure.signals import wallet_data_changed
+
+ROLLUP_AFFECTING_FIELDS = frozenset(
+    {
+        "period",
+        "period_id",
+        "deposit",
+        "deposit_id",
+        "category",
+        "category_id",
+        "entity",
+        "entity_id",
+        "transfer_type",
+        "value",
+    }
+)
+
+
+class TransferQuerySet(QuerySet):
+    """
+    Custom TransferQuerySet keeping TransferRollup table consistent and notifying about changed Wallets on bulk
+    Transfers operations.
+    """
+
+    def bulk_create(self, objs: Iterable, *args, **kwargs) -> list:
+        """
+        Extends bulk_create with setting Wallet of Transfers Periods and applying created Transfers
+        to TransferRollup table in the same transaction.
+
+        Args:
+            objs (Iterable): Transfer instances to create.
+
+        Returns:
+            list: Created Transfer instances.
+        """
+        from transfers.services.transfer_rollup_service import apply_rollup_deltas, get_objects_rollup_deltas
+
+        objs = list(objs)
+        self.set_periods_wallets(objs)
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            deltas = get_objects_rollup_deltas(objs)
+            apply_rollup_deltas(deltas)
+        wallet_data_changed.send(sender=self.model, wallet_ids={key.wallet_id for key in deltas})
+        return objs
+
+    def set_periods_wallets(self, objs: list[Model]) -> None:
+        """
+        Sets "wallet" of given Transfers to Wallet of their Periods. Wallets of Periods not cached on instances
+        are fetched with single query.
+
+        Args:
+            objs (list[Model]): Transfer instances.
+        """
+        from periods.models import Period
+
+        periods_wallets = {
+            obj.period_id: obj.period.wallet_id for obj in objs if self.model.period.is_cached(obj) and obj.period
+        }
+        if missing_periods_ids := {obj.period_id for obj in objs} - periods_wallets.keys():
+            periods_wallets.update(
+                Period.objects.using(self.db).filter(id__in=missing_periods_ids).values_list("id", "wallet_id")
+            )
+        for obj in objs:
+            obj.wallet_id = periods_wallets.get(obj.period_id)
+
+    def update(self, **kwargs) -> int:
+        """
+        Extends update with setting Wallet of updated Period and with moving updated Transfers between
+        TransferRollup rows in the same transaction.
+
+        Returns:
+            int: Number of affected database rows.
+        """
+        if period := kwargs.get("period", kwargs.get("period_id")):
+            from periods.models import Period
+
+            kwargs["wallet_id"] = (
+                period.wallet_id
+                if isinstance(period, Period)
+                else Subquery(Period.objects.filter(pk=period).values("wallet_id")[:1])
+            )
+        if not ROLLUP_AFFECTING_FIELDS.intersection(kwargs):
+            return super().update(**kwargs)
+
+        from transfers.services.transfer_rollup_service import (
+            apply_rollup_deltas,
+            get_queryset_rollup_deltas,
+            merge_rollup_deltas,
+        )
+
+        with transaction.atomic(using=self.db):
+            updated_transfers = self.model._base_manager.using(self.db).filter(
+                pk__in=list(self.values_list("pk", flat=True))
+            )
+            previous_deltas = get_queryset_rollup_deltas(updated_transfers, sign=-1)
+            rows = super().update(**kwargs)
+            current_deltas = get_queryset_rollup_deltas(updated_transfers)
+            apply_rollup_deltas(merge_rollup_deltas(previous_deltas, current_deltas))
+        wallet_data_changed.send(
+            sender=self.model, wallet_ids={key.wallet_id for key in (*previous_deltas, *current_deltas)}
+        )
+        return rows
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Extends delete with removing deleted Transfers from TransferRollup table in the same transaction.
+        If no signals nor cascades apply to deleted Transfers, they are deleted with single DELETE query
+        returning rollup deltas, without fetching deleted rows by Django Collector.
+
+        Returns:
+            tuple[int, dict[str, int]]: Number of deleted objects and number of deletions per model type.
+        """
+        from transfers.services.transfer_rollup_service import apply_rollup_deltas, get_queryset_rollup_deltas
+
+        with transaction.atomic(using=self.db):
+            if self.can_fast_delete():
+                deleted_count, deltas = self.fast_delete()
+                result = deleted_count, ({self.model._meta.label: deleted_count} if deleted_count else {})
+            else:
+                deltas = get_queryset_rollup_deltas(self, sign=-1)
+                result = super().delete()
+            apply_rollup_deltas(deltas)
+        wallet_data_changed.send(sender=self.model, wallet_ids={key.wallet_id for key in deltas})
+        return result
+
+    def can_fast_delete(self) -> bool:
+        """
+        Checks if QuerySet can be deleted with single DELETE query - if there are no signals nor cascades
+        for Transfer model and QuerySet is not sliced, distinct or combined.
+
+        Returns:
+            bool: True if QuerySet can be deleted without Django Collector.
+        """
+        if self.query.is_sliced or self.query.distinct or self.query.combinator or self._fields is not None:
+            return False
+        return Collector(using=self.db, origin=self).can_fast_delete(self)
+
+    def fast_delete(self) -> tuple[int, dict]:
+        """
+        Deletes QuerySet Transfers with single DELETE query, which returns deleted rows grouped by
+        TransferRollup keys, so rollup deltas are calculated by database in the same statement.
+
+        Returns:
+            tuple[int, dict]: Number of deleted Transfers and RollupDeltas of deleted Transfers.
+        """
+        from transfers.services.transfer_rollup_service import ROLLUP_KEY_LOOKUPS, RollupDelta, RollupKey
+
+        query = self._chain().query.clone()
+        query.clear_ordering(force=True)
+        delete_sql, params = query.chain(sql.DeleteQuery).get_compiler(self.db).as_sql()
+        columns = ", ".join(
+            connections[self.db].ops.quote_name(self.model._meta.get_field(lookup).column)
+            for lookup in ROLLUP_KEY_LOOKUPS.values()
+        )
+        value_column = connections[self.db].ops.quote_name(self.model._meta.get_field("value").column)
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"WITH deleted AS ({delete_sql} RETURNING {columns}, {value_column}) "
+                f"SELECT {columns}, COUNT(*), SUM({value_column}) FROM deleted GROUP BY {columns}",
+                params,
+            )
+            rows = cursor.fetchall()
+        deltas = {
+            RollupKey(**dict(zip(ROLLUP_KEY_LOOKUPS, row))): RollupDelta(transfers_count=-row[-2], value=-row[-1])
+            for row in rows
+        }
+        return sum(row[-2] for row in rows), deltas
+
+
+class TransferManager(models.Manager.from_queryset(TransferQuerySet)):
+    """Manager for Transfers."""
@@ -0,0 +1,115 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:28
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions.comparison
+
+
+def populate_transfer_rollups(apps, schema_editor):
+    Transfer = apps.get_model("transfers", "Transfer")
+    TransferRollup = apps.get_model("transfers", "TransferRollup")
+    rows = (
+        Transfer.objects.order_by()
+        .values("period__wallet_id", "period_id", "deposit_id", "category_id", "entity_id", "transfer_type")
+        .annotate(transfers_count=models.Count("id"), value_sum=models.Sum("value"))
+    )
+    TransferRollup.objects.bulk_create(
+        (
+            TransferRollup(
+                wallet_id=row["period__wallet_id"],
+                period_id=row["period_id"],
+                deposit_id=row["deposit_id"],
+                category_id=row["category_id"],
+                entity_id=row["entity_id"],
+                transfer_type=row["transfer_type"],
+                transfers_count=row["transfers_count"],
+                value=row["value_sum"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entities", "0001_initial"),
+        ("wallets", "0001_initial"),
+        ("categories", "0001_initial"),
+        ("periods", "0001_initial"),
+        ("transfers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransferRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("transfer_type", models.PositiveSmallIntegerField(choices=[(1, "📈 Income"), (2, "📉 Expense")])),
+                ("transfers_count", models.IntegerField(default=0)),
+                ("value", models.DecimalField(decimal_places=2, default=Decimal("0.00"), max_digits=20)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transfer_rollups",
+                        to="categories.transfercategory",
+                    ),
+                ),
+                (
+                    "deposit",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deposit_transfer_rollups",
+                        to="entities.deposit",
+                    ),
+                ),
+                (
+                    "entity",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entity_transfer_rollups",
+                        to="entities.entity",
+                    ),
+                ),
+                (
+                    "period",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transfer_rollups",
+                        to="periods.period",
+                    ),
+                ),
+                (
+                    "wallet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transfer_rollups",
+                        to="wallets.wallet",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "transfer rollups",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="transferrollup",
+            constraint=models.UniqueConstraint(
+                models.F("wallet"),
+                models.F("period"),
+                models.F("deposit"),
+                django.db.models.functions.comparison.Coalesce("category", 0),
+                django.db.models.functions.comparison.Coalesce("entity", 0),
+                models.F("transfer_type"),
+                name="transfers_transferrollup_unique_key",
+            ),
+        ),
+        migrations.RunPython(populate_transfer_rollups, migrations.RunPython.noop),
+    ]
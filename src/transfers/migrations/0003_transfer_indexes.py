@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transfers', '0002_transfer_rollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['period', 'category'], include=('deposit', 'value'), name='transfer_period_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['period', 'transfer_type'], include=('value',), name='transfer_period_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['deposit', 'transfer_type', 'period'], include=('value',), name='transfer_deposit_type_per_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['entity', 'period', 'transfer_type'], include=('value',), name='transfer_entity_per_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['period', 'date'], name='transfer_period_date_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_transfers_wallet(apps, schema_editor):
+    Period = apps.get_model("periods", "Period")
+    Transfer = apps.get_model("transfers", "Transfer")
+    Transfer.objects.update(
+        wallet_id=models.Subquery(Period.objects.filter(pk=models.OuterRef("period_id")).values("wallet_id")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0001_initial'),
+        ('periods', '0003_period_id_wallet_unique'),
+        ('transfers', '0003_transfer_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transfer',
+            name='wallet',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='transfers', to='wallets.wallet'),
+        ),
+        migrations.RunPython(
+            code=populate_transfers_wallet,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='transfer',
+            name='wallet',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, help_text='Wallet of Transfer Period, denormalized to filter Transfers without joining Periods', on_delete=django.db.models.deletion.CASCADE, related_name='transfers', to='wallets.wallet'),
+        ),
+        # Keeps Transfer wallet equal to Period wallet, also when Period is moved to another Wallet.
+        migrations.RunSQL(
+            sql=(
+                'ALTER TABLE "transfers_transfer" ADD CONSTRAINT "transfer_period_wallet_fk" '
+                'FOREIGN KEY ("period_id", "wallet_id") REFERENCES "periods_period" ("id", "wallet_id") '
+                'ON UPDATE CASCADE DEFERRABLE INITIALLY DEFERRED'
+            ),
+            reverse_sql='ALTER TABLE "transfers_transfer" DROP CONSTRAINT "transfer_period_wallet_fk"',
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['wallet', 'transfer_type', 'date'], include=('value',), name='transfer_wallet_type_date_idx'),
+        ),
+    ]
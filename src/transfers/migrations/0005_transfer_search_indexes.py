@@ -0,0 +1,46 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models.functions import Upper
+
+SEARCH_VECTOR_INDEX = GinIndex(
+    SearchVector("name", "description", config="simple"), name="transfer_search_vector_idx"
+)
+NAME_TRIGRAM_INDEX = GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="transfer_name_trgm_idx")
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    Creates GIN index on full-text search vector of Transfer name and description and, if pg_trgm extension
+    is available, GIN trigram index on upper-cased Transfer name serving case-insensitive substring search.
+    Indexes are created on PostgreSQL only.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    model = apps.get_model("transfers", "Transfer")
+    schema_editor.add_index(model, SEARCH_VECTOR_INDEX)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.add_index(model, NAME_TRIGRAM_INDEX)
+
+
+def drop_search_indexes(apps, schema_editor):
+    """Drops Transfer search indexes created by create_search_indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index in (SEARCH_VECTOR_INDEX, NAME_TRIGRAM_INDEX):
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(index.name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transfers', '0004_transfer_wallet'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, reverse_code=drop_search_indexes),
+    ]
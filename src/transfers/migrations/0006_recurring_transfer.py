@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:03
+
+from decimal import Decimal
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entities', '0001_initial'),
+        ('periods', '0003_period_id_wallet_unique'),
+        ('categories', '0001_initial'),
+        ('wallets', '0001_initial'),
+        ('transfers', '0005_transfer_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecurringTransfer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('transfer_type', models.PositiveSmallIntegerField(choices=[(1, '📈 Income'), (2, '📉 Expense')])),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('value', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('frequency', models.PositiveSmallIntegerField(choices=[(1, 'Monthly'), (2, 'Weekly'), (3, 'Every N days')])),
+                ('day_of_month', models.PositiveSmallIntegerField(blank=True, help_text='Day of month of MONTHLY occurrences. Last day of month used for shorter months.', null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(31)])),
+                ('interval_days', models.PositiveSmallIntegerField(blank=True, help_text='Number of days between EVERY_N_DAYS occurrences.', null=True, validators=[django.core.validators.MinValueValidator(1)])),
+                ('start_date', models.DateField(help_text='Date of first occurrence for WEEKLY and EVERY_N_DAYS frequencies, no occurrences before it.')),
+                ('end_date', models.DateField(blank=True, help_text='No occurrences after this date.', null=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='recurring_transfers', to='categories.transfercategory')),
+                ('deposit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deposit_recurring_transfers', to='entities.deposit')),
+                ('entity', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='entity_recurring_transfers', to='entities.entity')),
+                ('materialized_periods', models.ManyToManyField(blank=True, editable=False, help_text='Periods, for which occurrences were already materialized as Transfers.', related_name='materialized_recurring_transfers', to='periods.period')),
+                ('wallet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recurring_transfers', to='wallets.wallet')),
+            ],
+            options={
+                'verbose_name_plural': 'recurring transfers',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='recurringtransfer',
+            constraint=models.CheckConstraint(check=models.Q(('value__gt', Decimal('0.00'))), name='transfers_recurringtransfer_value_gt_0'),
+        ),
+        migrations.AddConstraint(
+            model_name='recurringtransfer',
+            constraint=models.CheckConstraint(check=models.Q(('entity', models.F('deposit')), _negated=True), name='transfers_recurringtransfer_deposit_and_entity_not_the_same'),
+        ),
+        migrations.AddConstraint(
+            model_name='recurringtransfer',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('day_of_month__gte', 1), ('day_of_month__lte', 31), ('frequency', 1)), ('frequency', 2), models.Q(('frequency', 3), ('interval_days__gte', 1)), _connector='OR'), name='transfers_recurringtransfer_valid_schedule'),
+        ),
+        migrations.AddConstraint(
+            model_name='recurringtransfer',
+            constraint=models.CheckConstraint(check=models.Q(('end_date__isnull', True), ('end_date__gte', models.F('start_date')), _connector='OR'), name='transfers_recurringtransfer_end_date_not_before_start_date'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from .expense_model import Expense
 from .income_model import Income
+from .recurring_transfer_model import RecurringTransfer
 from .transfer_model import Transfer
+from .transfer_rollup_model import TransferRollup
 
-__all__ = ["Transfer", "Expense", "Income"]
+__all__ = ["Transfer", "Expense", "Income", "RecurringTransfer", "TransferRollup"]
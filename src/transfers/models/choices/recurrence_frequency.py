@@ -0,0 +1,9 @@
+from django.db import models
+
+
+class RecurrenceFrequency(models.IntegerChoices):
+    """Choices for RecurringTransfer.frequency field."""
+
+    MONTHLY = 1, "Monthly"
+    WEEKLY = 2, "Weekly"
+    EVERY_N_DAYS = 3, "Every N days"
@@ -0,0 +1,189 @@
+import calendar
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+
+from categories.models.choices.category_type import CategoryType
+from transfers.models.choices.recurrence_frequency import RecurrenceFrequency
+
+
+class RecurringTransfer(models.Model):
+    """
+    Template of Transfer repeated with schedule rule. Occurrences due in Period are materialized as Transfers
+    once per Period - on Period creation or with materialize_recurring_transfers command.
+    """
+
+    wallet = models.ForeignKey("wallets.Wallet", on_delete=models.CASCADE, related_name="recurring_transfers")
+    transfer_type = models.PositiveSmallIntegerField(choices=CategoryType.choices, null=False, blank=False)
+    name = models.CharField(max_length=255, blank=True, null=False)
+    description = models.TextField(blank=True, null=True)
+    value = models.DecimalField(max_digits=10, decimal_places=2)
+    entity = models.ForeignKey(
+        "entities.Entity",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="entity_recurring_transfers",
+    )
+    deposit = models.ForeignKey(
+        "entities.Deposit",
+        on_delete=models.CASCADE,
+        blank=False,
+        null=False,
+        related_name="deposit_recurring_transfers",
+    )
+    category = models.ForeignKey(
+        "categories.TransferCategory",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="recurring_transfers",
+    )
+    frequency = models.PositiveSmallIntegerField(choices=RecurrenceFrequency.choices, null=False, blank=False)
+    day_of_month = models.PositiveSmallIntegerField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(1), MaxValueValidator(31)],
+        help_text="Day of month of MONTHLY occurrences. Last day of month used for shorter months.",
+    )
+    interval_days = models.PositiveSmallIntegerField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(1)],
+        help_text="Number of days between EVERY_N_DAYS occurrences.",
+    )
+    start_date = models.DateField(
+        null=False,
+        blank=False,
+        help_text="Date of first occurrence for WEEKLY and EVERY_N_DAYS frequencies, no occurrences before it.",
+    )
+    end_date = models.DateField(null=True, blank=True, help_text="No occurrences after this date.")
+    materialized_periods = models.ManyToManyField(
+        "periods.Period",
+        blank=True,
+        editable=False,
+        related_name="materialized_recurring_transfers",
+        help_text="Periods, for which occurrences were already materialized as Transfers.",
+    )
+
+    class Meta:
+        verbose_name_plural = "recurring transfers"
+        constraints = (
+            models.CheckConstraint(
+                name="%(app_label)s_%(class)s_value_gt_0",
+                check=models.Q(value__gt=Decimal("0.00")),
+            ),
+            models.CheckConstraint(
+                name="%(app_label)s_%(class)s_deposit_and_entity_not_the_same",
+                check=models.Q(_negated=True, entity=models.F("deposit")),
+            ),
+            models.CheckConstraint(
+                name="%(app_label)s_%(class)s_valid_schedule",
+                check=models.Q(frequency=RecurrenceFrequency.MONTHLY, day_of_month__gte=1, day_of_month__lte=31)
+                | models.Q(frequency=RecurrenceFrequency.WEEKLY)
+                | models.Q(frequency=RecurrenceFrequency.EVERY_N_DAYS, interval_days__gte=1),
+            ),
+            models.CheckConstraint(
+                name="%(app_label)s_%(class)s_end_date_not_before_start_date",
+                check=models.Q(end_date__isnull=True) | models.Q(end_date__gte=models.F("start_date")),
+            ),
+        )
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Override save method to execute validation before saving model in database. Validation compares Wallet
+        IDs of related objects, which are taken from cached related objects or loaded with at most one query.
+        """
+        from app_infrastructure.services.wallet_relations_service import WalletRelationsLookup
+
+        relations = WalletRelationsLookup().get_instance_relations(self, ("deposit", "entity", "category"))
+        self.validate_wallet(relations)
+        self.validate_deposit(relations)
+        self.validate_schedule()
+        super().save(*args, **kwargs)
+
+    def validate_wallet(self, relations: dict) -> None:
+        """
+        Checks if Wallet of category, entity and deposit is the same as RecurringTransfer Wallet.
+
+        Args:
+            relations (dict): RelatedObjectData by field name.
+
+        Raises:
+            ValidationError: Raised when different wallet for one of category, entity and deposit fields.
+        """
+        if any(data is not None and data.wallet_id != self.wallet_id for data in relations.values()):
+            raise ValidationError(
+                "Wallet for category, entity and deposit fields is not the same.", code="wallet-invalid"
+            )
+
+    def validate_deposit(self, relations: dict) -> None:
+        """
+        Checks if "deposit" field is Deposit, different from "entity" and the same as TransferCategory Deposit.
+
+        Args:
+            relations (dict): RelatedObjectData by field name.
+
+        Raises:
+            ValidationError: Raised on invalid "deposit" field value.
+        """
+        if relations["deposit"] is not None and not relations["deposit"].is_deposit:
+            raise ValidationError('Value of "deposit" field has to be Deposit model instance.', code="deposit-invalid")
+        if self.entity_id is not None and self.entity_id == self.deposit_id:
+            raise ValidationError("'deposit' and 'entity' fields cannot contain the same value.")
+        if relations["category"] is not None and relations["category"].deposit_id != self.deposit_id:
+            raise ValidationError("Transfer Deposit and Transfer Category Deposit has to be the same.")
+
+    def validate_schedule(self) -> None:
+        """
+        Checks if fields required by frequency are set and if end_date is not before start_date.
+
+        Raises:
+            ValidationError: Raised on invalid schedule.
+        """
+        if self.frequency == RecurrenceFrequency.MONTHLY and not 1 <= (self.day_of_month or 0) <= 31:
+            raise ValidationError("'day_of_month' between 1 and 31 is required for monthly frequency.")
+        if self.frequency == RecurrenceFrequency.EVERY_N_DAYS and not (self.interval_days or 0) >= 1:
+            raise ValidationError("'interval_days' greater than 0 is required for every N days frequency.")
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValidationError("'end_date' cannot be before 'start_date'.")
+
+    def get_occurrence_dates(self, date_start: date, date_end: date) -> list[date]:
+        """
+        Returns dates of occurrences due in given date range, limited to start_date and end_date.
+
+        Args:
+            date_start (date): First date of range.
+            date_end (date): Last date of range.
+
+        Returns:
+            list[date]: Occurrences dates in ascending order.
+        """
+        date_start = max(date_start, self.start_date)
+        date_end = min(date_end, self.end_date or date_end)
+        if date_start > date_end:
+            return []
+        if self.frequency == RecurrenceFrequency.MONTHLY:
+            dates = []
+            year, month = date_start.year, date_start.month
+            while (year, month) <= (date_end.year, date_end.month):
+                day = min(self.day_of_month, calendar.monthrange(year, month)[1])
+                if date_start <= (occurrence := date(year, month, day)) <= date_end:
+                    dates.append(occurrence)
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            return dates
+        step = 7 if self.frequency == RecurrenceFrequency.WEEKLY else self.interval_days
+        first = self.start_date + timedelta(days=-(-(date_start - self.start_date).days // step) * step)
+        return [first + timedelta(days=offset) for offset in range(0, (date_end - first).days + 1, step)]
+
+    def __str__(self) -> str:
+        """
+        Returns string representation of RecurringTransfer model instance.
+
+        Returns:
+            str: Custom string representation of instance.
+        """
+        return f"{self.name} | {self.get_frequency_display()} | {self.value}"
@@ -1,11 +1,14 @@
 from decimal import Decimal
+from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 
+from app_infrastructure.signals import wallet_data_changed
 from categories.models.choices.category_type import CategoryType
 from transfers.managers.expense_manager import ExpenseManager
 from transfers.managers.income_manager import IncomeManager
+from transfers.managers.transfer_manager import TransferManager
 
 
 class Transfer(models.Model):
@@ -16,6 +19,16 @@ class Transfer(models.Model):
     description = models.TextField(blank=True, null=True)
     value = models.DecimalField(max_digits=10, decimal_places=2)
     date = models.DateField(null=False, blank=False)
+    wallet = models.ForeignKey(
+        "wallets.Wallet",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=False,
+        editable=False,
+        db_index=False,
+        related_name="transfers",
+        help_text="Wallet of Transfer Period, denormalized to filter Transfers without joining Periods",
+    )
     period = models.ForeignKey(
         "periods.Period", blank=False, null=False, on_delete=models.CASCADE, related_name="transfers"
     )
@@ -29,12 +42,28 @@ class Transfer(models.Model):
         "categories.TransferCategory", on_delete=models.SET_NULL, blank=True, null=True, related_name="transfers"
     )
 
-    objects = models.Manager()
+    objects = TransferManager()
     incomes = IncomeManager()
     expenses = ExpenseManager()
 
     class Meta:
         verbose_name_plural = "transfers"
+        indexes = (
+            models.Index(
+                fields=("period", "category"), include=("deposit", "value"), name="transfer_period_category_idx"
+            ),
+            models.Index(fields=("period", "transfer_type"), include=("value",), name="transfer_period_type_idx"),
+            models.Index(
+                fields=("deposit", "transfer_type", "period"), include=("value",), name="transfer_deposit_type_per_idx"
+            ),
+            models.Index(
+                fields=("entity", "period", "transfer_type"), include=("value",), name="transfer_entity_per_type_idx"
+            ),
+            models.Index(fields=("period", "date"), name="transfer_period_date_idx"),
+            models.Index(
+                fields=("wallet", "transfer_type", "date"), include=("value",), name="transfer_wallet_type_date_idx"
+            ),
+        )
         constraints = (
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s_value_gt_0",
@@ -46,50 +75,112 @@ class Transfer(models.Model):
             ),
         )
 
-    def save(self, *args, **kwargs) -> None:
+    def save(self, *args, wallet_relations_lookup: Any = None, **kwargs) -> None:
+        """
+        Override save method to execute validation before saving model in database, to set Wallet of Period
+        and to apply saved changes to TransferRollup table. Validation compares Wallet IDs of related objects, which
+        are taken from cached related objects or loaded with at most one query.
+
+        Args:
+            wallet_relations_lookup (WalletRelationsLookup | None): Lookup shared between saved instances.
         """
-        Override save method to execute validation before saving model in database.
+        from app_infrastructure.services.wallet_relations_service import WalletRelationsLookup
+        from transfers.services.transfer_rollup_service import (
+            apply_rollup_deltas,
+            get_objects_rollup_deltas,
+            get_queryset_rollup_deltas,
+            merge_rollup_deltas,
+        )
+
+        relations = (wallet_relations_lookup or WalletRelationsLookup()).get_instance_relations(
+            self, ("period", "deposit", "entity", "category")
+        )
+        self.validate_wallet(relations)
+        self.validate_period(relations)
+        self.validate_deposit(relations)
+        self.wallet_id = getattr(relations["period"], "wallet_id", None)
+        with transaction.atomic():
+            previous_deltas = (
+                {} if self._state.adding else get_queryset_rollup_deltas(Transfer.objects.filter(pk=self.pk), sign=-1)
+            )
+            super().save(*args, **kwargs)
+            apply_rollup_deltas(merge_rollup_deltas(previous_deltas, get_objects_rollup_deltas([self])))
+
+    def delete(self, *args, **kwargs) -> tuple[int, dict[str, int]]:
         """
-        self.validate_wallet()
-        self.validate_period()
-        self.validate_deposit()
-        super().save(*args, **kwargs)
+        Override delete method to remove deleted Transfer from TransferRollup table and notify about changed Wallet.
 
-    def validate_wallet(self) -> None:
+        Returns:
+            tuple[int, dict[str, int]]: Number of deleted objects and number of deletions per model type.
+        """
+        from transfers.services.transfer_rollup_service import apply_rollup_deltas, get_queryset_rollup_deltas
+
+        with transaction.atomic():
+            deltas = get_queryset_rollup_deltas(Transfer.objects.filter(pk=self.pk), sign=-1)
+            result = super().delete(*args, **kwargs)
+            apply_rollup_deltas(deltas)
+        wallet_data_changed.send(sender=type(self), wallet_ids={key.wallet_id for key in deltas})
+        return result
+
+    def _get_relations(self, relations: dict | None) -> dict:
+        """
+        Returns given RelatedObjectData of related objects or loads them with WalletRelationsLookup.
+
+        Args:
+            relations (dict | None): RelatedObjectData by field name.
+
+        Returns:
+            dict: RelatedObjectData by field name.
+        """
+        if relations is not None:
+            return relations
+        from app_infrastructure.services.wallet_relations_service import WalletRelationsLookup
+
+        return WalletRelationsLookup().get_instance_relations(self, ("period", "deposit", "entity", "category"))
+
+    def validate_wallet(self, relations: dict | None = None) -> None:
         """
         Checks if wallet fields for period, category, entity and deposit are the same.
 
+        Args:
+            relations (dict | None): RelatedObjectData by field name. Loaded if not given.
+
         Raises:
             ValidationError: Raised when different wallet for one of period, category, entity and deposit fields.
         """
-        field_wallets = [self.deposit.wallet]
-        if self.category:
-            field_wallets.append(self.category.wallet)
-        if self.entity:
-            field_wallets.append(self.entity.wallet)
-        if not all((self.period.wallet == field_wallet for field_wallet in field_wallets)):
+        relations = self._get_relations(relations)
+        wallet_ids = {data.wallet_id for data in relations.values() if data is not None}
+        if len(wallet_ids) > 1:
             raise ValidationError(
                 "Wallet for period, category, entity and deposit fields is not the same.", code="wallet-invalid"
             )
 
-    def validate_period(self) -> None:
+    def validate_period(self, relations: dict | None = None) -> None:
         """
         Checks if Transfer "date" field value is between given "period" date range.
 
+        Args:
+            relations (dict | None): RelatedObjectData by field name. Loaded if not given.
+
         Raises:
             ValidationError: Raised when "date" field is out of given "period" date range.
         """
-        if not (self.period.date_start <= self.date <= self.period.date_end):
+        period = self._get_relations(relations)["period"]
+        if period is not None and not (period.date_start <= self.date <= period.date_end):
             raise ValidationError("Transfer date not in period date range.", code="date-invalid")
 
-    def validate_deposit(self) -> None:
+    def validate_deposit(self, relations: dict | None = None) -> None:
         """
         Checks if Entity instance from "deposit" field is marked as Deposit proxy.
 
+        Args:
+            relations (dict | None): RelatedObjectData by field name. Loaded if not given.
+
         Raises:
             ValidationError: Raised when is_deposit value is False for "deposit" field object.
         """
-        if not self.deposit.is_deposit:
+        deposit = self._get_relations(relations)["deposit"]
+        if deposit is not None and not deposit.is_deposit:
             raise ValidationError('Value of "deposit" field has to be Deposit model instance.', code="deposit-invalid")
 
     def __str__(self) -> str:
@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+from django.db import models
+from django.db.models.functions import Coalesce
+
+from categories.models.choices.category_type import CategoryType
+
+
+class TransferRollup(models.Model):
+    """
+    TransferRollup model storing number and sum of Transfers values grouped by Wallet, Period, Deposit,
+    TransferCategory, Entity and transfer type. Maintained on every Transfer write.
+    """
+
+    wallet = models.ForeignKey("wallets.Wallet", on_delete=models.CASCADE, related_name="transfer_rollups")
+    period = models.ForeignKey("periods.Period", on_delete=models.CASCADE, related_name="transfer_rollups")
+    deposit = models.ForeignKey("entities.Deposit", on_delete=models.CASCADE, related_name="deposit_transfer_rollups")
+    category = models.ForeignKey(
+        "categories.TransferCategory",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="transfer_rollups",
+    )
+    entity = models.ForeignKey(
+        "entities.Entity", on_delete=models.CASCADE, blank=True, null=True, related_name="entity_transfer_rollups"
+    )
+    transfer_type = models.PositiveSmallIntegerField(choices=CategoryType.choices, null=False, blank=False)
+    transfers_count = models.IntegerField(default=0)
+    value = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal("0.00"))
+
+    class Meta:
+        verbose_name_plural = "transfer rollups"
+        constraints = (
+            models.UniqueConstraint(
+                "wallet",
+                "period",
+                "deposit",
+                Coalesce("category", 0),
+                Coalesce("entity", 0),
+                "transfer_type",
+                name="%(app_label)s_%(class)s_unique_key",
+            ),
+        )
+
+    def __str__(self) -> str:
+        """
+        Returns string representation of TransferRollup model instance.
+
+        Returns:
+            str: Custom string representation of instance.
+        """
+        return f"{self.period} | {self.deposit} | {self.category} | {self.entity} | {self.value}"
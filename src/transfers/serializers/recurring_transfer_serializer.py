@@ -0,0 +1,50 @@
+from collections import OrderedDict
+
+from django.db.models import Model
+from rest_framework.exceptions import ValidationError
+
+from transfers.models.recurring_transfer_model import RecurringTransfer
+from transfers.serializers.transfer_serializer import TransferSerializer
+
+
+class RecurringTransferSerializer(TransferSerializer):
+    """Class for serializing RecurringTransfer model instances."""
+
+    class Meta:
+        model: Model = RecurringTransfer
+        fields: tuple[str] = (
+            "id",
+            "transfer_type",
+            "name",
+            "description",
+            "value",
+            "frequency",
+            "day_of_month",
+            "interval_days",
+            "start_date",
+            "end_date",
+            "entity",
+            "deposit",
+            "category",
+        )
+        read_only_fields: tuple[str] = ("id",)
+
+    def validate(self, attrs: OrderedDict) -> OrderedDict:
+        """
+        Extends Transfer validation with checking if TransferCategory type is the same as RecurringTransfer type.
+
+        Args:
+            attrs (OrderedDict): Dictionary containing all given params.
+
+        Returns:
+            OrderedDict: Validated dictionary containing all given params.
+
+        Raises:
+            ValidationError: Raised on TransferCategory of other type than RecurringTransfer.
+        """
+        attrs = super().validate(attrs)
+        transfer_type = attrs.get("transfer_type") or getattr(self.instance, "transfer_type", None)
+        category = attrs.get("category") or getattr(self.instance, "category", None)
+        if category and category.category_type != transfer_type:
+            raise ValidationError("Invalid TransferCategory for RecurringTransfer type provided.")
+        return attrs
@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from entities.models import Deposit
+from transfers.services.transfer_import_service import CsvColumnMapping
+
+
+class StatementFormat:
+    """Supported bank statement file formats."""
+
+    CSV = "csv"
+    OFX = "ofx"
+    choices = (CSV, OFX)
+
+
+class TransferImportSerializer(serializers.Serializer):
+    """Serializer validating bank statement import request."""
+
+    file = serializers.FileField()
+    statement_format = serializers.ChoiceField(choices=StatementFormat.choices, default=StatementFormat.CSV)
+    deposit = serializers.PrimaryKeyRelatedField(queryset=Deposit.objects.all())
+    encoding = serializers.CharField(default="utf-8-sig")
+    date_column = serializers.CharField(default=CsvColumnMapping._field_defaults["date_column"])
+    value_column = serializers.CharField(default=CsvColumnMapping._field_defaults["value_column"])
+    name_column = serializers.CharField(default=CsvColumnMapping._field_defaults["name_column"])
+    description_column = serializers.CharField(
+        default=CsvColumnMapping._field_defaults["description_column"], allow_blank=True
+    )
+    date_format = serializers.CharField(default=CsvColumnMapping._field_defaults["date_format"])
+    delimiter = serializers.CharField(default=CsvColumnMapping._field_defaults["delimiter"], max_length=1)
+    decimal_separator = serializers.ChoiceField(choices=(".", ","), default=".")
+
+    @property
+    def _wallet_pk(self) -> int:
+        """
+        Property for retrieving Wallet primary key passed in URL.
+
+        Returns:
+            int: Wallet model instance PK.
+        """
+        return int(getattr(self.context.get("view"), "kwargs", {}).get("wallet_pk", 0))
+
+    def validate_deposit(self, deposit: Deposit) -> Deposit:
+        """
+        Checks if Deposit belongs to Wallet passed in URL.
+
+        Args:
+            deposit (Deposit): Deposit model instance.
+
+        Returns:
+            Deposit: Validated Deposit.
+
+        Raises:
+            ValidationError: Raised on not matching wallet_pk values.
+        """
+        if deposit.wallet_id != self._wallet_pk:
+            raise ValidationError("Deposit from different Wallet.")
+        return deposit
+
+    @staticmethod
+    def validate_encoding(encoding: str) -> str:
+        """
+        Checks if given encoding is known.
+
+        Args:
+            encoding (str): Name of file encoding.
+
+        Returns:
+            str: Validated encoding.
+
+        Raises:
+            ValidationError: Raised on unknown encoding.
+        """
+        try:
+            "".encode(encoding)
+        except LookupError:
+            raise ValidationError("Unknown encoding.")
+        return encoding
+
+    def validate(self, attrs: OrderedDict) -> OrderedDict:
+        """
+        Builds CsvColumnMapping from given CSV options.
+
+        Args:
+            attrs (OrderedDict): Dictionary containing all given params.
+
+        Returns:
+            OrderedDict: Validated dictionary containing "column_mapping" instead of CSV options.
+        """
+        attrs["column_mapping"] = CsvColumnMapping(
+            **{field_name: attrs.pop(field_name) for field_name in CsvColumnMapping._fields}
+        )
+        if not attrs["column_mapping"].description_column:
+            attrs["column_mapping"] = attrs["column_mapping"]._replace(description_column=None)
+        return attrs
@@ -1,6 +1,10 @@
 from collections import OrderedDict
+from datetime import date
 from decimal import Decimal
+from typing import Any
 
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from django.db.models import Model
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -8,16 +12,113 @@ from rest_framework.exceptions import ValidationError
 from categories.models import TransferCategory
 from entities.models import Deposit, Entity
 from periods.models import Period
+from periods.services.period_index_service import get_period_index
 from transfers.models.transfer_model import Transfer
 
+BULK_CREATE_MAX_SIZE = 1000
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField resolving objects from "prefetched_objects" serializer context, if it was filled
+    for field. Otherwise, objects are fetched from database one by one.
+    """
+
+    def to_internal_value(self, data: Any) -> Model:
+        """
+        Returns object with given primary key from prefetched objects.
+
+        Args:
+            data (Any): Primary key of object.
+
+        Returns:
+            Model: Object with given primary key.
+
+        Raises:
+            ValidationError: Raised when object with given primary key does not exist.
+        """
+        prefetched_objects = self.context.get("prefetched_objects", {}).get(self.field_name)
+        if prefetched_objects is None:
+            return super().to_internal_value(data)
+        try:
+            pk = self.get_queryset().model._meta.pk.to_python(data)
+        except (TypeError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return prefetched_objects[pk]
+        except (KeyError, TypeError):
+            self.fail("does_not_exist", pk_value=data)
+
+
+class TransferListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer for creating multiple Transfers at once. Referenced Periods, Entities, Deposits and
+    TransferCategories are fetched with single query per model before validation, so items are validated
+    in memory. Transfers are created with single bulk_create.
+    """
+
+    def to_internal_value(self, data: Any) -> list[OrderedDict]:
+        """
+        Prefetches objects referenced by items before validating them.
+
+        Args:
+            data (Any): List of Transfers data.
+
+        Returns:
+            list[OrderedDict]: List of validated Transfers data.
+        """
+        if isinstance(data, list):
+            self._prefetch_related_objects(data)
+        return super().to_internal_value(data)
+
+    def _prefetch_related_objects(self, data: list) -> None:
+        """
+        Fills serializer context with objects referenced by items and with Wallet PeriodIndex.
+
+        Args:
+            data (list): List of Transfers data.
+        """
+        items = [item for item in data if isinstance(item, dict)]
+        prefetched_objects = {}
+        for field_name, field in self.child.fields.items():
+            if field.read_only or not isinstance(field, PrefetchedPrimaryKeyRelatedField):
+                continue
+            pks = set()
+            for item in items:
+                try:
+                    pks.add(field.get_queryset().model._meta.pk.to_python(item.get(field_name)))
+                except (TypeError, DjangoValidationError):
+                    continue
+            pks.discard(None)
+            prefetched_objects[field_name] = field.get_queryset().in_bulk(pks) if pks else {}
+        self.context["prefetched_objects"] = prefetched_objects
+        self.context["period_index"] = get_period_index(self.child._wallet_pk)
+
+    def create(self, validated_data: list[dict]) -> list[Transfer]:
+        """
+        Creates Transfers with single bulk_create query.
+
+        Args:
+            validated_data (list[dict]): List of validated Transfers data.
+
+        Returns:
+            list[Transfer]: Created Transfers.
+        """
+        model = self.child.Meta.model
+        with transaction.atomic():
+            return model.objects.bulk_create([model(**attrs) for attrs in validated_data])
+
 
 class TransferSerializer(serializers.ModelSerializer):
     """Class for serializing Transfer model instances."""
 
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     class Meta:
         model: Model = Transfer
         fields: tuple[str] = ("id", "name", "description", "value", "date", "period", "entity", "deposit", "category")
         read_only_fields: tuple[str] = ("id", "period")
+        list_serializer_class = TransferListSerializer
 
     @property
     def _wallet_pk(self) -> int:
@@ -57,7 +158,7 @@ class TransferSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: Raised on not matching wallet_pk values.
         """
-        if entity and entity.wallet.pk != self._wallet_pk:
+        if entity and entity.wallet_id != self._wallet_pk:
             raise ValidationError("Entity from different Wallet.")
         return entity
 
@@ -74,7 +175,7 @@ class TransferSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: Raised on not matching wallet_pk values.
         """
-        if deposit.wallet.pk != self._wallet_pk:
+        if deposit.wallet_id != self._wallet_pk:
             raise ValidationError("Deposit from different Wallet.")
         return deposit
 
@@ -91,13 +192,14 @@ class TransferSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: Raised on not matching wallet_pk values.
         """
-        if category and category.wallet.pk != self._wallet_pk:
+        if category and category.wallet_id != self._wallet_pk:
             raise ValidationError("TransferCategory from different Wallet.")
         return category
 
     def validate(self, attrs: OrderedDict) -> OrderedDict:
         """
-        Additional validation of "deposit" and "entity" fields, that cannot contain the same value.
+        Additional validation of "deposit" and "entity" fields, that cannot contain the same value. For bulk update
+        these checks depend on values of every updated Transfer, so they are executed by bulk_update_transfers.
 
         Args:
             attrs (OrderedDict): Dictionary containing all given params.
@@ -106,17 +208,34 @@ class TransferSerializer(serializers.ModelSerializer):
             OrderedDict: Validated dictionary containing all given params.
         """
         if "date" in attrs:
-            try:
-                attrs["period"] = Period.objects.get(
-                    wallet=self._wallet_pk, date_start__lte=attrs["date"], date_end__gte=attrs["date"]
-                )
-            except Period.DoesNotExist:
-                raise ValidationError("Period matching given date does not exist.")
+            attrs["period"] = self._get_period_for_date(attrs["date"])
+        if self.context.get("bulk_update"):
+            return attrs
         deposit = attrs.get("deposit") or getattr(self.instance, "deposit", None)
         entity = attrs.get("entity") or getattr(self.instance, "entity", None)
         category = attrs.get("category") or getattr(self.instance, "category", None)
         if any([deposit, entity]) and deposit == entity:
             raise ValidationError("'deposit' and 'entity' fields cannot contain the same value.")
-        if category and deposit != category.deposit:
+        if category and getattr(deposit, "pk", None) != category.deposit_id:
             raise ValidationError("Transfer Deposit and Transfer Category Deposit has to be the same.")
         return attrs
+
+    def _get_period_for_date(self, transfer_date: date) -> Period:
+        """
+        Returns Wallet Period containing given date. Period is searched in Wallet PeriodIndex, taken once
+        for all items by TransferListSerializer.
+
+        Args:
+            transfer_date (date): Date of Transfer.
+
+        Returns:
+            Period: Period containing given date.
+
+        Raises:
+            ValidationError: Raised when no Period contains given date.
+        """
+        period_index = self.context.get("period_index") or get_period_index(self._wallet_pk)
+        period = period_index.get_period(transfer_date)
+        if period is None:
+            raise ValidationError("Period matching given date does not exist.")
+        return period
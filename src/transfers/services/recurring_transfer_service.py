@@ -0,0 +1,111 @@
+from typing import Iterable, NamedTuple
+
+from django.db import transaction
+from django.db.models import BooleanField, ExpressionWrapper, F, Q
+
+from periods.models import Period
+from transfers.models.recurring_transfer_model import RecurringTransfer
+from transfers.models.transfer_model import Transfer
+
+
+class MaterializationResult(NamedTuple):
+    """Result of materializing RecurringTransfers occurrences."""
+
+    transfers: list[Transfer]
+    materialized_periods_count: int
+    invalid_recurring_transfers_ids: list[int]
+
+
+def get_invalid_recurring_transfer_condition() -> Q:
+    """
+    Returns condition matching RecurringTransfers, which cannot be materialized because of changes made in related
+    objects after RecurringTransfer was saved - Deposit, Entity or TransferCategory of other Wallet, Entity equal
+    to Deposit, TransferCategory of other Deposit or of other type.
+
+    Returns:
+        Q: Condition matching invalid RecurringTransfers.
+    """
+    return (
+        Q(deposit__is_deposit=False)
+        | ~Q(deposit__wallet_id=F("wallet_id"))
+        | Q(entity_id=F("deposit_id"))
+        | Q(entity__isnull=False) & ~Q(entity__wallet_id=F("wallet_id"))
+        | Q(category__isnull=False)
+        & (
+            ~Q(category__wallet_id=F("wallet_id"))
+            | ~Q(category__deposit_id=F("deposit_id"))
+            | ~Q(category__category_type=F("transfer_type"))
+        )
+    )
+
+
+def materialize_recurring_transfers(periods: Iterable[Period]) -> MaterializationResult:
+    """
+    Creates Transfers for all RecurringTransfers occurrences due in given Periods, not materialized for them yet.
+    RecurringTransfers of Periods Wallets are fetched and validated with single query, all occurrences are created
+    with single bulk_create and materialized Periods are marked with single insert, so every RecurringTransfer
+    is materialized only once per Period. Invalid RecurringTransfers are skipped and not marked.
+
+    Args:
+        periods (Iterable[Period]): Periods to materialize occurrences for.
+
+    Returns:
+        MaterializationResult: Created Transfers, number of materialized (RecurringTransfer, Period) pairs and IDs
+        of skipped invalid RecurringTransfers.
+    """
+    periods_by_wallet = {}
+    for period in periods:
+        periods_by_wallet.setdefault(period.wallet_id, []).append(period)
+    if not periods_by_wallet:
+        return MaterializationResult(transfers=[], materialized_periods_count=0, invalid_recurring_transfers_ids=[])
+    all_periods = [period for wallet_periods in periods_by_wallet.values() for period in wallet_periods]
+    through_model = RecurringTransfer.materialized_periods.through
+    with transaction.atomic():
+        recurring_transfers = list(
+            RecurringTransfer.objects.filter(
+                Q(end_date__isnull=True) | Q(end_date__gte=min(period.date_start for period in all_periods)),
+                wallet_id__in=periods_by_wallet,
+                start_date__lte=max(period.date_end for period in all_periods),
+            )
+            .annotate(is_invalid=ExpressionWrapper(get_invalid_recurring_transfer_condition(), BooleanField()))
+            .select_for_update(of=("self",))
+            .order_by("id")
+        )
+        materialized = set(
+            through_model.objects.filter(
+                recurringtransfer_id__in=[recurring_transfer.pk for recurring_transfer in recurring_transfers],
+                period_id__in=[period.pk for period in all_periods],
+            ).values_list("recurringtransfer_id", "period_id")
+        )
+        transfers, markers, invalid_ids = [], [], []
+        for recurring_transfer in recurring_transfers:
+            for period in periods_by_wallet[recurring_transfer.wallet_id]:
+                if (recurring_transfer.pk, period.pk) in materialized or not (
+                    recurring_transfer.start_date <= period.date_end
+                    and (recurring_transfer.end_date is None or recurring_transfer.end_date >= period.date_start)
+                ):
+                    continue
+                if recurring_transfer.is_invalid:
+                    invalid_ids.append(recurring_transfer.pk)
+                    break
+                transfers.extend(
+                    Transfer(
+                        transfer_type=recurring_transfer.transfer_type,
+                        name=recurring_transfer.name,
+                        description=recurring_transfer.description,
+                        value=recurring_transfer.value,
+                        date=occurrence_date,
+                        period=period,
+                        entity_id=recurring_transfer.entity_id,
+                        deposit_id=recurring_transfer.deposit_id,
+                        category_id=recurring_transfer.category_id,
+                    )
+                    for occurrence_date in recurring_transfer.get_occurrence_dates(period.date_start, period.date_end)
+                )
+                markers.append(through_model(recurringtransfer_id=recurring_transfer.pk, period_id=period.pk))
+        if transfers:
+            transfers = Transfer.objects.bulk_create(transfers)
+        through_model.objects.bulk_create(markers)
+    return MaterializationResult(
+        transfers=transfers, materialized_periods_count=len(markers), invalid_recurring_transfers_ids=invalid_ids
+    )
@@ -0,0 +1,87 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, Q, QuerySet, Value
+
+BULK_UPDATE_FIELDS = ("category", "entity", "deposit", "description", "date")
+
+
+def get_patched_value(attrs: dict, field_name: str, current_value: F) -> F | Value:
+    """
+    Returns expression of field ID after applying patch.
+
+    Args:
+        attrs (dict): Validated patch.
+        field_name (str): Name of foreign key field.
+        current_value (F): Expression of field ID before applying patch.
+
+    Returns:
+        F | Value: Patched ID value or current one, if field is not patched.
+    """
+    if field_name not in attrs:
+        return current_value
+    return Value(getattr(attrs[field_name], "pk", None), output_field=IntegerField())
+
+
+def validate_patched_transfers(queryset: QuerySet, attrs: dict) -> None:
+    """
+    Checks with single aggregate query, if any of Transfers would be invalid after applying patch - if its
+    "deposit" and "entity" would contain the same value or if its TransferCategory Deposit would differ from its
+    Deposit.
+
+    Args:
+        queryset (QuerySet): Updated Transfers.
+        attrs (dict): Validated patch.
+
+    Raises:
+        ValidationError: Raised when any of patched Transfers is invalid.
+    """
+    checks = {}
+    if {"deposit", "entity"} & attrs.keys():
+        checks["deposit_is_entity"] = Count("pk", filter=Q(patched_entity_id=F("patched_deposit_id")))
+    if {"deposit", "category"} & attrs.keys():
+        checks["deposit_not_category_deposit"] = Count(
+            "pk",
+            filter=Q(patched_category_deposit_id__isnull=False)
+            & ~Q(patched_category_deposit_id=F("patched_deposit_id")),
+        )
+    if not checks:
+        return
+    category_deposit_id = (
+        Value(getattr(attrs["category"], "deposit_id", None), output_field=IntegerField())
+        if "category" in attrs
+        else F("category__deposit_id")
+    )
+    invalid_counts = (
+        queryset.order_by()
+        .annotate(
+            patched_deposit_id=get_patched_value(attrs, "deposit", F("deposit_id")),
+            patched_entity_id=get_patched_value(attrs, "entity", F("entity_id")),
+            patched_category_deposit_id=category_deposit_id,
+        )
+        .aggregate(**checks)
+    )
+    if invalid_counts.get("deposit_is_entity"):
+        raise ValidationError("'deposit' and 'entity' fields cannot contain the same value.")
+    if invalid_counts.get("deposit_not_category_deposit"):
+        raise ValidationError("Transfer Deposit and Transfer Category Deposit has to be the same.")
+
+
+def bulk_update_transfers(queryset: QuerySet, attrs: dict) -> int:
+    """
+    Applies validated patch to given Transfers with single UPDATE query. Patch is validated against Wallet once
+    by serializer, rules depending on values of updated Transfers are checked with single aggregate query. Period
+    for patched date is resolved once by serializer, as all updated Transfers belong to the same Wallet.
+
+    Args:
+        queryset (QuerySet): Updated Transfers.
+        attrs (dict): Patch validated by Transfer serializer.
+
+    Returns:
+        int: Number of updated Transfers.
+
+    Raises:
+        ValidationError: Raised when any of patched Transfers is invalid.
+    """
+    with transaction.atomic():
+        validate_patched_transfers(queryset, attrs)
+        return queryset.update(**attrs)
@@ -0,0 +1,147 @@
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
+from django.db.models import DateField, DurationField, F, IntegerField, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Cast
+
+from app_infrastructure.signals import wallet_data_changed
+from entities.models import Deposit
+from periods.models import Period
+from transfers.models.transfer_model import Transfer
+from transfers.services.transfer_rollup_service import apply_rollup_deltas, get_queryset_rollup_deltas
+
+COPIED_COLUMNS = {
+    "transfer_type": "copy_transfer_type",
+    "name": "copy_name",
+    "description": "copy_description",
+    "value": "copy_value",
+    "date": "copy_date",
+    "wallet_id": "copy_wallet_id",
+    "period_id": "copy_period_id",
+    "entity_id": "copy_entity_id",
+    "deposit_id": "copy_deposit_id",
+    "category_id": "copy_category_id",
+}
+
+
+def get_copy_source_queryset(
+    queryset: QuerySet, months_shift: int = 0, days_shift: int = 0, deposit_pk: int | None = None
+) -> QuerySet:
+    """
+    Returns QuerySet of values of Transfers copies. Date of copy is shifted by given number of months and days
+    and its Period is resolved again within Transfer Wallet, so copy without matching Period gets NULL Period.
+    Target Deposit is resolved within Transfer Wallet as well, so Deposit of other Wallet gives NULL Deposit.
+
+    Args:
+        queryset (QuerySet): Copied Transfers.
+        months_shift (int): Number of months to shift date of copies by.
+        days_shift (int): Number of days to shift date of copies by.
+        deposit_pk (int | None): ID of Deposit set for copies. Deposit of copied Transfer used if not given.
+
+    Returns:
+        QuerySet: QuerySet of copy values tuples ordered by ID of copied Transfer.
+    """
+    queryset = queryset.order_by().annotate(
+        copy_id=F("id"),
+        copy_transfer_type=F("transfer_type"),
+        copy_name=F("name"),
+        copy_description=F("description"),
+        copy_value=F("value"),
+        copy_wallet_id=F("wallet_id"),
+        copy_entity_id=F("entity_id"),
+        copy_category_id=F("category_id"),
+        copy_category_deposit_id=F("category__deposit_id"),
+    )
+    if months_shift or days_shift:
+        queryset = queryset.annotate(
+            copy_date=Cast(
+                F("date") + Cast(Value(f"{months_shift} months {days_shift} days"), DurationField()), DateField()
+            )
+        ).annotate(
+            copy_period_id=Subquery(
+                Period.objects.filter(
+                    wallet_id=OuterRef("wallet_id"),
+                    date_start__lte=OuterRef("copy_date"),
+                    date_end__gte=OuterRef("copy_date"),
+                ).values("pk")[:1],
+                output_field=IntegerField(),
+            )
+        )
+    else:
+        queryset = queryset.annotate(copy_date=F("date"), copy_period_id=F("period_id"))
+    if deposit_pk is not None:
+        queryset = queryset.annotate(
+            copy_deposit_id=Subquery(
+                Deposit.objects.filter(pk=deposit_pk, wallet_id=OuterRef("wallet_id")).values("pk")[:1],
+                output_field=IntegerField(),
+            )
+        )
+    else:
+        queryset = queryset.annotate(copy_deposit_id=F("deposit_id"))
+    return queryset.order_by("copy_id").values_list("copy_id", "copy_category_deposit_id", *COPIED_COLUMNS.values())
+
+
+def copy_transfers(
+    queryset: QuerySet, months_shift: int = 0, days_shift: int = 0, deposit_pk: int | None = None
+) -> list[int]:
+    """
+    Copies given Transfers with single INSERT ... SELECT statement, so copied rows never leave the database.
+    Copies are validated in the same statement - nothing is inserted if any copy has no Period for its shifted
+    date or has invalid target Deposit. Copies are applied to TransferRollup table afterwards.
+
+    Args:
+        queryset (QuerySet): Copied Transfers.
+        months_shift (int): Number of months to shift date of copies by.
+        days_shift (int): Number of days to shift date of copies by.
+        deposit_pk (int | None): ID of Deposit set for copies. Deposit of copied Transfer used if not given.
+
+    Returns:
+        list[int]: IDs of created copies, ordered the same as copied Transfers.
+
+    Raises:
+        ValidationError: Raised when any of copies is invalid.
+    """
+    source_sql, source_params = get_copy_source_queryset(
+        queryset, months_shift, days_shift, deposit_pk
+    ).query.sql_with_params()
+    errors = {
+        "missing_period": "copy_period_id IS NULL",
+        "invalid_deposit": "copy_deposit_id IS NULL",
+        "deposit_is_entity": "copy_deposit_id = copy_entity_id",
+        "deposit_not_category_deposit": (
+            "copy_category_deposit_id <> copy_deposit_id" if deposit_pk is not None else "FALSE"
+        ),
+    }
+    sql = f"""
+        WITH source AS ({source_sql}),
+        inserted AS (
+            INSERT INTO {Transfer._meta.db_table} ({", ".join(COPIED_COLUMNS)})
+            SELECT {", ".join(COPIED_COLUMNS.values())} FROM source
+            WHERE NOT EXISTS (SELECT 1 FROM source WHERE {" OR ".join(f"({error})" for error in errors.values())})
+            ORDER BY copy_id
+            RETURNING id
+        )
+        SELECT
+            ARRAY(SELECT id FROM inserted ORDER BY id),
+            {", ".join(f"COUNT(*) FILTER (WHERE {error})" for error in errors.values())}
+        FROM source
+    """
+    connection = connections[queryset.db]
+    with transaction.atomic(using=queryset.db):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, source_params)
+            ids, *errors_counts = cursor.fetchone()
+        errors_counts = dict(zip(errors, errors_counts))
+        if errors_counts["missing_period"]:
+            raise ValidationError(
+                {"date": f"No Period for shifted date of {errors_counts['missing_period']} copied Transfers."}
+            )
+        if errors_counts["invalid_deposit"]:
+            raise ValidationError({"deposit": "Deposit from different Wallet."})
+        if errors_counts["deposit_is_entity"]:
+            raise ValidationError({"deposit": "'deposit' and 'entity' fields cannot contain the same value."})
+        if errors_counts["deposit_not_category_deposit"]:
+            raise ValidationError({"deposit": "Transfer Deposit and Transfer Category Deposit has to be the same."})
+        deltas = get_queryset_rollup_deltas(Transfer.objects.using(queryset.db).filter(pk__in=ids))
+        apply_rollup_deltas(deltas)
+    wallet_data_changed.send(sender=Transfer, wallet_ids={key.wallet_id for key in deltas})
+    return ids
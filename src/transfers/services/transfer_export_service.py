@@ -0,0 +1,141 @@
+import csv
+import json
+from typing import Any, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+DEFAULT_EXPORT_CHUNK_SIZE = 2000
+EXPORT_FIELDS = ("id", "name", "description", "value", "date", "period", "entity", "deposit", "category")
+
+
+class ExportFormat:
+    """Supported Transfers export formats with their content types."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+    choices = (CSV, NDJSON)
+    content_types = {CSV: "text/csv", NDJSON: "application/x-ndjson"}
+
+
+class _EchoBuffer:
+    """File-like object returning written value instead of storing it, used to get lines from csv.writer."""
+
+    @staticmethod
+    def write(value: str) -> str:
+        """
+        Returns given value.
+
+        Args:
+            value (str): Value written by csv.writer.
+
+        Returns:
+            str: Given value.
+        """
+        return value
+
+
+def iterate_transfers_values(
+    queryset: QuerySet, fields: tuple[str, ...] = EXPORT_FIELDS, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterates over Transfers values without caching them in QuerySet. On PostgreSQL rows are fetched
+    from server-side cursor in chunks of given size, so memory usage does not depend on number of rows.
+
+    Args:
+        queryset (QuerySet): Transfers QuerySet.
+        fields (tuple[str, ...]): Exported fields. Relations are exported as primary keys.
+        chunk_size (int): Number of rows fetched from database at once.
+
+    Returns:
+        Iterator[dict[str, Any]]: Iterator over Transfers values.
+    """
+    return queryset.prefetch_related(None).values(*fields).iterator(chunk_size=chunk_size)
+
+
+def _join_in_chunks(lines: Iterator[str], chunk_size: int) -> Iterator[str]:
+    """
+    Joins lines into chunks, to not send every line separately.
+
+    Args:
+        lines (Iterator[str]): Lines iterator.
+        chunk_size (int): Number of lines in single chunk.
+
+    Returns:
+        Iterator[str]: Iterator over chunks of lines.
+    """
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def stream_transfers_csv(
+    queryset: QuerySet, fields: tuple[str, ...] = EXPORT_FIELDS, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Streams Transfers as CSV. Header is yielded before query is executed.
+
+    Args:
+        queryset (QuerySet): Transfers QuerySet.
+        fields (tuple[str, ...]): Exported fields.
+        chunk_size (int): Number of rows fetched from database and yielded at once.
+
+    Returns:
+        Iterator[str]: Iterator over CSV chunks.
+    """
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(fields)
+    yield from _join_in_chunks(
+        (
+            writer.writerow([row[field] for field in fields])
+            for row in iterate_transfers_values(queryset, fields, chunk_size)
+        ),
+        chunk_size,
+    )
+
+
+def stream_transfers_ndjson(
+    queryset: QuerySet, fields: tuple[str, ...] = EXPORT_FIELDS, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Streams Transfers as newline delimited JSON objects.
+
+    Args:
+        queryset (QuerySet): Transfers QuerySet.
+        fields (tuple[str, ...]): Exported fields.
+        chunk_size (int): Number of rows fetched from database and yielded at once.
+
+    Returns:
+        Iterator[str]: Iterator over NDJSON chunks.
+    """
+    yield from _join_in_chunks(
+        (
+            json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+            for row in iterate_transfers_values(queryset, fields, chunk_size)
+        ),
+        chunk_size,
+    )
+
+
+def stream_transfers(
+    queryset: QuerySet, export_format: str, chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Streams Transfers in given format.
+
+    Args:
+        queryset (QuerySet): Transfers QuerySet.
+        export_format (str): One of ExportFormat choices.
+        chunk_size (int): Number of rows fetched from database and yielded at once.
+
+    Returns:
+        Iterator[str]: Iterator over exported chunks.
+    """
+    if export_format == ExportFormat.NDJSON:
+        return stream_transfers_ndjson(queryset, chunk_size=chunk_size)
+    return stream_transfers_csv(queryset, chunk_size=chunk_size)
@@ -0,0 +1,375 @@
+import csv
+import html
+import logging
+import re
+import time
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Iterator, NamedTuple
+
+from django.db import connection, transaction
+
+from app_infrastructure.signals import wallet_data_changed
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from periods.services.period_index_service import get_period_index
+from transfers.models.transfer_model import Transfer
+from transfers.services.transfer_rollup_service import apply_rollup_deltas, get_objects_rollup_deltas
+
+logger = logging.getLogger("default")
+
+DEFAULT_IMPORT_BATCH_SIZE = 2000
+MAX_REPORTED_ERRORS = 100
+STAGING_TABLE_NAME = "transfers_import_staging"
+STAGING_FIELDS = (
+    "transfer_type",
+    "name",
+    "description",
+    "value",
+    "date",
+    "wallet",
+    "period",
+    "entity",
+    "deposit",
+    "category",
+)
+OFX_TAG_PATTERN = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+
+
+class StatementRow(NamedTuple):
+    """Single operation parsed from bank statement. Positive value means Income, negative one means Expense."""
+
+    line_number: int
+    date: date
+    value: Decimal
+    name: str
+    description: str
+
+
+class ImportRowError(NamedTuple):
+    """Error of single bank statement row, that could not be imported."""
+
+    line_number: int
+    message: str
+
+
+class CsvColumnMapping(NamedTuple):
+    """Mapping of CSV bank statement columns onto Transfer fields and CSV format options."""
+
+    date_column: str = "date"
+    value_column: str = "value"
+    name_column: str = "name"
+    description_column: str | None = "description"
+    date_format: str = "%Y-%m-%d"
+    delimiter: str = ","
+    decimal_separator: str = "."
+
+
+class ImportReport(NamedTuple):
+    """Summary of bank statement import."""
+
+    imported_count: int
+    skipped_count: int
+    errors: list[ImportRowError]
+    duration: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Returns import throughput.
+
+        Returns:
+            float: Number of processed rows per second.
+        """
+        rows_count = self.imported_count + self.skipped_count
+        return round(rows_count / self.duration, 2) if self.duration else float(rows_count)
+
+
+def parse_decimal(value: str, decimal_separator: str = ".") -> Decimal:
+    """
+    Parses amount from bank statement, ignoring whitespaces and thousands separators.
+
+    Args:
+        value (str): Amount as string, f.e. "-1 234,56".
+        decimal_separator (str): Decimal separator used in amount.
+
+    Returns:
+        Decimal: Parsed amount.
+
+    Raises:
+        ValueError: Raised when amount can not be parsed.
+    """
+    value = re.sub(r"\s", "", value)
+    thousands_separator = "," if decimal_separator == "." else "."
+    value = value.replace(thousands_separator, "").replace(decimal_separator, ".")
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}.")
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: {value!r}.")
+    return amount
+
+
+def parse_csv_statement(
+    lines: Iterable[str], mapping: CsvColumnMapping = CsvColumnMapping()
+) -> Iterator[StatementRow | ImportRowError]:
+    """
+    Lazily parses CSV bank statement with header row into StatementRows. Rows that can not be parsed
+    are yielded as ImportRowErrors.
+
+    Args:
+        lines (Iterable[str]): Lines of CSV file.
+        mapping (CsvColumnMapping): Mapping of CSV columns onto Transfer fields.
+
+    Yields:
+        StatementRow | ImportRowError: Parsed row or parsing error.
+    """
+    reader = csv.DictReader(lines, delimiter=mapping.delimiter)
+    for row in reader:
+        try:
+            yield StatementRow(
+                line_number=reader.line_num,
+                date=datetime.strptime(row[mapping.date_column].strip(), mapping.date_format).date(),
+                value=parse_decimal(row[mapping.value_column], mapping.decimal_separator),
+                name=(row[mapping.name_column] or "").strip(),
+                description=(row.get(mapping.description_column) or "").strip() if mapping.description_column else "",
+            )
+        except KeyError as error:
+            yield ImportRowError(reader.line_num, f"Missing column: {error.args[0]}.")
+        except (TypeError, ValueError, AttributeError) as error:
+            yield ImportRowError(reader.line_num, str(error))
+
+
+def parse_ofx_statement(lines: Iterable[str]) -> Iterator[StatementRow | ImportRowError]:
+    """
+    Lazily parses OFX (both SGML and XML flavours) bank statement into StatementRows. Only STMTTRN aggregates
+    are read - TRNAMT, DTPOSTED, NAME and MEMO tags. Transactions that can not be parsed are yielded
+    as ImportRowErrors.
+
+    Args:
+        lines (Iterable[str]): Lines of OFX file.
+
+    Yields:
+        StatementRow | ImportRowError: Parsed row or parsing error.
+    """
+    transaction_data = None
+    transaction_line_number = 0
+    for line_number, line in enumerate(lines, start=1):
+        for closing, tag, value in OFX_TAG_PATTERN.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN" and not closing:
+                transaction_data, transaction_line_number = {}, line_number
+            elif tag == "STMTTRN" and transaction_data is not None:
+                yield _get_ofx_statement_row(transaction_line_number, transaction_data)
+                transaction_data = None
+            elif transaction_data is not None and not closing:
+                transaction_data[tag] = html.unescape(value.strip())
+
+
+def _get_ofx_statement_row(line_number: int, transaction_data: dict[str, str]) -> StatementRow | ImportRowError:
+    """
+    Converts values of OFX STMTTRN aggregate into StatementRow.
+
+    Args:
+        line_number (int): Number of line, where STMTTRN aggregate started.
+        transaction_data (dict[str, str]): Values of STMTTRN tags.
+
+    Returns:
+        StatementRow | ImportRowError: Parsed row or parsing error.
+    """
+    try:
+        return StatementRow(
+            line_number=line_number,
+            date=datetime.strptime(transaction_data["DTPOSTED"][:8], "%Y%m%d").date(),
+            value=parse_decimal(transaction_data["TRNAMT"]),
+            name=transaction_data.get("NAME", ""),
+            description=transaction_data.get("MEMO", ""),
+        )
+    except KeyError as error:
+        return ImportRowError(line_number, f"Missing tag: {error.args[0]}.")
+    except ValueError as error:
+        return ImportRowError(line_number, str(error))
+
+
+class TransferImportService:
+    """
+    Service importing bank statement rows as Incomes and Expenses of single Deposit. Rows are matched with
+    Wallet Periods by date and written in fixed-size batches - with COPY into staging table on PostgreSQL
+    and with bulk_create on other databases.
+
+    Args:
+        wallet_pk (int): Wallet ID.
+        deposit_pk (int): ID of Deposit, which statement is imported.
+        batch_size (int): Number of Transfers written at once.
+    """
+
+    def __init__(self, wallet_pk: int, deposit_pk: int, batch_size: int = DEFAULT_IMPORT_BATCH_SIZE):
+        self.wallet_pk = wallet_pk
+        self.deposit_pk = deposit_pk
+        self.batch_size = batch_size
+        self.period_index = get_period_index(wallet_pk)
+        self.value_field = Transfer._meta.get_field("value")
+        self.name_max_length = Transfer._meta.get_field("name").max_length
+
+    def import_rows(self, rows: Iterable[StatementRow | ImportRowError]) -> ImportReport:
+        """
+        Imports given bank statement rows. All batches are written in single transaction.
+
+        Args:
+            rows (Iterable[StatementRow | ImportRowError]): Parsed bank statement rows.
+
+        Returns:
+            ImportReport: Summary of import.
+        """
+        start = time.perf_counter()
+        imported_count, skipped_count, errors = 0, 0, []
+        batch = []
+        with transaction.atomic():
+            for row in rows:
+                result = row if isinstance(row, ImportRowError) else self._get_transfer(row)
+                if isinstance(result, ImportRowError):
+                    skipped_count += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(result)
+                    continue
+                batch.append(result)
+                if len(batch) >= self.batch_size:
+                    imported_count += self._write_batch(batch)
+                    batch = []
+            if batch:
+                imported_count += self._write_batch(batch)
+        if imported_count and connection.vendor == "postgresql":
+            wallet_data_changed.send(sender=Transfer, wallet_ids={int(self.wallet_pk)})
+        report = ImportReport(
+            imported_count=imported_count,
+            skipped_count=skipped_count,
+            errors=errors,
+            duration=time.perf_counter() - start,
+        )
+        logger.info(
+            f"Bank statement imported | Wallet ID: {self.wallet_pk} | Deposit ID: {self.deposit_pk} | "
+            f"Imported: {report.imported_count} | Skipped: {report.skipped_count} | "
+            f"Rows/sec: {report.rows_per_second}"
+        )
+        return report
+
+    def _get_period(self, transfer_date: date) -> Period | None:
+        """
+        Finds Wallet Period containing given date.
+
+        Args:
+            transfer_date (date): Date of Transfer.
+
+        Returns:
+            Period | None: Period containing given date or None if there is no such Period.
+        """
+        return self.period_index.get_period(transfer_date)
+
+    def _get_transfer(self, row: StatementRow) -> Transfer | ImportRowError:
+        """
+        Maps bank statement row onto Income or Expense depending on value sign.
+
+        Args:
+            row (StatementRow): Parsed bank statement row.
+
+        Returns:
+            Transfer | ImportRowError: Transfer to be created or error of row.
+        """
+        period = self._get_period(row.date)
+        if period is None:
+            return ImportRowError(row.line_number, f"Period matching date {row.date} does not exist.")
+        try:
+            value = abs(row.value).quantize(Decimal("0.01"))
+        except InvalidOperation:
+            return ImportRowError(row.line_number, f"Value {row.value} is too big.")
+        if not value:
+            return ImportRowError(row.line_number, "Value should be different than 0.00.")
+        if len(value.as_tuple().digits) > self.value_field.max_digits:
+            return ImportRowError(row.line_number, f"Value {row.value} is too big.")
+        return Transfer(
+            transfer_type=CategoryType.INCOME if row.value > 0 else CategoryType.EXPENSE,
+            name=row.name[: self.name_max_length],
+            description=row.description,
+            value=value,
+            date=row.date,
+            wallet_id=period.wallet_id,
+            period=period,
+            deposit_id=self.deposit_pk,
+        )
+
+    def _write_batch(self, transfers: list[Transfer]) -> int:
+        """
+        Writes batch of Transfers into database.
+
+        Args:
+            transfers (list[Transfer]): Transfers to be created.
+
+        Returns:
+            int: Number of created Transfers.
+        """
+        if connection.vendor != "postgresql":
+            return len(Transfer.objects.bulk_create(transfers))
+        fields = [Transfer._meta.get_field(field_name) for field_name in STAGING_FIELDS]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(Transfer._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE IF NOT EXISTS {STAGING_TABLE_NAME} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE_NAME} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                CsvCopyBuffer([getattr(transfer, field.attname) for field in fields] for transfer in transfers),
+            )
+            cursor.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {STAGING_TABLE_NAME}")
+            cursor.execute(f"TRUNCATE {STAGING_TABLE_NAME}")
+        apply_rollup_deltas(get_objects_rollup_deltas(transfers))
+        return len(transfers)
+
+
+class CsvCopyBuffer:
+    """
+    File-like object generating CSV content for COPY command on demand, row by row. NULL values are written
+    as unquoted empty strings and all other values are quoted, so empty strings are not taken for NULLs.
+
+    Args:
+        rows (Iterable[list]): Rows of values.
+    """
+
+    def __init__(self, rows: Iterable[list]):
+        self.rows = iter(rows)
+        self.buffer = ""
+
+    @staticmethod
+    def _format_row(row: list) -> str:
+        """
+        Formats row of values as CSV line.
+
+        Args:
+            row (list): Row values.
+
+        Returns:
+            str: CSV line.
+        """
+        return ",".join("" if value is None else '"' + str(value).replace('"', '""') + '"' for value in row) + "\n"
+
+    def read(self, size: int = -1) -> str:
+        """
+        Returns next chunk of CSV content.
+
+        Args:
+            size (int): Maximal length of returned chunk. Whole remaining content returned if negative.
+
+        Returns:
+            str: CSV content chunk. Empty string at the end of content.
+        """
+        while size < 0 or len(self.buffer) < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            self.buffer += self._format_row(row)
+        if size < 0:
+            size = len(self.buffer)
+        chunk, self.buffer = self.buffer[:size], self.buffer[size:]
+        return chunk
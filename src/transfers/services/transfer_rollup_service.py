@@ -0,0 +1,243 @@
+from collections import defaultdict
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+from typing import Iterable, NamedTuple
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Q, QuerySet, Sum
+
+from transfers.models.transfer_model import Transfer
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+class RollupKey(NamedTuple):
+    """Set of TransferRollup fields identifying single rollup row."""
+
+    wallet_id: int
+    period_id: int
+    deposit_id: int
+    category_id: int | None
+    entity_id: int | None
+    transfer_type: int
+
+
+class RollupDelta(NamedTuple):
+    """Change of transfers number and values sum for single TransferRollup row."""
+
+    transfers_count: int
+    value: Decimal
+
+
+RollupDeltas = dict[RollupKey, RollupDelta]
+
+ROLLUP_KEY_LOOKUPS = {
+    "wallet_id": "wallet_id",
+    "period_id": "period_id",
+    "deposit_id": "deposit_id",
+    "category_id": "category_id",
+    "entity_id": "entity_id",
+    "transfer_type": "transfer_type",
+}
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def is_transfer_rollups_enabled() -> bool:
+    """
+    Checks if aggregating readers should use TransferRollup table instead of Transfer table.
+
+    Returns:
+        bool: Value of TRANSFER_ROLLUPS_ENABLED setting.
+    """
+    return getattr(settings, "TRANSFER_ROLLUPS_ENABLED", False)
+
+
+def get_transfer_aggregate_model() -> type[models.Model]:
+    """
+    Returns model to be used as source of Transfers sums. Both returned models contain "period", "deposit",
+    "category", "entity", "transfer_type" and "value" fields, so they can be queried the same way for sums.
+
+    Returns:
+        type[models.Model]: TransferRollup model if rollups are enabled, Transfer model otherwise.
+    """
+    return TransferRollup if is_transfer_rollups_enabled() else Transfer
+
+
+def merge_rollup_deltas(*deltas_collection: RollupDeltas) -> RollupDeltas:
+    """
+    Merges given RollupDeltas dictionaries into single one by summing deltas with the same key.
+
+    Args:
+        *deltas_collection (RollupDeltas): RollupDeltas dictionaries to merge.
+
+    Returns:
+        RollupDeltas: Merged deltas.
+    """
+    counts = defaultdict(int)
+    values = defaultdict(Decimal)
+    for deltas in deltas_collection:
+        for key, delta in deltas.items():
+            counts[key] += delta.transfers_count
+            values[key] += delta.value
+    return {key: RollupDelta(transfers_count=counts[key], value=values[key]) for key in counts}
+
+
+def get_queryset_rollup_deltas(queryset: QuerySet, sign: int = 1) -> RollupDeltas:
+    """
+    Calculates RollupDeltas for Transfers in given QuerySet with single grouping query.
+
+    Args:
+        queryset (QuerySet): Transfers QuerySet.
+        sign (int): 1 for Transfers being added to rollups, -1 for Transfers being removed from them.
+
+    Returns:
+        RollupDeltas: Deltas for Transfers from QuerySet.
+    """
+    rows = (
+        queryset.order_by()
+        .values(*ROLLUP_KEY_LOOKUPS.values())
+        .annotate(rollup_transfers_count=Count("id"), rollup_value=Sum("value"))
+    )
+    return {
+        RollupKey(**{field: row[lookup] for field, lookup in ROLLUP_KEY_LOOKUPS.items()}): RollupDelta(
+            transfers_count=sign * row["rollup_transfers_count"], value=sign * row["rollup_value"]
+        )
+        for row in rows
+    }
+
+
+def get_objects_rollup_deltas(objs: Iterable[Transfer], sign: int = 1) -> RollupDeltas:
+    """
+    Calculates RollupDeltas for given Transfer instances.
+
+    Args:
+        objs (Iterable[Transfer]): Transfer instances.
+        sign (int): 1 for Transfers being added to rollups, -1 for Transfers being removed from them.
+
+    Returns:
+        RollupDeltas: Deltas for given Transfers.
+    """
+    counts = defaultdict(int)
+    values = defaultdict(Decimal)
+    for obj in objs:
+        key = RollupKey(
+            wallet_id=obj.wallet_id,
+            period_id=obj.period_id,
+            deposit_id=obj.deposit_id,
+            category_id=obj.category_id,
+            entity_id=obj.entity_id,
+            transfer_type=obj.transfer_type,
+        )
+        counts[key] += sign
+        values[key] += sign * Decimal(str(obj.value))
+    return {key: RollupDelta(transfers_count=counts[key], value=values[key]) for key in counts}
+
+
+def apply_rollup_deltas(deltas: RollupDeltas, update_predictions: bool = True) -> None:
+    """
+    Applies given RollupDeltas to TransferRollup table. Existing rows are updated with F() expressions, missing
+    rows are created and rows without any Transfer left are removed. Persisted current_result of matching
+    ExpensePredictions is updated with the same deltas.
+
+    Args:
+        deltas (RollupDeltas): Deltas to apply.
+        update_predictions (bool): Whether deltas change ExpensePredictions results too.
+    """
+    from predictions.services.prediction_result_service import apply_prediction_result_deltas
+
+    emptied_keys = []
+    with transaction.atomic():
+        if update_predictions:
+            apply_prediction_result_deltas(deltas)
+        for key, delta in deltas.items():
+            if not delta.transfers_count and not delta.value:
+                continue
+            if not _update_rollup(key, delta):
+                try:
+                    with transaction.atomic():
+                        TransferRollup.objects.create(
+                            **key._asdict(), transfers_count=delta.transfers_count, value=delta.value
+                        )
+                except IntegrityError:
+                    _update_rollup(key, delta)
+            if delta.transfers_count < 0:
+                emptied_keys.append(key)
+        if emptied_keys:
+            TransferRollup.objects.filter(
+                reduce(or_, (Q(**key._asdict()) for key in emptied_keys)), transfers_count__lte=0
+            ).delete()
+
+
+def _update_rollup(key: RollupKey, delta: RollupDelta) -> int:
+    """
+    Increments TransferRollup row for given key with RollupDelta values.
+
+    Args:
+        key (RollupKey): Key of updated TransferRollup row.
+        delta (RollupDelta): Values to add.
+
+    Returns:
+        int: Number of updated rows.
+    """
+    return TransferRollup.objects.filter(**key._asdict()).update(
+        transfers_count=F("transfers_count") + delta.transfers_count, value=F("value") + delta.value
+    )
+
+
+def move_rollups_to_null_bucket(field_name: str, instance_pk: int, excluded_deposit_pk: int | None = None) -> None:
+    """
+    Moves sums of TransferRollup rows pointing to object being deleted to rows with NULL value in given field,
+    which reflects SET_NULL behaviour of Transfer "category" and "entity" foreign keys. Moved rows are removed
+    by database cascade afterwards.
+
+    Args:
+        field_name (str): Name of nullable TransferRollup field - "category" or "entity".
+        instance_pk (int): Primary key of object being deleted.
+        excluded_deposit_pk (int | None): Primary key of Deposit, which rollups will be removed entirely.
+    """
+    queryset = TransferRollup.objects.filter(**{f"{field_name}_id": instance_pk})
+    if excluded_deposit_pk is not None:
+        queryset = queryset.exclude(deposit_id=excluded_deposit_pk)
+    deltas = {}
+    for rollup in queryset:
+        key = RollupKey(
+            wallet_id=rollup.wallet_id,
+            period_id=rollup.period_id,
+            deposit_id=rollup.deposit_id,
+            category_id=rollup.category_id,
+            entity_id=rollup.entity_id,
+            transfer_type=rollup.transfer_type,
+        )._replace(**{f"{field_name}_id": None})
+        deltas[key] = RollupDelta(transfers_count=rollup.transfers_count, value=rollup.value)
+    # ExpensePredictions of deleted TransferCategory are removed by cascade, so only not categorized ones gain
+    # moved sums. Moving between Entities does not change ExpensePredictions results.
+    apply_rollup_deltas(deltas, update_predictions=field_name == "category")
+
+
+def rebuild_transfer_rollups(wallet_id: int | None = None) -> int:
+    """
+    Recreates TransferRollup rows from scratch basing on Transfer table content.
+
+    Args:
+        wallet_id (int | None): Wallet id to rebuild rollups for. All Wallets rebuilt if not provided.
+
+    Returns:
+        int: Number of created TransferRollup rows.
+    """
+    transfers = Transfer.objects.all()
+    rollups = TransferRollup.objects.all()
+    if wallet_id is not None:
+        transfers = transfers.filter(wallet_id=wallet_id)
+        rollups = rollups.filter(wallet_id=wallet_id)
+    with transaction.atomic():
+        rollups.delete()
+        created_rollups = TransferRollup.objects.bulk_create(
+            (
+                TransferRollup(**key._asdict(), transfers_count=delta.transfers_count, value=delta.value)
+                for key, delta in get_queryset_rollup_deltas(transfers).items()
+            ),
+            batch_size=REBUILD_BATCH_SIZE,
+        )
+    return len(created_rollups)
@@ -0,0 +1,33 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from categories.models import TransferCategory
+from entities.models import Deposit, Entity
+from transfers.services.transfer_rollup_service import move_rollups_to_null_bucket
+
+
+@receiver(pre_delete, sender=TransferCategory)
+def move_deleted_category_rollups(sender: type[TransferCategory], instance: TransferCategory, **kwargs) -> None:
+    """
+    Moves TransferRollup sums of deleted TransferCategory to rows without category, as its Transfers
+    "category" field will be set to NULL.
+
+    Args:
+        sender (type[TransferCategory]): Model class sending signal.
+        instance (TransferCategory): TransferCategory being deleted.
+    """
+    move_rollups_to_null_bucket("category", instance.pk)
+
+
+@receiver(pre_delete, sender=Entity)
+@receiver(pre_delete, sender=Deposit)
+def move_deleted_entity_rollups(sender: type[Entity], instance: Entity, **kwargs) -> None:
+    """
+    Moves TransferRollup sums of deleted Entity to rows without entity, as its Transfers "entity" field will be
+    set to NULL. Rollups of Transfers with deleted Entity as Deposit are skipped, as they are removed by cascade.
+
+    Args:
+        sender (type[Entity]): Model class sending signal.
+        instance (Entity): Entity being deleted.
+    """
+    move_rollups_to_null_bucket("entity", instance.pk, excluded_deposit_pk=instance.pk)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from transfers.views.transfer_import_view import TransferImportAPIView
+
+app_name = "transfers"
+
+urlpatterns = [
+    path("transfers_import/", TransferImportAPIView.as_view(), name="transfers-import"),
+]
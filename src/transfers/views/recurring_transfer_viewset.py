@@ -0,0 +1,34 @@
+from django.db.models import QuerySet
+from rest_framework.filters import OrderingFilter
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.viewsets import ModelViewSet
+
+from app_infrastructure.permissions import UserBelongsToWalletPermission
+from transfers.serializers.recurring_transfer_serializer import RecurringTransferSerializer
+
+
+class RecurringTransferViewSet(ModelViewSet):
+    """ViewSet for managing RecurringTransfers."""
+
+    serializer_class = RecurringTransferSerializer
+    permission_classes = (IsAuthenticated, UserBelongsToWalletPermission)
+    filter_backends = (OrderingFilter,)
+    ordering_fields = ("id", "name", "transfer_type", "value", "frequency", "start_date", "end_date")
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Retrieve RecurringTransfers for Wallet passed in URL.
+
+        Returns:
+            QuerySet: Filtered RecurringTransfer QuerySet.
+        """
+        return self.serializer_class.Meta.model.objects.filter(wallet__pk=self.kwargs.get("wallet_pk")).order_by("id")
+
+    def perform_create(self, serializer: RecurringTransferSerializer) -> None:
+        """
+        Additionally save Wallet from URL on RecurringTransfer instance during saving serializer.
+
+        Args:
+            serializer [RecurringTransferSerializer]: Serializer for RecurringTransfer model.
+        """
+        serializer.save(wallet_id=int(self.kwargs.get("wallet_pk")))
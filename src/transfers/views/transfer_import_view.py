@@ -0,0 +1,62 @@
+import codecs
+
+from rest_framework import status
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from app_infrastructure.permissions import UserBelongsToWalletPermission
+from transfers.serializers.transfer_import_serializer import StatementFormat, TransferImportSerializer
+from transfers.services.transfer_import_service import (
+    TransferImportService,
+    parse_csv_statement,
+    parse_ofx_statement,
+)
+
+
+class TransferImportAPIView(APIView):
+    """
+    View importing bank statement file (CSV or OFX) as Incomes and Expenses of given Deposit.
+    """
+
+    permission_classes = (
+        IsAuthenticated,
+        UserBelongsToWalletPermission,
+    )
+    parser_classes = (MultiPartParser, FormParser)
+
+    def post(self, request: Request, wallet_pk: int) -> Response:
+        """
+        Streams uploaded bank statement into Wallet Transfers.
+
+        Args:
+            request [Request]: User request.
+            wallet_pk [int]: Wallet PK.
+
+        Returns:
+            Response: Import summary with numbers of imported and skipped rows, rows errors and rows per second.
+        """
+        serializer = TransferImportSerializer(data=request.data, context={"request": request, "view": self})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        lines = codecs.iterdecode(data["file"], data["encoding"])
+        rows = (
+            parse_ofx_statement(lines)
+            if data["statement_format"] == StatementFormat.OFX
+            else parse_csv_statement(lines, data["column_mapping"])
+        )
+        try:
+            report = TransferImportService(wallet_pk=wallet_pk, deposit_pk=data["deposit"].pk).import_rows(rows)
+        except UnicodeDecodeError:
+            return Response({"file": ["File can not be decoded with given encoding."]}, status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "imported_count": report.imported_count,
+                "skipped_count": report.skipped_count,
+                "errors": [{"line": error.line_number, "message": error.message} for error in report.errors],
+                "rows_per_second": report.rows_per_second,
+            },
+            status=status.HTTP_201_CREATED,
+        )
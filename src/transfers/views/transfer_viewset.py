@@ -1,5 +1,7 @@
+from django.core.validators import EMPTY_VALUES
 from django.db import transaction
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django_filters import rest_framework as filters
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -10,8 +12,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.paginations import DefaultOrKeysetPagination
 from app_infrastructure.permissions import UserBelongsToWalletPermission
-from transfers.serializers.transfer_serializer import TransferSerializer
+from app_infrastructure.services.row_serialization_service import get_row_serializer
+from transfers.serializers.transfer_serializer import BULK_CREATE_MAX_SIZE, TransferSerializer
+from transfers.services.transfer_bulk_update_service import BULK_UPDATE_FIELDS, bulk_update_transfers
+from transfers.services.transfer_copy_service import copy_transfers
+from transfers.services.transfer_export_service import ExportFormat, stream_transfers
 
 
 class TransferViewSet(ModelViewSet):
@@ -20,6 +27,7 @@ class TransferViewSet(ModelViewSet):
     serializer_class = TransferSerializer
     permission_classes = (IsAuthenticated, UserBelongsToWalletPermission)
     filter_backends = (filters.DjangoFilterBackend, OrderingFilter)
+    pagination_class = DefaultOrKeysetPagination
     ordering_fields = ("id", "name", "value", "date", "period", "entity", "category", "deposit")
 
     def get_queryset(self) -> QuerySet:
@@ -30,12 +38,82 @@ class TransferViewSet(ModelViewSet):
             QuerySet: Filtered TransferCategory QuerySet.
         """
         return (
-            self.serializer_class.Meta.model.objects.prefetch_related("period", "category")
-            .filter(period__wallet__pk=self.kwargs.get("wallet_pk"))
+            self.serializer_class.Meta.model.objects.filter(wallet__pk=self.kwargs.get("wallet_pk"))
             .order_by("id")
             .distinct()
         )
 
+    def has_filter_params(self, request) -> bool:
+        """
+        Checks if request contains at least one valid, not empty filter param of ViewSet FilterSet. Params
+        not handled by FilterSet, like pagination or ordering ones, are not taken into account.
+
+        Args:
+            request (Request): User request.
+
+        Returns:
+            bool: True if valid filter params are given, False otherwise.
+        """
+        filterset = self.filterset_class(request.query_params, queryset=self.get_queryset(), request=request)
+        if not filterset.is_valid():
+            return False
+        return any(value not in EMPTY_VALUES for value in filterset.form.cleaned_data.values())
+
+    @swagger_auto_schema(method="post", request_body=TransferSerializer(many=True))
+    @action(detail=False, methods=["post"])
+    def bulk_create(self, request, wallet_pk: str) -> Response:
+        """
+        Creates multiple Transfers at once. Referenced objects are fetched with fixed number of queries and
+        all Transfers are inserted with single query. Nothing is created if any of Transfers is invalid.
+
+        Returns:
+            Response: API response with created Transfers or with list of errors for every given Transfer.
+        """
+        if not isinstance(request.data, list):
+            return Response({"error": "Request data must be a list."}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False, max_length=BULK_CREATE_MAX_SIZE
+        )
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @swagger_auto_schema(
+        method="get",
+        manual_parameters=[
+            openapi.Parameter(
+                "export_format",
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=list(ExportFormat.choices),
+                default=ExportFormat.CSV,
+                description="Format of exported file.",
+            )
+        ],
+    )
+    @action(detail=False, methods=["get"])
+    def export(self, request, wallet_pk: str) -> StreamingHttpResponse | Response:
+        """
+        Streams filtered Transfers as CSV or NDJSON file. Rows are read with server-side cursor and sent
+        in chunks, so memory usage does not depend on number of exported Transfers.
+
+        Returns:
+            StreamingHttpResponse | Response: Streamed file or API response with error.
+        """
+        export_format = request.query_params.get("export_format", ExportFormat.CSV)
+        if export_format not in ExportFormat.choices:
+            return Response(
+                {"error": f"export_format must be one of: {', '.join(ExportFormat.choices)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            stream_transfers(queryset, export_format), content_type=ExportFormat.content_types[export_format]
+        )
+        response["Content-Disposition"] = f'attachment; filename="{self.basename}s.{export_format}"'
+        return response
+
     @swagger_auto_schema(
         method="delete",
         request_body=openapi.Schema(
@@ -53,10 +131,10 @@ class TransferViewSet(ModelViewSet):
     @action(detail=False, methods=["delete"])
     def bulk_delete(self, request, wallet_pk: str) -> Response:
         """
-        Removes multiple Transfers with given IDs at once.
+        Removes multiple Transfers with given IDs at once with single DELETE query.
 
         Returns:
-            Response: API response with status.
+            Response: API response with number of deleted Transfers.
         """
         ids = request.data.get("objects_ids", None)
         if not isinstance(ids, list):
@@ -64,8 +142,72 @@ class TransferViewSet(ModelViewSet):
         if not ids:
             return Response({"error": "objects_ids must not be an empty list."}, status=status.HTTP_400_BAD_REQUEST)
         with transaction.atomic():
-            self.serializer_class.Meta.model.objects.filter(period__wallet__id=int(wallet_pk), id__in=ids).delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+            deleted_count, _ = self.serializer_class.Meta.model.objects.filter(
+                wallet__id=int(wallet_pk), id__in=ids
+            ).delete()
+        return Response({"count": deleted_count}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        method="patch",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "objects_ids": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Items(type=openapi.TYPE_INTEGER),
+                    description="List of IDs to update. Transfers matching filter params are updated if not given.",
+                ),
+                "patch": openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "category": openapi.Schema(type=openapi.TYPE_INTEGER, x_nullable=True),
+                        "entity": openapi.Schema(type=openapi.TYPE_INTEGER, x_nullable=True),
+                        "deposit": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        "description": openapi.Schema(type=openapi.TYPE_STRING, x_nullable=True),
+                        "date": openapi.Schema(type=openapi.TYPE_STRING, format=openapi.FORMAT_DATE),
+                    },
+                    description="Values set for all updated Transfers.",
+                ),
+            },
+            required=["patch"],
+        ),
+    )
+    @action(detail=False, methods=["patch"])
+    def bulk_update(self, request, wallet_pk: str) -> Response:
+        """
+        Updates multiple Transfers with given IDs or matching filter params at once. Patch is validated once
+        and applied with single UPDATE query.
+
+        Returns:
+            Response: API response with number of updated Transfers.
+        """
+        ids = request.data.get("objects_ids", None)
+        patch = request.data.get("patch", None)
+        if ids is not None and (not isinstance(ids, list) or not ids):
+            return Response({"error": "objects_ids must be a not empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if ids is None and not self.has_filter_params(request):
+            return Response(
+                {"error": "objects_ids or valid filter params must be provided."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if not isinstance(patch, dict) or not patch:
+            return Response({"error": "patch must be a not empty object."}, status=status.HTTP_400_BAD_REQUEST)
+        if unsupported_fields := sorted(set(patch) - set(BULK_UPDATE_FIELDS)):
+            return Response(
+                {"error": f"Fields not supported in bulk update: {', '.join(unsupported_fields)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = self.get_serializer(data=patch, partial=True)
+        serializer.context["bulk_update"] = True
+        serializer.is_valid(raise_exception=True)
+        model = self.serializer_class.Meta.model
+        if ids is not None:
+            queryset = model.objects.filter(wallet__id=int(wallet_pk), id__in=ids)
+        else:
+            queryset = model.objects.filter(
+                wallet__id=int(wallet_pk), id__in=self.filter_queryset(self.get_queryset()).values("id")
+            )
+        updated_count = bulk_update_transfers(queryset, serializer.validated_data)
+        return Response({"count": updated_count}, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         method="post",
@@ -76,7 +218,14 @@ class TransferViewSet(ModelViewSet):
                     type=openapi.TYPE_ARRAY,
                     items=openapi.Items(type=openapi.TYPE_INTEGER),
                     description="List of IDs to copy.",
-                )
+                ),
+                "months_shift": openapi.Schema(
+                    type=openapi.TYPE_INTEGER, description="Number of months to shift date of copies by."
+                ),
+                "days_shift": openapi.Schema(
+                    type=openapi.TYPE_INTEGER, description="Number of days to shift date of copies by."
+                ),
+                "deposit": openapi.Schema(type=openapi.TYPE_INTEGER, description="ID of Deposit set for copies."),
             },
             required=["objects_ids"],
         ),
@@ -84,7 +233,9 @@ class TransferViewSet(ModelViewSet):
     @action(detail=False, methods=["post"])
     def copy(self, request, wallet_pk: str) -> Response:
         """
-        Copies multiple Transfers with given IDs.
+        Copies multiple Transfers with given IDs with single INSERT ... SELECT query. Date of copies can be shifted
+        by given number of months and days, which resolves Period of copies again, and Deposit of copies can be
+        replaced with given one.
 
         Returns:
             Response: API response with status.
@@ -94,17 +245,35 @@ class TransferViewSet(ModelViewSet):
             return Response({"error": "objects_ids must be a list."}, status=status.HTTP_400_BAD_REQUEST)
         if not ids:
             return Response({"error": "objects_ids must not be an empty list."}, status=status.HTTP_400_BAD_REQUEST)
-        new_objects = [
-            self.serializer_class.Meta.model(
-                **{
-                    field_name: getattr(copied_object, field_name)
-                    for field_name in ("transfer_type", *self.serializer_class.Meta.fields)
-                    if field_name not in ("id",)
-                }
-            )
-            for copied_object in self.serializer_class.Meta.model.objects.filter(
-                period__wallet__id=int(wallet_pk), id__in=ids
-            )
-        ]
-        objs = self.serializer_class.Meta.model.objects.bulk_create(new_objects)
-        return Response({"ids": [obj.id for obj in objs]} if objs else [], status=status.HTTP_201_CREATED)
+        params = {"months_shift": request.data.get("months_shift", 0), "days_shift": request.data.get("days_shift", 0)}
+        for param_name, value in params.items():
+            if not isinstance(value, int) or isinstance(value, bool):
+                return Response({"error": f"{param_name} must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        deposit_pk = request.data.get("deposit", None)
+        if deposit_pk is not None and (not isinstance(deposit_pk, int) or isinstance(deposit_pk, bool)):
+            return Response({"error": "deposit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        copies_ids = copy_transfers(
+            self.serializer_class.Meta.model.objects.filter(wallet__id=int(wallet_pk), id__in=ids),
+            deposit_pk=deposit_pk,
+            **params,
+        )
+        return Response({"ids": copies_ids} if copies_ids else [], status=status.HTTP_201_CREATED)
+
+    def list(self, request, *args, **kwargs) -> Response:
+        """
+        Lists filtered and ordered Transfers. Only columns rendered by serializer (and annotations added by filters,
+        needed for keyset pagination) are selected with QuerySet.values() and rows are rendered with RowSerializer
+        compiled from serializer, so no model instances or serializer fields are created per row.
+
+        Returns:
+            Response: API response with serialized Transfers, paginated if requested.
+        """
+        row_serializer = get_row_serializer(self.get_serializer_class())
+        if row_serializer is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*row_serializer.columns, *queryset.query.annotation_select)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(list(map(row_serializer.serialize, page)))
+        return Response(list(map(row_serializer.serialize, queryset)))
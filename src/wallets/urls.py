@@ -9,6 +9,7 @@ from periods.views.period_viewset import PeriodViewSet
 from predictions.views.expense_prediction_viewset import ExpensePredictionViewSet
 from transfers.views.expense_viewset import ExpenseViewSet
 from transfers.views.income_viewset import IncomeViewSet
+from transfers.views.recurring_transfer_viewset import RecurringTransferViewSet
 from wallets.views.wallet_viewset import WalletViewSet
 
 app_name = "wallets"
@@ -24,6 +25,7 @@ wallet_router.register(r"categories", TransferCategoryViewSet, basename="categor
 wallet_router.register(r"expense_predictions", ExpensePredictionViewSet, basename="expense_prediction")
 wallet_router.register(r"incomes", IncomeViewSet, basename="income")
 wallet_router.register(r"expenses", ExpenseViewSet, basename="expense")
+wallet_router.register(r"recurring_transfers", RecurringTransferViewSet, basename="recurring_transfer")
 
 
 urlpatterns = [
@@ -9,7 +9,7 @@ from rest_framework.viewsets import ModelViewSet
 
 from categories.models.choices.category_type import CategoryType
 from entities.models import Deposit
-from transfers.models import Transfer
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
 from wallets.filtersets.wallet_filterset import WalletFilterSet
 from wallets.models import Wallet
 from wallets.serializers.wallet_serializer import WalletSerializer
@@ -27,8 +27,9 @@ def get_wallet_transfers_sum(transfer_type: CategoryType) -> Func:
     """
     return Coalesce(
         Subquery(
-            Transfer.objects.filter(transfer_type=transfer_type, period__wallet__pk=OuterRef("pk"))
-            .values("period__wallet")
+            get_transfer_aggregate_model()
+            .objects.filter(transfer_type=transfer_type, wallet__pk=OuterRef("pk"))
+            .values("wallet")
             .annotate(total=Sum("value"))
             .values("total")[:1],
             output_field=DecimalField(decimal_places=2),
@@ -0,0 +1,104 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db.models import DecimalField, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
+from factory.base import FactoryMetaClass
+
+from app_infrastructure.services.derived_table_service import DerivedTableColumn, join_derived_table
+from periods.models import Period
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+
+def get_periods_with_transfers_sums(wallet: Wallet) -> QuerySet:
+    """
+    Returns Wallet Periods annotated with Transfers sums taken from joined derived table.
+
+    Args:
+        wallet (Wallet): Wallet of Periods.
+
+    Returns:
+        QuerySet: Annotated Period QuerySet.
+    """
+    return join_derived_table(
+        Period.objects.filter(wallet=wallet),
+        Transfer.objects.filter(period__wallet=wallet).order_by().values("period_id").annotate(total=Sum("value")),
+        table_alias="periods_sums",
+        join_on={"period_id": "pk"},
+    ).annotate(
+        transfers_sum=Coalesce(
+            DerivedTableColumn("periods_sums", "total", output_field=DecimalField(decimal_places=2)),
+            Value(0),
+            output_field=DecimalField(decimal_places=2),
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestJoinDerivedTable:
+    """Tests for join_derived_table service."""
+
+    @pytest.fixture
+    def periods(
+        self,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+    ) -> list[Period]:
+        """
+        Creates three Periods, where first one contains two Transfers, second one single Transfer
+        and third one no Transfers.
+
+        Returns:
+            list[Period]: Created Periods.
+        """
+        periods = [
+            period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+            for month in (1, 2, 3)
+        ]
+        deposit = deposit_factory(wallet=wallet)
+        transfer_factory(period=periods[0], deposit=deposit, value=Decimal("10.00"))
+        transfer_factory(period=periods[0], deposit=deposit, value=Decimal("5.00"))
+        transfer_factory(period=periods[1], deposit=deposit, value=Decimal("7.00"))
+        return periods
+
+    def test_annotate_with_derived_table_column(self, wallet: Wallet, periods: list[Period], django_assert_num_queries):
+        """
+        GIVEN: Three Periods with Transfers in two of them.
+        WHEN: Periods joined with derived table of Transfers sums.
+        THEN: Sums of every Period returned with single query, 0 for Period without Transfers.
+        """
+        with django_assert_num_queries(1):
+            result = list(get_periods_with_transfers_sums(wallet).order_by("id").values_list("id", "transfers_sum"))
+
+        assert result == [
+            (periods[0].id, Decimal("15.00")),
+            (periods[1].id, Decimal("7.00")),
+            (periods[2].id, Decimal("0")),
+        ]
+
+    def test_filter_order_and_count_by_derived_table_column(self, wallet: Wallet, periods: list[Period]):
+        """
+        GIVEN: Three Periods with Transfers in two of them.
+        WHEN: Periods joined with derived table of Transfers sums filtered, ordered and counted by sum.
+        THEN: Derived table column used in WHERE, ORDER BY and COUNT queries.
+        """
+        queryset = get_periods_with_transfers_sums(wallet).filter(transfers_sum__gt=0)
+
+        assert queryset.count() == 2
+        assert list(queryset.order_by("transfers_sum").values_list("id", flat=True)) == [periods[1].id, periods[0].id]
+
+    def test_queryset_used_as_subquery(self, wallet: Wallet, periods: list[Period]):
+        """
+        GIVEN: Three Periods with Transfers in two of them.
+        WHEN: Periods joined with derived table used as subquery of another QuerySet.
+        THEN: Derived table aliases relabeled and correct Periods returned.
+        """
+        queryset = Period.objects.filter(
+            pk__in=get_periods_with_transfers_sums(wallet).filter(transfers_sum__range=(1, 10)).values("pk")
+        )
+
+        assert list(queryset.values_list("id", flat=True)) == [periods[1].id]
@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+import pytest
+from factory.base import BaseFactory, FactoryMetaClass
+from rest_framework import serializers
+
+from app_infrastructure.services.row_serialization_service import get_row_serializer
+from categories.models.choices.category_type import CategoryType
+from transfers.models import Transfer
+from transfers.serializers.expense_serializer import ExpenseSerializer
+from transfers.serializers.income_serializer import IncomeSerializer
+from wallets.models import Wallet
+
+
+class TransferNameLengthSerializer(serializers.ModelSerializer):
+    """Serializer with field not rendered from single column."""
+
+    name_length = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Transfer
+        fields = ("id", "name_length")
+
+    def get_name_length(self, obj: Transfer) -> int:
+        return len(obj.name)
+
+
+@pytest.mark.django_db
+class TestGetRowSerializer:
+    """Tests for get_row_serializer."""
+
+    @pytest.mark.parametrize(
+        "serializer_class, transfer_type",
+        [(ExpenseSerializer, CategoryType.EXPENSE), (IncomeSerializer, CategoryType.INCOME)],
+    )
+    def test_rows_rendered_the_same_as_by_serializer(
+        self,
+        wallet: Wallet,
+        transfer_factory: BaseFactory,
+        entity_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        serializer_class: type[serializers.ModelSerializer],
+        transfer_type: CategoryType,
+    ):
+        """
+        GIVEN: Transfers with and without Entity, TransferCategory and description in database.
+        WHEN: Rows of QuerySet.values() with RowSerializer columns rendered with RowSerializer.
+        THEN: Rendered rows equal to Transfers serialized with ModelSerializer.
+        """
+        transfer_factory(
+            wallet=wallet,
+            transfer_type=transfer_type,
+            value=Decimal("1234.5"),
+            description="Description",
+            entity=entity_factory(wallet=wallet),
+            category=transfer_category_factory(wallet=wallet, category_type=transfer_type),
+        )
+        transfer_factory(
+            wallet=wallet,
+            transfer_type=transfer_type,
+            value=Decimal("0.01"),
+            description=None,
+            entity=None,
+            category=None,
+        )
+        queryset = Transfer.objects.filter(wallet=wallet).order_by("id")
+        row_serializer = get_row_serializer(serializer_class)
+
+        rows = [row_serializer.serialize(row) for row in queryset.values(*row_serializer.columns)]
+
+        assert rows == serializer_class(queryset, many=True).data
+        assert rows[0]["value"] == "1234.50"
+        assert rows[1]["entity"] is None and rows[1]["category"] is None
+
+    def test_none_returned_for_not_supported_serializer(self):
+        """
+        GIVEN: ModelSerializer with SerializerMethodField.
+        WHEN: get_row_serializer called for serializer.
+        THEN: None returned.
+        """
+        assert get_row_serializer(TransferNameLengthSerializer) is None
@@ -0,0 +1,129 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import BaseFactory, FactoryMetaClass
+
+from app_infrastructure.services.wallet_relations_service import RelatedObjectData, WalletRelationsLookup
+from categories.models.choices.category_type import CategoryType
+from predictions.models import ExpensePrediction
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+TRANSFER_RELATIONS = ("period", "deposit", "entity", "category")
+
+
+@pytest.mark.django_db
+class TestWalletRelationsLookup:
+    """Tests for WalletRelationsLookup."""
+
+    def test_relations_loaded_with_single_query(
+        self,
+        wallet: Wallet,
+        transfer_factory: BaseFactory,
+        entity_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        django_assert_num_queries,
+    ):
+        """
+        GIVEN: Transfer instance with only IDs of related Period, Deposit, Entity and TransferCategory set.
+        WHEN: WalletRelationsLookup.get_instance_relations called twice for Transfer with the same lookup.
+        THEN: Data of all related objects loaded with single query in first call only.
+        """
+        transfer = Transfer.objects.get(
+            pk=transfer_factory(
+                wallet=wallet, entity=entity_factory(wallet=wallet), category=transfer_category_factory(wallet=wallet)
+            ).pk
+        )
+        lookup = WalletRelationsLookup()
+
+        with django_assert_num_queries(1):
+            relations = lookup.get_instance_relations(transfer, TRANSFER_RELATIONS)
+        with django_assert_num_queries(0):
+            assert lookup.get_instance_relations(transfer, TRANSFER_RELATIONS) == relations
+
+        assert relations["period"] == RelatedObjectData(
+            wallet_id=wallet.pk, date_start=transfer.period.date_start, date_end=transfer.period.date_end
+        )
+        assert relations["deposit"] == RelatedObjectData(wallet_id=wallet.pk, is_deposit=True)
+        assert relations["entity"] == RelatedObjectData(wallet_id=wallet.pk)
+        assert relations["category"] == RelatedObjectData(wallet_id=wallet.pk, deposit_id=transfer.category.deposit_id)
+
+    def test_cached_relations_used_without_query(
+        self,
+        wallet: Wallet,
+        transfer_factory: BaseFactory,
+        transfer_category_factory: FactoryMetaClass,
+        django_assert_num_queries,
+    ):
+        """
+        GIVEN: Transfer instance with cached related objects and empty "entity" field.
+        WHEN: WalletRelationsLookup.get_instance_relations called for Transfer.
+        THEN: Data of related objects taken from cached objects without query, None for empty field.
+        """
+        transfer = transfer_factory(wallet=wallet, entity=None, category=transfer_category_factory(wallet=wallet))
+
+        with django_assert_num_queries(0):
+            relations = WalletRelationsLookup().get_instance_relations(transfer, TRANSFER_RELATIONS)
+
+        assert relations["entity"] is None
+        assert {data.wallet_id for field, data in relations.items() if field != "entity"} == {wallet.pk}
+
+    def test_transfer_save_with_shared_lookup(
+        self,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Period and Deposit of Wallet in database. Lookup with loaded Period and Deposit data.
+        WHEN: Transfer with only IDs of related objects saved with shared lookup.
+        THEN: Transfer saved without fetching related objects, "wallet" set to Wallet of Period.
+        """
+        period = period_factory(wallet=wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31))
+        deposit = deposit_factory(wallet=wallet)
+        lookup = WalletRelationsLookup()
+        lookup.load({("periods.period", period.pk), ("entities.entity", deposit.pk)})
+        transfer = Transfer(
+            transfer_type=CategoryType.EXPENSE,
+            name="Flat rent",
+            value=Decimal(900),
+            date=date(2024, 1, 10),
+            period_id=period.pk,
+            deposit_id=deposit.pk,
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            transfer.save(wallet_relations_lookup=lookup)
+
+        assert not any(
+            "periods_period" in query["sql"] or '"entities_entity"' in query["sql"]
+            for query in context.captured_queries
+        )
+        assert Transfer.objects.get(pk=transfer.pk).wallet_id == wallet.pk
+
+    def test_error_expense_prediction_wallets_compared_by_ids(
+        self,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Period and TransferCategory of different Wallets in database.
+        WHEN: ExpensePrediction with only IDs of Period and TransferCategory saved.
+        THEN: ValidationError raised.
+        """
+        period = period_factory(wallet=wallet_factory())
+        category = transfer_category_factory(wallet=wallet_factory())
+        prediction = ExpensePrediction(
+            period_id=period.pk, deposit_id=category.deposit_id, category_id=category.pk, current_plan=Decimal("100")
+        )
+
+        with pytest.raises(ValidationError) as exc:
+            prediction.save()
+
+        assert exc.value.code == "wallet-invalid"
+        assert not ExpensePrediction.objects.exists()
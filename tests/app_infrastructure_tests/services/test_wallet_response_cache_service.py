@@ -0,0 +1,219 @@
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_infrastructure.services.wallet_response_cache_service import (
+    bump_wallets_data_versions,
+    get_wallet_data_version,
+    get_wallet_response_cache_key,
+    get_wallet_response_cache_stats,
+    normalize_request_params,
+)
+from categories.models.choices.category_type import CategoryType
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+CACHED_ENDPOINT = "TransfersInPeriodsChartApiView"
+
+
+def transfers_chart_url(wallet_id: int) -> str:
+    """Create and return a transfers in periods chart URL."""
+    return reverse("charts:transfers-in-periods-chart", args=[wallet_id])
+
+
+@pytest.mark.django_db
+class TestWalletResponseCacheKeys:
+    """Tests for Wallet data versions and cache keys."""
+
+    def test_wallet_data_version_bump(self):
+        """
+        GIVEN: Wallet data version initialized in cache.
+        WHEN: bump_wallets_data_versions called for Wallet.
+        THEN: Wallet data version increased, other Wallets versions unchanged.
+        """
+        version = get_wallet_data_version(1)
+        other_version = get_wallet_data_version(2)
+
+        bump_wallets_data_versions([1])
+
+        assert get_wallet_data_version(1) > version
+        assert get_wallet_data_version(2) == other_version
+
+    def test_normalize_request_params(self):
+        """
+        GIVEN: The same request parameters in different order, with empty and multiple values.
+        WHEN: normalize_request_params called.
+        THEN: The same normalized string returned for all of them.
+        """
+        assert (
+            normalize_request_params({"period_from": "1", "deposit": "", "entity": ["3", "2"]})
+            == normalize_request_params({"entity": ["2", "3"], "period_from": 1})
+            == "entity=2&entity=3&period_from=1"
+        )
+
+    def test_cache_key_changes_with_wallet_data_version(self):
+        """
+        GIVEN: Cache key built for Wallet request.
+        WHEN: Wallet data version bumped.
+        THEN: New cache key differs from previous one.
+        """
+        key = get_wallet_response_cache_key("endpoint", 1, {"period_from": "1"})
+        assert key == get_wallet_response_cache_key("endpoint", 1, {"period_from": "1"})
+
+        bump_wallets_data_versions([1])
+
+        assert key != get_wallet_response_cache_key("endpoint", 1, {"period_from": "1"})
+
+
+@pytest.mark.django_db
+class TestCacheWalletResponse:
+    """Tests for cache_wallet_response decorator on chart view."""
+
+    @pytest.fixture(autouse=True)
+    def response_cache_enabled(self, settings: Any) -> None:
+        """Enables Wallet responses cache, which is disabled for process local cache backend used in tests."""
+        settings.WALLET_RESPONSE_CACHE_ENABLED = True
+
+    @pytest.fixture
+    def cache_backend(self, request: pytest.FixtureRequest, settings: Any, tmp_path: Path) -> str:
+        """Runs test with local memory and file based cache backends."""
+        if request.param == "file":
+            settings.CACHES = {
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": str(tmp_path / "cache"),
+                }
+            }
+        return request.param
+
+    @pytest.mark.parametrize("cache_backend", ["locmem", "file"], indirect=True)
+    def test_response_cached_until_wallet_data_changed(
+        self,
+        cache_backend: str,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet with Period and Income in database.
+        WHEN: Chart endpoint called twice, then Income created and endpoint called again.
+        THEN: Second response served from cache, third one calculated again with new Income included.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period = period_factory(wallet=wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31))
+        deposit = deposit_factory(wallet=wallet)
+        transfer_factory(period=period, deposit=deposit, transfer_type=CategoryType.INCOME, value=Decimal("10.00"))
+        api_client.force_authenticate(base_user)
+
+        first_response = api_client.get(transfers_chart_url(wallet.id))
+        second_response = api_client.get(transfers_chart_url(wallet.id))
+        assert get_wallet_response_cache_stats(CACHED_ENDPOINT) == {"hits": 1, "misses": 1}
+        assert first_response.data == second_response.data
+
+        transfer_factory(period=period, deposit=deposit, transfer_type=CategoryType.INCOME, value=Decimal("5.00"))
+        third_response = api_client.get(transfers_chart_url(wallet.id))
+
+        assert third_response.status_code == status.HTTP_200_OK
+        assert get_wallet_response_cache_stats(CACHED_ENDPOINT) == {"hits": 1, "misses": 2}
+        assert third_response.data["income_series"] != first_response.data["income_series"]
+
+    def test_query_params_in_cache_key(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet in database.
+        WHEN: Chart endpoint called with different and reordered query parameters.
+        THEN: Responses for different parameters cached separately, reordered parameters served from cache.
+        """
+        wallet = wallet_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        api_client.get(transfers_chart_url(wallet.id), data={"deposit": 1, "entity": 2})
+        api_client.get(transfers_chart_url(wallet.id), data={"entity": 2, "deposit": 1})
+        api_client.get(transfers_chart_url(wallet.id), data={"deposit": 2})
+
+        assert get_wallet_response_cache_stats(CACHED_ENDPOINT) == {"hits": 1, "misses": 2}
+
+    def test_bulk_operations_invalidate_cache(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Cached chart response for Wallet with Transfers.
+        WHEN: Wallet Transfers deleted with QuerySet.delete().
+        THEN: Wallet data version bumped and response calculated again.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period = period_factory(wallet=wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31))
+        transfer_factory(period=period, deposit=deposit_factory(wallet=wallet))
+        api_client.force_authenticate(base_user)
+        api_client.get(transfers_chart_url(wallet.id))
+        version = get_wallet_data_version(wallet.id)
+
+        Transfer.objects.filter(period__wallet=wallet).delete()
+        api_client.get(transfers_chart_url(wallet.id))
+
+        assert get_wallet_data_version(wallet.id) > version
+        assert get_wallet_response_cache_stats(CACHED_ENDPOINT) == {"hits": 0, "misses": 2}
+
+    def test_other_wallet_changes_do_not_invalidate_cache(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Cached chart response for Wallet.
+        WHEN: Period created in other Wallet and endpoint called again.
+        THEN: Response served from cache.
+        """
+        wallet = wallet_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+        api_client.get(transfers_chart_url(wallet.id))
+
+        period_factory(wallet=wallet_factory())
+        api_client.get(transfers_chart_url(wallet.id))
+
+        assert get_wallet_response_cache_stats(CACHED_ENDPOINT) == {"hits": 1, "misses": 1}
+
+    def test_cache_disabled(
+        self,
+        settings: Any,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet: Wallet,
+    ):
+        """
+        GIVEN: WALLET_RESPONSE_CACHE_ENABLED setting set to False.
+        WHEN: Chart endpoint called twice.
+        THEN: Cache not used.
+        """
+        settings.WALLET_RESPONSE_CACHE_ENABLED = False
+        wallet.owner = base_user
+        wallet.save()
+        api_client.force_authenticate(base_user)
+
+        api_client.get(transfers_chart_url(wallet.id))
+        api_client.get(transfers_chart_url(wallet.id))
+
+        assert get_wallet_response_cache_stats(CACHED_ENDPOINT) == {"hits": 0, "misses": 0}
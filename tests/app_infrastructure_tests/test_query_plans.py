@@ -0,0 +1,298 @@
+"""
+Query plan regression tests for endpoints aggregating Transfers. Every endpoint is called on seeded dataset,
+in which checked Wallet contains small part of all Transfers, and EXPLAIN of every executed query reading
+transfers_transfer table is checked against sequential scans.
+"""
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_infrastructure.filters import TextSearchFilter
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from predictions.models import ExpensePrediction
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+SEEDED_TABLES = (
+    "periods_period",
+    "entities_entity",
+    "categories_transfercategory",
+    "predictions_expenseprediction",
+    "transfers_transfer",
+)
+
+EXPECTED_TRANSFER_INDEXES = {
+    "transfers_in_periods_chart": "transfer_entity_per_type_idx",
+    "category_results_and_predictions_in_periods_chart": "transfer_period_category_idx",
+    "expenses_list_in_dates_range": "transfer_wallet_type_date_idx",
+}
+
+
+def seed_wallet_transfers(
+    wallet: Wallet,
+    periods_count: int,
+    transfers_per_period: int,
+    period_factory: FactoryMetaClass,
+    deposit_factory: FactoryMetaClass,
+    entity_factory: FactoryMetaClass,
+    transfer_category_factory: FactoryMetaClass,
+) -> dict[str, list]:
+    """
+    Creates monthly Periods, Deposits, Entities, TransferCategories, ExpensePredictions and Transfers for Wallet.
+
+    Args:
+        wallet (Wallet): Seeded Wallet.
+        periods_count (int): Number of monthly Periods.
+        transfers_per_period (int): Number of Transfers in every Period.
+        period_factory (FactoryMetaClass): Factory for Period model.
+        deposit_factory (FactoryMetaClass): Factory for Deposit model.
+        entity_factory (FactoryMetaClass): Factory for Entity model.
+        transfer_category_factory (FactoryMetaClass): Factory for TransferCategory model.
+
+    Returns:
+        dict[str, list]: Created Periods, Deposits, Entities and TransferCategories.
+    """
+    periods = [
+        period_factory(
+            wallet=wallet,
+            name=f"{wallet.pk}_{index}",
+            date_start=date(2020 + index // 12, index % 12 + 1, 1),
+            date_end=date(2020 + index // 12, index % 12 + 1, 28),
+        )
+        for index in range(periods_count)
+    ]
+    deposits = deposit_factory.create_batch(2, wallet=wallet)
+    entities = entity_factory.create_batch(4, wallet=wallet)
+    categories = [
+        transfer_category_factory(wallet=wallet, deposit=deposits[index % 2], category_type=category_type)
+        for index, category_type in enumerate([CategoryType.EXPENSE] * 4 + [CategoryType.INCOME] * 2)
+    ]
+    expense_categories = [category for category in categories if category.category_type == CategoryType.EXPENSE]
+    ExpensePrediction.objects.bulk_create(
+        ExpensePrediction(period=period, deposit=category.deposit, category=category, current_plan=Decimal("100"))
+        for period in periods
+        for category in expense_categories
+    )
+    Transfer.objects.bulk_create(
+        Transfer(
+            transfer_type=categories[index % len(categories)].category_type,
+            name="Transfer",
+            value=Decimal(index % 50 + 1),
+            date=period.date_start,
+            period=period,
+            deposit=categories[index % len(categories)].deposit,
+            entity=entities[index % len(entities)] if index % 5 else None,
+            category=categories[index % len(categories)] if index % 7 else None,
+        )
+        for period in periods
+        for index in range(transfers_per_period)
+    )
+    return {"periods": periods, "deposits": deposits, "entities": entities, "categories": categories}
+
+
+def get_endpoints(wallet: Wallet, seeded: dict[str, list]) -> dict[str, tuple[str, dict[str, Any]]]:
+    """
+    Returns URLs and query params of endpoints aggregating Transfers of Wallet.
+
+    Args:
+        wallet (Wallet): Checked Wallet.
+        seeded (dict[str, list]): Objects created for Wallet by seed_wallet_transfers.
+
+    Returns:
+        dict[str, tuple[str, dict[str, Any]]]: Endpoint URL and query params by endpoint name.
+    """
+    period, deposit, entity = seeded["periods"][-1], seeded["deposits"][0], seeded["entities"][0]
+    category = seeded["categories"][0]
+    return {
+        "deposits_in_periods_chart": (reverse("charts:deposits-in-periods-chart", args=[wallet.pk]), {}),
+        "transfers_in_periods_chart": (
+            reverse("charts:transfers-in-periods-chart", args=[wallet.pk]),
+            {"deposit": deposit.pk, "entity": entity.pk, "transfer_type": CategoryType.EXPENSE},
+        ),
+        "categories_in_periods_chart": (
+            reverse("charts:categories-in-periods-chart", args=[wallet.pk]),
+            {"category_type": CategoryType.EXPENSE},
+        ),
+        "top_entities_in_period_chart": (
+            reverse("charts:top-entities-in-period-chart", args=[wallet.pk]),
+            {"period": period.pk, "transfer_type": CategoryType.EXPENSE},
+        ),
+        "category_results_and_predictions_in_periods_chart": (
+            reverse("charts:category-results-and-predictions-in-periods-chart", args=[wallet.pk]),
+            {"category": category.pk},
+        ),
+        "deposits_predictions_results": (
+            reverse("predictions:deposits-predictions-results", args=[wallet.pk, period.pk]),
+            {},
+        ),
+        "expense_predictions_list": (
+            reverse("wallets:expense_prediction-list", args=[wallet.pk]),
+            {"period": period.pk},
+        ),
+        "deposits_list": (
+            reverse("wallets:deposit-list", args=[wallet.pk]),
+            {"fields": "id,balance,wallet_balance,wallet_percentage"},
+        ),
+        "expenses_list_in_period": (
+            reverse("wallets:expense-list", args=[wallet.pk]),
+            {"period": period.pk},
+        ),
+        "expenses_list_in_dates_range": (
+            reverse("wallets:expense-list", args=[wallet.pk]),
+            {"date_after": period.date_start, "date_before": period.date_end},
+        ),
+    }
+
+
+def get_query_plan(sql: str, params: tuple = ()) -> list[str]:
+    """
+    Runs EXPLAIN for given query and returns lines of its plan.
+
+    Args:
+        sql (str): SQL query.
+        params (tuple): Query params.
+
+    Returns:
+        list[str]: Query plan lines.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN {sql}", params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def get_sequential_scans(plan: list[str], table: str) -> list[str]:
+    """
+    Returns query plan lines with sequential scans on given table.
+
+    Args:
+        plan (list[str]): Query plan lines.
+        table (str): Checked table name.
+
+    Returns:
+        list[str]: Plan lines containing sequential scans on table.
+    """
+    return [line for line in plan if f"Seq Scan on {table}" in line]
+
+
+@pytest.mark.django_db
+class TestTransfersQueryPlans:
+    """Tests for query plans of endpoints aggregating Transfers."""
+
+    @pytest.fixture
+    def seeded_wallet(
+        self,
+        settings: Any,
+        base_user: AbstractUser,
+        user_factory: FactoryMetaClass,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ) -> tuple[Wallet, dict[str, list]]:
+        """
+        Creates Wallet of base_user with 12 Periods and 600 Transfers and three other Wallets with 36 Periods
+        and 7200 Transfers each. Disables TransferRollup table to check queries reading transfers_transfer.
+
+        Returns:
+            tuple[Wallet, dict[str, list]]: Checked Wallet and objects created for it.
+        """
+        settings.TRANSFER_ROLLUPS_ENABLED = False
+        seed: Callable = lambda wallet, periods_count, transfers_per_period: seed_wallet_transfers(  # NOQA
+            wallet,
+            periods_count,
+            transfers_per_period,
+            period_factory,
+            deposit_factory,
+            entity_factory,
+            transfer_category_factory,
+        )
+        wallet = wallet_factory(owner=base_user)
+        seeded = seed(wallet, 12, 50)
+        for _ in range(3):
+            seed(wallet_factory(owner=user_factory()), 36, 200)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {', '.join(SEEDED_TABLES)}")
+        return wallet, seeded
+
+    def test_no_sequential_scan_on_transfers(
+        self, api_client: APIClient, base_user: AbstractUser, seeded_wallet: tuple[Wallet, dict]
+    ):
+        """
+        GIVEN: Wallet containing 600 of 22200 Transfers in database.
+        WHEN: Every endpoint aggregating Transfers called by Wallet owner.
+        THEN: EXPLAIN of every query reading transfers_transfer contains no sequential scan on it. Selected
+        endpoints use dedicated composite indexes.
+        """
+        wallet, seeded = seeded_wallet
+        api_client.force_authenticate(base_user)
+        sequential_scans, used_indexes = {}, {}
+
+        for endpoint, (url, params) in get_endpoints(wallet, seeded).items():
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(url, data=params)
+            assert response.status_code == status.HTTP_200_OK, endpoint
+            transfers_queries = [
+                query["sql"] for query in context.captured_queries if "transfers_transfer" in query["sql"]
+            ]
+            assert transfers_queries, endpoint
+            for sql in transfers_queries:
+                plan = get_query_plan(sql)
+                used_indexes.setdefault(endpoint, set()).update(
+                    line.split(" using ")[1].split(" on ")[0] for line in plan if " using " in line
+                )
+                if scans := get_sequential_scans(plan, "transfers_transfer"):
+                    sequential_scans.setdefault(endpoint, []).extend(scans)
+
+        assert sequential_scans == {}
+        for endpoint, index_name in EXPECTED_TRANSFER_INDEXES.items():
+            assert index_name in used_indexes[endpoint], endpoint
+
+    def test_period_lookup_uses_index(self, seeded_wallet: tuple[Wallet, dict]):
+        """
+        GIVEN: Wallet with 12 Periods in database.
+        WHEN: Period containing given date searched in Wallet with sequential scans disabled for planner.
+        THEN: Query served by index on Period wallet, date_start and date_end.
+        """
+        wallet, _ = seeded_wallet
+        queryset = Period.objects.filter(
+            wallet=wallet, date_start__lte=date(2020, 5, 10), date_end__gte=date(2020, 5, 10)
+        ).values("pk")
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = get_query_plan(*queryset.query.sql_with_params())
+
+        assert any("period_wallet_dates_idx" in line for line in plan)
+        assert get_sequential_scans(plan, "periods_period") == []
+
+    def test_transfers_search_uses_index(self, seeded_wallet: tuple[Wallet, dict]):
+        """
+        GIVEN: 22200 Transfers in database, three of them named "Monthly salary".
+        WHEN: Transfers searched with TextSearchFilter by rare word.
+        THEN: Query served by GIN index on Transfer search vector, without sequential scan.
+        """
+        wallet, _ = seeded_wallet
+        Transfer.objects.filter(pk__in=Transfer.objects.filter(wallet=wallet).values("pk")[:3]).update(
+            name="Monthly salary"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE transfers_transfer")
+        queryset = TextSearchFilter(search_fields=("name", "description")).filter(Transfer.objects.all(), "sala")
+
+        plan = get_query_plan(*queryset.query.sql_with_params())
+
+        assert queryset.count() == 3
+        assert any("transfer_search_vector_idx" in line for line in plan)
+        assert get_sequential_scans(plan, "transfers_transfer") == []
@@ -133,6 +133,33 @@ class TestTransferCategoryFilterSetFiltering:
         assert response.data == serializer.data
         assert response.data[0]["id"] == matching_category.id
 
+    @pytest.mark.parametrize("filter_value", ("food", "FOOD", "gro", "supermarket"))
+    def test_get_categories_list_searched(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        filter_value: str,
+    ):
+        """
+        GIVEN: Two TransferCategory objects for single Wallet.
+        WHEN: The TransferCategoryViewSet list view is called with "search" filter.
+        THEN: Response must contain TransferCategory containing words starting with given value in name
+        or description.
+        """
+        wallet = wallet_factory(owner=base_user)
+        matching_category = transfer_category_factory(
+            wallet=wallet, name="Food and groceries", description="Supermarket shopping."
+        )
+        transfer_category_factory(wallet=wallet, name="Rent", description="Monthly flat rent.")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(categories_url(wallet.id), data={"search": filter_value})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in response.data] == [matching_category.id]
+
     def test_get_categories_list_filtered_by_deposit(
         self,
         api_client: APIClient,
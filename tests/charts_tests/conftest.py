@@ -0,0 +1,10 @@
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(autouse=True, params=[False, True], ids=["transfers", "transfer_rollups"])
+def transfer_rollups_enabled(request: pytest.FixtureRequest, settings: Any) -> bool:
+    """Runs each test with Transfers sums calculated from Transfer and TransferRollup tables."""
+    settings.TRANSFER_ROLLUPS_ENABLED = request.param
+    return request.param
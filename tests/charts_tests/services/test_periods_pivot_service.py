@@ -0,0 +1,87 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db.models import Count
+from factory.base import FactoryMetaClass
+
+from charts.services.periods_pivot_service import get_periods_pivot
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+
+@pytest.mark.django_db
+class TestPeriodsPivotService:
+    """Tests for get_periods_pivot service."""
+
+    def test_empty_series_and_periods(self, wallet: Wallet):
+        """
+        GIVEN: No periods and no series.
+        WHEN: get_periods_pivot called.
+        THEN: Empty array returned without querying database.
+        """
+        assert get_periods_pivot(Transfer.objects.all(), periods=[], series_field="category_id", series_ids=[]) == []
+
+    def test_dense_pivot(
+        self,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        django_assert_num_queries,
+    ):
+        """
+        GIVEN: Three Periods and two TransferCategories with Transfers only in some Periods.
+        WHEN: get_periods_pivot called for categories.
+        THEN: Dense array of sums indexed by category and period positions returned with single query.
+        """
+        periods = [
+            period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+            for month in (1, 2, 3)
+        ]
+        deposit = deposit_factory(wallet=wallet)
+        first_category = transfer_category_factory(wallet=wallet, deposit=deposit)
+        second_category = transfer_category_factory(wallet=wallet, deposit=deposit)
+        transfer_factory(period=periods[0], deposit=deposit, category=first_category, value=Decimal("10.50"))
+        transfer_factory(period=periods[0], deposit=deposit, category=first_category, value=Decimal("4.50"))
+        transfer_factory(period=periods[2], deposit=deposit, category=first_category, value=Decimal("1.00"))
+        transfer_factory(period=periods[1], deposit=deposit, category=second_category, value=Decimal("7.00"))
+        transfer_factory(period=periods[1], deposit=deposit, category=None, value=Decimal("100.00"))
+
+        with django_assert_num_queries(1):
+            pivot = get_periods_pivot(
+                Transfer.objects.filter(period__wallet=wallet),
+                periods=[{"pk": period.pk} for period in periods],
+                series_field="category_id",
+                series_ids=[second_category.id, first_category.id],
+            )
+
+        assert pivot == [[0.0, 7.0, 0.0], [15.0, 0.0, 1.0]]
+
+    def test_custom_aggregate(
+        self,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Period and two Deposits with Transfers.
+        WHEN: get_periods_pivot called for deposits with Count aggregate.
+        THEN: Array of Transfers numbers returned.
+        """
+        period = period_factory(wallet=wallet)
+        first_deposit = deposit_factory(wallet=wallet)
+        second_deposit = deposit_factory(wallet=wallet)
+        transfer_factory.create_batch(2, period=period, deposit=first_deposit)
+
+        pivot = get_periods_pivot(
+            Transfer.objects.all(),
+            periods=[{"pk": period.pk}],
+            series_field="deposit_id",
+            series_ids=[first_deposit.id, second_deposit.id],
+            aggregate=Count("id"),
+        )
+
+        assert pivot == [[2.0], [0.0]]
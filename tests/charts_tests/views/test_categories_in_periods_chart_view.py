@@ -4,6 +4,8 @@ from decimal import Decimal
 import pytest
 from conftest import get_jwt_access_token
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -11,7 +13,6 @@ from rest_framework.test import APIClient
 
 from app_users.models import User
 from categories.models.choices.category_type import CategoryType
-from charts.views.categories_in_periods_chart_view import get_categories_transfers_sums_in_period
 
 
 def categories_results_url(wallet_id: int) -> str:
@@ -430,306 +431,9 @@ class TestCategoriesInPeriodsChartAPIView:
         assert len(response.data["series"]) == 1
         assert response.data["series"][0]["data"] == [350.5]  # Sum of all transfers
 
-    def test_empty_period_no_transfers(
-        self,
-        base_user: User,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Period with no transfers for specified categories.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Empty dict returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {}
-
-    def test_different_wallets_isolation(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple wallets with categories and transfers.
-        WHEN: get_categories_transfers_sums_in_period called for specific wallet.
-        THEN: Only transfers from specified wallet included.
-        """
-        wallet1 = wallet_factory(owner=base_user)
-        wallet2 = wallet_factory(owner=base_user)
-
-        period1 = period_factory(wallet=wallet1, name="Jan 2024")
-        period2 = period_factory(wallet=wallet2, name="Jan 2024")
-
-        deposit1 = deposit_factory(wallet=wallet1)
-        deposit2 = deposit_factory(wallet=wallet2)
-
-        category1 = transfer_category_factory(wallet=wallet1, deposit=deposit1, category_type=CategoryType.INCOME)
-        category2 = transfer_category_factory(wallet=wallet2, deposit=deposit2, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period1, category=category1, value=Decimal("100.00"), deposit=deposit1)
-        transfer_factory(period=period2, category=category2, value=Decimal("200.00"), deposit=deposit2)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet1.id,
-            categories_ids=[category1.id],
-            period={"pk": period1.id, "name": period1.name},
-        )
-
-        assert result == {category1.id: 100.0}
-        assert category2.id not in result
-
-    def test_decimal_precision_handling(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Transfers with precise decimal values.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Result maintains proper decimal precision as float.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period, category=category, value=Decimal("100.33"), deposit=deposit)
-        transfer_factory(period=period, category=category, value=Decimal("200.67"), deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {category.id: 301.0}
-
-    def test_large_number_of_transfers(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Category with many transfers in single period.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: All transfers correctly aggregated.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE)
-
-        # Create 50 transfers
-        expected_sum = 0.0
-        for i in range(50):
-            value = Decimal(f"{(i + 1) * 10}.00")
-            transfer_factory(period=period, category=category, value=value, deposit=deposit)
-            expected_sum += float(value)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {category.id: expected_sum}
-
-    def test_empty_category_ids_list(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Empty list of category IDs.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Empty dict returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {}
-
-    def test_nonexistent_category_ids(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Non-existent category IDs.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Empty dict returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[999999, 999998],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {} == {}
-
-    def test_single_category_single_transfer(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Single category with one transfer in period.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Dict with category_id and correct sum returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-        transfer_factory(period=period, category=category, value=Decimal("500.00"), deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {category.id: 500.0}
-
-    def test_multiple_transfers_same_category_aggregation(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple transfers for same category in period.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Dict with category_id and aggregated sum returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE)
-
-        transfer_factory(period=period, category=category, value=Decimal("100.00"), deposit=deposit)
-        transfer_factory(period=period, category=category, value=Decimal("200.00"), deposit=deposit)
-        transfer_factory(period=period, category=category, value=Decimal("150.50"), deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {category.id: 450.5}
-
-    def test_multiple_categories_same_period(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple categories with transfers in same period.
-        WHEN: get_categories_transfers_sums_in_period called with all category IDs.
-        THEN: Dict with all category_ids and their respective sums returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-
-        category1 = transfer_category_factory(wallet=wallet, deposit=deposit, name="Cat 1")
-        category2 = transfer_category_factory(wallet=wallet, deposit=deposit, name="Cat 2")
-        category3 = transfer_category_factory(wallet=wallet, deposit=deposit, name="Cat 3")
-
-        transfer_factory(period=period, category=category1, value=Decimal("100.00"), deposit=deposit)
-        transfer_factory(period=period, category=category2, value=Decimal("200.00"), deposit=deposit)
-        transfer_factory(period=period, category=category3, value=Decimal("300.00"), deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category1.id, category2.id, category3.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert result == {category1.id: 100.0, category2.id: 200.0, category3.id: 300.0}
-
-    def test_category_with_no_transfers_excluded(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple categories, some with transfers and some without.
-        WHEN: get_categories_transfers_sums_in_period called.
-        THEN: Only categories with transfers appear in result dict.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-
-        category_with_transfer = transfer_category_factory(wallet=wallet, deposit=deposit, name="With Transfer")
-        category_without_transfer = transfer_category_factory(wallet=wallet, deposit=deposit, name="Without Transfer")
-
-        transfer_factory(period=period, category=category_with_transfer, value=Decimal("500.00"), deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category_with_transfer.id, category_without_transfer.id],
-            period={"pk": period.id, "name": period.name},
-        )
-
-        assert category_with_transfer.id in result
-        assert category_without_transfer.id not in result
-        assert result[category_with_transfer.id] == 500.0
-
-    def test_different_periods_isolation(
+    def test_queries_number_independent_of_periods_number(
         self,
+        api_client: APIClient,
         base_user: AbstractUser,
         wallet_factory: FactoryMetaClass,
         period_factory: FactoryMetaClass,
@@ -738,23 +442,24 @@ class TestCategoriesInPeriodsChartAPIView:
         transfer_factory: FactoryMetaClass,
     ):
         """
-        GIVEN: Transfers in multiple periods for same category.
-        WHEN: get_categories_transfers_sums_in_period called for specific period.
-        THEN: Only transfers from specified period included in sum.
+        GIVEN: Two Wallets with 2 and 6 Periods containing Transfers.
+        WHEN: CategoriesInPeriodsChartAPIView called for both Wallets.
+        THEN: The same number of database queries executed for both Wallets.
         """
-        wallet = wallet_factory(owner=base_user)
-        period1 = period_factory(wallet=wallet, name="Jan 2024")
-        period2 = period_factory(wallet=wallet, name="Feb 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit)
-
-        transfer_factory(period=period1, category=category, value=Decimal("100.00"), deposit=deposit)
-        transfer_factory(period=period2, category=category, value=Decimal("200.00"), deposit=deposit)
-
-        result = get_categories_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            categories_ids=[category.id],
-            period={"pk": period1.id, "name": period1.name},
-        )
-
-        assert result
+        api_client.force_authenticate(base_user)
+        queries_counts = []
+        for periods_count in (2, 6):
+            wallet = wallet_factory(owner=base_user)
+            deposit = deposit_factory(wallet=wallet)
+            categories = transfer_category_factory.create_batch(3, wallet=wallet, deposit=deposit)
+            for month in range(1, periods_count + 1):
+                period = period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+                for category in categories:
+                    transfer_factory(period=period, deposit=deposit, category=category)
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(categories_results_url(wallet.id))
+            assert response.status_code == status.HTTP_200_OK
+            assert all(len(series["data"]) == periods_count for series in response.data["series"])
+            queries_counts.append(len(context.captured_queries))
+
+        assert queries_counts[0] == queries_counts[1]
@@ -4,6 +4,8 @@ from decimal import Decimal
 import pytest
 from conftest import get_jwt_access_token
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -11,8 +13,8 @@ from rest_framework.test import APIClient
 
 from app_users.models import User
 from categories.models.choices.category_type import CategoryType
-from charts.views.deposits_in_periods_chart_view.services.deposits_transfers_sums_service import (
-    get_deposits_transfers_sums_in_period,
+from charts.views.deposits_in_periods_chart_view.services.deposits_balances_service import (
+    get_deposits_balances_in_periods,
 )
 
 
@@ -450,408 +452,75 @@ class TestDepositsInPeriodsChartAPIView:
         assert negative_series["data"] == [-500.0, -800.0]  # Cumulative expenses
         assert normal_series["data"] == [800.0, 1300.0]  # P1: 1000-200=800, P2: 800+500=1300
 
-    def test_empty_period_no_transfers(
+    def test_cumulative_balances_in_periods(
         self,
-        base_user: User,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Period with no transfers for specified deposits.
-        WHEN: get_deposits_transfers_sums_in_period called for any transfer type.
-        THEN: Empty dict returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {}
-
-    def test_single_deposit_single_income_transfer(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Single deposit with one income transfer in period.
-        WHEN: get_deposits_transfers_sums_in_period called for INCOME type.
-        THEN: Dict with deposit_id and correct sum returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-        transfer_factory(period=period, category=category, value=Decimal("500.00"), deposit=deposit)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {deposit.id: 500.0}
-
-    def test_single_deposit_single_expense_transfer(
-        self,
-        base_user: AbstractUser,
         wallet_factory: FactoryMetaClass,
         period_factory: FactoryMetaClass,
         deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Single deposit with one expense transfer in period.
-        WHEN: get_deposits_transfers_sums_in_period called for EXPENSE type.
-        THEN: Dict with deposit_id and correct sum returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE)
-        transfer_factory(period=period, category=category, value=Decimal("250.00"), deposit=deposit)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.EXPENSE,
-        )
-
-        assert result == {deposit.id: 250.0}
-
-    def test_multiple_transfers_same_type_aggregation(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple income transfers for same deposit in period.
-        WHEN: get_deposits_transfers_sums_in_period called for INCOME type.
-        THEN: Dict with deposit_id and aggregated sum returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period, category=category, value=Decimal("100.00"), deposit=deposit)
-        transfer_factory(period=period, category=category, value=Decimal("200.00"), deposit=deposit)
-        transfer_factory(period=period, category=category, value=Decimal("150.50"), deposit=deposit)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {deposit.id: 450.5}
-
-    def test_wrong_transfer_type_filtering(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Deposit with both income and expense transfers.
-        WHEN: get_deposits_transfers_sums_in_period called for INCOME type only.
-        THEN: Only income transfers summed, expenses ignored.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-
-        income_category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-        expense_category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE)
-
-        transfer_factory(period=period, category=income_category, value=Decimal("500.00"), deposit=deposit)
-        transfer_factory(period=period, category=expense_category, value=Decimal("300.00"), deposit=deposit)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {deposit.id: 500.0}
-
-    def test_multiple_deposits_same_period(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple deposits with transfers in same period.
-        WHEN: get_deposits_transfers_sums_in_period called with all deposit IDs.
-        THEN: Dict with all deposit_ids and their respective sums returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-
-        deposit1 = deposit_factory(wallet=wallet, name="Deposit 1")
-        deposit2 = deposit_factory(wallet=wallet, name="Deposit 2")
-        deposit3 = deposit_factory(wallet=wallet, name="Deposit 3")
-
-        category1 = transfer_category_factory(wallet=wallet, deposit=deposit1, category_type=CategoryType.INCOME)
-        category2 = transfer_category_factory(wallet=wallet, deposit=deposit2, category_type=CategoryType.INCOME)
-        category3 = transfer_category_factory(wallet=wallet, deposit=deposit3, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period, category=category1, value=Decimal("100.00"), deposit=deposit1)
-        transfer_factory(period=period, category=category2, value=Decimal("200.00"), deposit=deposit2)
-        transfer_factory(period=period, category=category3, value=Decimal("300.00"), deposit=deposit3)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit1.id, deposit2.id, deposit3.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {deposit1.id: 100.0, deposit2.id: 200.0, deposit3.id: 300.0}
-
-    def test_deposit_with_no_transfers_excluded(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
         transfer_factory: FactoryMetaClass,
+        django_assert_num_queries,
     ):
         """
-        GIVEN: Multiple deposits, some with transfers and some without.
-        WHEN: get_deposits_transfers_sums_in_period called.
-        THEN: Only deposits with transfers appear in result dict.
+        GIVEN: Wallet with six Periods, three Deposits and Incomes and Expenses in Periods.
+        WHEN: get_deposits_balances_in_periods called for Periods subset.
+        THEN: Balances of Deposits at the end of every given Period, including Transfers of earlier Periods,
+        returned with single query.
         """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-
-        deposit_with_transfer = deposit_factory(wallet=wallet, name="With Transfer")
-        deposit_without_transfer = deposit_factory(wallet=wallet, name="Without Transfer")
-
-        category = transfer_category_factory(
-            wallet=wallet, deposit=deposit_with_transfer, category_type=CategoryType.INCOME
-        )
-        transfer_factory(period=period, category=category, value=Decimal("500.00"), deposit=deposit_with_transfer)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit_with_transfer.id, deposit_without_transfer.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert deposit_with_transfer.id in result
-        assert deposit_without_transfer.id not in result
-        assert result[deposit_with_transfer.id] == 500.0
-
-    def test_different_periods_isolation(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Transfers in multiple periods for same deposit.
-        WHEN: get_deposits_transfers_sums_in_period called for specific period.
-        THEN: Only transfers from specified period included in sum.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period1 = period_factory(wallet=wallet, name="Jan 2024")
-        period2 = period_factory(wallet=wallet, name="Feb 2024")
-
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period1, category=category, value=Decimal("100.00"), deposit=deposit)
-        transfer_factory(period=period2, category=category, value=Decimal("200.00"), deposit=deposit)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period1.id, "name": period1.name, "date_end": period1.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {deposit.id: 100.0}
-
-    def test_different_wallets_isolation(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Multiple wallets with deposits and transfers.
-        WHEN: get_deposits_transfers_sums_in_period called for specific wallet.
-        THEN: Only transfers from specified wallet included.
-        """
-        wallet1 = wallet_factory(owner=base_user)
-        wallet2 = wallet_factory(owner=base_user)
-
-        period1 = period_factory(wallet=wallet1, name="Jan 2024")
-        period2 = period_factory(wallet=wallet2, name="Jan 2024")
-
-        deposit1 = deposit_factory(wallet=wallet1)
-        deposit2 = deposit_factory(wallet=wallet2)
-
-        category1 = transfer_category_factory(wallet=wallet1, deposit=deposit1, category_type=CategoryType.INCOME)
-        category2 = transfer_category_factory(wallet=wallet2, deposit=deposit2, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period1, category=category1, value=Decimal("100.00"), deposit=deposit1)
-        transfer_factory(period=period2, category=category2, value=Decimal("200.00"), deposit=deposit2)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet1.id,
-            deposit_ids=[deposit1.id],
-            period={"pk": period1.id, "name": period1.name, "date_end": period1.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {deposit1.id: 100.0}
-        assert deposit2.id not in result
+        wallet = wallet_factory()
+        periods = [
+            period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+            for month in range(1, 7)
+        ]
+        deposits = deposit_factory.create_batch(3, wallet=wallet)
+        expected_flows = {deposit.id: [Decimal("0.00")] * len(periods) for deposit in deposits}
+        for idx, period in enumerate(periods):
+            for deposit in deposits[: idx % 3 + 1]:
+                transfer_factory(
+                    period=period, deposit=deposit, transfer_type=CategoryType.INCOME, value=Decimal("100.10")
+                )
+                transfer_factory(
+                    period=period, deposit=deposit, transfer_type=CategoryType.EXPENSE, value=Decimal(idx + 1)
+                )
+                expected_flows[deposit.id][idx] = Decimal("100.10") - Decimal(idx + 1)
+        deposit_ids = [deposit.id for deposit in deposits]
+        periods_data = [{"pk": period.id, "date_end": period.date_end} for period in periods[2:]]
 
-    def test_decimal_precision_handling(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-        deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
-        transfer_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Transfers with precise decimal values.
-        WHEN: get_deposits_transfers_sums_in_period called.
-        THEN: Result maintains proper decimal precision as float.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
-
-        transfer_factory(period=period, category=category, value=Decimal("100.33"), deposit=deposit)
-        transfer_factory(period=period, category=category, value=Decimal("200.67"), deposit=deposit)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
+        with django_assert_num_queries(1):
+            balances = get_deposits_balances_in_periods(
+                wallet_pk=wallet.id, deposit_ids=deposit_ids, periods=periods_data
+            )
 
-        assert result == {deposit.id: 301.0}
+        assert balances == [
+            [float(sum(expected_flows[deposit_id][: idx + 1])) for idx in range(2, len(periods))]
+            for deposit_id in deposit_ids
+        ]
 
-    def test_large_number_of_transfers(
+    def test_queries_number_independent_of_periods_number(
         self,
+        api_client: APIClient,
         base_user: AbstractUser,
         wallet_factory: FactoryMetaClass,
         period_factory: FactoryMetaClass,
         deposit_factory: FactoryMetaClass,
-        transfer_category_factory: FactoryMetaClass,
         transfer_factory: FactoryMetaClass,
     ):
         """
-        GIVEN: Deposit with many transfers in single period.
-        WHEN: get_deposits_transfers_sums_in_period called.
-        THEN: All transfers correctly aggregated.
+        GIVEN: Two Wallets with 2 and 6 Periods containing Transfers.
+        WHEN: DepositsInPeriodsChartAPIView called for both Wallets.
+        THEN: The same number of database queries executed for both Wallets.
         """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-        deposit = deposit_factory(wallet=wallet)
-        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE)
-
-        # Create 50 transfers
-        expected_sum = 0.0
-        for i in range(50):
-            value = Decimal(f"{(i + 1) * 10}.00")
-            transfer_factory(period=period, category=category, value=value, deposit=deposit)
-            expected_sum += float(value)
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[deposit.id],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.EXPENSE,
-        )
-
-        assert result == {deposit.id: expected_sum}
-
-    def test_empty_deposit_ids_list(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Empty list of deposit IDs.
-        WHEN: get_deposits_transfers_sums_in_period called.
-        THEN: Empty dict returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {}
-
-    def test_nonexistent_deposit_ids(
-        self,
-        base_user: AbstractUser,
-        wallet_factory: FactoryMetaClass,
-        period_factory: FactoryMetaClass,
-    ):
-        """
-        GIVEN: Non-existent deposit IDs.
-        WHEN: get_deposits_transfers_sums_in_period called.
-        THEN: Empty dict returned.
-        """
-        wallet = wallet_factory(owner=base_user)
-        period = period_factory(wallet=wallet, name="Jan 2024")
-
-        result = get_deposits_transfers_sums_in_period(
-            wallet_pk=wallet.id,
-            deposit_ids=[999999, 999998],
-            period={"pk": period.id, "name": period.name, "date_end": period.date_end},
-            transfer_type=CategoryType.INCOME,
-        )
-
-        assert result == {}
+        api_client.force_authenticate(base_user)
+        queries_counts = []
+        for periods_count in (2, 6):
+            wallet = wallet_factory(owner=base_user)
+            deposit = deposit_factory(wallet=wallet)
+            for month in range(1, periods_count + 1):
+                period = period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+                transfer_factory(period=period, deposit=deposit)
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(deposits_results_url(wallet.id))
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["series"][0]["data"]) == periods_count
+            queries_counts.append(len(context.captured_queries))
+
+        assert queries_counts[0] == queries_counts[1]
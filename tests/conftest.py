@@ -4,6 +4,7 @@ import pytest
 from app_users_tests.factories import UserFactory
 from categories_tests.factories import TransferCategoryFactory
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from entities_tests.factories import DepositFactory, EntityFactory
 from periods_tests.factories import PeriodFactory
@@ -11,7 +12,7 @@ from predictions_tests.factories import ExpensePredictionFactory
 from pytest_django.lazy_django import skip_if_no_django
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
-from transfers_tests.factories import ExpenseFactory, IncomeFactory, TransferFactory
+from transfers_tests.factories import ExpenseFactory, IncomeFactory, RecurringTransferFactory, TransferFactory
 from wallets_tests.factories import WalletFactory
 
 from app_users.models import User
@@ -26,6 +27,7 @@ register(ExpensePredictionFactory)
 register(TransferFactory)
 register(IncomeFactory)
 register(ExpenseFactory)
+register(RecurringTransferFactory)
 
 
 @pytest.fixture
@@ -35,6 +37,12 @@ def api_client() -> APIClient:
     return APIClient()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """Clears cache before each test to keep cached responses isolated between tests."""
+    cache.clear()
+
+
 @pytest.fixture
 def base_user() -> Any:
     """User with base permissions."""
@@ -109,6 +109,30 @@ class TestEntityFilterSetFiltering:
         assert response.data == serializer.data
         assert response.data[0]["id"] == matching_entity.id
 
+    @pytest.mark.parametrize("filter_value", ("shop", "SHOP", "groc", "corner"))
+    def test_get_entities_list_searched(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        filter_value: str,
+    ):
+        """
+        GIVEN: Two Entity objects for single Wallet.
+        WHEN: The EntityViewSet list view is called with "search" filter.
+        THEN: Response must contain Entity containing words starting with given value in name or description.
+        """
+        wallet = wallet_factory(owner=base_user)
+        matching_entity = entity_factory(wallet=wallet, name="Grocery shop", description="Shop around the corner.")
+        entity_factory(wallet=wallet, name="Employer", description="Monthly salary.")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(entities_url(wallet.id), data={"search": filter_value})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [entity["id"] for entity in response.data] == [matching_entity.id]
+
     @pytest.mark.parametrize("filter_value", (True, False))
     def test_get_entities_list_filtered_by_is_active(
         self,
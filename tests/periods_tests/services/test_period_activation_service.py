@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from periods.models.choices.period_status import PeriodStatus
+from periods.services.period_activation_service import prepare_predictions_on_period_activation
+from predictions.models import ExpensePrediction
+from wallets.models import Wallet
+
+
+@pytest.fixture
+def period(wallet: Wallet, period_factory: FactoryMetaClass) -> Period:
+    """
+    Creates draft Period of Wallet.
+
+    Returns:
+        Period: Created Period.
+    """
+    return period_factory(wallet=wallet, status=PeriodStatus.DRAFT)
+
+
+@pytest.mark.django_db
+class TestPreparePredictionsOnPeriodActivation:
+    """Tests for prepare_predictions_on_period_activation."""
+
+    def test_predictions_prepared_for_wallet_categories(
+        self,
+        wallet: Wallet,
+        period: Period,
+        wallet_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Draft Period with one ExpensePrediction, unpredicted expense and income TransferCategories in Wallet
+        and expense TransferCategory in other Wallet.
+        WHEN: prepare_predictions_on_period_activation called twice for Period.
+        THEN: initial_plan set to current_plan of existing ExpensePrediction and zero ExpensePrediction created only
+        for unpredicted expense TransferCategory of Wallet in first call, nothing changed in second call.
+        """
+        prediction = expense_prediction_factory(period=period, current_plan=Decimal("100.00"), initial_plan=None)
+        unpredicted_category = transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE)
+        transfer_category_factory(wallet=wallet, category_type=CategoryType.INCOME)
+        transfer_category_factory(wallet=wallet_factory(), category_type=CategoryType.EXPENSE)
+
+        result = prepare_predictions_on_period_activation(wallet.pk, period.pk)
+        repeated_result = prepare_predictions_on_period_activation(str(wallet.pk), str(period.pk))
+
+        assert (result.initial_plans_count, result.created_predictions_count) == (1, 1)
+        assert (repeated_result.initial_plans_count, repeated_result.created_predictions_count) == (0, 0)
+        prediction.refresh_from_db()
+        assert prediction.initial_plan == Decimal("100.00")
+        assert list(
+            ExpensePrediction.objects.filter(period=period)
+            .exclude(pk=prediction.pk)
+            .values_list("category", "deposit", "initial_plan", "current_plan")
+        ) == [(unpredicted_category.pk, unpredicted_category.deposit_id, Decimal("0.00"), Decimal("0.00"))]
+        assert ExpensePrediction.objects.count() == 2
+
+    def test_queries_number_independent_of_categories_number(
+        self,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two draft Periods of Wallet with one unpredicted expense TransferCategory.
+        WHEN: prepare_predictions_on_period_activation called for first Period, then nine expense
+        TransferCategories added and prepare_predictions_on_period_activation called for second Period.
+        THEN: Zero ExpensePredictions for one and for ten TransferCategories created with the same number of queries.
+        """
+        first_period, second_period = period_factory.create_batch(2, wallet=wallet, status=PeriodStatus.DRAFT)
+        transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE)
+        with CaptureQueriesContext(connection) as single_queries:
+            single_result = prepare_predictions_on_period_activation(wallet.pk, first_period.pk)
+        transfer_category_factory.create_batch(9, wallet=wallet, category_type=CategoryType.EXPENSE)
+
+        with CaptureQueriesContext(connection) as many_queries:
+            many_result = prepare_predictions_on_period_activation(wallet.pk, second_period.pk)
+
+        assert single_result.created_predictions_count == 1
+        assert many_result.created_predictions_count == 10
+        assert len(many_queries) == len(single_queries)
@@ -0,0 +1,179 @@
+from datetime import date
+from typing import Any
+
+import pytest
+from factory.base import FactoryMetaClass
+
+from periods.models import Period
+from periods.services.period_index_service import (
+    PeriodIndex,
+    clear_period_indexes,
+    get_period_index,
+    get_wallet_periods_version,
+)
+from wallets.models import Wallet
+
+
+@pytest.fixture(autouse=True)
+def period_indexes(settings: Any) -> None:
+    """Clears process level cache of PeriodIndexes before each test and runs it with shared cache backend."""
+    settings.SHARED_CACHE_CONFIGURED = True
+    clear_period_indexes()
+
+
+@pytest.fixture
+def periods(wallet: Wallet, period_factory: FactoryMetaClass) -> list[Period]:
+    """
+    Creates three Periods of Wallet - January, February and April 2024.
+
+    Returns:
+        list[Period]: Created Periods.
+    """
+    return [
+        period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+        for month in (1, 2, 4)
+    ]
+
+
+@pytest.mark.django_db
+class TestPeriodIndex:
+    """Tests for PeriodIndex."""
+
+    @pytest.mark.parametrize(
+        "period_date, period_number",
+        (
+            (date(2024, 1, 1), 0),
+            (date(2024, 1, 28), 0),
+            (date(2024, 2, 15), 1),
+            (date(2024, 4, 28), 2),
+            (date(2023, 12, 31), None),
+            (date(2024, 1, 29), None),
+            (date(2024, 3, 10), None),
+            (date(2024, 5, 1), None),
+        ),
+    )
+    def test_get_period(self, periods: list[Period], period_date: date, period_number: int | None):
+        """
+        GIVEN: PeriodIndex of three not adjacent Periods given in random order.
+        WHEN: PeriodIndex.get_period called for date.
+        THEN: Period containing date returned, None for date out of all Periods.
+        """
+        period_index = PeriodIndex([periods[2], periods[0], periods[1]])
+
+        period = period_index.get_period(period_date)
+
+        assert len(period_index) == 3
+        assert period == (periods[period_number] if period_number is not None else None)
+
+
+@pytest.mark.django_db
+class TestGetPeriodIndex:
+    """Tests for get_period_index service."""
+
+    def test_index_cached_after_commit(
+        self, wallet: Wallet, periods: list[Period], django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        """
+        GIVEN: Wallet with three Periods.
+        WHEN: get_period_index called twice after commit of first call.
+        THEN: Periods fetched with single query in first call only.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            with django_assert_num_queries(1):
+                first_index = get_period_index(wallet.pk)
+
+        with django_assert_num_queries(0):
+            second_index = get_period_index(wallet.pk)
+
+        assert second_index is first_index
+        assert len(second_index) == 3
+
+    def test_index_not_cached_without_shared_cache(
+        self,
+        settings: Any,
+        wallet: Wallet,
+        periods: list[Period],
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """
+        GIVEN: Wallet with three Periods and process local cache backend.
+        WHEN: get_period_index called twice after commit of first call.
+        THEN: Periods fetched from database in every call.
+        """
+        settings.SHARED_CACHE_CONFIGURED = False
+        with django_capture_on_commit_callbacks(execute=True):
+            get_period_index(wallet.pk)
+
+        with django_assert_num_queries(1):
+            period_index = get_period_index(wallet.pk)
+
+        assert len(period_index) == 3
+
+    def test_index_not_cached_without_commit(
+        self, wallet: Wallet, periods: list[Period], django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        """
+        GIVEN: Wallet with three Periods.
+        WHEN: get_period_index called twice without commit of transaction.
+        THEN: Periods fetched from database in every call.
+        """
+        with django_capture_on_commit_callbacks(execute=False):
+            get_period_index(wallet.pk)
+
+        with django_assert_num_queries(1):
+            get_period_index(wallet.pk)
+
+    @pytest.mark.parametrize("change", ("create", "update", "delete"))
+    def test_index_invalidated_on_period_change(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        period_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks,
+        change: str,
+    ):
+        """
+        GIVEN: Cached PeriodIndex of Wallet with three Periods.
+        WHEN: Wallet Period created, updated or deleted.
+        THEN: Wallet Periods version bumped and PeriodIndex rebuilt with current Periods.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            get_period_index(wallet.pk)
+        version = get_wallet_periods_version(wallet.pk)
+
+        match change:
+            case "create":
+                period_factory(wallet=wallet, date_start=date(2024, 3, 1), date_end=date(2024, 3, 31))
+            case "update":
+                periods[1].date_end = date(2024, 3, 31)
+                periods[1].save()
+            case "delete":
+                periods[1].delete()
+        period_index = get_period_index(wallet.pk)
+
+        assert get_wallet_periods_version(wallet.pk) > version
+        assert (period_index.get_period(date(2024, 3, 10)) is not None) == (change != "delete")
+        assert (period_index.get_period(date(2024, 2, 10)) is not None) == (change != "delete")
+
+    def test_index_of_other_wallet_not_invalidated(
+        self,
+        wallet: Wallet,
+        wallet_factory: FactoryMetaClass,
+        periods: list[Period],
+        period_factory: FactoryMetaClass,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """
+        GIVEN: Cached PeriodIndex of Wallet.
+        WHEN: Period of other Wallet created.
+        THEN: Cached PeriodIndex of Wallet still used.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            get_period_index(wallet.pk)
+
+        period_factory(wallet=wallet_factory())
+
+        with django_assert_num_queries(0):
+            get_period_index(wallet.pk)
@@ -27,6 +27,7 @@ from periods.serializers.period_serializer import PeriodSerializer
 from periods.views.period_viewset import sum_period_transfers
 from predictions.models import ExpensePrediction
 from transfers.models import Transfer
+from transfers.models.choices.recurrence_frequency import RecurrenceFrequency
 from wallets.models.wallet_model import Wallet
 
 
@@ -756,6 +757,48 @@ class TestPeriodViewSetCreate:
                 current_plan=Decimal("0.00"),
             ).exists()
 
+    def test_create_period_materializes_recurring_transfers(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Monthly and weekly RecurringTransfers and RecurringTransfer ended before 2023 in Wallet.
+        WHEN: PeriodViewSet list view for Wallet id called by authenticated Wallet member by POST with
+        valid data for January 2023.
+        THEN: Transfers for RecurringTransfers occurrences due in created Period created.
+        """
+        wallet = wallet_factory(owner=base_user)
+        monthly = recurring_transfer_factory(wallet=wallet, day_of_month=10, start_date=date(2022, 1, 1))
+        weekly = recurring_transfer_factory(
+            wallet=wallet, frequency=RecurrenceFrequency.WEEKLY, start_date=date(2022, 12, 30)
+        )
+        recurring_transfer_factory(wallet=wallet, start_date=date(2022, 1, 1), end_date=date(2022, 12, 31))
+        api_client.force_authenticate(base_user)
+        payload = {
+            "name": "2023_01",
+            "date_start": date(2023, 1, 1),
+            "date_end": date(2023, 1, 31),
+            "status": PeriodStatus.DRAFT,
+        }
+
+        response = api_client.post(periods_url(wallet.id), payload)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        transfers = Transfer.objects.filter(period_id=response.data["id"]).order_by("date")
+        assert [(transfer.name, transfer.date) for transfer in transfers.filter(name=monthly.name)] == [
+            (monthly.name, date(2023, 1, 10))
+        ]
+        assert list(transfers.filter(name=weekly.name).values_list("date", flat=True)) == [
+            date(2023, 1, 6),
+            date(2023, 1, 13),
+            date(2023, 1, 20),
+            date(2023, 1, 27),
+        ]
+        assert transfers.count() == 5
+
     def test_error_create_two_draft_periods_for_one_wallet(
         self,
         api_client: APIClient,
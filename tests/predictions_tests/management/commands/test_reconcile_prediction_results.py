@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from factory.base import FactoryMetaClass
+
+from predictions.models import ExpensePrediction
+from predictions.services.prediction_result_service import get_prediction_results_drift
+from wallets.models import Wallet
+
+
+@pytest.mark.django_db
+class TestReconcilePredictionResultsCommand:
+    """Tests for reconcile_prediction_results admin command."""
+
+    def test_report_without_fix(
+        self, wallet: Wallet, period_factory: FactoryMetaClass, expense_prediction_factory: FactoryMetaClass, capsys
+    ):
+        """
+        GIVEN: ExpensePrediction with corrupted persisted current_result in database.
+        WHEN: reconcile_prediction_results command called without --fix argument.
+        THEN: Drifted ExpensePrediction reported and not repaired.
+        """
+        prediction = expense_prediction_factory(period=period_factory(wallet=wallet))
+        ExpensePrediction.objects.filter(id=prediction.id).update(current_result=Decimal("5.00"))
+
+        call_command("reconcile_prediction_results", wallet=wallet.id)
+
+        output = capsys.readouterr().out
+        assert f"ExpensePrediction {prediction.id}" in output
+        assert "Drifted prediction results: 1." in output
+        assert len(get_prediction_results_drift(wallet_id=wallet.id)) == 1
+
+    def test_repair_with_fix(self, expense_prediction_factory: FactoryMetaClass, capsys):
+        """
+        GIVEN: ExpensePredictions with corrupted persisted current_result in database.
+        WHEN: reconcile_prediction_results command called with --fix argument.
+        THEN: Drifted ExpensePredictions repaired.
+        """
+        expense_prediction_factory.create_batch(2)
+        ExpensePrediction.objects.update(current_result=Decimal("5.00"))
+
+        call_command("reconcile_prediction_results", fix=True)
+
+        assert "Prediction results repaired: 2." in capsys.readouterr().out
+        assert get_prediction_results_drift() == []
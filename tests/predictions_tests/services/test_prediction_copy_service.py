@@ -0,0 +1,172 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from periods.models import Period
+from periods.models.choices.period_status import PeriodStatus
+from predictions.models import ExpensePrediction
+from predictions.services.prediction_copy_service import copy_predictions, roll_predictions_forward
+from wallets.models import Wallet
+
+
+@pytest.fixture
+def periods(wallet: Wallet, period_factory: FactoryMetaClass) -> list[Period]:
+    """
+    Creates closed January 2024 Period and draft Periods from February to May 2024 of Wallet.
+
+    Returns:
+        list[Period]: Created Periods ordered by date_start.
+    """
+    return [
+        period_factory(
+            wallet=wallet,
+            date_start=date(2024, month, 1),
+            date_end=date(2024, month, 28),
+            status=PeriodStatus.CLOSED if month == 1 else PeriodStatus.DRAFT,
+        )
+        for month in range(1, 6)
+    ]
+
+
+@pytest.fixture
+def source_predictions(
+    wallet: Wallet, periods: list[Period], expense_prediction_factory: FactoryMetaClass
+) -> list[ExpensePrediction]:
+    """
+    Creates two categorized ExpensePredictions and one not categorized ExpensePrediction in first Period.
+
+    Returns:
+        list[ExpensePrediction]: Created categorized ExpensePredictions.
+    """
+    predictions = [
+        expense_prediction_factory(period=periods[0], current_plan=Decimal(value), description=f"Plan {value}")
+        for value in ("100.00", "250.50")
+    ]
+    expense_prediction_factory(period=periods[0], category=None)
+    return predictions
+
+
+@pytest.mark.django_db
+class TestCopyPredictions:
+    """Tests for copy_predictions."""
+
+    def test_predictions_copied_into_given_periods(
+        self, wallet: Wallet, periods: list[Period], source_predictions: list[ExpensePrediction]
+    ):
+        """
+        GIVEN: Period with two categorized and one not categorized ExpensePredictions.
+        WHEN: copy_predictions called for two other Periods of Wallet.
+        THEN: Categorized ExpensePredictions copied with their values into both Periods.
+        """
+        result = copy_predictions(wallet.pk, periods[0].pk, [periods[1].pk, str(periods[3].pk)])
+
+        assert (result.copied_predictions_count, result.target_periods_count) == (4, 2)
+        for period in (periods[1], periods[3]):
+            assert sorted(
+                ExpensePrediction.objects.filter(period=period).values_list(
+                    "category", "deposit", "current_plan", "description", "initial_plan"
+                )
+            ) == sorted(
+                (prediction.category_id, prediction.deposit_id, prediction.current_plan, prediction.description, None)
+                for prediction in source_predictions
+            )
+        assert not ExpensePrediction.objects.filter(period__in=(periods[2], periods[4])).exists()
+
+    def test_existing_predictions_skipped(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        source_predictions: list[ExpensePrediction],
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Period with two categorized ExpensePredictions and target Period with ExpensePrediction for one
+        of their TransferCategories.
+        WHEN: copy_predictions called twice for target Period.
+        THEN: Only missing ExpensePrediction copied in first call, existing one not changed. Nothing copied in
+        second call.
+        """
+        existing = expense_prediction_factory(
+            period=periods[1], category=source_predictions[0].category, current_plan=Decimal("5.00")
+        )
+
+        result = copy_predictions(wallet.pk, periods[0].pk, [periods[1].pk])
+        repeated_result = copy_predictions(wallet.pk, periods[0].pk, [periods[1].pk])
+
+        assert (result.copied_predictions_count, result.target_periods_count) == (1, 1)
+        assert (repeated_result.copied_predictions_count, repeated_result.target_periods_count) == (0, 0)
+        existing.refresh_from_db()
+        assert existing.current_plan == Decimal("5.00")
+        assert ExpensePrediction.objects.filter(period=periods[1]).count() == 2
+
+    def test_periods_of_other_wallet_skipped(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        source_predictions: list[ExpensePrediction],
+        period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Period with categorized ExpensePredictions and Period of other Wallet.
+        WHEN: copy_predictions called with Period of other Wallet as target or source.
+        THEN: Nothing copied.
+        """
+        other_period = period_factory()
+
+        into_other_wallet = copy_predictions(wallet.pk, periods[0].pk, [other_period.pk])
+        from_other_wallet = copy_predictions(other_period.wallet_id, periods[0].pk, [other_period.pk])
+
+        assert into_other_wallet.copied_predictions_count == 0
+        assert from_other_wallet.copied_predictions_count == 0
+        assert not ExpensePrediction.objects.filter(period=other_period).exists()
+
+
+@pytest.mark.django_db
+class TestRollPredictionsForward:
+    """Tests for roll_predictions_forward."""
+
+    def test_predictions_copied_into_future_draft_periods(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        source_predictions: list[ExpensePrediction],
+    ):
+        """
+        GIVEN: Period with categorized ExpensePredictions followed by four Periods, one of them active.
+        WHEN: roll_predictions_forward called for two Periods.
+        THEN: ExpensePredictions copied into two nearest draft Periods only.
+        """
+        Period.objects.filter(pk=periods[1].pk).update(status=PeriodStatus.ACTIVE)
+
+        result = roll_predictions_forward(wallet.pk, periods[0].pk, 2)
+
+        assert (result.copied_predictions_count, result.target_periods_count) == (4, 2)
+        assert set(ExpensePrediction.objects.filter(period__in=periods[1:]).values_list("period", flat=True)) == {
+            periods[2].pk,
+            periods[3].pk,
+        }
+
+    def test_single_query_independent_of_periods_number(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        source_predictions: list[ExpensePrediction],
+    ):
+        """
+        GIVEN: Period with categorized ExpensePredictions followed by four draft Periods.
+        WHEN: roll_predictions_forward called for one Period, then for all remaining Periods.
+        THEN: ExpensePredictions copied into one and into three Periods with single query.
+        """
+        with CaptureQueriesContext(connection) as single_queries:
+            single_result = roll_predictions_forward(wallet.pk, periods[0].pk, 1)
+        with CaptureQueriesContext(connection) as many_queries:
+            many_result = roll_predictions_forward(wallet.pk, periods[1].pk, 10)
+
+        assert single_result.target_periods_count == 1
+        assert many_result.target_periods_count == 3
+        assert len([query for query in single_queries if "INSERT" in query["sql"]]) == 1
+        assert len(many_queries) == len(single_queries)
@@ -0,0 +1,187 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from categories.models import TransferCategory
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from periods.models.choices.period_status import PeriodStatus
+from predictions.models import ExpensePrediction
+from predictions.services.prediction_forecast_service import (
+    ExpenseHistory,
+    ForecastMethod,
+    compute_forecasts,
+    forecast_expense_predictions,
+    load_expense_history,
+    write_forecasted_predictions,
+)
+from transfers.models import Expense
+from wallets.models import Wallet
+
+
+@pytest.fixture
+def periods(wallet: Wallet, period_factory: FactoryMetaClass) -> list[Period]:
+    """
+    Creates closed Periods from January 2023 to March 2024 and draft April 2024 Period of Wallet.
+
+    Returns:
+        list[Period]: Created Periods ordered by date_start.
+    """
+    return [
+        period_factory(
+            wallet=wallet,
+            date_start=date(2023 + month // 12, month % 12 + 1, 1),
+            date_end=date(2023 + month // 12, month % 12 + 1, 28),
+            status=PeriodStatus.DRAFT if month == 15 else PeriodStatus.CLOSED,
+        )
+        for month in range(16)
+    ]
+
+
+@pytest.fixture
+def category(wallet: Wallet, transfer_category_factory: FactoryMetaClass) -> TransferCategory:
+    """
+    Creates expense TransferCategory of Wallet.
+
+    Returns:
+        TransferCategory: Created TransferCategory.
+    """
+    return transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE, is_active=True)
+
+
+def create_expenses(category: TransferCategory, periods: list[Period], values: list[str]) -> None:
+    """
+    Creates Expense of TransferCategory with given value in every given Period.
+
+    Args:
+        category (TransferCategory): TransferCategory of Expenses.
+        periods (list[Period]): Periods of Expenses.
+        values (list[str]): Values of Expenses.
+    """
+    for period, value in zip(periods, values):
+        Expense.objects.create(
+            name="Expense",
+            value=Decimal(value),
+            date=period.date_start,
+            period=period,
+            deposit_id=category.deposit_id,
+            category=category,
+        )
+
+
+class TestComputeForecasts:
+    """Tests for compute_forecasts."""
+
+    def test_estimators(self):
+        """
+        GIVEN: Expenses history of two TransferCategories in four Periods.
+        WHEN: Calling compute_forecasts for Period starting year after second Period.
+        THEN: All estimators calculated for both TransferCategories.
+        """
+        history = ExpenseHistory(
+            categories=[(1, 10), (2, 20)],
+            periods_starts=[date(2023, 11, 1), date(2023, 12, 1), date(2024, 1, 1), date(2024, 2, 1)],
+            values=[[100.0, 10.0, 20.0, 30.0], [0.0, 0.0, 0.0, 0.0]],
+        )
+
+        forecasts = compute_forecasts(
+            history, target_start=date(2024, 12, 1), method=ForecastMethod.PERCENTILE, window=3, percentile=50
+        )
+
+        assert forecasts[0]._asdict() == {
+            "category": 1,
+            "deposit": 10,
+            "moving_average": Decimal("20.00"),
+            "exponential": Decimal("29.33"),
+            "seasonal": Decimal("10.00"),
+            "percentile": Decimal("20.00"),
+            "suggested_plan": Decimal("20.00"),
+        }
+        assert forecasts[1][2:] == (Decimal("0.00"), Decimal("0.00"), Decimal("0.00"), Decimal("0.00"), Decimal("0.00"))
+
+    def test_missing_seasonal_period_and_empty_history(self):
+        """
+        GIVEN: Expenses history without Period from previous year and history without Periods.
+        WHEN: Calling compute_forecasts with seasonal method.
+        THEN: Seasonal estimate missing, moving average suggested. Zeros returned for empty history.
+        """
+        history = ExpenseHistory(categories=[(1, 10)], periods_starts=[date(2024, 1, 1)], values=[[15.5]])
+        empty_history = ExpenseHistory(categories=[(1, 10)], periods_starts=[], values=[[]])
+
+        forecast = compute_forecasts(history, target_start=date(2024, 2, 1), method=ForecastMethod.SEASONAL)[0]
+        empty_forecast = compute_forecasts(empty_history, target_start=date(2024, 2, 1))[0]
+
+        assert (forecast.seasonal, forecast.suggested_plan) == (None, Decimal("15.50"))
+        assert (empty_forecast.moving_average, empty_forecast.suggested_plan) == (Decimal("0.00"), Decimal("0.00"))
+
+
+@pytest.mark.django_db
+class TestForecastExpensePredictions:
+    """Tests for loading expenses history and forecasting ExpensePredictions."""
+
+    def test_load_expense_history(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        category: TransferCategory,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Expenses of expense TransferCategory, income TransferCategory and inactive TransferCategory
+        in Periods of Wallet.
+        WHEN: Calling load_expense_history for last Period limited to three Periods.
+        THEN: Dense matrix of active expense TransferCategory expenses in three Periods before last one returned
+        with three queries.
+        """
+        income_category = transfer_category_factory(wallet=wallet, category_type=CategoryType.INCOME)
+        inactive_category = transfer_category_factory(
+            wallet=wallet, category_type=CategoryType.EXPENSE, is_active=False
+        )
+        create_expenses(category, periods[12:], ["10.00", "20.00", "30.00", "40.00"])
+        create_expenses(category, periods[13:14], ["5.00"])
+        create_expenses(inactive_category, periods[12:15], ["1.00", "1.00", "1.00"])
+
+        with CaptureQueriesContext(connection) as queries:
+            history = load_expense_history(wallet.pk, before=periods[15].date_start, max_periods=3)
+
+        assert len(queries) == 3
+        assert income_category.id not in [category_id for category_id, _ in history.categories]
+        assert history == ExpenseHistory(
+            categories=[(category.id, category.deposit_id)],
+            periods_starts=[period.date_start for period in periods[12:15]],
+            values=[[10.0, 25.0, 30.0]],
+        )
+
+    def test_forecast_and_write_predictions(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        category: TransferCategory,
+        transfer_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Year of Expenses of TransferCategory with ExpensePrediction in draft Period and TransferCategory
+        without Expenses.
+        WHEN: Forecasting draft Period with seasonal method and writing forecasts.
+        THEN: Existing ExpensePrediction current_plan overwritten with value from previous year, description kept.
+        ExpensePrediction for TransferCategory without expenses not created.
+        """
+        transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE, is_active=True)
+        create_expenses(category, periods[:15], [f"{month}.00" for month in range(1, 16)])
+        prediction = expense_prediction_factory(
+            period=periods[15], category=category, current_plan=Decimal("1.00"), description="Kept"
+        )
+
+        forecasts = forecast_expense_predictions(periods[15], method=ForecastMethod.SEASONAL)
+        written_count = write_forecasted_predictions(periods[15], forecasts)
+
+        assert written_count == 1
+        assert [forecast.suggested_plan for forecast in forecasts] == [Decimal("4.00"), Decimal("0.00")]
+        prediction.refresh_from_db()
+        assert (prediction.current_plan, prediction.description) == (Decimal("4.00"), "Kept")
+        assert ExpensePrediction.objects.filter(period=periods[15]).count() == 1
@@ -0,0 +1,221 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from factory.base import FactoryMetaClass
+
+from categories.models import TransferCategory
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from predictions.models import ExpensePrediction
+from predictions.services.prediction_result_service import (
+    get_actual_current_result,
+    get_prediction_results_drift,
+    repair_prediction_results,
+)
+from transfers.models import Expense, Transfer
+from wallets.models import Wallet
+
+
+def assert_results_consistent(wallet: Wallet) -> None:
+    """
+    Checks if persisted current_result of every Wallet ExpensePrediction equals sum calculated from Transfers.
+
+    Args:
+        wallet (Wallet): Wallet model instance.
+    """
+    assert all(
+        current_result == actual_result
+        for current_result, actual_result in ExpensePrediction.objects.filter(period__wallet=wallet)
+        .annotate(actual_result=get_actual_current_result())
+        .values_list("current_result", "actual_result")
+    )
+
+
+@pytest.fixture
+def period(wallet: Wallet, period_factory: FactoryMetaClass) -> Period:
+    """
+    Creates September 2024 Period of Wallet.
+
+    Returns:
+        Period: Created Period.
+    """
+    return period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+
+
+@pytest.fixture
+def category(wallet: Wallet, transfer_category_factory: FactoryMetaClass) -> TransferCategory:
+    """
+    Creates expense TransferCategory of Wallet.
+
+    Returns:
+        TransferCategory: Created TransferCategory.
+    """
+    return transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE)
+
+
+def create_expense(period: Period, category: TransferCategory | None, deposit_id: int, value: str) -> Transfer:
+    """
+    Creates Expense in Period with given TransferCategory and value.
+
+    Args:
+        period (Period): Period of Expense.
+        category (TransferCategory | None): TransferCategory of Expense.
+        deposit_id (int): Deposit ID of Expense.
+        value (str): Value of Expense.
+
+    Returns:
+        Transfer: Created Expense.
+    """
+    return Expense.objects.create(
+        name="Expense",
+        value=Decimal(value),
+        date=period.date_start,
+        period=period,
+        deposit_id=deposit_id,
+        category=category,
+    )
+
+
+@pytest.mark.django_db
+class TestPredictionCurrentResult:
+    """Tests for keeping ExpensePrediction current_result consistent with Transfers."""
+
+    def test_transfer_create_update_and_delete(
+        self,
+        wallet: Wallet,
+        period: Period,
+        category: TransferCategory,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePrediction for TransferCategory in database.
+        WHEN: Creating, updating and deleting Expenses of its TransferCategory.
+        THEN: ExpensePrediction current_result follows sum of Expenses values.
+        """
+        prediction = expense_prediction_factory(period=period, category=category)
+
+        expense = create_expense(period, category, category.deposit_id, "10.50")
+        create_expense(period, category, category.deposit_id, "20.25")
+        prediction.refresh_from_db()
+        assert prediction.current_result == Decimal("30.75")
+
+        expense.value = Decimal("100.00")
+        expense.save()
+        prediction.refresh_from_db()
+        assert prediction.current_result == Decimal("120.25")
+
+        expense.delete()
+        prediction.refresh_from_db()
+        assert prediction.current_result == Decimal("20.25")
+        assert_results_consistent(wallet)
+
+    def test_transfer_moved_between_predictions(
+        self,
+        wallet: Wallet,
+        period: Period,
+        category: TransferCategory,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePredictions with and without TransferCategory in database.
+        WHEN: Removing TransferCategory from Expense and deleting TransferCategory with Expenses.
+        THEN: Expenses values moved to ExpensePrediction without TransferCategory.
+        """
+        expense_prediction_factory(period=period, category=category)
+        uncategorized = expense_prediction_factory(period=period, category=None, deposit=category.deposit)
+        expense = create_expense(period, category, category.deposit_id, "10.00")
+        create_expense(period, category, category.deposit_id, "5.00")
+
+        expense.category = None
+        expense.save()
+        uncategorized.refresh_from_db()
+        assert uncategorized.current_result == Decimal("10.00")
+        assert_results_consistent(wallet)
+
+        category.delete()
+        uncategorized.refresh_from_db()
+        assert uncategorized.current_result == Decimal("15.00")
+        assert_results_consistent(wallet)
+
+    def test_entity_delete(
+        self,
+        wallet: Wallet,
+        period: Period,
+        category: TransferCategory,
+        expense_prediction_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePrediction and Expense with Entity in database.
+        WHEN: Deleting Entity of Expense.
+        THEN: ExpensePrediction current_result not changed.
+        """
+        prediction = expense_prediction_factory(period=period, category=category)
+        expense = create_expense(period, category, category.deposit_id, "42.00")
+        expense.entity = entity_factory(wallet=wallet)
+        expense.save()
+
+        expense.entity.delete()
+
+        prediction.refresh_from_db()
+        assert prediction.current_result == Decimal("42.00")
+        assert_results_consistent(wallet)
+
+    def test_prediction_created_after_transfers(
+        self,
+        wallet: Wallet,
+        period: Period,
+        category: TransferCategory,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Expenses of TransferCategory in database.
+        WHEN: Creating ExpensePredictions with save() and with bulk_create().
+        THEN: current_result of created ExpensePredictions calculated from existing Expenses.
+        """
+        create_expense(period, category, category.deposit_id, "12.34")
+        create_expense(period, None, category.deposit_id, "1.00")
+
+        prediction = expense_prediction_factory(period=period, category=category)
+        ExpensePrediction.objects.bulk_create(
+            [ExpensePrediction(period=period, category=None, deposit_id=category.deposit_id, current_plan=0)]
+        )
+
+        prediction.refresh_from_db()
+        assert prediction.current_result == Decimal("12.34")
+        assert ExpensePrediction.objects.get(category__isnull=True).current_result == Decimal("1.00")
+        assert_results_consistent(wallet)
+
+
+@pytest.mark.django_db
+class TestPredictionResultsDrift:
+    """Tests for get_prediction_results_drift and repair_prediction_results."""
+
+    def test_drift_detected_and_repaired(
+        self,
+        wallet: Wallet,
+        period: Period,
+        category: TransferCategory,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePredictions of two Wallets with corrupted persisted current_result.
+        WHEN: Calling get_prediction_results_drift for Wallet and repair_prediction_results for drifted ones.
+        THEN: Only drifted ExpensePrediction of given Wallet reported and repaired.
+        """
+        prediction = expense_prediction_factory(period=period, category=category)
+        expense_prediction_factory(period=period)
+        other_prediction = expense_prediction_factory()
+        create_expense(period, category, category.deposit_id, "7.00")
+        ExpensePrediction.objects.filter(id__in=(prediction.id, other_prediction.id)).update(
+            current_result=Decimal("99.00")
+        )
+
+        drifts = get_prediction_results_drift(wallet_id=wallet.id)
+        repaired_count = repair_prediction_results([drift.prediction_id for drift in drifts])
+
+        assert [tuple(drift) for drift in drifts] == [(prediction.id, Decimal("99.00"), Decimal("7.00"))]
+        assert repaired_count == 1
+        assert get_prediction_results_drift(wallet_id=wallet.id) == []
+        assert [drift.prediction_id for drift in get_prediction_results_drift()] == [other_prediction.id]
@@ -1,17 +1,83 @@
-from django.db.models import QuerySet
+from django.db.models import Case, DecimalField, Func, OuterRef, Q, QuerySet, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
 
+from predictions.models.expense_prediction_model import ExpensePrediction
 from predictions.views.expense_prediction_viewset import (
     get_current_funds_left,
     get_current_progress,
     get_previous_funds_left,
-    get_previous_period_prediction_plan,
-    sum_period_transfers_with_category,
 )
+from transfers.services.transfer_rollup_service import get_transfer_aggregate_model
+
+
+def sum_period_transfers_with_category(period_ref: str) -> Case:
+    """
+    Function for calculate Transfers values sum of given TransferCategory in Period.
+
+    Args:
+        period_ref (string): Period field name for OuterRef.
+
+    Returns:
+        Case: ORM function returning Sum of Period Transfers values for specified TransferCategory.
+    """
+
+    return Case(
+        When(
+            category__isnull=True,
+            then=Coalesce(
+                Subquery(
+                    get_transfer_aggregate_model()
+                    .objects.filter(Q(period=OuterRef(period_ref), deposit=OuterRef("deposit"), category__isnull=True))
+                    .values("period")
+                    .annotate(total=Sum("value"))
+                    .values("total")[:1],
+                    output_field=DecimalField(decimal_places=2),
+                ),
+                Value(0),
+                output_field=DecimalField(decimal_places=2),
+            ),
+        ),
+        default=Coalesce(
+            Subquery(
+                get_transfer_aggregate_model()
+                .objects.filter(
+                    Q(period=OuterRef(period_ref), deposit=OuterRef("deposit"), category=OuterRef("category"))
+                )
+                .values("period")
+                .annotate(total=Sum("value"))
+                .values("total")[:1],
+                output_field=DecimalField(decimal_places=2),
+            ),
+            Value(0),
+            output_field=DecimalField(decimal_places=2),
+        ),
+        output_field=DecimalField(decimal_places=2),
+    )
+
+
+def get_previous_period_prediction_plan() -> Func:
+    """
+    Function for calculate Transfers values sum of given TransferCategory in particular Period.
+
+    Returns:
+        Func: ORM function returning Sum of Period Transfers values for specified TransferCategory.
+    """
+    return Coalesce(
+        Subquery(
+            ExpensePrediction.objects.filter(
+                period=OuterRef("period__previous_period"), category=OuterRef("category")
+            ).values("current_plan")[:1]
+        ),
+        Value(0),
+        output_field=DecimalField(decimal_places=2),
+    )
 
 
 def annotate_expense_prediction_queryset(queryset: QuerySet) -> QuerySet:
     """
-    Annotates QuerySet with calculated fields returned in ExpensePredictionViewSet.
+    Annotates QuerySet with calculated fields returned in ExpensePredictionViewSet. Uses correlated subqueries
+    as reference implementation for ExpensePredictionViewSet derived tables. current_result is persisted
+    in ExpensePrediction table.
 
     Args:
         queryset (QuerySet): Input ExpensePrediction QuerySet
@@ -20,7 +86,6 @@ def annotate_expense_prediction_queryset(queryset: QuerySet) -> QuerySet:
         QuerySet: Annotated ExpensePrediction QuerySet.
     """
     return queryset.annotate(
-        current_result=sum_period_transfers_with_category(period_ref="period"),
         previous_plan=get_previous_period_prediction_plan(),
         previous_result=sum_period_transfers_with_category(period_ref="period__previous_period"),
     ).annotate(
@@ -292,10 +292,10 @@ class TestCopyPredictionsFromPreviousPeriodAPIView:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == "No predictions to copy from previous Period."
 
-    @patch("predictions.models.ExpensePrediction.objects.bulk_create")
+    @patch("predictions.views.copy_predictions_from_previous_period_view.copy_predictions")
     def test_copy_predictions_database_error(
         self,
-        mock_bulk_create,
+        mock_copy_predictions,
         api_client: APIClient,
         base_user: User,
         wallet_factory: FactoryMetaClass,
@@ -304,11 +304,11 @@ class TestCopyPredictionsFromPreviousPeriodAPIView:
         transfer_category_factory: FactoryMetaClass,
     ):
         """
-        GIVEN: Database error during bulk_create operation.
+        GIVEN: Database error during copying ExpensePredictions.
         WHEN: CopyPredictionsFromPreviousPeriodAPIView endpoint called with POST.
         THEN: HTTP 500 returned with error message and transaction is rolled back.
         """
-        mock_bulk_create.side_effect = Exception("Database connection error")
+        mock_copy_predictions.side_effect = Exception("Database connection error")
 
         wallet = wallet_factory(owner=base_user)
         category = transfer_category_factory(wallet=wallet)
@@ -357,3 +357,69 @@ class TestCopyPredictionsFromPreviousPeriodAPIView:
         # Test DELETE method
         response = api_client.delete(url)
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_copy_predictions_from_given_source_period(
+        self,
+        api_client: APIClient,
+        base_user: User,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet with three Periods and ExpensePredictions in first and second one.
+        WHEN: CopyPredictionsFromPreviousPeriodAPIView endpoint called with POST for third Period with first Period
+        as "source_period".
+        THEN: HTTP 200 returned and predictions of first Period copied instead of previous Period ones.
+        """
+        wallet = wallet_factory(owner=base_user)
+        source_period = period_factory(wallet=wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31))
+        previous_period = period_factory(
+            wallet=wallet, date_start=date(2024, 2, 1), date_end=date(2024, 2, 29), previous_period=source_period
+        )
+        current_period = period_factory(
+            wallet=wallet, date_start=date(2024, 3, 1), date_end=date(2024, 3, 31), previous_period=previous_period
+        )
+        source_prediction = expense_prediction_factory(period=source_period, current_plan=Decimal("10.00"))
+        expense_prediction_factory(period=previous_period, current_plan=Decimal("20.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            copy_predictions_url(wallet.id, current_period.id), {"source_period": source_period.id}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert list(
+            ExpensePrediction.objects.filter(period=current_period).values_list("category", "current_plan")
+        ) == [(source_prediction.category_id, Decimal("10.00"))]
+
+    @pytest.mark.parametrize("source_period", ("abc", "other_wallet"))
+    def test_copy_predictions_invalid_source_period(
+        self,
+        api_client: APIClient,
+        base_user: User,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        source_period: str,
+    ):
+        """
+        GIVEN: Wallet with Period and other Wallet Period with ExpensePredictions.
+        WHEN: CopyPredictionsFromPreviousPeriodAPIView endpoint called with POST with invalid "source_period"
+        or Period of other Wallet.
+        THEN: HTTP 400 returned, no predictions copied.
+        """
+        wallet = wallet_factory(owner=base_user)
+        current_period = period_factory(wallet=wallet)
+        other_period = period_factory(wallet=wallet_factory())
+        expense_prediction_factory(period=other_period)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            copy_predictions_url(wallet.id, current_period.id),
+            {"source_period": other_period.id if source_period == "other_wallet" else source_period},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not ExpensePrediction.objects.filter(period=current_period).exists()
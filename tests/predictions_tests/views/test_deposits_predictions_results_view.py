@@ -4,6 +4,8 @@ from decimal import Decimal
 import pytest
 from conftest import get_jwt_access_token
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -432,3 +434,50 @@ class TestDepositsPredictionsResultsAPIViewIntegration:
         # The values should maintain their precision but be formatted with 2 decimal places
         assert deposit_data["predictions_sum"] == "123.46"  # Rounded to 2 decimal places
         assert deposit_data["period_expenses"] == "67.90"  # Rounded to 2 decimal places
+
+    def test_queries_number_independent_of_deposits_and_periods_number(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Wallets - first with single Deposit and Period, second with three Deposits and six Periods
+        containing Incomes, Expenses and ExpensePredictions.
+        WHEN: DepositsPredictionsResultsAPIView called for last Period of both Wallets.
+        THEN: The same number of database queries executed for both Wallets and history summed for every Deposit.
+        """
+        api_client.force_authenticate(base_user)
+        queries_counts = []
+        for deposits_count, periods_count in ((1, 1), (3, 6)):
+            wallet = wallet_factory(owner=base_user)
+            deposits = deposit_factory.create_batch(deposits_count, wallet=wallet)
+            for month in range(1, periods_count + 1):
+                period = period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+                for deposit in deposits:
+                    income_category = transfer_category_factory(
+                        wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME
+                    )
+                    expense_category = transfer_category_factory(
+                        wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE
+                    )
+                    transfer_factory(period=period, deposit=deposit, category=income_category, value=Decimal("100.00"))
+                    transfer_factory(period=period, deposit=deposit, category=expense_category, value=Decimal("30.00"))
+                    expense_prediction_factory(period=period, category=expense_category, current_plan=Decimal("50.00"))
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(deposits_predictions_results_url(wallet.id, period.id))
+            assert response.status_code == status.HTTP_200_OK
+            queries_counts.append(len(context.captured_queries))
+
+            for deposit_data in response.data:
+                assert deposit_data["period_balance"] == f"{100 * periods_count - 30 * (periods_count - 1):.2f}"
+                assert deposit_data["predictions_sum"] == "50.00"
+                assert deposit_data["period_expenses"] == "30.00"
+                assert deposit_data["funds_left_for_expenses"] == "20.00"
+
+        assert queries_counts[0] == queries_counts[1]
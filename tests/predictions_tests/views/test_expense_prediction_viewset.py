@@ -5,9 +5,12 @@ from typing import Any
 import pytest
 from conftest import get_jwt_access_token
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.db.models import F, Q
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
-from predictions_tests.utils import annotate_expense_prediction_queryset
+from predictions_tests.utils import annotate_expense_prediction_queryset, sum_period_transfers_with_category
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -16,8 +19,13 @@ from categories.models import TransferCategory
 from categories.models.choices.category_priority import CategoryPriority
 from categories.models.choices.category_type import CategoryType
 from periods.models.choices.period_status import PeriodStatus
+from predictions.filtersets.expense_prediction_filterset import ExpensePredictionFilterSet
 from predictions.models.expense_prediction_model import ExpensePrediction
 from predictions.serializers.expense_prediction_serializer import ExpensePredictionSerializer
+from predictions.views.expense_prediction_viewset import PREVIOUS_RESULTS_ALIAS
+from predictions.views.prediction_progress_status_view import PredictionProgressStatus
+from transfers.models import Transfer
+from wallets.models import Wallet
 
 
 def expense_prediction_url(wallet_id: int):
@@ -159,6 +167,7 @@ class TestExpensePredictionViewSetList:
         ).order_by("id")
         serializer = ExpensePredictionSerializer(predictions, many=True)
         assert response.status_code == status.HTTP_200_OK
+        assert serializer.data
         assert response.data == serializer.data
         for prediction in serializer.data:
             category = TransferCategory.objects.get(id=prediction["category"])
@@ -225,6 +234,7 @@ class TestExpensePredictionViewSetList:
         ).order_by("id")
         serializer = ExpensePredictionSerializer(predictions, many=True)
         assert response.status_code == status.HTTP_200_OK
+        assert serializer.data
         assert response.data == serializer.data
         assert serializer.data[0]["id"] == previous_prediction.id and serializer.data[0]["previous_plan"] == str(
             Decimal(Decimal("0.00")).quantize(Decimal("0.00"))
@@ -304,6 +314,168 @@ class TestExpensePredictionViewSetList:
         )
 
 
+@pytest.mark.django_db
+class TestExpensePredictionViewSetListQueryPlan:
+    """Tests for query plan of list view on ExpensePredictionViewSet."""
+
+    PERIODS_COUNT = 12
+    CATEGORIES_COUNT = 20
+    TRANSFERS_PER_PREDICTION = 10
+
+    @pytest.fixture
+    def wallet(
+        self,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ) -> Wallet:
+        """
+        Creates Wallet with 12 Periods, 20 expense TransferCategories, ExpensePrediction for every
+        (Period, TransferCategory) pair and ten Transfers for three quarters of TransferCategories and for
+        no TransferCategory in every Period. Plans are chosen to cover every PredictionProgressStatus.
+
+        Returns:
+            Wallet: Wallet with synthetic data.
+        """
+        wallet = wallet_factory(owner=base_user)
+        deposit = deposit_factory(wallet=wallet)
+        categories = transfer_category_factory.create_batch(
+            self.CATEGORIES_COUNT, wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE
+        )
+        transfers = []
+        for month in range(1, self.PERIODS_COUNT + 1):
+            period = period_factory(wallet=wallet, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+            ExpensePrediction.objects.bulk_create(
+                ExpensePrediction(
+                    period=period,
+                    deposit=deposit,
+                    category=category,
+                    current_plan=Decimal(self.TRANSFERS_PER_PREDICTION * (index + 1) * (index % 3)),
+                )
+                for index, category in enumerate(categories)
+            )
+            for index, category in enumerate([*categories, None]):
+                if index % 4 == 3:
+                    continue
+                transfers.extend(
+                    Transfer(
+                        transfer_type=CategoryType.EXPENSE,
+                        name="Transfer",
+                        value=Decimal(index + 1),
+                        date=period.date_start,
+                        period=period,
+                        deposit=deposit,
+                        category=category,
+                    )
+                    for _ in range(self.TRANSFERS_PER_PREDICTION)
+                )
+        Transfer.objects.bulk_create(transfers)
+        return wallet
+
+    def test_no_correlated_subqueries_in_query_plan(
+        self, api_client: APIClient, base_user: AbstractUser, wallet: Wallet
+    ):
+        """
+        GIVEN: Wallet with 240 ExpensePredictions and 1920 Transfers in database.
+        WHEN: ExpensePredictionViewSet list endpoint called by Wallet owner.
+        THEN: EXPLAIN of ExpensePredictions query contains no SubPlan executed per ExpensePrediction.
+        """
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(expense_prediction_url(wallet.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        predictions_queries = [
+            query["sql"] for query in context.captured_queries if PREVIOUS_RESULTS_ALIAS in query["sql"]
+        ]
+        assert predictions_queries
+        for sql in predictions_queries:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN {sql}")
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            assert "SubPlan" not in plan
+
+    def test_persisted_current_result_matches_reference_implementation(self, wallet: Wallet):
+        """
+        GIVEN: Wallet with 240 ExpensePredictions created before 1920 Transfers in database.
+        WHEN: Persisted current_result of ExpensePredictions compared with Transfers sums calculated with correlated
+        subqueries.
+        THEN: Values are equal for every ExpensePrediction.
+        """
+        predictions = ExpensePrediction.objects.filter(period__wallet=wallet).annotate(
+            reference_current_result=sum_period_transfers_with_category(period_ref="period")
+        )
+
+        assert predictions.filter(current_result__gt=0).exists()
+        assert not predictions.exclude(current_result=F("reference_current_result")).exists()
+
+    @pytest.mark.parametrize("ordering", ["current_progress", "-current_progress", "previous_funds_left"])
+    @pytest.mark.parametrize("progress_status", [None, *(status.value for status in PredictionProgressStatus)])
+    def test_results_match_reference_implementation(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet: Wallet,
+        ordering: str,
+        progress_status: int | None,
+    ):
+        """
+        GIVEN: Wallet with 240 ExpensePredictions and 1920 Transfers in database.
+        WHEN: ExpensePredictionViewSet list endpoint called by Wallet owner with ordering and progress_status.
+        THEN: Response equal to ExpensePredictions annotated with correlated subqueries returned.
+        """
+        api_client.force_authenticate(base_user)
+        params = {"ordering": f"{ordering},id"}
+        if progress_status is not None:
+            params["progress_status"] = progress_status
+
+        response = api_client.get(expense_prediction_url(wallet.id), data=params)
+
+        predictions = ExpensePredictionFilterSet.filter_by_progress_status(
+            annotate_expense_prediction_queryset(ExpensePrediction.objects.filter(period__wallet=wallet)).filter(
+                Q(category__isnull=False) | Q(current_result__gt=0)
+            ),
+            "progress_status",
+            progress_status if progress_status is not None else 0,
+        ).order_by(ordering, "id")
+        serializer = ExpensePredictionSerializer(predictions, many=True)
+        assert response.status_code == status.HTTP_200_OK
+        assert serializer.data
+        assert response.data == serializer.data
+
+    @pytest.mark.parametrize("ordering", ["current_result", "-current_funds_left", "category__name", "-id"])
+    def test_keyset_pagination_matches_unpaginated_results(
+        self, api_client: APIClient, base_user: AbstractUser, wallet: Wallet, ordering: str
+    ):
+        """
+        GIVEN: Wallet with 240 ExpensePredictions and 1920 Transfers in database.
+        WHEN: ExpensePredictionViewSet list endpoint called by Wallet owner with "pagination=cursor" and ordering
+        by annotated or related field, then with next links.
+        THEN: Pages joined together equal to unpaginated response ordered by the same field and id.
+        """
+        api_client.force_authenticate(base_user)
+        id_ordering = "-id" if ordering.startswith("-") else "id"
+        expected = api_client.get(expense_prediction_url(wallet.id), data={"ordering": f"{ordering},{id_ordering}"})
+
+        results = []
+        response = api_client.get(
+            expense_prediction_url(wallet.id), data={"pagination": "cursor", "page_size": 50, "ordering": ordering}
+        )
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            results.extend(response.data["results"])
+            if response.data["next"] is None:
+                break
+            response = api_client.get(response.data["next"])
+
+        assert len(results) == len(expected.data)
+        assert results == expected.data
+
+
 @pytest.mark.django_db
 class TestExpensePredictionViewSetCreate:
     """Tests for create ExpensePrediction on ExpensePredictionViewSet."""
@@ -995,3 +1167,314 @@ class TestExpensePredictionViewSetDelete:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not ExpensePrediction.objects.filter(period__wallet=wallet).exists()
+
+
+@pytest.mark.django_db
+class TestExpensePredictionViewSetUpsert:
+    """Tests for upsert action on ExpensePredictionViewSet."""
+
+    @staticmethod
+    def upsert_url(wallet_id: int) -> str:
+        """Create and return an ExpensePrediction upsert URL."""
+        return reverse("wallets:expense_prediction-upsert", args=[wallet_id])
+
+    def test_upsert_predictions(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Draft Period with ExpensePrediction for one of two expense TransferCategories of Wallet, income
+        TransferCategory of Wallet and expense TransferCategory of other Wallet.
+        WHEN: ExpensePredictionViewSet upsert action called with valid and invalid rows.
+        THEN: HTTP 200 - existing ExpensePrediction updated, missing one created, invalid rows skipped and status
+        of every row returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period = period_factory(wallet=wallet, status=PeriodStatus.DRAFT)
+        existing_category, new_category = transfer_category_factory.create_batch(
+            2, wallet=wallet, category_type=CategoryType.EXPENSE
+        )
+        income_category = transfer_category_factory(wallet=wallet, category_type=CategoryType.INCOME)
+        other_wallet_category = transfer_category_factory(wallet=wallet_factory(), category_type=CategoryType.EXPENSE)
+        existing = expense_prediction_factory(period=period, category=existing_category, current_plan=Decimal("1.00"))
+        api_client.force_authenticate(base_user)
+        payload = {
+            "period": period.id,
+            "predictions": [
+                {
+                    "category": existing_category.id,
+                    "deposit": existing_category.deposit_id,
+                    "current_plan": "150.00",
+                    "description": "Updated",
+                },
+                {"category": new_category.id, "deposit": new_category.deposit_id, "current_plan": "80.50"},
+                {"category": income_category.id, "deposit": income_category.deposit_id, "current_plan": "10.00"},
+                {"category": new_category.id, "deposit": existing_category.deposit_id, "current_plan": "10.00"},
+                {"category": other_wallet_category.id, "deposit": new_category.deposit_id, "current_plan": "10.00"},
+                {"category": new_category.id, "deposit": new_category.deposit_id, "current_plan": "0.00"},
+                {"category": new_category.id, "deposit": new_category.deposit_id, "current_plan": "20.00"},
+            ],
+        }
+
+        response = api_client.post(self.upsert_url(wallet.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        created = ExpensePrediction.objects.get(period=period, category=new_category)
+        results = response.data["results"]
+        assert [result["status"] for result in results] == ["updated", "created"] + ["invalid"] * 5
+        assert [result["id"] for result in results[:2]] == [existing.id, created.id]
+        assert results[2]["errors"] == ["Incorrect category provided. Please provide expense category."]
+        assert results[3]["errors"] == ["Category Deposit different than Prediction Deposit"]
+        assert results[4]["errors"] == ["TransferCategory does not exist in Wallet."]
+        assert results[5]["errors"]["current_plan"] == ["Value should be higher than 0.00."]
+        assert results[6]["errors"] == ["ExpensePrediction for TransferCategory and Deposit already given in request."]
+        existing.refresh_from_db()
+        assert (existing.current_plan, existing.description) == (Decimal("150.00"), "Updated")
+        assert (created.deposit_id, created.current_plan, created.description) == (
+            new_category.deposit_id,
+            Decimal("80.50"),
+            None,
+        )
+        assert ExpensePrediction.objects.filter(period=period).count() == 2
+
+    def test_new_prediction_not_added_to_active_period(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Active Period with ExpensePrediction for one of two expense TransferCategories of Wallet.
+        WHEN: ExpensePredictionViewSet upsert action called with rows for both TransferCategories.
+        THEN: HTTP 200 - existing ExpensePrediction updated, new one not created.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period = period_factory(wallet=wallet, status=PeriodStatus.ACTIVE)
+        existing_category, new_category = transfer_category_factory.create_batch(
+            2, wallet=wallet, category_type=CategoryType.EXPENSE
+        )
+        existing = expense_prediction_factory(period=period, category=existing_category)
+        api_client.force_authenticate(base_user)
+        payload = {
+            "period": period.id,
+            "predictions": [
+                {"category": category.id, "deposit": category.deposit_id, "current_plan": "10.00"}
+                for category in (existing_category, new_category)
+            ],
+        }
+
+        response = api_client.post(self.upsert_url(wallet.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [result["status"] for result in response.data["results"]] == ["updated", "invalid"]
+        assert response.data["results"][1]["errors"] == ["New Expense Prediction cannot be added to active Period."]
+        existing.refresh_from_db()
+        assert existing.current_plan == Decimal("10.00")
+        assert not ExpensePrediction.objects.filter(period=period, category=new_category).exists()
+
+    @pytest.mark.parametrize(
+        "period_status, other_wallet_period, error",
+        (
+            (PeriodStatus.CLOSED, False, "Expense Prediction cannot be changed when Period is closed."),
+            (PeriodStatus.DRAFT, True, "Period does not exist in Wallet."),
+        ),
+    )
+    def test_error_invalid_period(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        period_status: PeriodStatus,
+        other_wallet_period: bool,
+        error: str,
+    ):
+        """
+        GIVEN: Closed Period of Wallet or Period of other Wallet.
+        WHEN: ExpensePredictionViewSet upsert action called for Period.
+        THEN: HTTP 400 - ExpensePrediction not created.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period = period_factory(wallet=wallet_factory() if other_wallet_period else wallet, status=period_status)
+        category = transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE)
+        api_client.force_authenticate(base_user)
+        payload = {
+            "period": period.id,
+            "predictions": [{"category": category.id, "deposit": category.deposit_id, "current_plan": "10.00"}],
+        }
+
+        response = api_client.post(self.upsert_url(wallet.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == error
+        assert not ExpensePrediction.objects.filter(period=period).exists()
+
+    def test_queries_number_independent_of_rows_number(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two draft Periods and ten expense TransferCategories of Wallet.
+        WHEN: ExpensePredictionViewSet upsert action called with one row for first Period and with ten rows
+        for second Period.
+        THEN: HTTP 200 - ExpensePredictions created with the same number of queries.
+        """
+        wallet = wallet_factory(owner=base_user)
+        first_period, second_period = period_factory.create_batch(2, wallet=wallet, status=PeriodStatus.DRAFT)
+        deposit = deposit_factory(wallet=wallet)
+        categories = transfer_category_factory.create_batch(
+            10, wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE
+        )
+        api_client.force_authenticate(base_user)
+
+        def upsert(period_id: int, rows_number: int) -> CaptureQueriesContext:
+            payload = {
+                "period": period_id,
+                "predictions": [
+                    {"category": category.id, "deposit": deposit.id, "current_plan": "10.00"}
+                    for category in categories[:rows_number]
+                ],
+            }
+            with CaptureQueriesContext(connection) as queries:
+                response = api_client.post(self.upsert_url(wallet.id), payload, format="json")
+            assert response.status_code == status.HTTP_200_OK
+            return queries
+
+        single_queries = upsert(first_period.id, 1)
+        many_queries = upsert(second_period.id, 10)
+
+        assert ExpensePrediction.objects.filter(period=second_period).count() == 10
+        assert len(many_queries) == len(single_queries)
+
+
+@pytest.mark.django_db
+class TestExpensePredictionViewSetForecast:
+    """Tests for forecast action on ExpensePredictionViewSet."""
+
+    @staticmethod
+    def forecast_url(wallet_id: int) -> str:
+        """Create and return an ExpensePrediction forecast URL."""
+        return reverse("wallets:expense_prediction-forecast", args=[wallet_id])
+
+    def test_auth_required(self, api_client: APIClient, wallet: Wallet):
+        """
+        GIVEN: Wallet instance in database.
+        WHEN: ExpensePredictionViewSet forecast action called without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.get(self.forecast_url(wallet.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_forecast_and_write_predictions(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two closed Periods with Expenses of TransferCategory and draft Period of Wallet.
+        WHEN: ExpensePredictionViewSet forecast action called with GET and with POST for draft Period.
+        THEN: HTTP 200 - estimates returned. ExpensePrediction created with suggested plan only for POST.
+        """
+        wallet = wallet_factory(owner=base_user)
+        closed_periods = [
+            period_factory(
+                wallet=wallet,
+                date_start=date(2024, month, 1),
+                date_end=date(2024, month, 28),
+                status=PeriodStatus.CLOSED,
+            )
+            for month in (1, 2)
+        ]
+        period = period_factory(
+            wallet=wallet, date_start=date(2024, 3, 1), date_end=date(2024, 3, 31), status=PeriodStatus.DRAFT
+        )
+        category = transfer_category_factory(wallet=wallet, category_type=CategoryType.EXPENSE, is_active=True)
+        for closed_period, value in zip(closed_periods, (Decimal("10.00"), Decimal("30.00"))):
+            Transfer.objects.create(
+                name="Expense",
+                value=value,
+                date=closed_period.date_start,
+                period=closed_period,
+                deposit=category.deposit,
+                category=category,
+                transfer_type=CategoryType.EXPENSE,
+            )
+        api_client.force_authenticate(base_user)
+
+        get_response = api_client.get(self.forecast_url(wallet.id), {"period": period.id, "window": 2})
+        assert not ExpensePrediction.objects.filter(period=period).exists()
+        post_response = api_client.post(
+            self.forecast_url(wallet.id),
+            {"period": period.id, "method": "percentile", "percentile": 100},
+            format="json",
+        )
+
+        assert get_response.status_code == status.HTTP_200_OK
+        assert get_response.data["forecasts"] == [
+            {
+                "category": category.id,
+                "deposit": category.deposit_id,
+                "moving_average": Decimal("20.00"),
+                "exponential": Decimal("23.33"),
+                "seasonal": None,
+                "percentile": Decimal("25.00"),
+                "suggested_plan": Decimal("20.00"),
+            }
+        ]
+        assert post_response.status_code == status.HTTP_200_OK
+        assert post_response.data["written_predictions_count"] == 1
+        assert ExpensePrediction.objects.get(period=period, category=category).current_plan == Decimal("30.00")
+
+    def test_error_invalid_parameters(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Closed Period of Wallet and Period of other Wallet.
+        WHEN: ExpensePredictionViewSet forecast action called with invalid method, with Period of other Wallet
+        and with POST for closed Period.
+        THEN: Bad request HTTP 400 returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        closed_period = period_factory(wallet=wallet, status=PeriodStatus.CLOSED)
+        other_period = period_factory(wallet=wallet_factory())
+        api_client.force_authenticate(base_user)
+
+        invalid_method_response = api_client.get(
+            self.forecast_url(wallet.id), {"period": closed_period.id, "method": "unknown"}
+        )
+        other_wallet_response = api_client.get(self.forecast_url(wallet.id), {"period": other_period.id})
+        closed_period_response = api_client.post(
+            self.forecast_url(wallet.id), {"period": closed_period.id}, format="json"
+        )
+
+        assert invalid_method_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "method" in invalid_method_response.data["detail"]
+        assert other_wallet_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert other_wallet_response.data["error"] == "Period does not exist in Wallet."
+        assert closed_period_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert closed_period_response.data["error"] == (
+            "Forecasted Expense Predictions can be written only into draft Period."
+        )
+        assert not ExpensePrediction.objects.exists()
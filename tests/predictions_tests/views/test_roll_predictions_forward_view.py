@@ -0,0 +1,119 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_users.models import User
+from periods.models.choices.period_status import PeriodStatus
+from predictions.models import ExpensePrediction
+
+
+def roll_predictions_forward_url(wallet_id: int, period_id: int):
+    """Create and return a roll predictions forward URL."""
+    return reverse("predictions:roll-predictions-forward", args=[wallet_id, period_id])
+
+
+@pytest.mark.django_db
+class TestRollPredictionsForwardAPIView:
+    """Tests for RollPredictionsForwardAPIView."""
+
+    def test_auth_required(self, api_client: APIClient, period_factory: FactoryMetaClass):
+        """
+        GIVEN: Period in database.
+        WHEN: RollPredictionsForwardAPIView endpoint called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        period = period_factory()
+
+        response = api_client.post(roll_predictions_forward_url(period.wallet_id, period.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_roll_predictions_forward(
+        self,
+        api_client: APIClient,
+        base_user: User,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet with closed Period with ExpensePredictions followed by three draft Periods.
+        WHEN: RollPredictionsForwardAPIView endpoint called with POST with "periods_count" equal to 2.
+        THEN: HTTP 200 returned, predictions copied into two nearest draft Periods.
+        """
+        wallet = wallet_factory(owner=base_user)
+        periods = [
+            period_factory(
+                wallet=wallet,
+                date_start=date(2024, month, 1),
+                date_end=date(2024, month, 28),
+                status=PeriodStatus.CLOSED if month == 1 else PeriodStatus.DRAFT,
+            )
+            for month in range(1, 5)
+        ]
+        expense_prediction_factory.create_batch(2, period=periods[0], current_plan=Decimal("10.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            roll_predictions_forward_url(wallet.id, periods[0].id), {"periods_count": 2}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"copied_predictions_count": 4, "target_periods_count": 2}
+        assert set(ExpensePrediction.objects.filter(period__in=periods[1:]).values_list("period", flat=True)) == {
+            periods[1].id,
+            periods[2].id,
+        }
+
+    @pytest.mark.parametrize("periods_count", (None, 0, "2", True, 25))
+    def test_error_invalid_periods_count(
+        self,
+        api_client: APIClient,
+        base_user: User,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        periods_count: int | str | None,
+    ):
+        """
+        GIVEN: Wallet with Period.
+        WHEN: RollPredictionsForwardAPIView endpoint called with POST with invalid "periods_count".
+        THEN: HTTP 400 returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period = period_factory(wallet=wallet)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            roll_predictions_forward_url(wallet.id, period.id), {"periods_count": periods_count}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "periods_count must be an integer from 1 to 24."
+
+    def test_error_period_of_other_wallet(
+        self,
+        api_client: APIClient,
+        base_user: User,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet of User and Period of other Wallet.
+        WHEN: RollPredictionsForwardAPIView endpoint called with POST for Period of other Wallet.
+        THEN: HTTP 400 returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        other_period = period_factory(wallet=wallet_factory())
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            roll_predictions_forward_url(wallet.id, other_period.id), {"periods_count": 1}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "Period does not exist in Wallet."
@@ -1,5 +1,6 @@
 import random
 from datetime import date, timedelta
+from decimal import Decimal
 
 import factory.fuzzy
 from categories_tests.factories import TransferCategoryFactory
@@ -11,6 +12,7 @@ from categories.models import TransferCategory
 from categories.models.choices.category_type import CategoryType
 from entities.models import Deposit, Entity
 from periods.models import Period
+from transfers.models.choices.recurrence_frequency import RecurrenceFrequency
 from wallets.models import Wallet
 
 
@@ -206,3 +208,33 @@ class ExpenseFactory(TransferFactory):
             CategoryType: EXPENSE CategoryType.
         """
         return CategoryType.EXPENSE
+
+
+class RecurringTransferFactory(factory.django.DjangoModelFactory):
+    """Factory for RecurringTransfer model."""
+
+    class Meta:
+        model = "transfers.RecurringTransfer"
+
+    wallet = factory.SubFactory(WalletFactory)
+    transfer_type = CategoryType.EXPENSE
+    name = factory.Faker("text", max_nb_chars=128)
+    description = factory.Faker("text", max_nb_chars=255)
+    value = Decimal("100.00")
+    frequency = RecurrenceFrequency.MONTHLY
+    day_of_month = 1
+    interval_days = None
+    start_date = date(2024, 1, 1)
+    end_date = None
+    entity = None
+    category = None
+
+    @factory.lazy_attribute
+    def deposit(self, *args) -> Deposit:
+        """
+        Returns Deposit with the same Wallet as RecurringTransfer.
+
+        Returns:
+            Deposit: Deposit with the same Wallet as RecurringTransfer.
+        """
+        return DepositFactory(wallet=self.wallet)
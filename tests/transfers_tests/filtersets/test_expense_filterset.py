@@ -129,6 +129,77 @@ class TestExpenseFilterSetFiltering:
         assert response.data == serializer.data
         assert response.data[0]["id"] == matching_transfer.id
 
+    @pytest.mark.parametrize("filter_value", ("rent", "RENT", "Fla", "flat re", "landlord", "rent!"))
+    def test_get_transfers_list_searched(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+        filter_value: str,
+    ):
+        """
+        GIVEN: Two Expense objects for single Wallet.
+        WHEN: The ExpenseViewSet list view is called with "search" filter.
+        THEN: Response must contain Expense containing words starting with given words in name or description.
+        """
+        wallet = wallet_factory(owner=base_user)
+        matching_transfer = expense_factory(wallet=wallet, name="Flat rent", description="Paid to landlord.")
+        expense_factory(wallet=wallet, name="Groceries", description="Weekly shopping.")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_url(wallet.id), data={"search": filter_value})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [transfer["id"] for transfer in response.data] == [matching_transfer.id]
+
+    def test_get_transfers_list_searched_ordered_by_relevance(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Expense objects for single Wallet, two of them matching search value.
+        WHEN: The ExpenseViewSet list view is called with "search" filter.
+        THEN: Response must contain matching Expenses ordered by relevance - Expense containing searched word
+        in both name and description first.
+        """
+        wallet = wallet_factory(owner=base_user)
+        weak_match = expense_factory(wallet=wallet, name="Shopping", description="Fuel for car.")
+        strong_match = expense_factory(wallet=wallet, name="Car fuel", description="Fuel for car.")
+        expense_factory(wallet=wallet, name="Groceries", description="Weekly shopping.")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_url(wallet.id), data={"search": "car"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [transfer["id"] for transfer in response.data] == [strong_match.id, weak_match.id]
+
+    def test_get_transfers_list_searched_with_explicit_ordering(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Expense objects for single Wallet, two of them matching search value.
+        WHEN: The ExpenseViewSet list view is called with "search" filter and "ordering" param.
+        THEN: Response must contain matching Expenses ordered by given field - relevance ordering discarded.
+        """
+        wallet = wallet_factory(owner=base_user)
+        weak_match = expense_factory(wallet=wallet, name="Shopping", description="Fuel for car.", value=Decimal("1"))
+        strong_match = expense_factory(wallet=wallet, name="Car fuel", description="Fuel for car.", value=Decimal("2"))
+        expense_factory(wallet=wallet, name="Groceries", description="Weekly shopping.")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_url(wallet.id), data={"search": "car", "ordering": "value"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [transfer["id"] for transfer in response.data] == [weak_match.id, strong_match.id]
+
     def test_get_transfers_list_filtered_by_period(
         self,
         api_client: APIClient,
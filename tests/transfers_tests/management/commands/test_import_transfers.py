@@ -0,0 +1,60 @@
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from factory.base import FactoryMetaClass
+
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+
+@pytest.mark.django_db
+class TestImportTransfersCommand:
+    """Tests for import_transfers admin command."""
+
+    def test_import_csv_file(
+        self,
+        tmp_path: Path,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet with Period and Deposit. CSV statement file with two rows.
+        WHEN: import_transfers command called for CSV file.
+        THEN: Two Transfers created, summary with rows per second printed.
+        """
+        period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        deposit = deposit_factory(wallet=wallet)
+        statement_path = tmp_path / "statement.csv"
+        statement_path.write_text("when,amount,title\n2024-09-01,-5.00,Shop\n2024-09-02,50.00,Refund\n")
+        output = StringIO()
+
+        call_command(
+            "import_transfers",
+            wallet.id,
+            deposit.id,
+            str(statement_path),
+            "--date-column=when",
+            "--value-column=amount",
+            "--name-column=title",
+            "--description-column=",
+            stdout=output,
+        )
+
+        assert Transfer.objects.filter(period__wallet=wallet, deposit=deposit).count() == 2
+        assert "Transfers imported: 2. Rows skipped: 0. Rows/sec:" in output.getvalue()
+
+    def test_error_deposit_from_other_wallet(self, tmp_path: Path, wallet: Wallet, deposit_factory: FactoryMetaClass):
+        """
+        GIVEN: Deposit not belonging to given Wallet.
+        WHEN: import_transfers command called.
+        THEN: CommandError raised.
+        """
+        statement_path = tmp_path / "statement.csv"
+        statement_path.write_text("date,value,name\n")
+
+        with pytest.raises(CommandError):
+            call_command("import_transfers", wallet.id, deposit_factory().id, str(statement_path))
@@ -0,0 +1,64 @@
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from factory.base import FactoryMetaClass
+
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+
+@pytest.mark.django_db
+class TestMaterializeRecurringTransfersCommand:
+    """Tests for materialize_recurring_transfers admin command."""
+
+    def test_materialize_all_wallets(
+        self,
+        wallet: Wallet,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: RecurringTransfers and two Periods in each of two Wallets.
+        WHEN: materialize_recurring_transfers command called twice without arguments with batch of single Period.
+        THEN: Transfers created for all Periods of all Wallets in first call only.
+        """
+        other_wallet = wallet_factory()
+        for period_wallet in (wallet, other_wallet):
+            period_factory(wallet=period_wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31))
+            period_factory(wallet=period_wallet, date_start=date(2024, 2, 1), date_end=date(2024, 2, 29))
+            recurring_transfer_factory(wallet=period_wallet)
+        output = StringIO()
+
+        call_command("materialize_recurring_transfers", batch_size=1, stdout=output)
+        call_command("materialize_recurring_transfers", batch_size=1, stdout=StringIO())
+
+        assert Transfer.objects.filter(wallet=wallet).count() == 2
+        assert Transfer.objects.filter(wallet=other_wallet).count() == 2
+        assert "Created transfers: 4, materialized periods: 4." in output.getvalue()
+
+    def test_materialize_selected_wallets_since_date(
+        self,
+        wallet: Wallet,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: RecurringTransfers and two Periods in each of two Wallets.
+        WHEN: materialize_recurring_transfers command called with --wallet and --since arguments.
+        THEN: Transfers created only for given Wallet Periods ending on or after given date.
+        """
+        other_wallet = wallet_factory()
+        for period_wallet in (wallet, other_wallet):
+            period_factory(wallet=period_wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31))
+            period_factory(wallet=period_wallet, date_start=date(2024, 2, 1), date_end=date(2024, 2, 29))
+            recurring_transfer_factory(wallet=period_wallet)
+
+        call_command(
+            "materialize_recurring_transfers", "--wallet", str(wallet.id), "--since", "2024-02-01", stdout=StringIO()
+        )
+
+        assert list(Transfer.objects.values_list("wallet", "date")) == [(wallet.id, date(2024, 2, 1))]
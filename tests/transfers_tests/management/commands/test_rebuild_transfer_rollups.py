@@ -0,0 +1,40 @@
+import pytest
+from django.core.management import call_command
+from factory.base import FactoryMetaClass
+
+from transfers.models import Transfer, TransferRollup
+from wallets.models import Wallet
+
+
+@pytest.mark.django_db
+class TestRebuildTransferRollupsCommand:
+    """Tests for rebuild_transfer_rollups admin command."""
+
+    def test_rebuild_all_wallets(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers in database and empty TransferRollup table.
+        WHEN: rebuild_transfer_rollups command called without arguments.
+        THEN: TransferRollup table recreated for all Wallets.
+        """
+        transfer_factory.create_batch(3, wallet=wallet)
+        transfer_factory()
+        TransferRollup.objects.all().delete()
+
+        call_command("rebuild_transfer_rollups")
+
+        assert sum(TransferRollup.objects.values_list("transfers_count", flat=True)) == Transfer.objects.count()
+
+    def test_rebuild_single_wallet(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers for two Wallets in database and empty TransferRollup table.
+        WHEN: rebuild_transfer_rollups command called with --wallet argument.
+        THEN: TransferRollup table recreated only for given Wallet.
+        """
+        transfer_factory.create_batch(3, wallet=wallet)
+        transfer_factory()
+        TransferRollup.objects.all().delete()
+
+        call_command("rebuild_transfer_rollups", wallet=wallet.id)
+
+        assert sum(TransferRollup.objects.values_list("transfers_count", flat=True)) == 3
+        assert not TransferRollup.objects.exclude(wallet=wallet).exists()
@@ -0,0 +1,129 @@
+from datetime import date
+
+import pytest
+from django.core.exceptions import ValidationError
+from factory.base import FactoryMetaClass
+
+from categories.models.choices.category_type import CategoryType
+from transfers.models import RecurringTransfer
+from transfers.models.choices.recurrence_frequency import RecurrenceFrequency
+from wallets.models.wallet_model import Wallet
+
+
+@pytest.mark.django_db
+class TestRecurringTransferModel:
+    """Tests for RecurringTransfer model"""
+
+    @pytest.mark.parametrize(
+        "schedule, date_range, expected_dates",
+        [
+            (
+                {"frequency": RecurrenceFrequency.MONTHLY, "day_of_month": 15},
+                (date(2024, 1, 10), date(2024, 3, 20)),
+                [date(2024, 1, 15), date(2024, 2, 15), date(2024, 3, 15)],
+            ),
+            (
+                {"frequency": RecurrenceFrequency.MONTHLY, "day_of_month": 31},
+                (date(2024, 2, 1), date(2024, 4, 30)),
+                [date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)],
+            ),
+            (
+                {"frequency": RecurrenceFrequency.WEEKLY, "start_date": date(2023, 12, 27)},
+                (date(2024, 1, 1), date(2024, 1, 31)),
+                [date(2024, 1, 3), date(2024, 1, 10), date(2024, 1, 17), date(2024, 1, 24), date(2024, 1, 31)],
+            ),
+            (
+                {"frequency": RecurrenceFrequency.EVERY_N_DAYS, "interval_days": 10, "start_date": date(2024, 1, 5)},
+                (date(2024, 1, 20), date(2024, 2, 10)),
+                [date(2024, 1, 25), date(2024, 2, 4)],
+            ),
+            (
+                {
+                    "frequency": RecurrenceFrequency.MONTHLY,
+                    "day_of_month": 1,
+                    "start_date": date(2024, 2, 2),
+                    "end_date": date(2024, 4, 1),
+                },
+                (date(2024, 1, 1), date(2024, 5, 31)),
+                [date(2024, 3, 1), date(2024, 4, 1)],
+            ),
+            (
+                {"frequency": RecurrenceFrequency.WEEKLY, "start_date": date(2024, 6, 1)},
+                (date(2024, 1, 1), date(2024, 1, 31)),
+                [],
+            ),
+        ],
+    )
+    def test_get_occurrence_dates(self, schedule: dict, date_range: tuple[date, date], expected_dates: list[date]):
+        """
+        GIVEN: RecurringTransfer with monthly, weekly or every N days schedule.
+        WHEN: RecurringTransfer.get_occurrence_dates called for date range.
+        THEN: Dates of occurrences due in date range, limited to start_date and end_date, returned.
+        """
+        recurring_transfer = RecurringTransfer(**{"start_date": date(2020, 1, 1), **schedule})
+
+        assert recurring_transfer.get_occurrence_dates(*date_range) == expected_dates
+
+    @pytest.mark.parametrize(
+        "schedule",
+        [
+            {"frequency": RecurrenceFrequency.MONTHLY, "day_of_month": None},
+            {"frequency": RecurrenceFrequency.MONTHLY, "day_of_month": 32},
+            {"frequency": RecurrenceFrequency.EVERY_N_DAYS, "interval_days": None},
+            {"frequency": RecurrenceFrequency.WEEKLY, "end_date": date(2023, 12, 31)},
+        ],
+    )
+    def test_error_invalid_schedule(self, wallet: Wallet, recurring_transfer_factory: FactoryMetaClass, schedule: dict):
+        """
+        GIVEN: Schedule without field required by frequency or with end_date before start_date.
+        WHEN: RecurringTransfer instance create attempt with invalid schedule.
+        THEN: ValidationError raised. RecurringTransfer not created in database.
+        """
+        with pytest.raises(ValidationError):
+            recurring_transfer_factory(wallet=wallet, start_date=date(2024, 1, 1), **schedule)
+        assert not RecurringTransfer.objects.filter(wallet=wallet).exists()
+
+    def test_error_relations_from_other_wallet(
+        self,
+        wallet: Wallet,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Deposit and TransferCategory of other Wallet in database.
+        WHEN: RecurringTransfer instance create attempt with other Wallet TransferCategory or Deposit.
+        THEN: ValidationError raised. RecurringTransfer not created in database.
+        """
+        other_wallet = wallet_factory()
+        other_deposit = deposit_factory(wallet=other_wallet)
+        other_category = transfer_category_factory(
+            wallet=other_wallet, deposit=other_deposit, category_type=CategoryType.EXPENSE
+        )
+
+        with pytest.raises(ValidationError, match="Wallet for category, entity and deposit fields is not the same."):
+            recurring_transfer_factory(wallet=wallet, deposit=other_deposit)
+        with pytest.raises(ValidationError, match="Wallet for category, entity and deposit fields is not the same."):
+            recurring_transfer_factory(wallet=wallet, category=other_category)
+        assert not RecurringTransfer.objects.filter(wallet=wallet).exists()
+
+    def test_error_category_of_other_deposit(
+        self,
+        wallet: Wallet,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: TransferCategory of other Deposit in Wallet.
+        WHEN: RecurringTransfer instance create attempt with TransferCategory of other Deposit.
+        THEN: ValidationError raised. RecurringTransfer not created in database.
+        """
+        category = transfer_category_factory(
+            wallet=wallet, deposit=deposit_factory(wallet=wallet), category_type=CategoryType.EXPENSE
+        )
+
+        with pytest.raises(ValidationError, match="Transfer Deposit and Transfer Category Deposit has to be the same."):
+            recurring_transfer_factory(wallet=wallet, deposit=deposit_factory(wallet=wallet), category=category)
+        assert not RecurringTransfer.objects.filter(wallet=wallet).exists()
@@ -8,6 +8,7 @@ from factory.base import BaseFactory, FactoryMetaClass
 
 from categories.models.choices.category_priority import CategoryPriority
 from categories.models.choices.category_type import CategoryType
+from periods.models import Period
 from transfers.models.transfer_model import Transfer
 from wallets.models.wallet_model import Wallet
 
@@ -312,3 +313,73 @@ class TestTransferModel:
 
         assert str(exc.value.args[0]) == "Wallet for period, category, entity and deposit fields is not the same."
         assert not Transfer.objects.all().exists()
+
+    def test_wallet_set_from_period(
+        self,
+        wallet: Wallet,
+        transfer_factory: BaseFactory,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Periods of Wallet in database.
+        WHEN: Transfers created with save and bulk_create without "wallet" value and moved to other Period
+        with update.
+        THEN: Transfers "wallet" field set to Wallet of their Period.
+        """
+        period_1 = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        period_2 = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 10, 1), date_end=datetime.date(2024, 10, 31)
+        )
+        saved_transfer = transfer_factory(period=period_1, date=datetime.date(2024, 9, 1))
+        created_transfer = Transfer.objects.bulk_create(
+            [
+                Transfer(
+                    transfer_type=CategoryType.EXPENSE,
+                    name="Flat rent",
+                    value=Decimal(900),
+                    date=datetime.date(2024, 10, 1),
+                    period_id=period_2.pk,
+                    deposit=deposit_factory(wallet=wallet),
+                )
+            ]
+        )[0]
+
+        Transfer.objects.filter(pk=saved_transfer.pk).update(period=period_2.pk)
+
+        assert created_transfer.wallet_id == wallet.pk
+        assert Transfer.objects.filter(wallet=wallet).count() == 2
+        assert Transfer.objects.get(pk=saved_transfer.pk).wallet_id == wallet.pk
+
+    @pytest.mark.django_db(transaction=True)
+    def test_error_wallet_different_than_period_wallet(
+        self, wallet_factory: FactoryMetaClass, transfer_factory: BaseFactory
+    ):
+        """
+        GIVEN: Transfer and other Wallet in database.
+        WHEN: Transfer "wallet" updated to Wallet different than Wallet of Transfer Period.
+        THEN: IntegrityError raised.
+        """
+        transfer = transfer_factory()
+        other_wallet = wallet_factory()
+
+        with pytest.raises(IntegrityError) as exc:
+            Transfer.objects.filter(pk=transfer.pk).update(wallet=other_wallet)
+
+        assert 'violates foreign key constraint "transfer_period_wallet_fk"' in str(exc.value)
+        assert Transfer.objects.get(pk=transfer.pk).wallet_id == transfer.period.wallet_id
+
+    def test_wallet_updated_with_period_wallet(self, wallet_factory: FactoryMetaClass, transfer_factory: BaseFactory):
+        """
+        GIVEN: Transfer and other Wallet in database.
+        WHEN: Transfer Period moved to other Wallet.
+        THEN: Transfer "wallet" updated to new Wallet of Period.
+        """
+        transfer = transfer_factory()
+        other_wallet = wallet_factory()
+
+        Period.objects.filter(pk=transfer.period_id).update(wallet=other_wallet)
+
+        assert Transfer.objects.get(pk=transfer.pk).wallet_id == other_wallet.pk
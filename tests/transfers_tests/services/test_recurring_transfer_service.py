@@ -0,0 +1,179 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from categories.models import TransferCategory
+from categories.models.choices.category_type import CategoryType
+from periods.models import Period
+from transfers.models import RecurringTransfer, Transfer, TransferRollup
+from transfers.models.choices.recurrence_frequency import RecurrenceFrequency
+from transfers.services.recurring_transfer_service import materialize_recurring_transfers
+from wallets.models.wallet_model import Wallet
+
+
+@pytest.mark.django_db
+class TestMaterializeRecurringTransfers:
+    """Tests for materialize_recurring_transfers."""
+
+    @pytest.fixture
+    def periods(self, wallet: Wallet, period_factory: FactoryMetaClass) -> list[Period]:
+        """
+        Creates Periods for January and February 2024 in Wallet.
+
+        Returns:
+            list[Period]: Created Periods.
+        """
+        return [
+            period_factory(wallet=wallet, date_start=date(2024, 1, 1), date_end=date(2024, 1, 31)),
+            period_factory(wallet=wallet, date_start=date(2024, 2, 1), date_end=date(2024, 2, 29)),
+        ]
+
+    def test_occurrences_materialized_once(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        entity_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Monthly RecurringTransfer with Entity and TransferCategory and every 14 days RecurringTransfer
+        in Wallet with two Periods.
+        WHEN: materialize_recurring_transfers called twice for both Periods.
+        THEN: Transfers created for every occurrence with RecurringTransfer values and applied to TransferRollup
+        table in first call, nothing created in second call.
+        """
+        monthly = recurring_transfer_factory(
+            wallet=wallet,
+            transfer_type=CategoryType.INCOME,
+            value=Decimal("5000.00"),
+            day_of_month=10,
+            entity=entity_factory(wallet=wallet),
+        )
+        monthly.category = transfer_category_factory(
+            wallet=wallet, deposit=monthly.deposit, category_type=CategoryType.INCOME
+        )
+        monthly.save()
+        every_14_days = recurring_transfer_factory(
+            wallet=wallet,
+            frequency=RecurrenceFrequency.EVERY_N_DAYS,
+            interval_days=14,
+            day_of_month=None,
+            start_date=date(2024, 1, 3),
+        )
+
+        result = materialize_recurring_transfers(periods)
+        repeated_result = materialize_recurring_transfers(periods)
+
+        assert len(result.transfers) == 7
+        assert result.materialized_periods_count == 4
+        assert result.invalid_recurring_transfers_ids == []
+        assert list(
+            Transfer.objects.filter(name=monthly.name)
+            .order_by("date")
+            .values_list("date", "period", "value", "transfer_type", "entity", "deposit", "category", "wallet")
+        ) == [
+            (
+                occurrence_date,
+                period.pk,
+                monthly.value,
+                CategoryType.INCOME,
+                monthly.entity_id,
+                monthly.deposit_id,
+                monthly.category_id,
+                wallet.pk,
+            )
+            for occurrence_date, period in zip((date(2024, 1, 10), date(2024, 2, 10)), periods)
+        ]
+        assert list(
+            Transfer.objects.filter(name=every_14_days.name).order_by("date").values_list("date", flat=True)
+        ) == [
+            date(2024, 1, 3),
+            date(2024, 1, 17),
+            date(2024, 1, 31),
+            date(2024, 2, 14),
+            date(2024, 2, 28),
+        ]
+        assert TransferRollup.objects.filter(wallet=wallet).aggregate(total=Sum("value"))["total"] == Decimal(
+            "10500.00"
+        )
+        assert repeated_result.transfers == []
+        assert repeated_result.materialized_periods_count == 0
+        assert Transfer.objects.filter(wallet=wallet).count() == 7
+
+    def test_deleted_transfer_not_materialized_again(
+        self, wallet: Wallet, periods: list[Period], recurring_transfer_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: RecurringTransfer materialized in Period and its Transfer deleted afterwards.
+        WHEN: materialize_recurring_transfers called again for Period.
+        THEN: Transfer not created again.
+        """
+        recurring_transfer_factory(wallet=wallet)
+        Transfer.objects.filter(pk=materialize_recurring_transfers(periods[:1]).transfers[0].pk).delete()
+
+        result = materialize_recurring_transfers(periods[:1])
+
+        assert result.transfers == []
+        assert not Transfer.objects.filter(wallet=wallet).exists()
+
+    def test_invalid_recurring_transfer_skipped(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Valid RecurringTransfer and RecurringTransfer, which TransferCategory Deposit was changed after
+        RecurringTransfer was saved.
+        WHEN: materialize_recurring_transfers called for Periods.
+        THEN: Transfers created only for valid RecurringTransfer. Invalid RecurringTransfer reported and not marked
+        as materialized.
+        """
+        valid = recurring_transfer_factory(wallet=wallet)
+        invalid = recurring_transfer_factory(wallet=wallet)
+        invalid.category = transfer_category_factory(
+            wallet=wallet, deposit=invalid.deposit, category_type=CategoryType.EXPENSE
+        )
+        invalid.save()
+        TransferCategory.objects.filter(pk=invalid.category_id).update(deposit=deposit_factory(wallet=wallet))
+
+        result = materialize_recurring_transfers(periods)
+
+        assert {transfer.name for transfer in result.transfers} == {valid.name}
+        assert result.invalid_recurring_transfers_ids == [invalid.pk]
+        assert not RecurringTransfer.objects.get(pk=invalid.pk).materialized_periods.exists()
+
+    def test_queries_number_independent_of_recurring_transfers_number(
+        self,
+        wallet: Wallet,
+        periods: list[Period],
+        deposit_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: RecurringTransfer of Deposit in Wallet with two Periods.
+        WHEN: materialize_recurring_transfers called for first Period, then nine RecurringTransfers of the same
+        Deposit added and materialize_recurring_transfers called for second Period.
+        THEN: Occurrences of one and of ten RecurringTransfers materialized with the same number of queries.
+        """
+        deposit = deposit_factory(wallet=wallet)
+        recurring_transfer_factory(wallet=wallet, deposit=deposit)
+        with CaptureQueriesContext(connection) as single_queries:
+            single_result = materialize_recurring_transfers(periods[:1])
+        for _ in range(9):
+            recurring_transfer_factory(wallet=wallet, deposit=deposit)
+
+        with CaptureQueriesContext(connection) as many_queries:
+            many_result = materialize_recurring_transfers(periods[1:])
+
+        assert len(single_result.transfers) == 1
+        assert len(many_result.transfers) == 10
+        assert len(many_queries) == len(single_queries)
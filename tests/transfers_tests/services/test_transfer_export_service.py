@@ -0,0 +1,111 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from factory.base import FactoryMetaClass
+
+from transfers.models import Transfer
+from transfers.services.transfer_export_service import (
+    ExportFormat,
+    stream_transfers,
+    stream_transfers_csv,
+    stream_transfers_ndjson,
+)
+from wallets.models import Wallet
+
+
+@pytest.mark.django_db
+class TestTransferExportService:
+    """Tests for Transfers export streaming functions."""
+
+    @pytest.fixture
+    def transfers(
+        self,
+        wallet: Wallet,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+    ) -> list[Transfer]:
+        """
+        Creates five Transfers in single Period of Wallet, without Entity and TransferCategory.
+
+        Returns:
+            list[Transfer]: Created Transfers.
+        """
+        period = period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        deposit = deposit_factory(wallet=wallet)
+        return [
+            transfer_factory(
+                period=period,
+                deposit=deposit,
+                entity=None,
+                category=None,
+                name=f"Transfer, {index}",
+                description=None,
+                value=Decimal(f"{index + 1}.50"),
+                date=date(2024, 9, index + 1),
+            )
+            for index in range(5)
+        ]
+
+    def test_stream_csv(self, wallet: Wallet, transfers: list[Transfer], django_assert_num_queries):
+        """
+        GIVEN: Five Transfers in database.
+        WHEN: stream_transfers_csv called with chunk size smaller than number of Transfers.
+        THEN: Header and Transfers rows streamed in chunks, all rows fetched with single query.
+        """
+        queryset = Transfer.objects.filter(period__wallet=wallet).order_by("id")
+
+        with django_assert_num_queries(1):
+            chunks = list(stream_transfers_csv(queryset, chunk_size=2))
+
+        assert len(chunks) == 4
+        assert chunks[0] == "id,name,description,value,date,period,entity,deposit,category\r\n"
+        assert "".join(chunks[1:]).splitlines() == [
+            f'{transfer.id},"Transfer, {index}",,{index + 1}.50,2024-09-0{index + 1},'
+            f"{transfer.period_id},,{transfer.deposit_id},"
+            for index, transfer in enumerate(transfers)
+        ]
+
+    def test_stream_ndjson(self, wallet: Wallet, transfers: list[Transfer], django_assert_num_queries):
+        """
+        GIVEN: Five Transfers in database.
+        WHEN: stream_transfers_ndjson called with chunk size smaller than number of Transfers.
+        THEN: JSON object per Transfer streamed in chunks, all rows fetched with single query.
+        """
+        queryset = Transfer.objects.filter(period__wallet=wallet).order_by("id")
+
+        with django_assert_num_queries(1):
+            chunks = list(stream_transfers_ndjson(queryset, chunk_size=2))
+
+        assert len(chunks) == 3
+        assert [json.loads(line) for line in "".join(chunks).splitlines()] == [
+            {
+                "id": transfer.id,
+                "name": f"Transfer, {index}",
+                "description": None,
+                "value": f"{index + 1}.50",
+                "date": f"2024-09-0{index + 1}",
+                "period": transfer.period_id,
+                "entity": None,
+                "deposit": transfer.deposit_id,
+                "category": None,
+            }
+            for index, transfer in enumerate(transfers)
+        ]
+
+    def test_csv_header_streamed_before_query(
+        self, wallet: Wallet, transfers: list[Transfer], django_assert_num_queries
+    ):
+        """
+        GIVEN: Five Transfers in database.
+        WHEN: First chunk taken from CSV stream.
+        THEN: Header returned without executing query.
+        """
+        stream = stream_transfers(Transfer.objects.filter(period__wallet=wallet), ExportFormat.CSV)
+
+        with django_assert_num_queries(0):
+            header = next(stream)
+
+        assert header.startswith("id,name")
@@ -0,0 +1,180 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from factory.base import FactoryMetaClass
+
+from categories.models.choices.category_type import CategoryType
+from entities.models import Deposit
+from transfers.models import Transfer, TransferRollup
+from transfers.services.transfer_import_service import (
+    CsvColumnMapping,
+    ImportRowError,
+    StatementRow,
+    TransferImportService,
+    parse_csv_statement,
+    parse_ofx_statement,
+)
+from wallets.models import Wallet
+
+OFX_STATEMENT = """OFXHEADER:100
+DATA:OFXSGML
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20240905120000[+1:CET]
+<TRNAMT>-12.50
+<NAME>Grocery &amp; Co
+<MEMO>Card payment
+</STMTTRN>
+<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20240910<TRNAMT>1000.00<NAME>Salary</STMTTRN>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<TRNAMT>-1.00
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+class TestParseCsvStatement:
+    """Tests for parse_csv_statement function."""
+
+    def test_parse_with_default_mapping(self):
+        """
+        GIVEN: CSV lines with default columns.
+        WHEN: parse_csv_statement called.
+        THEN: StatementRows with signed values returned.
+        """
+        lines = ["date,value,name,description\n", "2024-09-01,-10.50,Shop,Card\n", "2024-09-02,100,Salary,\n"]
+
+        rows = list(parse_csv_statement(lines))
+
+        assert rows == [
+            StatementRow(2, date(2024, 9, 1), Decimal("-10.50"), "Shop", "Card"),
+            StatementRow(3, date(2024, 9, 2), Decimal("100"), "Salary", ""),
+        ]
+
+    def test_parse_with_custom_mapping(self):
+        """
+        GIVEN: CSV lines with custom columns, delimiter, date format and decimal separator.
+        WHEN: parse_csv_statement called with matching CsvColumnMapping.
+        THEN: StatementRows returned.
+        """
+        mapping = CsvColumnMapping(
+            date_column="Data",
+            value_column="Kwota",
+            name_column="Opis",
+            description_column=None,
+            date_format="%d.%m.%Y",
+            delimiter=";",
+            decimal_separator=",",
+        )
+        lines = ["Data;Opis;Kwota\n", '01.09.2024;"Shop; Market";-1 234,56\n']
+
+        rows = list(parse_csv_statement(lines, mapping))
+
+        assert rows == [StatementRow(2, date(2024, 9, 1), Decimal("-1234.56"), "Shop; Market", "")]
+
+    def test_invalid_rows_yielded_as_errors(self):
+        """
+        GIVEN: CSV lines with invalid date, invalid value, not finite value and missing column.
+        WHEN: parse_csv_statement called.
+        THEN: ImportRowErrors returned for invalid rows and parsing continued.
+        """
+        lines = [
+            "date,value,name\n",
+            "2024-13-01,1,A\n",
+            "2024-09-01,abc,B\n",
+            "2024-09-01,1,C\n",
+            "2024-09-01,NaN,D\n",
+        ]
+
+        rows = list(parse_csv_statement(lines, CsvColumnMapping(description_column=None)))
+
+        assert isinstance(rows[0], ImportRowError) and rows[0].line_number == 2
+        assert rows[1] == ImportRowError(3, "Invalid amount: 'abc'.")
+        assert rows[2] == StatementRow(4, date(2024, 9, 1), Decimal("1"), "C", "")
+        assert rows[3] == ImportRowError(5, "Invalid amount: 'NaN'.")
+        assert list(parse_csv_statement(["date,value\n", "2024-09-01,1\n"])) == [
+            ImportRowError(2, "Missing column: name.")
+        ]
+
+
+class TestParseOfxStatement:
+    """Tests for parse_ofx_statement function."""
+
+    def test_parse_sgml_statement(self):
+        """
+        GIVEN: OFX SGML statement with two valid transactions and one without DTPOSTED tag.
+        WHEN: parse_ofx_statement called.
+        THEN: StatementRows returned for valid transactions, ImportRowError for invalid one.
+        """
+        rows = list(parse_ofx_statement(OFX_STATEMENT.splitlines(keepends=True)))
+
+        assert rows == [
+            StatementRow(4, date(2024, 9, 5), Decimal("-12.50"), "Grocery & Co", "Card payment"),
+            StatementRow(11, date(2024, 9, 10), Decimal("1000.00"), "Salary", ""),
+            ImportRowError(12, "Missing tag: DTPOSTED."),
+        ]
+
+
+@pytest.mark.django_db
+class TestTransferImportService:
+    """Tests for TransferImportService."""
+
+    @pytest.fixture
+    def deposit(self, wallet: Wallet, period_factory: FactoryMetaClass, deposit_factory: FactoryMetaClass) -> Deposit:
+        """Creates Deposit in Wallet with September and October 2024 Periods."""
+        period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        period_factory(wallet=wallet, date_start=date(2024, 10, 1), date_end=date(2024, 10, 31))
+        return deposit_factory(wallet=wallet)
+
+    @staticmethod
+    def get_rows() -> list[StatementRow | ImportRowError]:
+        """Returns statement rows with seven valid rows and six invalid ones."""
+        return [
+            *(
+                StatementRow(index, date(2024, 9 + index % 2, 10), Decimal(index - 3), f"T{index}", "")
+                for index in range(7)
+            ),
+            StatementRow(7, date(2024, 9, 1), Decimal("0.00"), "Zero", ""),
+            StatementRow(8, date(2025, 1, 1), Decimal("1.00"), "No period", ""),
+            ImportRowError(9, "Invalid amount: 'abc'."),
+            StatementRow(10, date(2024, 9, 1), Decimal("-0.004"), "Sub-cent", ""),
+            StatementRow(11, date(2024, 9, 1), Decimal("123456789.00"), "Too big", ""),
+            StatementRow(12, date(2024, 9, 1), Decimal("1E+30"), "Too big for quantize", ""),
+        ]
+
+    @pytest.mark.parametrize("vendor", ["postgresql", "sqlite"])
+    def test_import_rows(self, monkeypatch: pytest.MonkeyPatch, wallet: Wallet, deposit: Deposit, vendor: str):
+        """
+        GIVEN: Wallet with Periods and Deposit. Statement rows with positive, negative, zero, sub-cent, too big
+        and unmatched values.
+        WHEN: TransferImportService.import_rows called with batch size lower than rows number, using COPY
+        or bulk_create fallback.
+        THEN: Incomes and Expenses created in matching Periods, TransferRollup updated, invalid rows reported.
+        """
+        monkeypatch.setattr(connection, "vendor", vendor)
+
+        report = TransferImportService(wallet_pk=wallet.pk, deposit_pk=deposit.pk, batch_size=2).import_rows(
+            self.get_rows()
+        )
+
+        assert report.imported_count == 6
+        assert report.skipped_count == 7
+        assert [error.line_number for error in report.errors] == [3, 7, 8, 9, 10, 11, 12]
+        assert [error.message for error in report.errors[4:]] == [
+            "Value should be different than 0.00.",
+            "Value 123456789.00 is too big.",
+            "Value 1E+30 is too big.",
+        ]
+        assert report.rows_per_second > 0
+        transfers = Transfer.objects.filter(period__wallet=wallet)
+        assert transfers.filter(transfer_type=CategoryType.EXPENSE).count() == 3
+        assert transfers.filter(transfer_type=CategoryType.INCOME).count() == 3
+        for transfer in transfers:
+            assert transfer.deposit_id == deposit.pk
+            assert transfer.period.date_start <= transfer.date <= transfer.period.date_end
+            assert transfer.value > 0
+        assert sum(TransferRollup.objects.filter(wallet=wallet).values_list("value", flat=True)) == Decimal("12.00")
@@ -0,0 +1,259 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db.models.signals import post_delete
+from factory.base import FactoryMetaClass
+
+from categories.models.choices.category_type import CategoryType
+from transfers.models import Expense, Transfer, TransferRollup
+from transfers.services.transfer_rollup_service import get_queryset_rollup_deltas, rebuild_transfer_rollups
+from wallets.models import Wallet
+
+
+def get_rollups_state(wallet: Wallet) -> dict:
+    """
+    Returns content of TransferRollup table for given Wallet.
+
+    Args:
+        wallet (Wallet): Wallet model instance.
+
+    Returns:
+        dict: TransferRollup rows keyed by rollup key.
+    """
+    return {
+        (rollup.period_id, rollup.deposit_id, rollup.category_id, rollup.entity_id, rollup.transfer_type): (
+            rollup.transfers_count,
+            rollup.value,
+        )
+        for rollup in TransferRollup.objects.filter(wallet=wallet)
+    }
+
+
+def get_transfers_state(wallet: Wallet) -> dict:
+    """
+    Returns expected content of TransferRollup table for given Wallet calculated from Transfer table.
+
+    Args:
+        wallet (Wallet): Wallet model instance.
+
+    Returns:
+        dict: Expected TransferRollup rows keyed by rollup key.
+    """
+    return {
+        (key.period_id, key.deposit_id, key.category_id, key.entity_id, key.transfer_type): (
+            delta.transfers_count,
+            delta.value,
+        )
+        for key, delta in get_queryset_rollup_deltas(Transfer.objects.filter(period__wallet=wallet)).items()
+    }
+
+
+@pytest.mark.django_db
+class TestTransferRollupService:
+    """Tests for keeping TransferRollup table consistent with Transfer table."""
+
+    def test_transfer_create(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: Creating Transfers one by one.
+        THEN: TransferRollup rows contain numbers and sums of created Transfers.
+        """
+        transfer_factory.create_batch(3, wallet=wallet)
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+        assert sum(count for count, _ in get_rollups_state(wallet).values()) == 3
+
+    def test_transfer_create_in_the_same_rollup(
+        self, wallet: Wallet, period_factory: FactoryMetaClass, deposit_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Period and Deposit in database.
+        WHEN: Creating two Expenses with the same period, deposit, category and entity.
+        THEN: Single TransferRollup row with summed values created.
+        """
+        period = period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        deposit = deposit_factory(wallet=wallet)
+        for value in (Decimal("10.50"), Decimal("20.25")):
+            Expense.objects.create(
+                name="Expense", value=value, date=date(2024, 9, 1), period=period, deposit=deposit, category=None
+            )
+
+        rollup = TransferRollup.objects.get(wallet=wallet)
+        assert rollup.transfers_count == 2
+        assert rollup.value == Decimal("30.75")
+        assert rollup.transfer_type == CategoryType.EXPENSE
+        assert rollup.category is None
+        assert rollup.entity is None
+
+    def test_transfer_update(
+        self, wallet: Wallet, transfer_factory: FactoryMetaClass, deposit_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Transfers in database.
+        WHEN: Changing value and deposit of single Transfer with save().
+        THEN: Transfer moved between TransferRollup rows.
+        """
+        transfer_factory.create_batch(2, wallet=wallet)
+        transfer = Transfer.objects.filter(period__wallet=wallet).first()
+        transfer.value = Decimal("123.45")
+        transfer.deposit = deposit_factory(wallet=wallet)
+        transfer.entity = None
+        transfer.category = None
+        transfer.save()
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+
+    def test_transfer_delete(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers in database.
+        WHEN: Deleting single Transfer with delete().
+        THEN: Transfer removed from TransferRollup rows. Empty rows removed.
+        """
+        transfer = transfer_factory(wallet=wallet)
+        transfer_factory(wallet=wallet)
+
+        transfer.delete()
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+        assert TransferRollup.objects.filter(wallet=wallet).count() == 1
+
+    def test_bulk_create(self, wallet: Wallet, period_factory: FactoryMetaClass, deposit_factory: FactoryMetaClass):
+        """
+        GIVEN: Period and Deposit in database.
+        WHEN: Creating Expenses with bulk_create.
+        THEN: TransferRollup rows contain numbers and sums of created Transfers.
+        """
+        period = period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        deposit = deposit_factory(wallet=wallet)
+        Expense.objects.bulk_create(
+            Expense(
+                transfer_type=CategoryType.EXPENSE,
+                name=f"Expense {idx}",
+                value=Decimal(idx),
+                date=date(2024, 9, idx),
+                period=period,
+                deposit=deposit,
+            )
+            for idx in range(1, 6)
+        )
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+        rollup = TransferRollup.objects.get(wallet=wallet)
+        assert rollup.transfers_count == 5
+        assert rollup.value == Decimal("15.00")
+
+    def test_queryset_update(
+        self, wallet: Wallet, transfer_factory: FactoryMetaClass, deposit_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Transfers in database.
+        WHEN: Changing deposit and value of all Transfers with QuerySet.update().
+        THEN: Transfers moved between TransferRollup rows.
+        """
+        transfer_factory.create_batch(3, wallet=wallet)
+        Transfer.objects.filter(period__wallet=wallet).update(
+            deposit=deposit_factory(wallet=wallet), entity=None, category=None, value=Decimal("1.00")
+        )
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+
+    def test_queryset_delete(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers in database.
+        WHEN: Deleting Transfers with QuerySet.delete().
+        THEN: TransferRollup rows of deleted Transfers removed.
+        """
+        transfers = transfer_factory.create_batch(3, wallet=wallet)
+
+        Transfer.objects.filter(id__in=[transfer.id for transfer in transfers[:2]]).delete()
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+
+    def test_queryset_delete_with_signal_receiver(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers in database and post_delete signal receiver connected for Transfer model.
+        WHEN: Deleting Transfers with QuerySet.delete().
+        THEN: Transfers deleted with Django Collector sending signal for every deleted Transfer, TransferRollup
+        rows of deleted Transfers removed.
+        """
+        transfers = transfer_factory.create_batch(3, wallet=wallet)
+        deleted_ids = []
+        receiver = lambda instance, **kwargs: deleted_ids.append(instance.id)  # NOQA
+        post_delete.connect(receiver, sender=Transfer, weak=False)
+        try:
+            queryset = Transfer.objects.filter(id__in=[transfer.id for transfer in transfers[:2]])
+            assert not queryset.can_fast_delete()
+            deleted_count, _ = queryset.delete()
+        finally:
+            post_delete.disconnect(receiver, sender=Transfer)
+
+        assert deleted_count == 2
+        assert sorted(deleted_ids) == sorted(transfer.id for transfer in transfers[:2])
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+
+    def test_category_delete(
+        self,
+        wallet: Wallet,
+        transfer_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Transfers with and without TransferCategory in database.
+        WHEN: Deleting TransferCategory.
+        THEN: TransferRollup sums moved to rows without category.
+        """
+        deposit = deposit_factory(wallet=wallet)
+        category = transfer_category_factory(wallet=wallet, deposit=deposit)
+        transfer_factory(wallet=wallet, deposit=deposit, category=category, entity=None)
+        transfer_factory(wallet=wallet, deposit=deposit, category=None, entity=None)
+
+        category.delete()
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+        assert TransferRollup.objects.filter(wallet=wallet, category__isnull=True).count() >= 1
+
+    def test_entity_and_deposit_delete(
+        self,
+        wallet: Wallet,
+        transfer_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Transfers with Entities in database.
+        WHEN: Deleting Entity and Deposit of Transfers.
+        THEN: TransferRollup rows of deleted Deposit removed, sums of deleted Entity moved to rows without entity.
+        """
+        deposit = deposit_factory(wallet=wallet)
+        other_deposit = deposit_factory(wallet=wallet)
+        entity = entity_factory(wallet=wallet)
+        transfer_factory(
+            wallet=wallet, deposit=deposit, entity=entity, category=None, transfer_type=CategoryType.EXPENSE
+        )
+        transfer_factory(wallet=wallet, deposit=other_deposit, entity=deposit, category=None)
+        transfer_factory(wallet=wallet, deposit=deposit, entity=None, category=None, transfer_type=CategoryType.EXPENSE)
+
+        entity.delete()
+        other_deposit.delete()
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+        rollup = TransferRollup.objects.get(wallet=wallet)
+        assert rollup.entity is None
+        assert rollup.transfers_count == 2
+
+    def test_rebuild_transfer_rollups(self, wallet: Wallet, transfer_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers in database and corrupted TransferRollup table.
+        WHEN: Calling rebuild_transfer_rollups for Wallet.
+        THEN: TransferRollup table recreated basing on Transfers.
+        """
+        transfer_factory.create_batch(3, wallet=wallet)
+        other_wallet_transfer = transfer_factory()
+        TransferRollup.objects.filter(wallet=wallet).update(value=Decimal("0.01"))
+
+        rebuild_transfer_rollups(wallet_id=wallet.id)
+
+        assert get_rollups_state(wallet) == get_transfers_state(wallet)
+        assert TransferRollup.objects.filter(wallet=other_wallet_transfer.period.wallet).exists()
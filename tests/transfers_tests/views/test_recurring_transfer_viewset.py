@@ -0,0 +1,177 @@
+"""
+Tests for RecurringTransferViewSet:
+* TestRecurringTransferViewSetList - GET on list view.
+* TestRecurringTransferViewSetCreate - POST on list view.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from categories.models.choices.category_type import CategoryType
+from transfers.models import RecurringTransfer
+from transfers.models.choices.recurrence_frequency import RecurrenceFrequency
+from transfers.serializers.recurring_transfer_serializer import RecurringTransferSerializer
+
+
+def recurring_transfers_url(wallet_id: int) -> str:
+    """
+    Create and return a RecurringTransfer list URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to list view.
+    """
+    return reverse("wallets:recurring_transfer-list", args=[wallet_id])
+
+
+@pytest.mark.django_db
+class TestRecurringTransferViewSetList:
+    """Tests for list view on RecurringTransferViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, wallet_factory: FactoryMetaClass):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: RecurringTransferViewSet list view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.get(recurring_transfers_url(wallet_factory().id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_retrieve_recurring_transfers_list(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        recurring_transfer_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two RecurringTransfers in Wallet of User and one in other Wallet.
+        WHEN: RecurringTransferViewSet list view called with GET by Wallet owner.
+        THEN: HTTP 200 - Response with serialized RecurringTransfers of Wallet returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        recurring_transfer_factory.create_batch(2, wallet=wallet)
+        recurring_transfer_factory()
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(recurring_transfers_url(wallet.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        serializer = RecurringTransferSerializer(
+            RecurringTransfer.objects.filter(wallet=wallet).order_by("id"), many=True
+        )
+        assert response.data == serializer.data
+        assert len(response.data) == 2
+
+
+@pytest.mark.django_db
+class TestRecurringTransferViewSetCreate:
+    """Tests for create view on RecurringTransferViewSet."""
+
+    def test_create_recurring_transfer(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Deposit and TransferCategory in Wallet of User.
+        WHEN: RecurringTransferViewSet list view called with POST by Wallet owner with valid payload.
+        THEN: HTTP 201 - RecurringTransfer created in Wallet.
+        """
+        wallet = wallet_factory(owner=base_user)
+        deposit = deposit_factory(wallet=wallet)
+        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.EXPENSE)
+        api_client.force_authenticate(base_user)
+        payload = {
+            "transfer_type": CategoryType.EXPENSE,
+            "name": "Rent",
+            "value": Decimal("1500.00"),
+            "frequency": RecurrenceFrequency.MONTHLY,
+            "day_of_month": 10,
+            "start_date": date(2024, 1, 1),
+            "deposit": deposit.id,
+            "category": category.id,
+        }
+
+        response = api_client.post(recurring_transfers_url(wallet.id), payload)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        recurring_transfer = RecurringTransfer.objects.get(id=response.data["id"])
+        assert recurring_transfer.wallet == wallet
+        assert recurring_transfer.category == category
+        assert recurring_transfer.day_of_month == 10
+
+    def test_error_category_of_other_type(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Deposit and income TransferCategory in Wallet of User.
+        WHEN: RecurringTransferViewSet list view called with POST with expense type and income TransferCategory.
+        THEN: HTTP 400 - RecurringTransfer not created.
+        """
+        wallet = wallet_factory(owner=base_user)
+        deposit = deposit_factory(wallet=wallet)
+        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=CategoryType.INCOME)
+        api_client.force_authenticate(base_user)
+        payload = {
+            "transfer_type": CategoryType.EXPENSE,
+            "value": Decimal("1500.00"),
+            "frequency": RecurrenceFrequency.WEEKLY,
+            "start_date": date(2024, 1, 1),
+            "deposit": deposit.id,
+            "category": category.id,
+        }
+
+        response = api_client.post(recurring_transfers_url(wallet.id), payload)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert (
+            response.data["detail"]["non_field_errors"][0]
+            == "Invalid TransferCategory for RecurringTransfer type provided."
+        )
+        assert not RecurringTransfer.objects.filter(wallet=wallet).exists()
+
+    def test_error_invalid_schedule(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Deposit in Wallet of User.
+        WHEN: RecurringTransferViewSet list view called with POST with monthly frequency without day_of_month.
+        THEN: HTTP 400 - RecurringTransfer not created.
+        """
+        wallet = wallet_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+        payload = {
+            "transfer_type": CategoryType.EXPENSE,
+            "value": Decimal("1500.00"),
+            "frequency": RecurrenceFrequency.MONTHLY,
+            "start_date": date(2024, 1, 1),
+            "deposit": deposit_factory(wallet=wallet).id,
+        }
+
+        response = api_client.post(recurring_transfers_url(wallet.id), payload)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not RecurringTransfer.objects.filter(wallet=wallet).exists()
@@ -0,0 +1,162 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from categories.models.choices.category_type import CategoryType
+from transfers.models import Transfer
+from wallets.models import Wallet
+
+
+def transfers_import_url(wallet_id: int) -> str:
+    """
+    Create and return a Transfers import URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to import view.
+    """
+    return reverse("transfers:transfers-import", args=[wallet_id])
+
+
+@pytest.mark.django_db
+class TestTransferImportAPIView:
+    """Tests for TransferImportAPIView."""
+
+    def test_auth_required(self, api_client: APIClient, wallet: Wallet):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferImportAPIView called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.post(transfers_import_url(wallet.id), data={})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_wallet_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, wallet_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferImportAPIView called with POST by User not belonging to given Wallet.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        wallet = wallet_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(transfers_import_url(wallet.id), data={})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_import_csv_statement(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet with Period and Deposit. CSV statement with custom columns and one row out of Periods.
+        WHEN: TransferImportAPIView called with POST by Wallet member with column mapping.
+        THEN: HTTP 201 - Income and Expense created, invalid row and rows per second reported.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        deposit = deposit_factory(wallet=wallet)
+        statement = SimpleUploadedFile(
+            "statement.csv",
+            "Data;Tytuł;Kwota\n01.09.2024;Zakupy;-12,50\n02.09.2024;Pensja;1 000,00\n01.01.2025;Inne;-1,00\n".encode(),
+        )
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            transfers_import_url(wallet.id),
+            data={
+                "file": statement,
+                "deposit": deposit.id,
+                "date_column": "Data",
+                "name_column": "Tytuł",
+                "value_column": "Kwota",
+                "description_column": "",
+                "date_format": "%d.%m.%Y",
+                "delimiter": ";",
+                "decimal_separator": ",",
+            },
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["imported_count"] == 2
+        assert response.data["skipped_count"] == 1
+        assert response.data["errors"] == [{"line": 4, "message": "Period matching date 2025-01-01 does not exist."}]
+        assert "rows_per_second" in response.data
+        assert list(
+            Transfer.objects.filter(period__wallet=wallet)
+            .order_by("date")
+            .values_list("transfer_type", "name", "value")
+        ) == [(CategoryType.EXPENSE, "Zakupy", Decimal("12.50")), (CategoryType.INCOME, "Pensja", Decimal("1000.00"))]
+
+    def test_import_ofx_statement(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Wallet with Period and Deposit. OFX statement with single transaction.
+        WHEN: TransferImportAPIView called with POST by Wallet member with "ofx" statement_format.
+        THEN: HTTP 201 - Expense created.
+        """
+        wallet = wallet_factory(owner=base_user)
+        period_factory(wallet=wallet, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        deposit = deposit_factory(wallet=wallet)
+        statement = SimpleUploadedFile(
+            "statement.ofx", b"<OFX><STMTTRN><DTPOSTED>20240905<TRNAMT>-12.50<NAME>Shop</STMTTRN></OFX>"
+        )
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            transfers_import_url(wallet.id),
+            data={"file": statement, "deposit": deposit.id, "statement_format": "ofx"},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["imported_count"] == 1
+        assert Transfer.expenses.filter(period__wallet=wallet, name="Shop", value=Decimal("12.50")).exists()
+
+    def test_error_deposit_from_other_wallet(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Wallets of User with Deposit in second one.
+        WHEN: TransferImportAPIView called with POST for first Wallet and Deposit of second one.
+        THEN: HTTP 400 - Nothing imported.
+        """
+        wallet = wallet_factory(owner=base_user)
+        deposit = deposit_factory(wallet=wallet_factory(owner=base_user))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            transfers_import_url(wallet.id),
+            data={"file": SimpleUploadedFile("statement.csv", b"date,value,name\n"), "deposit": deposit.id},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["deposit"][0] == "Deposit from different Wallet."
@@ -2,13 +2,17 @@
 Test file for both IncomeViewSet and TransferViewSet.
 """
 
+import csv
 import datetime
+import json
 from decimal import Decimal
 from typing import Any, Callable
 
 import pytest
 from conftest import get_jwt_access_token
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -16,7 +20,7 @@ from rest_framework.test import APIClient
 
 from app_users.models import User
 from categories.models.choices.category_type import CategoryType
-from transfers.models import Expense, Income
+from transfers.models import Expense, Income, TransferRollup
 from transfers.models.transfer_model import Transfer
 from transfers.serializers.expense_serializer import ExpenseSerializer
 from transfers.serializers.income_serializer import IncomeSerializer
@@ -129,6 +133,84 @@ def income_copy_url(wallet_id: int) -> str:
     return reverse("wallets:income-copy", args=[wallet_id])
 
 
+def expense_bulk_create_url(wallet_id: int) -> str:
+    """
+    Create and return an Expense bulk create URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to bulk create view.
+    """
+    return reverse("wallets:expense-bulk-create", args=[wallet_id])
+
+
+def income_bulk_create_url(wallet_id: int) -> str:
+    """
+    Create and return an Income bulk create URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to bulk create view.
+    """
+    return reverse("wallets:income-bulk-create", args=[wallet_id])
+
+
+def expense_export_url(wallet_id: int) -> str:
+    """
+    Create and return an Expense export URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to export view.
+    """
+    return reverse("wallets:expense-export", args=[wallet_id])
+
+
+def income_export_url(wallet_id: int) -> str:
+    """
+    Create and return an Income export URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to export view.
+    """
+    return reverse("wallets:income-export", args=[wallet_id])
+
+
+def expense_bulk_update_url(wallet_id: int) -> str:
+    """
+    Create and return an Expense bulk update URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to bulk update view.
+    """
+    return reverse("wallets:expense-bulk-update", args=[wallet_id])
+
+
+def income_bulk_update_url(wallet_id: int) -> str:
+    """
+    Create and return an Income bulk update URL.
+
+    Args:
+        wallet_id (int): Wallet ID.
+
+    Returns:
+        str: Relative url to bulk update view.
+    """
+    return reverse("wallets:income-bulk-update", args=[wallet_id])
+
+
 @pytest.fixture(
     params=[pytest.param(expenses_list_url, id="ExpenseViewSet"), pytest.param(incomes_list_url, id="IncomeViewSet")]
 )
@@ -160,6 +242,36 @@ def transfer_bulk_delete_url(request):
     return request.param
 
 
+@pytest.fixture(
+    params=[
+        pytest.param(expense_bulk_create_url, id="ExpenseViewSet"),
+        pytest.param(income_bulk_create_url, id="IncomeViewSet"),
+    ]
+)
+def transfer_bulk_create_url(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(expense_bulk_update_url, id="ExpenseViewSet"),
+        pytest.param(income_bulk_update_url, id="IncomeViewSet"),
+    ]
+)
+def transfer_bulk_update_url(request):
+    return request.param
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(expense_export_url, id="ExpenseViewSet"),
+        pytest.param(income_export_url, id="IncomeViewSet"),
+    ]
+)
+def transfer_export_url(request):
+    return request.param
+
+
 def get_transfer_type_from_url_fixture(url_fixture: Callable):
     if url_fixture.__name__.startswith("expense"):
         return CategoryType.EXPENSE
@@ -299,6 +411,41 @@ class TestTransferViewSetList:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == serializer.data
 
+    def test_list_selects_only_serialized_columns(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_list_url: Callable,
+    ):
+        """
+        GIVEN: Three Transfer model instances for single Wallet created in database.
+        WHEN: TransferViewSet list view called by Wallet owner.
+        THEN: Transfers fetched with single query selecting only serialized columns, without querying related
+        tables.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_list_url)
+        for _ in range(3):
+            transfer_factory(wallet=wallet, transfer_type=transfer_type)
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(transfer_list_url(wallet.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+        transfer_queries = [query["sql"] for query in queries.captured_queries if "transfers_transfer" in query["sql"]]
+        assert len(transfer_queries) == 1
+        selected_columns = transfer_queries[0].split(" FROM ")[0]
+        assert '"transfer_type"' not in selected_columns
+        assert '"wallet_id"' not in selected_columns
+        assert not any(
+            "periods_period" in query["sql"] or "categories_transfercategory" in query["sql"]
+            for query in queries.captured_queries
+        )
+
     def test_transfers_list_limited_to_wallet(
         self,
         api_client: APIClient,
@@ -388,6 +535,198 @@ class TestTransferViewSetList:
         assert expense_transfer.id not in [transfer["id"] for transfer in response.data]
 
 
+@pytest.mark.django_db
+class TestTransferViewSetListKeysetPagination:
+    """Tests for list view on TransferViewSet with opt-in keyset pagination."""
+
+    @pytest.fixture
+    def transfers(
+        self,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_list_url: Callable,
+    ) -> list[Transfer]:
+        """
+        Creates nine Transfers in Wallet of base_user with repeated values, names and dates and with NULL
+        Entities and TransferCategories for some of them.
+
+        Returns:
+            list[Transfer]: Created Transfers.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_list_url)
+        period = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        deposit = deposit_factory(wallet=wallet)
+        entities = entity_factory.create_batch(2, wallet=wallet)
+        categories = transfer_category_factory.create_batch(
+            2, wallet=wallet, deposit=deposit, category_type=transfer_type
+        )
+        return [
+            transfer_factory(
+                period=period,
+                deposit=deposit,
+                transfer_type=transfer_type,
+                name=f"transfer {index % 4}",
+                value=Decimal(index % 3 + 1),
+                date=datetime.date(2024, 9, index % 5 + 1),
+                entity=entities[index % 2] if index % 3 else None,
+                category=categories[index % 2] if index % 4 else None,
+            )
+            for index in range(9)
+        ]
+
+    @staticmethod
+    def get_expected_ids(transfers: list[Transfer], ordering: str) -> list[int]:
+        """
+        Returns IDs of Transfers sorted by given ordering field and ID, with NULL values placed last.
+
+        Args:
+            transfers (list[Transfer]): Transfers.
+            ordering (str): Ordering field, prefixed with "-" for descending ordering.
+
+        Returns:
+            list[int]: Sorted Transfers IDs.
+        """
+        field_name = ordering.lstrip("-")
+        attname = Transfer._meta.get_field(field_name).attname
+        descending = ordering.startswith("-")
+        not_null = sorted(
+            (transfer for transfer in transfers if getattr(transfer, attname) is not None),
+            key=lambda transfer: (getattr(transfer, attname), transfer.id),
+            reverse=descending,
+        )
+        null = sorted(
+            (transfer for transfer in transfers if getattr(transfer, attname) is None),
+            key=lambda transfer: transfer.id,
+            reverse=descending,
+        )
+        return [transfer.id for transfer in not_null + null]
+
+    @pytest.mark.parametrize("ordering", ["id", "-id", "name", "-value", "date", "-entity", "category", "-category"])
+    def test_walk_pages_forward_and_backward(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        transfers: list[Transfer],
+        transfer_list_url: Callable,
+        ordering: str,
+    ):
+        """
+        GIVEN: Nine Transfers with repeated and NULL values of ordering field.
+        WHEN: TransferViewSet list view called with "pagination=cursor" and ordering, then with next
+        and previous links.
+        THEN: HTTP 200 - Every Transfer returned once in given order, previous links return the same pages.
+        """
+        api_client.force_authenticate(base_user)
+        url = transfer_list_url(transfers[0].period.wallet_id)
+        response = api_client.get(url, data={"pagination": "cursor", "page_size": 2, "ordering": ordering})
+        pages = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            assert "count" not in response.data
+            pages.append([transfer["id"] for transfer in response.data["results"]])
+            if response.data["next"] is None:
+                break
+            response = api_client.get(response.data["next"])
+
+        assert [transfer_id for page in pages for transfer_id in page] == self.get_expected_ids(transfers, ordering)
+        assert len(pages) == 5
+        for page in reversed(pages[:-1]):
+            response = api_client.get(response.data["previous"])
+            assert [transfer["id"] for transfer in response.data["results"]] == page
+        assert response.data["previous"] is None
+
+    def test_count_returned_on_request(
+        self, api_client: APIClient, base_user: AbstractUser, transfers: list[Transfer], transfer_list_url: Callable
+    ):
+        """
+        GIVEN: Nine Transfers in Wallet.
+        WHEN: TransferViewSet list view called with "pagination=cursor" and "count=true".
+        THEN: HTTP 200 - Number of all Transfers returned together with first page.
+        """
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(
+            transfer_list_url(transfers[0].period.wallet_id), data={"pagination": "cursor", "count": "true"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 9
+        assert len(response.data["results"]) == 9
+        assert response.data["next"] is None
+
+    def test_walk_pages_of_search_results(
+        self, api_client: APIClient, base_user: AbstractUser, transfers: list[Transfer], transfer_list_url: Callable
+    ):
+        """
+        GIVEN: Nine Transfers in Wallet with names matching search value.
+        WHEN: TransferViewSet list view called with "search" param and "pagination=cursor", then with next links.
+        THEN: HTTP 200 - Every Transfer returned once.
+        """
+        api_client.force_authenticate(base_user)
+        url = transfer_list_url(transfers[0].period.wallet_id)
+        response = api_client.get(url, data={"search": "transfer", "pagination": "cursor", "page_size": 4})
+        ids = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            ids.extend(transfer["id"] for transfer in response.data["results"])
+            if response.data["next"] is None:
+                break
+            response = api_client.get(response.data["next"])
+
+        assert sorted(ids) == sorted(transfer.id for transfer in transfers)
+
+    def test_queries_number_independent_of_page(
+        self, api_client: APIClient, base_user: AbstractUser, transfers: list[Transfer], transfer_list_url: Callable
+    ):
+        """
+        GIVEN: Nine Transfers in Wallet.
+        WHEN: TransferViewSet list view called for first and for last page with keyset pagination.
+        THEN: Both pages fetched with the same number of queries, without COUNT and OFFSET.
+        """
+        api_client.force_authenticate(base_user)
+        url = transfer_list_url(transfers[0].period.wallet_id)
+        response = api_client.get(url, data={"pagination": "cursor", "page_size": 8, "ordering": "-value"})
+
+        with CaptureQueriesContext(connection) as first_page_queries:
+            api_client.get(url, data={"pagination": "cursor", "page_size": 8, "ordering": "-value"})
+        with CaptureQueriesContext(connection) as last_page_queries:
+            last_page_response = api_client.get(response.data["next"])
+
+        assert len(last_page_response.data["results"]) == 1
+        assert len(last_page_queries) <= len(first_page_queries)
+        assert not any(
+            "COUNT(" in query["sql"] or "OFFSET" in query["sql"] for query in last_page_queries.captured_queries
+        )
+
+    @pytest.mark.parametrize("cursor", ["invalid", "eyJvIjogIm5hbWUiLCAicCI6IFsxLCAxXSwgInIiOiAwfQ=="])
+    def test_error_invalid_cursor(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        transfers: list[Transfer],
+        transfer_list_url: Callable,
+        cursor: str,
+    ):
+        """
+        GIVEN: Nine Transfers in Wallet.
+        WHEN: TransferViewSet list view called with malformed cursor or with cursor created for other ordering.
+        THEN: HTTP 404 returned.
+        """
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_list_url(transfers[0].period.wallet_id), data={"cursor": cursor})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.django_db
 class TestTransferViewSetCreate:
     """Tests for create Transfer on TransferViewSet."""
@@ -1797,7 +2136,7 @@ class TestTransferViewSetBulkDelete:
         """
         GIVEN: Users JWT in request headers as HTTP_AUTHORIZATION.
         WHEN: TransferViewSet bulk delete endpoint called with DELETE.
-        THEN: HTTP 204 returned.
+        THEN: HTTP 200 returned.
         """
         wallet = wallet_factory(owner=base_user)
         transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_delete_url)
@@ -1807,7 +2146,7 @@ class TestTransferViewSetBulkDelete:
         response = api_client.delete(
             url, data={"objects_ids": [transfer.id]}, HTTP_AUTHORIZATION=f"Bearer {jwt_access_token}", format="json"
         )
-        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.status_code == status.HTTP_200_OK
 
     def test_user_not_wallet_member(
         self,
@@ -1841,7 +2180,8 @@ class TestTransferViewSetBulkDelete:
         """
         GIVEN: Transfer instances for Wallet created in database.
         WHEN: TransferViewSet bulk delete view called with DELETE by User belonging to Wallet.
-        THEN: No content HTTP 204, Transfers deleted.
+        THEN: HTTP 200 with number of deleted Transfers, Transfers deleted with single DELETE query without
+        fetching them, TransferRollup rows of Transfers removed.
         """
         wallet = wallet_factory(owner=base_user)
         transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_delete_url)
@@ -1851,11 +2191,47 @@ class TestTransferViewSetBulkDelete:
         url = transfer_bulk_delete_url(wallet.id)
 
         assert Transfer.objects.filter(transfer_type=transfer_type).count() == 2
+        assert TransferRollup.objects.filter(wallet=wallet).exists()
 
-        response = api_client.delete(url, data={"objects_ids": [transfer_1.id, transfer_2.id]}, format="json")
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.delete(url, data={"objects_ids": [transfer_1.id, transfer_2.id]}, format="json")
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"count": 2}
+        transfers_queries = [
+            query["sql"] for query in context.captured_queries if '"transfers_transfer"' in query["sql"]
+        ]
+        assert len(transfers_queries) == 1
+        assert "DELETE" in transfers_queries[0]
         assert not Transfer.objects.filter(transfer_type=transfer_type).exists()
+        assert not TransferRollup.objects.filter(wallet=wallet).exists()
+
+    def test_bulk_delete_transfers_of_other_wallet_not_deleted(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_delete_url: Callable,
+    ):
+        """
+        GIVEN: Transfer of Wallet and Transfer of other Wallet created in database.
+        WHEN: TransferViewSet bulk delete view called with DELETE with IDs of both Transfers.
+        THEN: HTTP 200 with number of deleted Transfers, only Transfer of Wallet deleted.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_delete_url)
+        transfer = transfer_factory(transfer_type=transfer_type, wallet=wallet)
+        other_transfer = transfer_factory(transfer_type=transfer_type, wallet=wallet_factory())
+        api_client.force_authenticate(base_user)
+
+        response = api_client.delete(
+            transfer_bulk_delete_url(wallet.id), data={"objects_ids": [transfer.id, other_transfer.id]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"count": 1}
+        assert list(Transfer.objects.values_list("id", flat=True)) == [other_transfer.id]
 
     @pytest.mark.parametrize(
         "objects_ids",
@@ -1889,6 +2265,239 @@ class TestTransferViewSetBulkDelete:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.django_db
+class TestTransferViewSetBulkUpdate:
+    """Tests for bulk_update Transfer on TransferViewSet."""
+
+    def test_auth_required(
+        self,
+        api_client: APIClient,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_update_url: Callable,
+    ):
+        """
+        GIVEN: Transfer instance for Wallet created in database.
+        WHEN: Transfer bulk update view called with PATCH without authentication.
+        THEN: Unauthorized HTTP 401.
+        """
+        transfer = transfer_factory(transfer_type=get_transfer_type_from_url_fixture(transfer_bulk_update_url))
+
+        response = api_client.patch(transfer_bulk_update_url(transfer.period.wallet.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_bulk_update_category_by_ids(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_update_url: Callable,
+    ):
+        """
+        GIVEN: Three Transfers with the same Deposit for Wallet created in database.
+        WHEN: TransferViewSet bulk update view called with PATCH with IDs of two Transfers and new category.
+        THEN: HTTP 200 with number of updated Transfers, two Transfers updated with single UPDATE query,
+        TransferRollup table updated.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_update_url)
+        deposit = deposit_factory(wallet=wallet)
+        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=transfer_type)
+        transfers = [
+            transfer_factory(transfer_type=transfer_type, wallet=wallet, deposit=deposit, category=None)
+            for _ in range(3)
+        ]
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.patch(
+                transfer_bulk_update_url(wallet.id),
+                data={"objects_ids": [transfers[0].id, transfers[1].id], "patch": {"category": category.id}},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"count": 2}
+        transfers_updates = [
+            query for query in context.captured_queries if query["sql"].startswith('UPDATE "transfers_transfer" ')
+        ]
+        assert len(transfers_updates) == 1
+        assert list(Transfer.objects.order_by("id").values_list("category", flat=True)) == [
+            category.id,
+            category.id,
+            None,
+        ]
+        assert sum(TransferRollup.objects.filter(category=category).values_list("value", flat=True)) == (
+            transfers[0].value + transfers[1].value
+        )
+
+    def test_bulk_update_clear_category(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_update_url: Callable,
+    ):
+        """
+        GIVEN: Two Transfers with TransferCategory for Wallet created in database.
+        WHEN: TransferViewSet bulk update view called with PATCH with IDs of Transfers and null category.
+        THEN: HTTP 200, category of Transfers cleared, TransferRollup sums moved to rows without category.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_update_url)
+        deposit = deposit_factory(wallet=wallet)
+        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=transfer_type)
+        transfers = [
+            transfer_factory(
+                transfer_type=transfer_type, wallet=wallet, deposit=deposit, category=category, entity=None
+            )
+            for _ in range(2)
+        ]
+        api_client.force_authenticate(base_user)
+
+        response = api_client.patch(
+            transfer_bulk_update_url(wallet.id),
+            data={"objects_ids": [transfer.id for transfer in transfers], "patch": {"category": None}},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"count": 2}
+        assert set(Transfer.objects.values_list("category", flat=True)) == {None}
+        assert not TransferRollup.objects.filter(category=category).exists()
+        assert sum(
+            TransferRollup.objects.filter(wallet=wallet, category__isnull=True).values_list("value", flat=True)
+        ) == (transfers[0].value + transfers[1].value)
+
+    def test_bulk_update_date_by_filter_params(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_update_url: Callable,
+    ):
+        """
+        GIVEN: Transfers of two Entities in January Period and February Period for Wallet created in database.
+        WHEN: TransferViewSet bulk update view called with PATCH with "entity" filter param and new date.
+        THEN: HTTP 200, Transfers of Entity moved to new date and February Period, other Transfers unchanged.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_update_url)
+        january = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 1, 1), date_end=datetime.date(2024, 1, 31)
+        )
+        february = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 2, 1), date_end=datetime.date(2024, 2, 29)
+        )
+        entity, other_entity = entity_factory(wallet=wallet), entity_factory(wallet=wallet)
+        for transfer_entity in (entity, entity, other_entity):
+            transfer_factory(transfer_type=transfer_type, wallet=wallet, period=january, entity=transfer_entity)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.patch(
+            f"{transfer_bulk_update_url(wallet.id)}?entity={entity.id}",
+            data={"patch": {"date": "2024-02-10"}},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"count": 2}
+        assert set(Transfer.objects.filter(entity=entity).values_list("date", "period")) == {
+            (datetime.date(2024, 2, 10), february.id)
+        }
+        assert Transfer.objects.get(entity=other_entity).period == january
+
+    @pytest.mark.parametrize("query_params", ("", "?page_size=10", "?ordering=date", "?entiti=1", "?entity="))
+    def test_error_bulk_update_without_filter_params(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_update_url: Callable,
+        query_params: str,
+    ):
+        """
+        GIVEN: Transfers for Wallet created in database.
+        WHEN: TransferViewSet bulk update view called with PATCH without objects_ids and with query params
+        that are not valid, not empty filter params.
+        THEN: HTTP 400, Transfers not updated.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_update_url)
+        transfer_factory.create_batch(2, transfer_type=transfer_type, wallet=wallet, description="Old")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.patch(
+            f"{transfer_bulk_update_url(wallet.id)}{query_params}",
+            data={"patch": {"description": "New"}},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "objects_ids or valid filter params must be provided."
+        assert set(Transfer.objects.values_list("description", flat=True)) == {"Old"}
+
+    @pytest.mark.parametrize(
+        "patch_field, error_message",
+        (
+            ("category", "Transfer Deposit and Transfer Category Deposit has to be the same."),
+            ("entity", "'deposit' and 'entity' fields cannot contain the same value."),
+            ("value", "Fields not supported in bulk update: value."),
+        ),
+    )
+    def test_error_bulk_update_invalid_patch(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_bulk_update_url: Callable,
+        patch_field: str,
+        error_message: str,
+    ):
+        """
+        GIVEN: Transfers of Deposit for Wallet created in database.
+        WHEN: TransferViewSet bulk update view called with PATCH with category of other Deposit, entity the same
+        as Transfers Deposit or not supported field.
+        THEN: HTTP 400, Transfers not updated.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_update_url)
+        deposit = deposit_factory(wallet=wallet)
+        transfers = [
+            transfer_factory(transfer_type=transfer_type, wallet=wallet, deposit=deposit, entity=None, category=None)
+            for _ in range(2)
+        ]
+        patch_value = {
+            "category": lambda: transfer_category_factory(wallet=wallet, category_type=transfer_type).id,
+            "entity": lambda: deposit.id,
+            "value": lambda: "10.00",
+        }[patch_field]()
+        api_client.force_authenticate(base_user)
+
+        response = api_client.patch(
+            transfer_bulk_update_url(wallet.id),
+            data={"objects_ids": [transfer.id for transfer in transfers], "patch": {patch_field: patch_value}},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert error_message in str(response.data)
+        assert set(Transfer.objects.values_list("category", "entity")) == {(None, None)}
+
+
 @pytest.mark.django_db
 class TestTransferViewSetCopy:
     """Tests for copy Transfer on TransferViewSet."""
@@ -1990,6 +2599,92 @@ class TestTransferViewSetCopy:
         )
         assert len(unique_expenses) == 2
 
+    def test_copy_transfers_with_date_shift_and_deposit(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_copy_url: Callable,
+    ):
+        """
+        GIVEN: Transfers of January Period and February Period for Wallet created in database.
+        WHEN: TransferViewSet copy view called with POST with months_shift and deposit params.
+        THEN: HTTP 201, Transfers copied with single INSERT query into February Period with given Deposit,
+        TransferRollup table updated.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_copy_url)
+        january = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 1, 1), date_end=datetime.date(2024, 1, 31)
+        )
+        february = period_factory(
+            wallet=wallet, date_start=datetime.date(2024, 2, 1), date_end=datetime.date(2024, 2, 29)
+        )
+        deposit = deposit_factory(wallet=wallet)
+        transfers = [
+            transfer_factory(
+                transfer_type=transfer_type, wallet=wallet, period=january, date=transfer_date, category=None
+            )
+            for transfer_date in (datetime.date(2024, 1, 10), datetime.date(2024, 1, 31))
+        ]
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post(
+                transfer_copy_url(wallet.id),
+                data={"objects_ids": [transfer.id for transfer in transfers], "months_shift": 1, "deposit": deposit.id},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert (
+            len([query for query in context.captured_queries if "INSERT INTO transfers_transfer" in query["sql"]]) == 1
+        )
+        copies = Transfer.objects.filter(pk__in=response.data["ids"]).order_by("id")
+        assert [(copy.date, copy.period, copy.deposit, copy.wallet_id) for copy in copies] == [
+            (datetime.date(2024, 2, 10), february, deposit, wallet.id),
+            (datetime.date(2024, 2, 29), february, deposit, wallet.id),
+        ]
+        assert [(copy.name, copy.value, copy.entity_id) for copy in copies] == [
+            (transfer.name, transfer.value, transfer.entity_id) for transfer in transfers
+        ]
+        assert sum(TransferRollup.objects.filter(period=february).values_list("value", flat=True)) == sum(
+            transfer.value for transfer in transfers
+        )
+
+    @pytest.mark.parametrize("param", ("months_shift", "deposit"))
+    def test_error_copy_transfers_invalid_target(
+        self,
+        api_client: APIClient,
+        base_user: Any,
+        wallet_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_factory: FactoryMetaClass,
+        transfer_copy_url: Callable,
+        param: str,
+    ):
+        """
+        GIVEN: Transfer for Wallet created in database.
+        WHEN: TransferViewSet copy view called with POST with months_shift param resolving date without Period or
+        with Deposit of other Wallet.
+        THEN: HTTP 400, Transfers not copied.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_copy_url)
+        transfer = transfer_factory(transfer_type=transfer_type, wallet=wallet)
+        payload = {"objects_ids": [transfer.id]}
+        payload[param] = 120 if param == "months_shift" else deposit_factory().id
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfer_copy_url(wallet.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert ("date" if param == "months_shift" else "deposit") in response.data["detail"]
+        assert Transfer.objects.count() == 1
+
     @pytest.mark.parametrize(
         "objects_ids",
         [
@@ -2020,3 +2715,321 @@ class TestTransferViewSetCopy:
         response = api_client.post(url, data={"objects_ids": objects_ids}, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestTransferViewSetBulkCreate:
+    """Tests for bulk_create view on TransferViewSet."""
+
+    @pytest.fixture
+    def payload_factory(
+        self,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_bulk_create_url: Callable,
+    ) -> Callable[[int], tuple[Wallet, list[dict]]]:
+        """
+        Returns function creating Wallet with two Periods and payload with given number of valid Transfers spread
+        among these Periods, three Entities and three TransferCategories.
+        """
+
+        def create_payload(transfers_count: int) -> tuple[Wallet, list[dict]]:
+            wallet = wallet_factory(owner=base_user)
+            transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_create_url)
+            period_factory(wallet=wallet, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30))
+            period_factory(wallet=wallet, date_start=datetime.date(2024, 10, 1), date_end=datetime.date(2024, 10, 31))
+            deposit = deposit_factory(wallet=wallet)
+            entities = entity_factory.create_batch(3, wallet=wallet)
+            categories = transfer_category_factory.create_batch(
+                3, wallet=wallet, deposit=deposit, category_type=transfer_type
+            )
+            payload = [
+                {
+                    "name": f"Transfer {index}",
+                    "description": "",
+                    "value": str(Decimal(index + 1)),
+                    "date": str(datetime.date(2024, 9 + index % 2, 1 + index % 28)),
+                    "entity": entities[index % 3].pk,
+                    "deposit": deposit.pk,
+                    "category": categories[index % 3].pk if index % 4 else None,
+                }
+                for index in range(transfers_count)
+            ]
+            return wallet, payload
+
+        return create_payload
+
+    def test_auth_required(self, api_client: APIClient, wallet: Wallet, transfer_bulk_create_url: Callable):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferViewSet bulk_create view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.post(transfer_bulk_create_url(wallet.id), data=[], format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_wallet_member(
+        self,
+        api_client: APIClient,
+        user_factory: FactoryMetaClass,
+        wallet_factory: FactoryMetaClass,
+        transfer_bulk_create_url: Callable,
+    ):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferViewSet bulk_create view called with POST by User not belonging to given Wallet.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        wallet = wallet_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(transfer_bulk_create_url(wallet.id), data=[], format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_bulk_create_transfers(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        payload_factory: Callable,
+        transfer_bulk_create_url: Callable,
+    ):
+        """
+        GIVEN: Wallet with Periods, Deposit, Entities and TransferCategories in database. Valid payload
+        with ten Transfers prepared.
+        WHEN: TransferViewSet bulk_create view called with POST by User belonging to Wallet.
+        THEN: HTTP 201 - Transfers with matching Periods and transfer_type created and returned,
+        TransferRollup table updated.
+        """
+        wallet, payload = payload_factory(10)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_bulk_create_url)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfer_bulk_create_url(wallet.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        transfers = Transfer.objects.filter(period__wallet=wallet, transfer_type=transfer_type).order_by("id")
+        assert transfers.count() == 10
+        serializer = ExpenseSerializer if transfer_type == CategoryType.EXPENSE else IncomeSerializer
+        assert response.data == serializer(transfers, many=True).data
+        for transfer in transfers:
+            assert transfer.period.date_start <= transfer.date <= transfer.period.date_end
+        assert sum(TransferRollup.objects.filter(wallet=wallet).values_list("value", flat=True)) == sum(
+            Decimal(item["value"]) for item in payload
+        )
+
+    def test_queries_number_independent_of_transfers_number(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        payload_factory: Callable,
+        transfer_bulk_create_url: Callable,
+    ):
+        """
+        GIVEN: Two Wallets with the same Periods, Deposit, Entities and TransferCategories and payloads
+        with 12 and 120 Transfers.
+        WHEN: TransferViewSet bulk_create view called with POST for both payloads.
+        THEN: HTTP 201 - The same number of database queries executed for both payloads.
+        """
+        api_client.force_authenticate(base_user)
+        queries_counts = []
+        for transfers_count in (12, 120):
+            wallet, payload = payload_factory(transfers_count)
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.post(transfer_bulk_create_url(wallet.id), data=payload, format="json")
+            assert response.status_code == status.HTTP_201_CREATED
+            queries_counts.append(len(context.captured_queries))
+
+        assert queries_counts[0] == queries_counts[1]
+
+    def test_error_per_item_errors_returned(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        payload_factory: Callable,
+        transfer_bulk_create_url: Callable,
+    ):
+        """
+        GIVEN: Payload with five Transfers, where four of them are invalid.
+        WHEN: TransferViewSet bulk_create view called with POST by User belonging to Wallet.
+        THEN: HTTP 400 - Errors returned for every invalid Transfer, no Transfer created.
+        """
+        wallet, payload = payload_factory(5)
+        other_wallet = wallet_factory(owner=base_user)
+        payload[1]["date"] = "2025-01-01"
+        payload[2]["category"] = transfer_category_factory(wallet=other_wallet).pk
+        payload[3]["entity"] = 999999
+        payload[4]["value"] = "0.00"
+        payload[4]["entity"] = entity_factory(wallet=other_wallet).pk
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfer_bulk_create_url(wallet.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert response.data[1]["non_field_errors"] == ["Period matching given date does not exist."]
+        assert response.data[2]["category"] == ["TransferCategory from different Wallet."]
+        assert response.data[3]["entity"][0].code == "does_not_exist"
+        assert response.data[4]["value"] == ["Value should be higher than 0.00."]
+        assert response.data[4]["entity"] == ["Entity from different Wallet."]
+        assert not Transfer.objects.filter(period__wallet=wallet).exists()
+
+    @pytest.mark.parametrize("payload", [{}, [], "1", [1]])
+    def test_error_invalid_payload(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        payload: Any,
+        transfer_bulk_create_url: Callable,
+    ):
+        """
+        GIVEN: Wallet created in database.
+        WHEN: TransferViewSet bulk_create view called with POST by User belonging to Wallet with invalid payload.
+        THEN: HTTP 400 returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfer_bulk_create_url(wallet.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestTransferViewSetExport:
+    """Tests for export view on TransferViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, wallet: Wallet, transfer_export_url: Callable):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferViewSet export view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.get(transfer_export_url(wallet.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_wallet_member(
+        self,
+        api_client: APIClient,
+        user_factory: FactoryMetaClass,
+        wallet_factory: FactoryMetaClass,
+        transfer_export_url: Callable,
+    ):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferViewSet export view called with GET by User not belonging to given Wallet.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        wallet = wallet_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(transfer_export_url(wallet.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_error_invalid_export_format(
+        self, api_client: APIClient, base_user: AbstractUser, wallet_factory: FactoryMetaClass, transfer_export_url
+    ):
+        """
+        GIVEN: Wallet model instance in database.
+        WHEN: TransferViewSet export view called with GET with unsupported export_format.
+        THEN: Bad request HTTP 400 returned.
+        """
+        wallet = wallet_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_export_url(wallet.id), data={"export_format": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["error"] == "export_format must be one of: csv, ndjson."
+
+    def test_export_csv_with_filters(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_category_factory: FactoryMetaClass,
+        transfer_export_url: Callable,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Transfers of exported type and one Transfer of other type in Wallet, one Transfer
+        in other Wallet.
+        WHEN: TransferViewSet export view called with GET with value_min filter and ordering.
+        THEN: HTTP 200 - Filtered Transfers of exported type from Wallet streamed as CSV in given order.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_export_url)
+        transfer_factory, other_type_factory = (
+            (expense_factory, income_factory)
+            if transfer_type == CategoryType.EXPENSE
+            else (income_factory, expense_factory)
+        )
+        period = period_factory(wallet=wallet)
+        deposit = deposit_factory(wallet=wallet)
+        category = transfer_category_factory(wallet=wallet, deposit=deposit, category_type=transfer_type)
+        transfers = [
+            transfer_factory(period=period, deposit=deposit, category=category, value=Decimal(value))
+            for value in ("5.00", "20.00", "10.00")
+        ]
+        other_type_factory(period=period, deposit=deposit, value=Decimal("30.00"))
+        transfer_factory(value=Decimal("40.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_export_url(wallet.id), data={"value_min": "10", "ordering": "-value"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"].endswith('s.csv"')
+        rows = list(csv.DictReader(b"".join(response.streaming_content).decode().splitlines()))
+        assert [(int(row["id"]), row["value"]) for row in rows] == [
+            (transfers[1].id, "20.00"),
+            (transfers[2].id, "10.00"),
+        ]
+
+    def test_export_ndjson(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        wallet_factory: FactoryMetaClass,
+        period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        transfer_export_url: Callable,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Transfers of exported type in Wallet.
+        WHEN: TransferViewSet export view called with GET with "ndjson" export_format.
+        THEN: HTTP 200 - Transfers streamed as JSON objects in separate lines.
+        """
+        wallet = wallet_factory(owner=base_user)
+        transfer_type = get_transfer_type_from_url_fixture(transfer_export_url)
+        transfer_factory = expense_factory if transfer_type == CategoryType.EXPENSE else income_factory
+        period = period_factory(wallet=wallet)
+        deposit = deposit_factory(wallet=wallet)
+        transfers = transfer_factory.create_batch(2, period=period, deposit=deposit)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_export_url(wallet.id), data={"export_format": "ndjson"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        assert [(row["id"], row["value"]) for row in rows] == [
+            (transfer.id, f"{transfer.value:.2f}") for transfer in transfers
+        ]